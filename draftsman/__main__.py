@@ -0,0 +1,12 @@
+# __main__.py
+
+"""
+Allows the ``draftsman`` command line tools to be run with
+``python -m draftsman``. See :py:mod:`draftsman.cli`.
+"""
+
+from draftsman.cli import main
+
+import sys
+
+sys.exit(main())
@@ -8,7 +8,7 @@ under the namespace ``draftsman``.
 
 from draftsman import utils
 from draftsman.error import IncorrectBlueprintTypeError
-from typing import Union
+from typing import Iterator, Union
 
 
 from draftsman.classes.blueprintable import Blueprintable
@@ -19,8 +19,8 @@ from draftsman.classes.blueprintbook import BlueprintBook
 
 
 @utils.reissue_warnings
-def get_blueprintable_from_string(blueprintable_string):
-    # type: (str) -> Blueprintable
+def get_blueprintable_from_string(blueprintable_string, lazy=False, trusted=False):
+    # type: (str, bool, bool) -> Blueprintable
     """
     Returns a :py:class:`.Blueprint` or a :py:class:`.BlueprintBook` depending
     on the string passed in.
@@ -33,6 +33,11 @@ def get_blueprintable_from_string(blueprintable_string):
     the above types and return the appropriate class instance.
 
     :param blueprintable_string: The blueprint string to interpret.
+    :param lazy: Whether or not to defer the construction of entities in any
+        :py:class:`.Blueprint` until they are first accessed.
+    :param trusted: Whether or not to skip validation of the data, for strings
+        known to be exported by Factorio or Draftsman. See
+        :py:class:`.Blueprint` for more information.
 
     :returns: A ``Blueprint``, ``DeconstructionPlanner``, ``UpgradePlanner``,
         or ``BlueprintBook`` object.
@@ -44,16 +49,93 @@ def get_blueprintable_from_string(blueprintable_string):
         ``"deconstruction_planner"``, ``"upgrade_planner"``, nor
         ``"blueprint_book"``.
     """
-    blueprintable = utils.string_to_JSON(blueprintable_string)
-    if "blueprint" in blueprintable:
-        return Blueprint(blueprintable_string)
-    elif "deconstruction_planner" in blueprintable:
-        return DeconstructionPlanner(blueprintable_string)
-    elif "upgrade_planner" in blueprintable:
-        return UpgradePlanner(blueprintable_string)
-    elif "blueprint_book" in blueprintable:
-        return BlueprintBook(blueprintable_string)
+    blueprintable = utils.stream_string_to_JSON(blueprintable_string)
+    return get_blueprintable_from_JSON(blueprintable, lazy=lazy, trusted=trusted)
+
+
+@utils.reissue_warnings
+def get_blueprintable_from_JSON(blueprintable_JSON, lazy=False, trusted=False):
+    # type: (dict, bool, bool) -> Blueprintable
+    """
+    Gets a Blueprintable object from an already decoded blueprintable ``dict``,
+    such as the output of :py:func:`.utils.string_to_JSON`. The type of the
+    returned object is determined by the root key of the dict, in the same
+    way as :py:func:`get_blueprintable_from_string`.
+
+    :param blueprintable_JSON: The decoded blueprintable ``dict``.
+    :param lazy: Whether or not to defer the construction of entities in any
+        :py:class:`.Blueprint` until they are first accessed.
+    :param trusted: Whether or not to skip validation of the data, for strings
+        known to be exported by Factorio or Draftsman. See
+        :py:class:`.Blueprint` for more information.
+
+    :returns: A ``Blueprint``, ``DeconstructionPlanner``, ``UpgradePlanner``,
+        or ``BlueprintBook`` object.
+
+    :exception IncorrectBlueprintTypeError: If the root level of the dict is
+        neither ``"blueprint"``, ``"deconstruction_planner"``,
+        ``"upgrade_planner"``, nor ``"blueprint_book"``.
+    """
+    if "blueprint" in blueprintable_JSON:
+        return Blueprint(blueprintable_JSON["blueprint"], lazy=lazy, trusted=trusted)
+    elif "deconstruction_planner" in blueprintable_JSON:
+        return DeconstructionPlanner(blueprintable_JSON["deconstruction_planner"])
+    elif "upgrade_planner" in blueprintable_JSON:
+        return UpgradePlanner(blueprintable_JSON["upgrade_planner"])
+    elif "blueprint_book" in blueprintable_JSON:
+        return BlueprintBook(
+            blueprintable_JSON["blueprint_book"], lazy=lazy, trusted=trusted
+        )
     else:
         raise IncorrectBlueprintTypeError(
-            "Unknown blueprintable '{}'".format(list(blueprintable.keys())[0])
+            "Unknown blueprintable '{}'".format(list(blueprintable_JSON.keys())[0])
         )
+
+
+def iter_entities_from_string(blueprint_string):
+    # type: (str) -> Iterator[dict]
+    """
+    Yields the raw entity dicts of a blueprint string one at a time, without
+    decoding the entire string or constructing any :py:class:`.Entity`
+    objects. Useful for processing extremely large blueprints in bounded
+    memory. If the string is not a blueprint, nothing is yielded.
+
+    :param blueprint_string: The blueprint string to read.
+
+    :returns: A generator yielding each entity ``dict`` in the blueprint.
+
+    :exception MalformedBlueprintStringError: If the ``blueprint_string``
+        cannot be resolved due to an error with the zlib or JSON decompression.
+    """
+    chunks = utils.decode_string_chunks(blueprint_string)
+    return utils.iter_JSON_array(chunks, ("blueprint", "entities"))
+
+
+def iter_blueprintables_from_string(blueprint_book_string, lazy=False, trusted=False):
+    # type: (str, bool, bool) -> Iterator[Blueprintable]
+    """
+    Yields each Blueprintable inside of a blueprint book string one at a time.
+    Only one child Blueprintable is decoded and constructed at a time, so
+    arbitrarily large book exports can be processed in bounded memory, as long
+    as each child fits on its own. Nested blueprint books are yielded whole. If
+    the string is not a blueprint book, nothing is yielded.
+
+    :param blueprint_book_string: The blueprint book string to read.
+    :param lazy: Whether or not to defer the construction of entities in any
+        :py:class:`.Blueprint` until they are first accessed.
+    :param trusted: Whether or not to skip validation of the data, for strings
+        known to be exported by Factorio or Draftsman. See
+        :py:class:`.Blueprint` for more information.
+
+    :returns: A generator yielding a ``Blueprint``, ``DeconstructionPlanner``,
+        ``UpgradePlanner``, or ``BlueprintBook`` for each entry in the book.
+
+    :exception MalformedBlueprintStringError: If the ``blueprint_book_string``
+        cannot be resolved due to an error with the zlib or JSON decompression.
+    :exception IncorrectBlueprintTypeError: If an entry in the book is not a
+        recognized blueprintable.
+    """
+    chunks = utils.decode_string_chunks(blueprint_book_string)
+    for child in utils.iter_JSON_array(chunks, ("blueprint_book", "blueprints")):
+        child.pop("index", None)
+        yield get_blueprintable_from_JSON(child, lazy=lazy, trusted=trusted)
@@ -29,6 +29,14 @@ class Association(weakref.ref):
     def __deepcopy__(self, memo):
         return self
 
+    def __reduce__(self):
+        # Pickle the referenced entity itself; since it's also kept alive by
+        # its parent collection, the unpickled Association points to the same
+        # unpickled entity
+        if self() is None:
+            return (_dead_association, ())
+        return (Association, (self(),))
+
     # def __deepcopy__(self, memo):
     #     # type: (dict) -> Association
     #     entity = memo.get(id(self()), copy.deepcopy(self(), memo))
@@ -49,3 +57,16 @@ class Association(weakref.ref):
             type(self()).__name__,
             id(self()),
         )
+
+
+class _Placeholder(object):
+    pass
+
+
+def _dead_association():
+    # type: () -> Association
+    """
+    Creates an Association whose referenced object no longer exists, used to
+    unpickle Associations that were already dead when they were pickled.
+    """
+    return Association(_Placeholder())
@@ -87,19 +87,26 @@ from __future__ import unicode_literals
 from draftsman._factorio_version import __factorio_version_info__
 from draftsman.classes.association import Association
 from draftsman.classes.blueprintable import Blueprintable
+from draftsman.classes.compact_entitylist import CompactEntityList
 from draftsman.classes.entitylike import EntityLike
 from draftsman.classes.entitylist import EntityList
+from draftsman.classes.extents import Extents
 from draftsman.classes.tilelist import TileList
 from draftsman.classes.transformable import Transformable
 from draftsman.classes.collection import EntityCollection, TileCollection
+from draftsman.classes.spatial_backends import new_spatial_data_structure
 from draftsman.classes.spatial_data_structure import SpatialDataStructure
-from draftsman.classes.spatial_hashmap import SpatialHashMap
+# Unused since spatial backends became selectable; only kept so that existing
+# code importing it from this module keeps working
+from draftsman.classes.spatial_hashmap import SpatialHashMap  # noqa: F401
+from draftsman.classes.spatiallike import SpatialLike
 from draftsman.error import (
     DraftsmanError,
     UnreasonablySizedBlueprintError,
     DataFormatError,
     InvalidAssociationError,
 )
+from draftsman import geometry
 from draftsman import signatures
 from draftsman.tile import Tile
 from draftsman import utils
@@ -107,11 +114,11 @@ from draftsman.warning import DraftsmanWarning
 
 from builtins import int
 import copy
+import itertools
 import math
 from schema import SchemaError
 import six
-from typing import Sequence, Union
-import warnings
+from typing import Callable, Sequence, Union
 
 
 class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
@@ -126,17 +133,72 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
     # =========================================================================
 
     @utils.reissue_warnings
-    def __init__(self, blueprint=None):
-        # type: (Union[str, dict]) -> None
+    def __init__(
+        self,
+        blueprint=None,
+        lazy=False,
+        trusted=False,
+        compact=False,
+        spatial_backend="hashmap",
+    ):
+        # type: (Union[str, dict], bool, bool, bool, Union[str, Callable]) -> None
         """
         Creates a ``Blueprint`` class. Will load the data from ``blueprint`` if
         provided, and otherwise initializes itself with defaults. ``blueprint``
         can be either an encoded blueprint string or a dict object containing
         the desired key-value pairs.
 
+        If ``lazy`` is ``True``, the entities in ``blueprint`` are kept as raw
+        dicts and are only constructed the first time they are needed, such as
+        when accessing :py:attr:`entities`, :py:attr:`entity_map`,
+        :py:attr:`area`, or when exporting. This makes reading metadata like
+        :py:attr:`label` or :py:attr:`icons` much cheaper, but any warnings or
+        errors caused by the entities are only issued when they are loaded.
+
+        If ``trusted`` is ``True``, ``blueprint`` is assumed to already be in
+        the exact format that Factorio or Draftsman exports, such as a string
+        copied straight out of the game. Its data is then stored as-is without
+        being validated or normalized (see
+        :py:func:`.signatures.set_validation_enabled`), no warnings are issued,
+        and entities are added without being checked for overlap. This makes
+        loading large blueprints much faster, but any problems with the data
+        go unnoticed until :py:meth:`validate` is called. If ``blueprint`` is a
+        ``dict``, its contents become part of the Blueprint and may be
+        modified.
+
+        If ``compact`` is ``True``, :py:attr:`entities` is a
+        :py:class:`.CompactEntityList` instead of an :py:class:`.EntityList`,
+        which stores the entities in arrays instead of as :py:class:`.Entity`
+        objects. This uses a fraction of the memory, but the entities are not
+        validated, and only the Blueprint's metadata, tiles, area, and export
+        functions are supported. :py:attr:`entity_map` queries do not include
+        the compact entities, and transformations, filtered searches, and
+        connection functions raise a :py:class:`.DraftsmanError`. ``lazy`` has
+        no effect on compact blueprints.
+
+        ``spatial_backend`` selects the :py:class:`.SpatialDataStructure` used
+        for :py:attr:`entity_map` and :py:attr:`tile_map`; see
+        :py:mod:`.spatial_backends`. If it's ``"auto"``, each one is chosen to
+        suit the distribution of the entities or tiles whenever
+        :py:attr:`entities` or :py:attr:`tiles` are set (or loaded).
+
         :param blueprint_string: Either a Factorio-format blueprint string or a
             ``dict`` object with the desired keys in the correct format.
+        :param lazy: Whether or not to defer the construction of the entities
+            in ``blueprint`` until they are first accessed.
+        :param trusted: Whether or not to skip validation of ``blueprint``.
+        :param compact: Whether or not to store the entities in a
+            :py:class:`.CompactEntityList`.
+        :param spatial_backend: The name of a spatial backend, ``"auto"``, or a
+            callable which returns a new :py:class:`.SpatialDataStructure`.
+
+        :exception ValueError: If ``spatial_backend`` is not a known backend.
         """
+        self._lazy = lazy
+        self._trusted = trusted
+        self._compact = compact
+        self._spatial_backend = spatial_backend
+
         super(Blueprint, self).__init__(
             root_item="blueprint", item="blueprint", init_data=blueprint
         )
@@ -186,15 +248,35 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
         self._area = None
         self._tile_width = 0
         self._tile_height = 0
+        # The bounding boxes of every entity and tile, so that the area can be
+        # updated when one is removed
+        self._extents = Extents()
+        # Whether or not the area and extents need to be recalculated, either
+        # because a compact entity has changed or because the extents refer to
+        # objects of another blueprint (after being copied or pickled)
+        self._area_outdated = False
+        # Raw entity dicts that have yet to be loaded (if lazy)
+        self._unloaded_entities = None
 
         ### DATA ###
         # Create spatial hashing objects to make spatial queries much quicker
-        self._tile_map = SpatialHashMap()
-        self._entity_map = SpatialHashMap()
+        self._tile_map = new_spatial_data_structure(self._spatial_backend)
+        self._entity_map = new_spatial_data_structure(self._spatial_backend)
 
         # Data lists
-        if "entities" in kwargs:
-            self._root["entities"] = EntityList(self, kwargs.pop("entities"))
+        if self._compact:
+            self._root["entities"] = CompactEntityList(
+                self, kwargs.pop("entities", None)
+            )
+        elif "entities" in kwargs and self._lazy:
+            # Keep the raw entity dicts until they're actually needed
+            self._unloaded_entities = kwargs.pop("entities")
+            self._root["entities"] = EntityList(self)
+            self._root["entities"]._unloaded = self._unloaded_entities
+        elif "entities" in kwargs:
+            self._root["entities"] = EntityList(
+                self, kwargs.pop("entities"), trusted=self._trusted
+            )
         else:
             self._root["entities"] = EntityList(self)
 
@@ -203,6 +285,8 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
         else:
             self._root["tiles"] = TileList(self)
 
+        self._tune_spatial_maps()
+
         if "schedules" in kwargs:
             self._root["schedules"] = kwargs.pop("schedules")
         else:
@@ -210,39 +294,17 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
 
         # Issue warnings for any keyword not recognized by Blueprint
         for unused_arg in kwargs:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
             )
 
-        # Convert circuit and power connections to Associations
-        for entity in self.entities:
-            if hasattr(entity, "connections"):  # Wire connections
-                connections = entity.connections
-                for side in connections:
-                    if side in {"1", "2"}:
-                        for color in connections[side]:
-                            connection_points = connections[side][color]
-                            for point in connection_points:
-                                old = point["entity_id"] - 1
-                                point["entity_id"] = Association(self.entities[old])
-
-                    elif side in {"Cu0", "Cu1"}:  # pragma: no branch
-                        connection_points = connections[side]
-                        for point in connection_points:
-                            old = point["entity_id"] - 1
-                            point["entity_id"] = Association(self.entities[old])
-
-            if hasattr(entity, "neighbours"):  # Power pole connections
-                neighbours = entity.neighbours
-                for i, neighbour in enumerate(neighbours):
-                    neighbours[i] = Association(self.entities[neighbour - 1])
-
-        # Change all locomotive numbers to use Associations
-        for schedule in self.schedules:
-            for i, locomotive in enumerate(schedule["locomotives"]):
-                schedule["locomotives"][i] = Association(self.entities[locomotive - 1])
+        # Convert all entity numbers to Associations, unless we're waiting
+        # until the entities are loaded
+        # Compact entities always refer to each other by entity number
+        if self._unloaded_entities is None and not self._compact:
+            self._resolve_associations()
 
     # =========================================================================
     # Blueprint properties
@@ -447,24 +509,33 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
         of a regular list, as well as some extra features. For more information
         on ``EntityList``, check out this writeup
         :ref:`here <handbook.blueprints.blueprint_differences>`.
+
+        If the Blueprint is ``lazy``, its entities are constructed when the
+        list is first used; getting its length does not construct them.
         """
         return self._root["entities"]
 
     @entities.setter
     def entities(self, value):
         # type: (list[EntityLike]) -> None
+        self._load_entities()
         self._entity_map.clear()
 
         if value is None:
             self._root["entities"].clear()
+        elif self._compact and isinstance(value, (list, CompactEntityList)):
+            self._root["entities"] = CompactEntityList(self, value)
         elif isinstance(value, list):
             self._root["entities"] = EntityList(self, value)
         elif isinstance(value, EntityList):
+            # Copy the other list's entities, not the ones it hasn't loaded yet
+            value._load()
             # Just don't ask
             self._root["entities"] = copy.deepcopy(value, memo={"new_parent": self})
         else:
             raise TypeError("'entities' must be an EntityList, list, or None")
 
+        self._tune_spatial_maps(tiles=False)
         self.recalculate_area()
 
     def on_entity_insert(self, entitylike, merge):
@@ -490,21 +561,83 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
         # If no errors, add this to hashmap (as well as any of it's children)
         self.entity_map.recursive_add(entitylike)
 
-        # Update dimensions of Blueprint
-        self._area = utils.extend_aabb(self._area, entitylike.get_world_bounding_box())
-        (
-            self._tile_width,
-            self._tile_height,
-        ) = utils.aabb_to_dimensions(self._area)
+        # Update dimensions of Blueprint, unless they're going to be
+        # recalculated anyway
+        if self._area_outdated:
+            return entitylike
+
+        bounding_box = entitylike.get_world_bounding_box()
+        area = utils.extend_aabb(self._area, bounding_box)
+        tile_width, tile_height = utils.aabb_to_dimensions(area)
         # Check the blueprint for unreasonable size
-        if self._tile_width > 10000 or self._tile_height > 10000:
+        if tile_width > 10000 or tile_height > 10000:
             raise UnreasonablySizedBlueprintError(
                 "Current blueprint dimensions ({}, {}) exceeds the maximum size"
-                " (10,000 x 10,000)".format(self._tile_width, self._tile_height)
+                " (10,000 x 10,000)".format(tile_width, tile_height)
             )
 
+        self._area = area
+        self._tile_width, self._tile_height = tile_width, tile_height
+        self._extents.add(id(entitylike), bounding_box)
+
         return entitylike
 
+    def on_entities_insert(self, entitylikes, trusted=False):
+        # type: (list[EntityLike], bool) -> list[EntityLike]
+        """
+        Callback function for when multiple :py:class:`.EntityLike` are added to
+        this Blueprint's :py:attr:`entities` list at once. Equivalent to calling
+        :py:meth:`on_entity_insert` on each entity without merging, but adds
+        them to :py:attr:`entity_map` and checks them for overlap in a single
+        pass. If ``trusted`` is ``True``, the entities are added without any
+        entity-specific checks or overlap checks.
+
+        :raises UnreasonablySizedBlueprintError: If inserting the new entities
+            causes the blueprint to exceed 10,000 x 10,000 tiles in dimension.
+        """
+        # Check the new dimensions of the Blueprint before modifying anything
+        area = self._area
+        bounding_boxes = []
+        for entitylike in entitylikes:
+            bounding_box = entitylike.get_world_bounding_box()
+            bounding_boxes.append(bounding_box)
+            area = utils.extend_aabb(area, bounding_box)
+        tile_width, tile_height = utils.aabb_to_dimensions(area)
+        if tile_width > 10000 or tile_height > 10000:
+            raise UnreasonablySizedBlueprintError(
+                "Current blueprint dimensions ({}, {}) exceeds the maximum size"
+                " (10,000 x 10,000)".format(tile_width, tile_height)
+            )
+
+        if trusted:
+            for entitylike in entitylikes:
+                self.entity_map.recursive_add(entitylike)
+        else:
+            # Issue entity-specific warnings/errors if any exist for each
+            # entitylike
+            for entitylike in entitylikes:
+                entitylike.on_insert(self)
+
+            # Add all of them to the hashmap, issuing overlapping warnings
+            self.entity_map.recursive_add_batch(entitylikes)
+
+        self._area = area
+        self._tile_width, self._tile_height = tile_width, tile_height
+        for entitylike, bounding_box in zip(entitylikes, bounding_boxes):
+            self._extents.add(id(entitylike), bounding_box)
+
+        return entitylikes
+
+    def on_compact_entity_change(self):
+        # type: () -> None
+        """
+        Callback function for when entities are added to, removed from, or
+        modified inside of a compact :py:attr:`entities` list. Rather than
+        recalculating the area of the Blueprint each time, it is recalculated
+        the next time it's accessed.
+        """
+        self._area_outdated = True
+
     def on_entity_set(self, old_entitylike, new_entitylike):
         # type: (EntityLike, EntityLike) -> None
         """
@@ -512,7 +645,13 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
         a Blueprint's :py:attr:`entities` list. Handles the removal of the old
         ``EntityLike`` from :py:attr:`entity_map` and adds the new one in it's
         stead.
+
+        :raises UnreasonablySizedBlueprintError: If replacing the entity causes
+            the blueprint to exceed 10,000 x 10,000 tiles in dimension.
         """
+        # Check the new dimensions of the Blueprint before modifying anything
+        self._replace_extents(old_entitylike, new_entitylike)
+
         # Remove the entity and its children
         self.entity_map.recursive_remove(old_entitylike)
 
@@ -528,9 +667,6 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
         # Add the new entity and its children
         self.entity_map.recursive_add(new_entitylike)
 
-        # Disdain
-        # self.recalculate_area()
-
     def on_entity_remove(self, entitylike):
         # type: (EntityLike) -> None
         """
@@ -547,8 +683,8 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
         # Perform any remove checks on per entity basis
         entitylike.on_remove(self)
 
-        # This sucks lmao
-        # self.recalculate_area()
+        # Update dimensions of Blueprint
+        self._remove_extents(entitylike)
 
     # =========================================================================
 
@@ -559,6 +695,7 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
         An implementation of :py:class:`.SpatialDataStructure` for ``entities``.
         Not exported; read only.
         """
+        self._load_entities()
         return self._entity_map
 
     # =========================================================================
@@ -601,6 +738,7 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
         else:
             raise TypeError("'tiles' must be a TileList, list, or None")
 
+        self._tune_spatial_maps(entities=False)
         self.recalculate_area()
 
     def on_tile_insert(self, tile, merge):
@@ -622,20 +760,25 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
         # Add to tile map
         self.tile_map.add(tile)
 
-        # Update dimensions
-        self._area = utils.extend_aabb(self._area, tile.get_world_bounding_box())
-        (
-            self._tile_width,
-            self._tile_height,
-        ) = utils.aabb_to_dimensions(self.area)
+        # Update dimensions, unless they're going to be recalculated anyway
+        if self._area_outdated:
+            return tile
+
+        bounding_box = tile.get_world_bounding_box()
+        area = utils.extend_aabb(self._area, bounding_box)
+        tile_width, tile_height = utils.aabb_to_dimensions(area)
 
         # Check the blueprint for unreasonable size
-        if self._tile_width > 10000 or self._tile_height > 10000:
+        if tile_width > 10000 or tile_height > 10000:
             raise UnreasonablySizedBlueprintError(
                 "Current blueprint dimensions ({}, {}) exceeds the maximum size"
-                " (10,000 x 10,000)".format(self._tile_width, self._tile_height)
+                " (10,000 x 10,000)".format(tile_width, tile_height)
             )
 
+        self._area = area
+        self._tile_width, self._tile_height = tile_width, tile_height
+        self._extents.add(id(tile), bounding_box)
+
         return tile
 
     def on_tile_set(self, old_tile, new_tile):
@@ -644,15 +787,17 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
         Callback function for when a :py:class:`.Tile` is overwritten in a
         Blueprint's :py:attr:`tiles` list. Handles the removal of the old ``Tile``
         from :py:attr:`tile_map` and adds the new one in it's stead.
+
+        :raises UnreasonablySizedBlueprintError: If replacing the tile causes
+            the blueprint to exceed 10,000 x 10,000 tiles in dimension.
         """
+        # Check the new dimensions of the Blueprint before modifying anything
+        self._replace_extents(old_tile, new_tile)
+
         self.tile_map.remove(old_tile)
         self.tile_map.handle_overlapping(new_tile, False)
         self.tile_map.add(new_tile)
 
-        # Unfortunately, this can't be here because we need to recalculate after
-        # modifying the base list, which happens *after* this function finishes
-        # self.recalculate_area() # TODO
-
     def on_tile_remove(self, tile):
         # type: (Tile) -> None
         """
@@ -662,8 +807,21 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
         """
         self.tile_map.remove(tile)
 
-        # Disdain...
-        # self.recalculate_area() # TODO
+        # Update dimensions
+        self._remove_extents(tile)
+
+    def on_transform(self):
+        # type: () -> None
+        """
+        Callback function for when a Blueprint has been translated, rotated, or
+        flipped. Rebuilds the :py:attr:`entity_map` and :py:attr:`tile_map`
+        once every object has moved. Transforms never change the size of a
+        Blueprint, so its ``area`` is only recalculated when it is next
+        accessed.
+        """
+        self.entity_map.rebuild(self.entities)
+        self.tile_map.rebuild(self.tiles)
+        self._area_outdated = True
 
     # =========================================================================
 
@@ -703,6 +861,7 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
         :exception DataFormatError: If set to anything other than a ``list`` of
             :py:data:`.SCHEDULE`.
         """
+        self._load_entities()
         return self._root["schedules"]
 
     @schedules.setter
@@ -732,6 +891,9 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
 
         :type: ``list[list[float, float], list[float, float]]``
         """
+        self._load_entities()
+        if self._area_outdated:
+            self.recalculate_area()
         return self._area
 
     # =========================================================================
@@ -745,6 +907,9 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
 
         :type: ``int``
         """
+        self._load_entities()
+        if self._area_outdated:
+            self.recalculate_area()
         return self._tile_width
 
     # =========================================================================
@@ -758,6 +923,9 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
 
         :type: ``int``
         """
+        self._load_entities()
+        if self._area_outdated:
+            self.recalculate_area()
         return self._tile_height
 
     # =========================================================================
@@ -779,6 +947,104 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
 
         return False
 
+    # =========================================================================
+
+    @property
+    def flippable(self):
+        # type: () -> bool
+        self._check_not_compact("flippable")
+        return super(Blueprint, self).flippable
+
+    # =========================================================================
+    # Transformations, searches, and connections
+    # =========================================================================
+
+    # Each of these needs the full interface of every entity, which compact
+    # entities don't have
+
+    def translate(self, x, y):
+        # type: (int, int) -> None
+        self._check_not_compact("translate()")
+        super(Blueprint, self).translate(x, y)
+
+    def rotate(self, angle):
+        # type: (int) -> None
+        self._check_not_compact("rotate()")
+        super(Blueprint, self).rotate(angle)
+
+    def flip(self, direction="horizontal"):
+        # type: (str) -> None
+        self._check_not_compact("flip()")
+        super(Blueprint, self).flip(direction)
+
+    def find_entity(self, name, position):
+        # type: (str, Union[Vector, PrimitiveVector]) -> EntityLike
+        self._check_not_compact("find_entity()")
+        return super(Blueprint, self).find_entity(name, position)
+
+    def find_entity_at_position(self, position):
+        # type: (Union[Vector, PrimitiveVector]) -> EntityLike
+        self._check_not_compact("find_entity_at_position()")
+        return super(Blueprint, self).find_entity_at_position(position)
+
+    def find_entities(self, aabb=None):
+        # type: (Union[AABB, PrimitiveAABB]) -> list[EntityLike]
+        self._check_not_compact("find_entities()")
+        return super(Blueprint, self).find_entities(aabb)
+
+    def find_entities_filtered(self, **kwargs):
+        # type: (**dict) -> list[EntityLike]
+        self._check_not_compact("find_entities_filtered()")
+        return super(Blueprint, self).find_entities_filtered(**kwargs)
+
+    def find_entities_filtered_batch(
+        self, areas=None, positions=None, radius=None, **kwargs
+    ):
+        # type: (list, list, Union[float, list[float]], **dict) -> list[list[EntityLike]]
+        self._check_not_compact("find_entities_filtered_batch()")
+        return super(Blueprint, self).find_entities_filtered_batch(
+            areas, positions, radius, **kwargs
+        )
+
+    def add_power_connection(self, entity_1, entity_2, side=1):
+        # type: (Union[EntityLike, int, str], Union[EntityLike, int, str], int) -> None
+        self._check_not_compact("add_power_connection()")
+        super(Blueprint, self).add_power_connection(entity_1, entity_2, side)
+
+    def remove_power_connection(self, entity_1, entity_2, side=1):
+        # type: (Union[EntityLike, int, str], Union[EntityLike, int, str], int) -> None
+        self._check_not_compact("remove_power_connection()")
+        super(Blueprint, self).remove_power_connection(entity_1, entity_2, side)
+
+    def remove_power_connections(self):
+        # type: () -> None
+        self._check_not_compact("remove_power_connections()")
+        super(Blueprint, self).remove_power_connections()
+
+    def generate_power_connections(self, prefer_axis=True, only_axis=False):
+        # type: (bool, bool) -> None
+        self._check_not_compact("generate_power_connections()")
+        super(Blueprint, self).generate_power_connections(prefer_axis, only_axis)
+
+    def add_circuit_connection(self, color, entity_1, entity_2, side1=1, side2=1):
+        # type: (str, Union[EntityLike, int, str], Union[EntityLike, int, str], int, int) -> None
+        self._check_not_compact("add_circuit_connection()")
+        super(Blueprint, self).add_circuit_connection(
+            color, entity_1, entity_2, side1, side2
+        )
+
+    def remove_circuit_connection(self, color, entity_1, entity_2, side1=1, side2=1):
+        # type: (str, Union[EntityLike, int, str], Union[EntityLike, int, str], int, int) -> None
+        self._check_not_compact("remove_circuit_connection()")
+        super(Blueprint, self).remove_circuit_connection(
+            color, entity_1, entity_2, side1, side2
+        )
+
+    def remove_circuit_connections(self):
+        # type: () -> None
+        self._check_not_compact("remove_circuit_connections()")
+        super(Blueprint, self).remove_circuit_connections()
+
     # =========================================================================
     # Utility functions
     # =========================================================================
@@ -786,16 +1052,25 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
     def recalculate_area(self):
         # type: () -> None
         """
-        Recalculates the ``area``, ``tile_width``, and ``tile_height``. Called
-        automatically when an EntityLike or Tile object is altered or removed.
-        Can be called by the end user, though it shouldn't be neccessary.
+        Recalculates the ``area``, ``tile_width``, and ``tile_height`` from
+        every entity and tile. Called automatically when ``entities`` or
+        ``tiles`` are set or transformed; removing or replacing a single
+        EntityLike or Tile only updates the dimensions with its own bounding
+        box. Can be called by the end user, though it shouldn't be neccessary.
         """
-        self._area = None
-        for entity in self.entities:
-            self._area = utils.extend_aabb(self._area, entity.get_world_bounding_box())
-
-        for tile in self.tiles:
-            self._area = utils.extend_aabb(self._area, tile.get_world_bounding_box())
+        self._extents.clear()
+        if self._compact:
+            # Compact entities are only ever measured all at once, so they share
+            # a single bounding box
+            boxes = self.entities.get_world_bounding_boxes()
+            self._extents.add(id(self.entities), geometry.bounding_box(boxes))
+            spatial_likes = self.tiles
+        else:
+            spatial_likes = itertools.chain(self.entities, self.tiles)
+        for spatial_like in spatial_likes:
+            self._extents.add(id(spatial_like), spatial_like.get_world_bounding_box())
+        self._area = self._extents.get_bounding_box()
+        self._area_outdated = False
 
         self._tile_width, self._tile_height = utils.aabb_to_dimensions(self._area)
 
@@ -815,6 +1090,8 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
 
         :returns: The ``dict`` representation of the Blueprint.
         """
+        self._load_entities()
+
         # Create a new dict to return without modifying the original Blueprint
         # (We exclude "entities" and "tiles" because these objects are not
         # copyable for space and recursion depth reasons)
@@ -822,11 +1099,18 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
             x: self._root[x] for x in self._root if x not in {"entities", "tiles"}
         }
 
-        # This associates each entity with a numeric index, which we use later
-        flattened_list = utils.flatten_entities(self._root["entities"])
+        # Compact entities are exported straight from their arrays, and already
+        # refer to each other by entity number
+        if self._compact:
+            flattened_list = []
+            out_dict["entities"] = self._root["entities"].to_dicts()
+        else:
+            # This associates each entity with a numeric index, which we use
+            # later
+            flattened_list = utils.flatten_entities(self._root["entities"])
+            out_dict["entities"] = []
 
         # Convert all Entities into dicts
-        out_dict["entities"] = []
         i = 0
         for entity in flattened_list:
             # Get a copy of the dict representation of the Entity
@@ -861,63 +1145,206 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
                 tile["position"]["x"] -= self.snapping_grid_position["x"]
                 tile["position"]["y"] -= self.snapping_grid_position["y"]
 
-        def throw_invalid_connection(entity):
-            raise InvalidAssociationError(
-                "'{}' at {} is connected to an entity that no longer exists".format(
-                    entity["name"], entity["position"]
+        # Compact entities (and schedules) already use entity numbers
+        if not self._compact:
+
+            def throw_invalid_connection(owner):
+                # `owner` is either an entity dict or a description of a
+                # schedule
+                if isinstance(owner, dict):
+                    owner = "'{}' at {}".format(owner["name"], owner["position"])
+                raise InvalidAssociationError(
+                    "{} is connected to an entity that no longer exists".format(owner)
                 )
+
+            # Map each entity (by identity) to its exported entity_number so that
+            # every association can be resolved in constant time
+            entity_numbers = {
+                id(entity): i + 1 for i, entity in enumerate(flattened_list)
+            }
+
+            def resolve_association(owner, association):
+                try:
+                    return entity_numbers[id(association())]
+                except KeyError:
+                    # Either the associated entity no longer exists, or it is not
+                    # contained within this blueprint
+                    throw_invalid_connection(owner)
+
+            # Convert all associations to use their integer indices
+            for entity in out_dict["entities"]:
+                if "connections" in entity:  # Wire connections
+                    connections = entity["connections"]
+                    for side in connections:
+                        if side in {"1", "2"}:
+                            for color in connections[side]:
+                                connection_points = connections[side][color]
+                                for point in connection_points:
+                                    old = point["entity_id"]
+                                    point["entity_id"] = resolve_association(
+                                        entity, old
+                                    )
+
+                        elif side in {"Cu0", "Cu1"}:  # pragma: no branch
+                            connection_points = connections[side]
+                            for point in connection_points:
+                                old = point["entity_id"]
+                                point["entity_id"] = resolve_association(entity, old)
+
+                if "neighbours" in entity:  # Power pole connections
+                    neighbours = entity["neighbours"]
+                    for i, neighbour in enumerate(neighbours):
+                        neighbours[i] = resolve_association(entity, neighbour)
+
+            # Change all locomotive names to use entity_number
+            for j, schedule in enumerate(out_dict["schedules"]):
+                locomotives = schedule["locomotives"]
+                for i, locomotive in enumerate(locomotives):
+                    locomotives[i] = resolve_association(
+                        "Schedule {}".format(j), locomotive
+                    )
+
+        # Delete empty entries to compress as much as possible
+        if len(out_dict["entities"]) == 0:
+            del out_dict["entities"]
+        if len(out_dict["tiles"]) == 0:
+            del out_dict["tiles"]
+        if len(out_dict["schedules"]) == 0:
+            del out_dict["schedules"]
+
+        return {"blueprint": out_dict}
+
+    def _check_not_compact(self, feature):
+        # type: (str) -> None
+        """
+        Raises a :py:class:`.DraftsmanError` saying that ``feature`` is not
+        supported if this is a compact blueprint.
+        """
+        if self._compact:
+            raise DraftsmanError(
+                "{} is not supported on compact blueprints".format(feature)
+            )
+
+    def _load_entities(self):
+        # type: () -> None
+        """
+        Constructs all of the entities whose loading was deferred by ``lazy``,
+        and then converts the entity numbers in their connections and in
+        :py:attr:`schedules` to Associations. Does nothing if there are no
+        unloaded entities.
+        """
+        if self._unloaded_entities is None:
+            return
+
+        # Clear first, so that accessing `entities` below doesn't recurse
+        entities = self._unloaded_entities
+        self._unloaded_entities = None
+        self._root["entities"]._unloaded = None
+
+        with self._trusted_context():
+            self._root["entities"].extend_from_dicts(entities, trusted=self._trusted)
+        self._tune_spatial_maps(tiles=False)
+        self._resolve_associations()
+
+    def _tune_spatial_maps(self, entities=True, tiles=True):
+        # type: (bool, bool) -> None
+        """
+        Replaces :py:attr:`entity_map` and/or :py:attr:`tile_map` with the
+        structures best suited to the current entities and tiles, if
+        ``spatial_backend`` is ``"auto"``. Does nothing otherwise, or for
+        entities that are unloaded or compact.
+        """
+        if self._spatial_backend != "auto":
+            return
+
+        if entities and self._unloaded_entities is None and not self._compact:
+            self._entity_map = new_spatial_data_structure(
+                "auto", self._root["entities"]
             )
+        if tiles:
+            self._tile_map = new_spatial_data_structure("auto", self._root["tiles"])
 
-        # Convert all associations to use their integer indices
-        # (This could be nicer)
-        for entity in out_dict["entities"]:
-            if "connections" in entity:  # Wire connections
-                connections = entity["connections"]
+    def _resolve_associations(self):
+        # type: () -> None
+        """
+        Converts the entity numbers of every circuit and power connection, as
+        well as every locomotive in :py:attr:`schedules`, into Associations
+        pointing to the corresponding entities.
+        """
+        # Convert circuit and power connections to Associations
+        for entity in self.entities:
+            if hasattr(entity, "connections"):  # Wire connections
+                connections = entity.connections
                 for side in connections:
                     if side in {"1", "2"}:
                         for color in connections[side]:
                             connection_points = connections[side][color]
                             for point in connection_points:
-                                old = point["entity_id"]
-                                if old() is None:  # pragma: no coverage
-                                    throw_invalid_connection(entity)
-                                else:  # Association
-                                    point["entity_id"] = flattened_list.index(old()) + 1
+                                old = point["entity_id"] - 1
+                                point["entity_id"] = Association(self.entities[old])
 
                     elif side in {"Cu0", "Cu1"}:  # pragma: no branch
                         connection_points = connections[side]
                         for point in connection_points:
-                            old = point["entity_id"]
-                            if old() is None:  # pragma: no coverage
-                                throw_invalid_connection(entity)
-                            else:  # Association
-                                point["entity_id"] = flattened_list.index(old()) + 1
-
-            if "neighbours" in entity:  # Power pole connections
-                neighbours = entity["neighbours"]
+                            old = point["entity_id"] - 1
+                            point["entity_id"] = Association(self.entities[old])
+
+            if hasattr(entity, "neighbours"):  # Power pole connections
+                neighbours = entity.neighbours
                 for i, neighbour in enumerate(neighbours):
-                    if neighbour() is None:  # pragma: no coverage
-                        throw_invalid_connection(entity)
-                    else:  # Association
-                        neighbours[i] = flattened_list.index(neighbour()) + 1
+                    neighbours[i] = Association(self.entities[neighbour - 1])
 
-        # Change all locomotive names to use entity_number
-        for schedule in out_dict["schedules"]:
+        # Change all locomotive numbers to use Associations
+        for schedule in self.schedules:
             for i, locomotive in enumerate(schedule["locomotives"]):
-                if locomotive() is None:  # pragma: no coverage
-                    throw_invalid_connection(entity)
-                else:  # Association
-                    schedule["locomotives"][i] = flattened_list.index(locomotive()) + 1
+                schedule["locomotives"][i] = Association(self.entities[locomotive - 1])
 
-        # Delete empty entries to compress as much as possible
-        if len(out_dict["entities"]) == 0:
-            del out_dict["entities"]
-        if len(out_dict["tiles"]) == 0:
-            del out_dict["tiles"]
-        if len(out_dict["schedules"]) == 0:
-            del out_dict["schedules"]
+    def _remove_extents(self, spatial_like):
+        # type: (SpatialLike) -> None
+        """
+        Removes the bounding box of an entity or tile that is being removed
+        from the Blueprint, and updates the Blueprint's dimensions without
+        checking every other entity and tile.
+        """
+        if self._area_outdated:
+            return
 
-        return {"blueprint": out_dict}
+        self._extents.remove(id(spatial_like))
+        self._area = self._extents.get_bounding_box()
+        self._tile_width, self._tile_height = utils.aabb_to_dimensions(self._area)
+
+    def _replace_extents(self, old_spatial_like, new_spatial_like):
+        # type: (SpatialLike, SpatialLike) -> None
+        """
+        Replaces the bounding box of an entity or tile with that of the one
+        replacing it, and updates the Blueprint's dimensions. If the new
+        dimensions are too large, the bounding boxes are left unchanged.
+
+        :raises UnreasonablySizedBlueprintError: If the new dimensions exceed
+            10,000 x 10,000 tiles.
+        """
+        if self._area_outdated:
+            return
+
+        self._extents.remove(id(old_spatial_like))
+        self._extents.add(
+            id(new_spatial_like), new_spatial_like.get_world_bounding_box()
+        )
+        area = self._extents.get_bounding_box()
+        tile_width, tile_height = utils.aabb_to_dimensions(area)
+
+        if tile_width > 10000 or tile_height > 10000:
+            self._extents.remove(id(new_spatial_like))
+            self._extents.add(
+                id(old_spatial_like), old_spatial_like.get_world_bounding_box()
+            )
+            raise UnreasonablySizedBlueprintError(
+                "Current blueprint dimensions ({}, {}) exceeds the maximum size"
+                " (10,000 x 10,000)".format(tile_width, tile_height)
+            )
+
+        self._area = area
+        self._tile_width, self._tile_height = tile_width, tile_height
 
     def __deepcopy__(self, memo):
         # type: (dict) -> Blueprint
@@ -932,7 +1359,7 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
         # OverlappingEntitiesWarnings
         v = getattr(self, "_entity_map")
         setattr(result, "_entity_map", copy.deepcopy(v, memo))
-        result.entity_map.clear()
+        result._entity_map.clear()
 
         # We copy everything else, save for the 'root' dictionary, because
         # deepcopying those depend on some of the other attributes, so we load
@@ -940,6 +1367,9 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
         for k, v in self.__dict__.items():
             if k == "_entity_map" or k == "_root":
                 continue
+            elif k == "_extents":
+                # Extents are keyed by the identity of each entity and tile
+                result._extents = Extents()
             else:
                 setattr(result, k, copy.deepcopy(v, memo))
 
@@ -956,5 +1386,16 @@ class Blueprint(Transformable, TileCollection, EntityCollection, Blueprintable):
             else:
                 copied_dict[rk] = copy.deepcopy(rv, memo)
         setattr(result, "_root", copied_dict)
+        # The tiles were copied without being added to the new extents
+        result._area_outdated = True
 
         return result
+
+    def __getstate__(self):
+        # type: () -> dict
+        state = self.__dict__.copy()
+        # The identity of each entity and tile is not preserved when pickling,
+        # so the extents are recalculated when next needed
+        state["_extents"] = Extents()
+        state["_area_outdated"] = True
+        return state
@@ -8,6 +8,7 @@ from draftsman import signatures
 from draftsman import utils
 
 from abc import ABCMeta, abstractmethod
+from contextlib import contextmanager
 
 # import deal # TODO
 import json
@@ -27,6 +28,10 @@ class Blueprintable(object):
     are) overwritten in select circumstances.
     """
 
+    # Whether or not the data this blueprintable is loaded from is trusted;
+    # set by subclasses that support the `trusted` option
+    _trusted = False
+
     @utils.reissue_warnings
     def __init__(self, root_item, item, init_data=None):
         # type: (str, str, Union[str, dict]) -> None
@@ -42,18 +47,58 @@ class Blueprintable(object):
         self._root_item = six.text_type(root_item)
         self._root["item"] = six.text_type(item)
 
-        if init_data is None:
-            self.setup()
-        elif isinstance(init_data, six.string_types):
-            self.load_from_string(init_data)
-        elif isinstance(init_data, dict):
-            self.setup(**init_data)
-        else:
-            raise TypeError(
-                "'{}' must be a factorio blueprint string, a dictionary, or None".format(
-                    self._root_item
+        with self._trusted_context():
+            if init_data is None:
+                self.setup()
+            elif isinstance(init_data, six.string_types):
+                self.load_from_string(init_data)
+            elif isinstance(init_data, dict):
+                self.setup(**init_data)
+            else:
+                raise TypeError(
+                    "'{}' must be a factorio blueprint string, a dictionary, or "
+                    "None".format(self._root_item)
                 )
-            )
+
+    @contextmanager
+    def _trusted_context(self):
+        """
+        Context manager for loading trusted data. If this blueprintable is
+        trusted, validation is disabled (see
+        :py:func:`.signatures.set_validation_enabled`) and any warnings are
+        discarded (see :py:func:`.utils.discard_warnings`) for the duration of
+        the ``with`` block; otherwise, does nothing.
+        """
+        if not self._trusted:
+            yield
+            return
+        with utils.discard_warnings(), signatures.validation_disabled():
+            yield
+
+    @utils.reissue_warnings
+    def validate(self):
+        # type: () -> None
+        """
+        Validates and normalizes the entire blueprintable by loading it again
+        from its own :py:meth:`to_dict` output, issuing the same warnings and
+        raising the same errors as loading it without ``trusted``. Afterwards,
+        the blueprintable is no longer considered trusted. If an error is
+        raised, the blueprintable is left unchanged.
+
+        Any existing references to the contents of the blueprintable, such as
+        entities, refer to the old objects and should be retrieved again.
+
+        :exception DataFormatError: If any of the data is in an invalid format.
+        """
+        data = self.to_dict()[self._root_item]
+        state = dict(self.__dict__)
+        try:
+            self._trusted = False
+            self.setup(**data)
+        except Exception:
+            self.__dict__.clear()
+            self.__dict__.update(state)
+            raise
 
     @utils.reissue_warnings
     def load_from_string(self, string):
@@ -71,7 +116,7 @@ class Blueprintable(object):
         :exception IncorrectBlueprintTypeError: If the input string is of a
             different type than the base class.
         """
-        root = utils.string_to_JSON(string)
+        root = utils.stream_string_to_JSON(string)
         # Ensure that the blueprint string actually points to a blueprint
         if self._root_item not in root:
             raise IncorrectBlueprintTypeError(
@@ -369,13 +414,22 @@ class Blueprintable(object):
         """
         pass
 
-    def to_string(self):  # pragma: no coverage
-        # type: () -> str
+    def to_string(self, compression_level=9, fast_json=False):  # pragma: no coverage
+        # type: (int, bool) -> str
         """
         Returns this object as an encoded Factorio blueprint string.
 
+        :param compression_level: The zlib compression level to use, from ``0``
+            to ``9``. Lower levels encode faster but produce longer strings.
+            See :py:class:`.utils.StringEncoder`.
+        :param fast_json: Whether or not to serialize with ``orjson`` if it's
+            installed. See :py:class:`.utils.StringEncoder`.
+
         :returns: The zlib-compressed, base-64 encoded string.
 
+        :exception ValueError: If ``compression_level`` is not in the range
+            ``[0, 9]``.
+
         :example:
 
         .. doctest::
@@ -392,7 +446,7 @@ class Blueprintable(object):
             >>> BlueprintBook({"version": (1, 0)}).to_string()
             '0eNqrVkrKKU0tKMrMK4lPys/PVrKqVsosSc1VskJI6IIldJQSk0syy1LjM/NSUiuUrAx0lMpSi4oz8/OUrIwsDE3MTSzNzcwNDcxMzWprAVWGHQI='
         """
-        return utils.JSON_to_string(self.to_dict())
+        return utils.JSON_to_string(self.to_dict(), compression_level, fast_json)
 
     def __setitem__(self, key, value):
         # type: (str, Any) -> None
@@ -61,10 +61,10 @@ from draftsman.warning import DraftsmanWarning, IndexWarning
 
 from builtins import int
 import copy
+import itertools
 from schema import SchemaError
 import six
-from typing import Union
-import warnings
+from typing import Any, Callable, Union
 
 try:  # pragma: no coverage
     from collections.abc import MutableSequence
@@ -72,6 +72,74 @@ except ImportError:  # pragma: no coverage
     from collections import MutableSequence
 
 
+def _blueprintable_from_dict(elem, lazy=False, trusted=False):
+    # type: (dict, bool, bool) -> Blueprintable
+    """
+    Creates the Blueprintable described by the root key of ``elem``.
+    """
+    # fmt: off
+    if "blueprint" in elem:
+        return Blueprint(elem["blueprint"], lazy=lazy, trusted=trusted)
+    elif "deconstruction_planner" in elem:
+        return DeconstructionPlanner(elem["deconstruction_planner"])
+    elif "upgrade_planner" in elem:
+        return UpgradePlanner(elem["upgrade_planner"])
+    elif "blueprint_book" in elem:
+        return BlueprintBook(elem["blueprint_book"], lazy=lazy, trusted=trusted)
+    else:
+        raise TypeError(
+            "Dictionary input cannot be resolve to a blueprintable"
+        )
+    # fmt: on
+
+
+def _blueprintable_to_dict(blueprintable):
+    # type: (Blueprintable) -> dict
+    return blueprintable.to_dict()
+
+
+def _call_and_record_warnings(function, args):
+    # type: (Callable, tuple) -> tuple[Any, list[tuple]]
+    """
+    Calls ``function`` in a worker process, returning its result alongside
+    every warning it issued so they can be reissued in the main process.
+    """
+    # Forked workers inherit the warning collector of the main process, so a
+    # new one is always needed
+    with utils.collect_warnings() as warning_list:
+        result = function(*args)
+    return result, warning_list
+
+
+def _map_in_processes(function, args_list, workers):
+    # type: (Callable, list[tuple], int) -> list
+    """
+    Calls ``function`` with each set of arguments in ``args_list`` across a
+    pool of ``workers`` processes, and returns the results in the same order
+    as ``args_list``. Warnings issued in the workers are reissued here, in
+    order.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunksize = max(1, len(args_list) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(
+            executor.map(
+                _call_and_record_warnings,
+                itertools.repeat(function),
+                args_list,
+                chunksize=chunksize,
+            )
+        )
+
+    out = []
+    for result, warning_list in results:
+        for message, category in warning_list:
+            utils.warn(message, category, stacklevel=3)
+        out.append(result)
+    return out
+
+
 class BlueprintableList(MutableSequence):
     """
     List of Blueprintable instances. "Blueprintable" in this context means
@@ -79,28 +147,30 @@ class BlueprintableList(MutableSequence):
     can exist inside other BlueprintBook instances.
     """
 
-    def __init__(self, initlist=None):
-        # type: (list[Blueprint]) -> None
+    def __init__(self, initlist=None, lazy=False, workers=None, trusted=False):
+        # type: (list[Blueprint], bool, int, bool) -> None
         self.data = []
-        if initlist is not None:
-            for elem in initlist:
-                if isinstance(elem, dict):
-                    # fmt: off
-                    if "blueprint" in elem:
-                        self.append(Blueprint(elem["blueprint"]))
-                    elif "deconstruction_planner" in elem:
-                        self.append(DeconstructionPlanner(elem["deconstruction_planner"]))
-                    elif "upgrade_planner" in elem:
-                        self.append(UpgradePlanner(elem["upgrade_planner"]))
-                    elif "blueprint_book" in elem:
-                        self.append(BlueprintBook(elem["blueprint_book"]))
-                    else:
-                        raise TypeError(
-                            "Dictionary input cannot be resolve to a blueprintable"
-                        )
-                    # fmt: on
-                else:
-                    self.append(elem)
+        if initlist is None:
+            return
+
+        if workers is not None and len(initlist) > 1:
+            # Construct every dict entry in a process pool, keeping the order
+            dict_args = [
+                (elem, lazy, trusted) for elem in initlist if isinstance(elem, dict)
+            ]
+            constructed = iter(
+                _map_in_processes(_blueprintable_from_dict, dict_args, workers)
+            )
+            initlist = [
+                next(constructed) if isinstance(elem, dict) else elem
+                for elem in initlist
+            ]
+
+        for elem in initlist:
+            if isinstance(elem, dict):
+                self.append(_blueprintable_from_dict(elem, lazy, trusted))
+            else:
+                self.append(elem)
 
     def insert(self, idx, value):
         # type: (int, Union[Blueprint, BlueprintBook]) -> None
@@ -143,15 +213,28 @@ class BlueprintBook(Blueprintable):
     """
 
     @utils.reissue_warnings
-    def __init__(self, blueprint_book=None):
-        # type: (str, Union[str, dict]) -> None
+    def __init__(self, blueprint_book=None, lazy=False, workers=None, trusted=False):
+        # type: (Union[str, dict], bool, int, bool) -> None
         """
         Creates a ``BlueprintBook`` class. Will load the data from
         ``blueprint_book`` if provided, otherwise initializes with defaults.
 
         :param blueprint_book: Either a Factorio-format blueprint string or a
             ``dict`` object with the desired keys in the correct format.
+        :param lazy: Whether or not to defer the construction of the entities
+            of every :py:class:`.Blueprint` in this book until they are first
+            accessed. See :py:class:`.Blueprint` for more information.
+        :param workers: The number of processes to construct the child
+            blueprintables with. If ``None``, they are constructed one after
+            another in the current process. See :py:meth:`to_dict` for caveats.
+        :param trusted: Whether or not to skip validation of ``blueprint_book``
+            and every blueprintable inside of it. See :py:class:`.Blueprint`
+            for more information.
         """
+        self._lazy = lazy
+        self._workers = workers
+        self._trusted = trusted
+
         super(BlueprintBook, self).__init__(
             root_item="blueprint_book", item="blueprint-book", init_data=blueprint_book
         )
@@ -175,13 +258,18 @@ class BlueprintBook(Blueprintable):
             self.version = utils.encode_version(*__factorio_version_info__)
 
         if "blueprints" in kwargs:
-            self._root["blueprints"] = BlueprintableList(kwargs.pop("blueprints"))
+            self._root["blueprints"] = BlueprintableList(
+                kwargs.pop("blueprints"),
+                lazy=self._lazy,
+                workers=self._workers,
+                trusted=self._trusted,
+            )
         else:
             self._root["blueprints"] = BlueprintableList()
 
         # Issue warnings for any keyword not recognized by BlueprintBook
         for unused_arg in kwargs:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -267,7 +355,7 @@ class BlueprintBook(Blueprintable):
                     "'active_index' ({}) not in range [0, 65536)".format(value)
                 )
             elif self.blueprints is not None and value >= len(self.blueprints):
-                warnings.warn(
+                utils.warn(
                     "'active_index' ({}) not in range [0, {})".format(
                         value, len(self.blueprints)
                     ),
@@ -310,21 +398,48 @@ class BlueprintBook(Blueprintable):
     # Utility functions
     # =========================================================================
 
-    def to_dict(self):
-        # type: () -> dict
+    def to_dict(self, workers=None):
+        # type: (int) -> dict
         """
         Returns the blueprint as a dictionary. Intended for getting the
         precursor to a Factorio blueprint string before encoding and compression
         takes place.
 
+        :param workers: The number of processes to convert the child
+            blueprintables with. If ``None``, they are converted one after
+            another in the current process.
+
         :returns: The dict representation of the BlueprintBook.
+
+        .. NOTE::
+
+            When ``workers`` is specified, each child blueprintable is pickled
+            and sent to a :py:class:`concurrent.futures.ProcessPoolExecutor`,
+            so the children must be picklable, and the worker processes must
+            be able to import any custom entity classes they contain. Starting
+            the pool has a fixed cost, so this is only faster for books with
+            many large blueprints. Warnings issued in the workers are reissued
+            in the calling process.
         """
+        # Copy everything except the blueprints, which are converted below
+        out_dict = copy.deepcopy(
+            {x: self._root[x] for x in self._root if x != "blueprints"}
+        )
+
         # Get the root dicts from each blueprint and insert them into blueprints
-        out_dict = copy.deepcopy(self._root)
+        if workers is not None and len(self.blueprints) > 1:
+            blueprintable_entries = _map_in_processes(
+                _blueprintable_to_dict,
+                [(blueprintable,) for blueprintable in self.blueprints],
+                workers,
+            )
+        else:
+            blueprintable_entries = [
+                blueprintable.to_dict() for blueprintable in self.blueprints
+            ]
 
         out_dict["blueprints"] = []
-        for i, blueprintable in enumerate(self.blueprints):
-            blueprintable_entry = blueprintable.to_dict()
+        for i, blueprintable_entry in enumerate(blueprintable_entries):
             blueprintable_entry["index"] = i
             out_dict["blueprints"].append(blueprintable_entry)
 
@@ -332,3 +447,24 @@ class BlueprintBook(Blueprintable):
             del out_dict["blueprints"]
 
         return {"blueprint_book": out_dict}
+
+    def to_string(self, compression_level=9, fast_json=False, workers=None):
+        # type: (int, bool, int) -> str
+        """
+        Returns this object as an encoded Factorio blueprint string.
+
+        :param compression_level: The zlib compression level to use, from ``0``
+            to ``9``. See :py:class:`.utils.StringEncoder`.
+        :param fast_json: Whether or not to serialize with ``orjson`` if it's
+            installed. See :py:class:`.utils.StringEncoder`.
+        :param workers: The number of processes to convert the child
+            blueprintables with. See :py:meth:`to_dict`.
+
+        :returns: The zlib-compressed, base-64 encoded string.
+
+        :exception ValueError: If ``compression_level`` is not in the range
+            ``[0, 9]``.
+        """
+        return utils.JSON_to_string(
+            self.to_dict(workers=workers), compression_level, fast_json
+        )
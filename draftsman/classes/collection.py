@@ -2,10 +2,12 @@
 # -*- encoding: utf-8 -*-
 
 from draftsman.classes.association import Association
+from draftsman.classes.entityfilter import EntityFilter
 from draftsman.classes.entitylike import EntityLike
 from draftsman.classes.entitylist import EntityList
 from draftsman.classes.tilelist import TileList
 from draftsman.classes.spatial_data_structure import SpatialDataStructure
+from draftsman.classes.spatial_hashmap import SpatialHashMap
 from draftsman.classes.tile import Tile
 from draftsman.classes.vector import Vector, PrimitiveVector
 from draftsman.error import (
@@ -22,11 +24,11 @@ from draftsman.warning import (
     TooManyConnectionsWarning,
 )
 from draftsman.utils import AABB, PrimitiveAABB, flatten_entities, distance
+from draftsman import geometry, utils
 
 import abc
 import six
 from typing import Union
-import warnings
 
 
 @six.add_metaclass(abc.ABCMeta)
@@ -99,6 +101,27 @@ class EntityCollection(object):
         """
         pass
 
+    def on_entities_insert(self, entitylikes, trusted=False):
+        # type: (list[EntityLike], bool) -> list[EntityLike]
+        """
+        Function called when multiple :py:class:`.EntityLike` are inserted into
+        this object's :py:attr:`entities` list at once, such as with
+        :py:meth:`.EntityList.extend_from_dicts`. By default, this function
+        calls :py:meth:`on_entity_insert` on each entity in turn, but child
+        classes can override it to handle the entire batch more efficiently.
+        ``trusted`` indicates that the entities are known to be valid, so
+        child classes can skip any checks on them.
+
+        :returns: The ``list`` of entities to add to the ``entities`` list.
+        """
+        result = []
+        for entitylike in entitylikes:
+            entitylike = self.on_entity_insert(entitylike, False)
+            if entitylike is not None:  # pragma: no branch
+                result.append(entitylike)
+
+        return result
+
     def on_entity_set(self, old_entitylike, new_entitylike):  # pragma: no coverage
         # type: (EntityLike, EntityLike) -> None
         """
@@ -234,10 +257,17 @@ class EntityCollection(object):
               - ``bool``
               - | Whether or not to return the inverse of the search.
                 | False by default.
+            * - ``filter``
+              - ``EntityFilter`` or ``callable``
+              - | A precompiled predicate to use instead of ``name``,
+                | ``type``, ``direction`` and ``invert``.
 
         ``position`` and ``radius`` take precidence over ``aabb`` if all are
         specified. If no region keywords are specified, the entire Collection is
         searched.
+
+        :exception ValueError: If ``filter`` is specified alongside any of the
+            other criteria keywords (except ``limit``).
         """
 
         search_region = []
@@ -258,38 +288,124 @@ class EntityCollection(object):
             # Search all entities, but make sure it's a 1D list
             search_region = flatten_entities(self.entities)
 
-        if isinstance(kwargs.get("name", None), str):
-            names = {kwargs.pop("name", None)}
-        else:
-            names = kwargs.pop("name", None)
-        if isinstance(kwargs.get("type", None), str):
-            types = {kwargs.pop("type", None)}
-        else:
-            types = kwargs.pop("type", None)
-        if isinstance(kwargs.get("direction", None), int):
-            directions = {kwargs.pop("direction", None)}
-        else:
-            directions = kwargs.pop("direction", None)
+        test = self._get_entity_filter(kwargs)
+        limit = kwargs.pop("limit", None)
 
-        # Keep track of how many
-        limit = kwargs.pop("limit", len(search_region))
+        return [entity for entity in search_region if test(entity)][:limit]
 
-        def test(entity):
-            if names is not None and entity.name not in names:
-                return False
-            if types is not None and entity.type not in types:
-                return False
-            if (
-                directions is not None
-                and getattr(entity, "direction", None) not in directions
-            ):
-                return False
-            return True
+    def find_entities_filtered_batch(
+        self, areas=None, positions=None, radius=None, **kwargs
+    ):
+        # type: (list[Union[AABB, PrimitiveAABB]], list[Union[Vector, PrimitiveVector]], Union[float, list[float]], **dict) -> list[list[EntityLike]]
+        """
+        Performs many searches with :py:meth:`find_entities_filtered` at once,
+        one for each region in either ``areas`` or ``positions``. Every region
+        is searched in a single pass over :py:attr:`entity_map` (where it
+        supports it), and the criteria are only prepared once for all of them.
+
+        Accepts the same criteria keywords as :py:meth:`find_entities_filtered`,
+        with ``limit`` applying to each region separately. If the criteria
+        include a ``name`` or ``type`` (and are not inverted), only the entities
+        with those names or types are searched, so finding a few kinds of entity
+        in many regions doesn't have to look at every other entity in them.
+        Each region finds the same entities as :py:meth:`find_entities_filtered`
+        would (including which ones are cut off by ``limit``), though not
+        necessarily in the same order.
+
+        :param areas: A sequence of areas to search, each either an
+            :py:class:`.AABB` or a ``PrimitiveAABB``.
+        :param positions: A sequence of positions to search, each either a
+            PrimitiveVector or a :py:class:`.Vector`.
+        :param radius: The radius of the circle around each of ``positions`` to
+            search, or a sequence with a radius for each of them. If omitted,
+            each position is searched as a point.
+
+        :returns: A ``list`` with the ``list`` of entities found in each region,
+            in the same order as ``areas`` or ``positions``.
+
+        :exception ValueError: If neither or both of ``areas`` and
+            ``positions`` are specified, if ``radius`` is specified without
+            ``positions`` or with a different number of radii than positions, or
+            if ``filter`` is specified alongside any of the other criteria
+            keywords (except ``limit``).
+        """
+        if (areas is None) == (positions is None):
+            raise ValueError("Exactly one of 'areas' or 'positions' must be specified")
+        if radius is not None and positions is None:
+            raise ValueError("'radius' can only be specified alongside 'positions'")
+
+        test = self._get_entity_filter(kwargs)
+        limit = kwargs.pop("limit", None)
+
+        if areas is not None:
+            areas = [AABB.from_other(area) for area in areas]
+        elif radius is not None:
+            if isinstance(radius, (int, float)):
+                radius = [radius] * len(positions)
+            elif len(radius) != len(positions):
+                raise ValueError(
+                    "'radius' must have the same length as 'positions' ({} != {})".format(
+                        len(radius), len(positions)
+                    )
+                )
 
-        if kwargs.get("invert", None):
-            return list(filter(lambda entity: not test(entity), search_region))[:limit]
-        else:
-            return list(filter(lambda entity: test(entity), search_region))[:limit]
+        def search(entity_map, indices):
+            if areas is not None:
+                return entity_map.get_in_areas([areas[i] for i in indices])
+            elif radius is None:
+                return entity_map.get_on_points([positions[i] for i in indices])
+            else:
+                return entity_map.get_in_radii(
+                    [radius[i] for i in indices], [positions[i] for i in indices]
+                )
+
+        entity_map = self.entity_map
+        if (
+            isinstance(test, EntityFilter)
+            and not test.invert
+            and (test.names is not None or test.types is not None)
+            and isinstance(self.entities, EntityList)
+        ):
+            # Search a map of only the entities that could match instead
+            entity_map = SpatialHashMap()
+            entity_map.rebuild(self.entities.find_leaves(test.names, test.types))
+
+        indices = range(len(areas if areas is not None else positions))
+        results = [
+            [entity for entity in found if test(entity)]
+            for found in search(entity_map, indices)
+        ]
+
+        if limit is not None and entity_map is not self.entity_map:
+            # Which entities are cut off by the limit depends on the order they
+            # are found in, so regions with too many matches are searched again
+            # in the same way as `find_entities_filtered()`
+            truncated = [i for i in indices if len(results[i]) > limit]
+            if truncated:
+                for i, found in zip(truncated, search(self.entity_map, truncated)):
+                    results[i] = [entity for entity in found if test(entity)]
+
+        return [found[:limit] for found in results]
+
+    def _get_entity_filter(self, kwargs):
+        # type: (dict) -> EntityFilter
+        """
+        Gets the predicate described by the criteria keywords of
+        :py:meth:`find_entities_filtered`, removing them from ``kwargs``.
+        """
+        criteria = {
+            key: kwargs.pop(key)
+            for key in ("name", "type", "direction", "invert")
+            if key in kwargs
+        }
+        test = kwargs.pop("filter", None)
+        if test is None:
+            return EntityFilter(**criteria)
+        elif criteria:
+            raise ValueError(
+                "'filter' cannot be specified alongside {}".format(sorted(criteria))
+            )
+        return test
 
     # =========================================================================
     # Connections
@@ -391,7 +507,7 @@ class EntityCollection(object):
             entity_1.global_position.data, entity_2.global_position.data
         )
         if real_dist > min_dist:
-            warnings.warn(
+            utils.warn(
                 "Distance between entity '{}' and entity '{}' ({}) is greater"
                 " than max connection distance ({})".format(
                     entity_1.name, entity_2.name, real_dist, min_dist
@@ -403,13 +519,13 @@ class EntityCollection(object):
         # Issue a warning if the either of the connected entities have 5 or more
         # power connections
         if len(entity_1.neighbours) >= 5:
-            warnings.warn(
+            utils.warn(
                 "'entity_1' ({}) has more than 5 connections".format(entity_1.name),
                 TooManyConnectionsWarning,
                 stacklevel=2,
             )
         if len(entity_2.neighbours) >= 5:
-            warnings.warn(
+            utils.warn(
                 "'entity_2' ({}) has more than 5 connections".format(entity_2.name),
                 TooManyConnectionsWarning,
                 stacklevel=2,
@@ -562,55 +678,59 @@ class EntityCollection(object):
         """
         # Get all power poles in the Collection (1D list)
         electric_poles = self.find_entities_filtered(type="electric-pole")
-        for cur_pole in electric_poles:
-            # Get all the power poles candidates
-            def power_connectable(other):
-                # type: (EntityLike) -> bool
-                # Don't include ourself in the entities we're connecting to
-                if other is cur_pole:
-                    return False
-                # If only_axis is true, only include ones that have the same x
-                # or y
-                if (
-                    cur_pole.global_position.x != other.global_position.x
-                    and cur_pole.global_position.y != other.global_position.y
-                    and only_axis
-                ):
-                    return False
-                # Only return poles that are less than the max power pole
-                # distance
-                dist = distance(
-                    cur_pole.global_position.data, other.global_position.data
-                )
-                min_dist = min(
-                    cur_pole.maximum_wire_distance, other.maximum_wire_distance
-                )
-                return dist <= min_dist
-
-            potential_neighbours = list(filter(power_connectable, electric_poles))
+        positions = [pole.global_position.data for pole in electric_poles]
+        wire_distances = [pole.maximum_wire_distance for pole in electric_poles]
+
+        # Two poles can only be in range of each other if the squares around
+        # them (with a radius of their wire distance) overlap, so only those
+        # pairs need to be checked
+        boxes = [
+            [x - r, y - r, x + r, y + r] for (x, y), r in zip(positions, wire_distances)
+        ]
+        potential_neighbours = [[] for _ in electric_poles]
+        for i, j in geometry.overlapping_pairs(boxes):
+            # If only_axis is true, only include ones that have the same x or y
+            if (
+                positions[i][0] != positions[j][0]
+                and positions[i][1] != positions[j][1]
+                and only_axis
+            ):
+                continue
+            # Only include poles that are less than the max power pole distance
+            dist = distance(positions[i], positions[j])
+            if dist <= min(wire_distances[i], wire_distances[j]):
+                # Pairs are sorted, so each list stays in the same order as
+                # `electric_poles`
+                potential_neighbours[i].append(j)
+                potential_neighbours[j].append(i)
+
+        for cur_pole, cur_pos, neighbours in zip(
+            electric_poles, positions, potential_neighbours
+        ):
             # Sort the power poles by distance
-            potential_neighbours.sort(
-                key=lambda x: distance(
-                    x.global_position.data, cur_pole.global_position.data
-                )
-            )
+            neighbours.sort(key=lambda j: distance(positions[j], cur_pos))
 
             # Sort the power poles by whether or not they are on the axis first
             if prefer_axis:
-                potential_neighbours.sort(
-                    key=lambda x: not (
-                        x.global_position.x == cur_pole.global_position.x
-                        or x.global_position.y == cur_pole.global_position.y
+                neighbours.sort(
+                    key=lambda j: not (
+                        positions[j][0] == cur_pos[0] or positions[j][1] == cur_pos[1]
                     )
                 )
 
             # Iterate over every potential neighbour
-            while len(potential_neighbours) > 0:
-                neighbour = potential_neighbours.pop()
+            while len(neighbours) > 0:
+                neighbour = electric_poles[neighbours.pop()]
                 # Make sure this connection would not exceed each entities max
                 # connections
                 if len(cur_pole.neighbours) < 5 and len(neighbour.neighbours) < 5:
-                    self.add_power_connection(cur_pole, neighbour)
+                    # Both poles are known to be in this collection and in range
+                    # of each other, so we can skip the checks in
+                    # `add_power_connection()`
+                    if Association(neighbour) not in cur_pole.neighbours:
+                        cur_pole.neighbours.append(Association(neighbour))
+                    if Association(cur_pole) not in neighbour.neighbours:
+                        neighbour.neighbours.append(Association(cur_pole))
 
     # =========================================================================
 
@@ -683,14 +803,14 @@ class EntityCollection(object):
             raise EntityNotCircuitConnectableError(entity_2.name)
 
         if side1 == 2 and not entity_1.dual_circuit_connectable:
-            warnings.warn(
+            utils.warn(
                 "'side1' was specified as 2, but entity '{}' is not"
                 " dual circuit connectable".format(type(entity_1).__name__),
                 ConnectionSideWarning,
                 stacklevel=2,
             )
         if side2 == 2 and not entity_2.dual_circuit_connectable:
-            warnings.warn(
+            utils.warn(
                 "'side2' was specified as 2, but entity '{}' is not"
                 " dual circuit connectable".format(type(entity_2).__name__),
                 ConnectionSideWarning,
@@ -705,7 +825,7 @@ class EntityCollection(object):
             entity_1.global_position.data, entity_2.global_position.data
         )
         if real_dist > min_dist:
-            warnings.warn(
+            utils.warn(
                 "Distance between entity '{}' and entity '{}' ({}) is greater"
                 " than max connection distance ({})".format(
                     entity_1.name, entity_2.name, real_dist, min_dist
@@ -16,6 +16,8 @@ class CollisionSet:
     others.
     """
 
+    __slots__ = ("shapes",)
+
     def __init__(self, shapes, position=(0, 0)):
         # type: (list[utils.Shape], Vector) -> None
         """
@@ -0,0 +1,662 @@
+# compact_entitylist.py
+# -*- encoding: utf-8 -*-
+
+from draftsman.classes.association import Association
+from draftsman.classes.entitylike import EntityLike
+from draftsman.classes.vector import Vector
+from draftsman.data import entities
+from draftsman.entity import new_entity
+from draftsman.error import DraftsmanError, InvalidAssociationError
+from draftsman import utils
+
+from array import array
+
+try:  # pragma: no coverage
+    from collections.abc import Sequence
+except ImportError:  # pragma: no coverage
+    from collections import Sequence
+from copy import deepcopy
+import six
+from typing import Any, Iterable, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no coverage
+    from draftsman.classes.blueprint import Blueprint
+
+
+# The keys of each entity dict which are stored in columns
+_COLUMN_KEYS = frozenset({"entity_number", "name", "position", "direction"})
+
+# The local bounding box of every (name, direction) pair, determined from a
+# template entity
+_bounding_boxes = {}
+
+# Whether or not each entity name is double-grid-aligned, determined from a
+# template entity
+_double_grid_aligned = {}
+
+
+def _new_template(name, **kwargs):
+    # type: (str, **dict) -> Union[EntityLike, None]
+    """
+    Creates a new entity with ``name`` and ``kwargs`` to read the properties of
+    that kind of entity from, or returns ``None`` if it could not be created.
+    """
+    try:
+        with utils.discard_warnings():
+            return new_entity(name, **kwargs)
+    except Exception:
+        return None
+
+
+def _get_bounding_box(name, direction):
+    # type: (str, int) -> Union[list[float], None]
+    """
+    Returns the local bounding box of an entity with ``name`` facing
+    ``direction`` as a ``[x1, y1, x2, y2]`` list, or ``None`` if it has no
+    collision box or could not be created.
+    """
+    key = (name, direction)
+    try:
+        return _bounding_boxes[key]
+    except KeyError:
+        pass
+
+    # Unknown entities don't contribute to the area of the blueprint, the same
+    # as a regular blueprint
+    box = None
+    template = _new_template(name, direction=direction)
+    if template is not None:
+        bounding_box = template.collision_set.get_bounding_box()
+        if bounding_box is not None:
+            box = bounding_box.top_left + bounding_box.bot_right
+    _bounding_boxes[key] = box
+    return box
+
+
+def _is_double_grid_aligned(name):
+    # type: (str) -> bool
+    """
+    Returns whether or not entities with ``name`` are double-grid-aligned.
+    Unknown entities are not.
+    """
+    try:
+        return _double_grid_aligned[name]
+    except KeyError:
+        pass
+
+    template = _new_template(name)
+    aligned = template is not None and template.double_grid_aligned
+    _double_grid_aligned[name] = aligned
+    return aligned
+
+
+def _contains_associations(data):
+    # type: (dict) -> bool
+    """
+    Returns whether or not the connections or neighbours of the entity dict
+    ``data`` refer to other entities with :py:class:`.Association` objects.
+    """
+    for neighbour in data.get("neighbours", ()):
+        if isinstance(neighbour, Association):
+            return True
+    for side, value in data.get("connections", {}).items():
+        if side in {"1", "2"}:
+            points = [point for color in value for point in value[color]]
+        else:
+            points = value
+        for point in points:
+            if isinstance(point["entity_id"], Association):
+                return True
+    return False
+
+
+class CompactEntityView(object):
+    """
+    A lightweight view of a single entity inside of a
+    :py:class:`.CompactEntityList`. Reading or writing the attributes of the
+    view reads or writes the columns of the list directly; views hold no data
+    of their own, and are created each time an entity is accessed.
+
+    Any key of the entity other than ``name``, ``position``, and ``direction``
+    is accessed with item syntax, in the same format as an exported entity
+    dict:
+
+    .. code-block:: python
+
+        view = blueprint.entities[0]
+        view.position = (10.5, 10.5)
+        view["recipe"] = "iron-gear-wheel"
+
+    To access the full interface of an entity, :py:meth:`to_entity` creates a
+    new :py:class:`.Entity` with the same data.
+    """
+
+    __slots__ = ("_entities", "_index")
+
+    def __init__(self, entities, index):
+        # type: (CompactEntityList, int) -> None
+        self._entities = entities
+        self._index = index
+
+    # =========================================================================
+
+    @property
+    def name(self):
+        # type: () -> str
+        """
+        The name of the entity.
+
+        :getter: Gets the name of the entity.
+        :setter: Sets the name of the entity.
+        :type: ``str``
+
+        :exception TypeError: If set to anything other than a ``str``.
+        """
+        entities = self._entities
+        return entities._names[entities._name_ids[self._index]]
+
+    @name.setter
+    def name(self, value):
+        # type: (str) -> None
+        if not isinstance(value, six.string_types):
+            raise TypeError("'name' must be a str")
+        self._entities._name_ids[self._index] = self._entities._get_name_id(value)
+        self._entities._on_change()
+
+    # =========================================================================
+
+    @property
+    def type(self):
+        # type: () -> str
+        """
+        The type of the entity, or ``None`` if ``name`` is not a recognized
+        entity. Read only.
+
+        :type: ``str``
+        """
+        return entities.raw.get(self.name, {}).get("type", None)
+
+    # =========================================================================
+
+    @property
+    def position(self):
+        # type: () -> Vector
+        """
+        The position of the entity. Modifying the returned :py:class:`.Vector`
+        does not modify the entity; set this attribute instead.
+
+        :getter: Gets a copy of the position of the entity.
+        :setter: Sets the position of the entity. Accepts a ``dict`` with
+            ``"x"`` and ``"y"`` keys, or a sequence of two numbers.
+        :type: :py:class:`.Vector`
+        """
+        return Vector(self._entities._x[self._index], self._entities._y[self._index])
+
+    @position.setter
+    def position(self, value):
+        # type: (Union[dict, Sequence, Vector]) -> None
+        position = Vector.from_other(value, float)
+        self._entities._x[self._index] = position.x
+        self._entities._y[self._index] = position.y
+        self._entities._on_change()
+
+    # =========================================================================
+
+    @property
+    def direction(self):
+        # type: () -> int
+        """
+        The direction of the entity.
+
+        :getter: Gets the direction of the entity.
+        :setter: Sets the direction of the entity.
+        :type: ``int``
+
+        :exception ValueError: If set to a value outside of ``[0, 8)``.
+        """
+        return self._entities._directions[self._index]
+
+    @direction.setter
+    def direction(self, value):
+        # type: (int) -> None
+        if not 0 <= value < 8:
+            raise ValueError("'direction' must be in the range [0, 8)")
+        self._entities._directions[self._index] = value
+        self._entities._on_change()
+
+    # =========================================================================
+
+    @property
+    def entity_number(self):
+        # type: () -> int
+        """
+        The number of the entity when exported, which is also how other
+        entities refer to it in their connections. Read only.
+
+        :type: ``int``
+        """
+        return self._index + 1
+
+    # =========================================================================
+
+    @property
+    def double_grid_aligned(self):
+        # type: () -> bool
+        """
+        Whether or not the entity is aligned with the double grid, the same as
+        :py:attr:`.EntityLike.double_grid_aligned`. Read only.
+
+        :type: ``bool``
+        """
+        return _is_double_grid_aligned(self.name)
+
+    # =========================================================================
+
+    def get_world_bounding_box(self):
+        # type: () -> utils.AABB
+        """
+        Gets the world-space bounding box of the entity, the same as
+        :py:meth:`.SpatialLike.get_world_bounding_box`.
+
+        :returns: A new :py:class:`.AABB`, or ``None`` if the entity has no
+            collision box.
+        """
+        box = _get_bounding_box(self.name, self.direction)
+        if box is None:
+            return None
+        x = self._entities._x[self._index]
+        y = self._entities._y[self._index]
+        return utils.AABB(box[0] + x, box[1] + y, box[2] + x, box[3] + y)
+
+    def to_dict(self):
+        # type: () -> dict
+        """
+        Returns the entity as an exported entity ``dict``, without an
+        ``entity_number``. Modifying the result does not modify the entity.
+
+        :returns: The ``dict`` representation of the entity.
+        """
+        return self._entities._to_dict(self._index)
+
+    def to_entity(self):
+        # type: () -> Entity
+        """
+        Creates a new :py:class:`.Entity` from the data of this entity. The new
+        entity is validated in the same way as any other, and is not part of
+        any blueprint; modifying it does not modify this entity.
+
+        :returns: A new :py:class:`.Entity` instance.
+        """
+        return new_entity(**self.to_dict())
+
+    # =========================================================================
+
+    def __getitem__(self, key):
+        # type: (str) -> Any
+        return self._entities._extras[self._index][key]
+
+    def __setitem__(self, key, value):
+        # type: (str, Any) -> None
+        if key in _COLUMN_KEYS:
+            raise KeyError("'{}' must be set as an attribute".format(key))
+        self._entities._extras.setdefault(self._index, {})[key] = value
+
+    def __delitem__(self, key):
+        # type: (str) -> None
+        extras = self._entities._extras[self._index]
+        del extras[key]
+        if not extras:
+            del self._entities._extras[self._index]
+
+    def __contains__(self, key):
+        # type: (str) -> bool
+        return key in self._entities._extras.get(self._index, ())
+
+    def __eq__(self, other):
+        # type: (Any) -> bool
+        return (
+            isinstance(other, CompactEntityView)
+            and other._entities is self._entities
+            and other._index == self._index
+        )
+
+    def __ne__(self, other):
+        # type: (Any) -> bool
+        return not self == other
+
+    def __hash__(self):
+        # type: () -> int
+        return hash((id(self._entities), self._index))
+
+    def __repr__(self):  # pragma: no coverage
+        # type: () -> str
+        return "<CompactEntityView {}>{}".format(self.entity_number, self.to_dict())
+
+
+class CompactEntityList(Sequence):
+    """
+    A memory efficient alternative to :py:class:`.EntityList`, used by
+    blueprints created with ``compact=True``. Instead of an :py:class:`.Entity`
+    object per entity, the name, position, and direction of every entity are
+    stored in typed arrays; any other keys are kept as they were imported.
+    Each entity takes about 20 bytes plus the size of its other keys, which
+    makes it possible to hold blueprints with hundreds of thousands of entities
+    in memory.
+
+    Indexing or iterating the list creates :py:class:`.CompactEntityView`
+    objects, which read and write the arrays directly. Entities are exported
+    straight from the arrays, without creating any entity objects.
+
+    Entities are stored in the format that Factorio exports, and are not
+    validated when added. Connections between entities refer to each other by
+    their (1-indexed) position in the list, the same as an exported blueprint;
+    to keep them valid, entities can only be added to the end of the list and
+    cannot be removed individually.
+    """
+
+    def __init__(self, parent=None, initlist=None):
+        # type: (Blueprint, Iterable[Union[dict, EntityLike]]) -> None
+        """
+        Instantiates a new ``CompactEntityList``.
+
+        :param parent: The blueprint that contains the list.
+        :param initlist: A list of entity dicts or :py:class:`.Entity` objects
+            to initialize with. If the entity dicts have ``entity_number``
+            keys, their connections are renumbered to match their position in
+            the list.
+        """
+        self._parent = parent
+        self._names = []  # type: list[str]
+        self._name_lookup = {}  # type: dict[str, int]
+        self._name_ids = array("I")
+        self._x = array("d")
+        self._y = array("d")
+        self._directions = array("B")
+        # The non-column keys of each entity, by index; only entities with
+        # extra keys have an entry
+        self._extras = {}  # type: dict[int, dict]
+
+        if initlist is not None:
+            self.extend(initlist)
+
+    def _get_name_id(self, name):
+        # type: (str) -> int
+        try:
+            return self._name_lookup[name]
+        except KeyError:
+            self._name_lookup[name] = len(self._names)
+            self._names.append(name)
+            return self._name_lookup[name]
+
+    def _on_change(self):
+        # type: () -> None
+        if self._parent is not None:
+            self._parent.on_compact_entity_change()
+
+    def _truncate(self, length):
+        # type: (int) -> None
+        """
+        Removes every entity past ``length``.
+        """
+        del self._name_ids[length:]
+        del self._x[length:]
+        del self._y[length:]
+        del self._directions[length:]
+        for index in [i for i in self._extras if i >= length]:
+            del self._extras[index]
+
+    def _add(self, entity):
+        # type: (Union[dict, EntityLike]) -> None
+        """
+        Adds ``entity`` to the end of the columns.
+        """
+        if isinstance(entity, EntityLike):
+            entity = entity.to_dict()
+        elif isinstance(entity, CompactEntityView):
+            entity = entity.to_dict()
+        elif not isinstance(entity, dict):
+            raise TypeError(
+                "Entities in a CompactEntityList must be entity dicts or Entity "
+                "instances, not '{}'".format(type(entity).__name__)
+            )
+
+        if _contains_associations(entity):
+            raise DraftsmanError(
+                "Entities in a CompactEntityList must refer to other entities "
+                "by their entity numbers, not with Associations"
+            )
+
+        position = entity["position"]
+        try:
+            x, y = float(position["x"]), float(position["y"])
+        except TypeError:
+            x, y = float(position[0]), float(position[1])
+        direction = entity.get("direction", 0)
+        if not isinstance(direction, six.integer_types) or not 0 <= direction < 8:
+            raise ValueError("'direction' must be an int in the range [0, 8)")
+        name_id = self._get_name_id(entity["name"])
+        extras = {k: v for k, v in entity.items() if k not in _COLUMN_KEYS}
+
+        self._name_ids.append(name_id)
+        self._x.append(x)
+        self._y.append(y)
+        self._directions.append(direction)
+        if extras:
+            self._extras[len(self._name_ids) - 1] = deepcopy(extras)
+
+    def _renumber_connections(self, index, entity_numbers):
+        # type: (int, dict[int, int]) -> None
+        """
+        Replaces every entity number in the connections and neighbours of the
+        entity at ``index`` with its value in ``entity_numbers``.
+        """
+
+        def renumber(entity_number):
+            try:
+                return entity_numbers[entity_number]
+            except KeyError:
+                entity = self._to_dict(index)
+                six.raise_from(
+                    InvalidAssociationError(
+                        "'{}' at {} is connected to an entity that does not "
+                        "exist".format(entity["name"], entity["position"])
+                    ),
+                    None,
+                )
+
+        data = self._extras[index]
+        if "connections" in data:
+            connections = data["connections"]
+            for side in connections:
+                if side in {"1", "2"}:
+                    points = [
+                        point
+                        for color in connections[side]
+                        for point in connections[side][color]
+                    ]
+                else:
+                    points = connections[side]
+                for point in points:
+                    point["entity_id"] = renumber(point["entity_id"])
+
+        if "neighbours" in data:
+            neighbours = data["neighbours"]
+            for i, neighbour in enumerate(neighbours):
+                neighbours[i] = renumber(neighbour)
+
+    def append(self, entity):
+        # type: (Union[dict, EntityLike]) -> None
+        """
+        Appends an entity to the end of the list. Any connections of the entity
+        must refer to other entities by their entity number.
+
+        :param entity: An exported entity ``dict``, or an :py:class:`.Entity`
+            instance whose data is copied.
+
+        :exception TypeError: If ``entity`` is neither a ``dict`` nor an
+            ``Entity``.
+        :exception DraftsmanError: If the connections of ``entity`` refer to
+            other entities with :py:class:`.Association` objects.
+        """
+        self.extend([entity])
+
+    def extend(self, entities):
+        # type: (Iterable[Union[dict, EntityLike]]) -> None
+        """
+        Appends each entity in ``entities`` to the end of the list. If every
+        entity is a ``dict`` with an ``entity_number``, their connections are
+        renumbered to match their new positions in the list. Much faster than
+        calling :py:meth:`append` for each entity.
+
+        :param entities: An iterable of exported entity dicts, or
+            :py:class:`.Entity` instances whose data is copied.
+
+        :exception TypeError: If any of the entities is neither a ``dict`` nor
+            an ``Entity``.
+        :exception DraftsmanError: If the connections of any entity refer to
+            other entities with :py:class:`.Association` objects.
+        """
+        start = len(self)
+        entity_numbers = {}
+        renumber = False
+        try:
+            for i, entity in enumerate(entities, start + 1):
+                if isinstance(entity, dict) and "entity_number" in entity:
+                    entity_numbers[entity["entity_number"]] = i
+                    renumber = renumber or entity["entity_number"] != i
+                self._add(entity)
+
+            # Imported entity numbers don't have to be contiguous, so update
+            # any references to them
+            if renumber:
+                for i in range(start, len(self)):
+                    if i in self._extras:
+                        self._renumber_connections(i, entity_numbers)
+        except Exception:
+            self._truncate(start)
+            raise
+
+        self._on_change()
+
+    def clear(self):
+        # type: () -> None
+        """
+        Removes every entity from the list.
+        """
+        del self._names[:]
+        self._name_lookup.clear()
+        self._name_ids = array("I")
+        self._x = array("d")
+        self._y = array("d")
+        self._directions = array("B")
+        self._extras.clear()
+        self._on_change()
+
+    # =========================================================================
+
+    def get_world_bounding_boxes(self):
+        # type: () -> list[list[float]]
+        """
+        Gets the world-space bounding box of every entity with a collision box,
+        as ``[x1, y1, x2, y2]`` lists.
+
+        :returns: A ``list`` of bounding boxes.
+        """
+        local_boxes = {}
+        boxes = []
+        for name_id, x, y, direction in zip(
+            self._name_ids, self._x, self._y, self._directions
+        ):
+            key = (name_id, direction)
+            try:
+                box = local_boxes[key]
+            except KeyError:
+                box = local_boxes[key] = _get_bounding_box(
+                    self._names[name_id], direction
+                )
+            if box is not None:
+                boxes.append([box[0] + x, box[1] + y, box[2] + x, box[3] + y])
+        return boxes
+
+    def _to_dict(self, index):
+        # type: (int) -> dict
+        result = {
+            "name": self._names[self._name_ids[index]],
+            "position": {"x": self._x[index], "y": self._y[index]},
+        }
+        if self._directions[index] != 0:
+            result["direction"] = self._directions[index]
+        if index in self._extras:
+            result.update(deepcopy(self._extras[index]))
+        return result
+
+    def to_dicts(self):
+        # type: () -> list[dict]
+        """
+        Exports every entity as a ``dict`` with an ``entity_number``, in the
+        same format as :py:meth:`.Blueprint.to_dict`. Modifying the result does
+        not modify the list.
+
+        :returns: A ``list`` of entity dicts.
+        """
+        result = []
+        for i in range(len(self)):
+            entity = self._to_dict(i)
+            entity["entity_number"] = i + 1
+            result.append(entity)
+        return result
+
+    # =========================================================================
+
+    def __getitem__(self, index):
+        # type: (Union[int, slice]) -> Union[CompactEntityView, list[CompactEntityView]]
+        if isinstance(index, slice):
+            return [
+                CompactEntityView(self, i) for i in range(*index.indices(len(self)))
+            ]
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("list index out of range")
+        return CompactEntityView(self, index)
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._name_ids)
+
+    def __iter__(self):
+        # type: () -> Iterable[CompactEntityView]
+        for i in range(len(self)):
+            yield CompactEntityView(self, i)
+
+    def __eq__(self, other):
+        # type: (Any) -> bool
+        return isinstance(other, CompactEntityList) and (
+            self.to_dicts() == other.to_dicts()
+        )
+
+    def __ne__(self, other):
+        # type: (Any) -> bool
+        return not self == other
+
+    def __deepcopy__(self, memo):
+        # type: (dict) -> CompactEntityList
+        """
+        Creates a deepcopy of the list. Like :py:class:`.EntityList`, if the
+        ``memo`` dict has a ``"new_parent"`` key, the new list uses it as its
+        parent.
+        """
+        new = CompactEntityList(memo.get("new_parent", self._parent))
+        new._names = list(self._names)
+        new._name_lookup = dict(self._name_lookup)
+        new._name_ids = array("I", self._name_ids)
+        new._x = array("d", self._x)
+        new._y = array("d", self._y)
+        new._directions = array("B", self._directions)
+        new._extras = deepcopy(self._extras, memo)
+        return new
+
+    def __repr__(self):  # pragma: no coverage
+        # type: () -> str
+        return "<CompactEntityList>{}".format(self.to_dicts())
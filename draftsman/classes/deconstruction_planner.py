@@ -60,7 +60,6 @@ import copy
 from schema import SchemaError
 import six
 from typing import Union
-import warnings
 
 
 class DeconstructionPlanner(Blueprintable):
@@ -113,7 +112,7 @@ class DeconstructionPlanner(Blueprintable):
 
         # Issue warnings for any keyword not recognized by UpgradePlanner
         for unused_arg in kwargs:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
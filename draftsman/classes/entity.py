@@ -23,6 +23,21 @@ from schema import Schema
 import six
 
 
+# Collision data shared between all Entities of the same name, keyed by
+# ``(name, direction)``; see ``Entity._get_collision_data()``
+_collision_data = {}
+
+
+def clear_collision_data():
+    # type: () -> None
+    """
+    Clears the collision data cached for every Entity prototype. Must be called
+    if the contents of :py:mod:`draftsman.data.entities` change, so that Entities
+    created afterward reflect the new data.
+    """
+    _collision_data.clear()
+
+
 class Entity(EntityLike):
     """
     Entity base-class. Used for all entity types that are specified in Factorio.
@@ -58,6 +73,15 @@ class Entity(EntityLike):
         },
     }
 
+    # The collision mask to use if the entity's prototype does not specify one.
+    # Overridden by prototypes which default to different collision layers.
+    _default_collision_mask = {
+        "item-layer",
+        "object-layer",
+        "player-layer",
+        "water-tile",
+    }
+
     @classmethod
     def dump_format(cls):
         # type: () -> dict
@@ -139,48 +163,14 @@ class Entity(EntityLike):
             self.id = kwargs["id"]
             self.unused_args.pop("id")
 
-        # TODO: technically there's no reason each individual entity needs it's
-        # own copy of it's collision set, (aside from rotation)
-        # Therefore it would be more efficient to create a lookup table where
-        # each Entity type would get the root copy of the data and then
-        # transform it when needed (less performant maybe?)
-
-        # Collision set (Internal)
-        # Check to see if we have overwritten this value with the better ones
+        # Collision set, collision mask, and tile dimensions (Internal)
+        # These are identical for every entity with the same name, so they are
+        # only calculated once per prototype and then shared between instances
+        collision_data = self._get_collision_data()
         if not hasattr(self, "_overwritten_collision_set"):
-            collision_box = entities.raw[self.name]["collision_box"]
-            self._collision_set = CollisionSet(
-                [
-                    utils.AABB(
-                        collision_box[0][0],
-                        collision_box[0][1],
-                        collision_box[1][0],
-                        collision_box[1][1],
-                    )
-                ]
-            )
-
-        # Collision mask (Internal)
-        if "collision_mask" in entities.raw[self.name]:
-            self._collision_mask = set(entities.raw[self.name]["collision_mask"])
-        else:  # Base default
-            self._collision_mask = {
-                "item-layer",
-                "object-layer",
-                "player-layer",
-                "water-tile",
-            }
-
-        # Tile Width and Height (Internal)
-        # Usually tile dimensions are implicitly based on the collision box
-        self._tile_width, self._tile_height = utils.aabb_to_dimensions(
-            self._collision_set.get_bounding_box()
-        )
-        # But sometimes it can be overrided in special cases (rails)
-        if "tile_width" in entities.raw[self.name]:
-            self._tile_width = entities.raw[self.name]["tile_width"]
-        if "tile_height" in entities.raw[self.name]:
-            self._tile_height = entities.raw[self.name]["tile_height"]
+            self._collision_set = collision_data[0]
+        self._collision_mask = collision_data[1]
+        self._tile_width, self._tile_height = collision_data[2], collision_data[3]
 
         # Hidden? (Internal)
         self._hidden = "hidden" in entities.raw[self.name]["flags"]
@@ -446,9 +436,9 @@ class Entity(EntityLike):
         """
         The set of all collision layers that this Entity collides with,
         specified as strings. Equivalent to Factorio's ``data.raw`` equivalent.
-        Not exported; read only.
+        Shared between all Entities with the same name. Not exported; read only.
 
-        :type: ``set{str}``
+        :type: ``frozenset{str}``
         """
         return self._collision_mask
 
@@ -763,6 +753,79 @@ class Entity(EntityLike):
     #     """
     #     self.exports[name] = [criterion, formatter]
 
+    def _get_collision_data(self):
+        # type: () -> tuple[CollisionSet, frozenset, int, int]
+        """
+        Gets the collision set, collision mask, and tile width and height of
+        this Entity's prototype. The values are calculated the first time an
+        Entity of a particular name is created, and every subsequent Entity with
+        that name recieves the exact same objects. Thus, the returned values
+        must never be modified in place; if an Entity needs a different
+        collision set it should replace its own reference with a new one.
+
+        :returns: A tuple of the form ``(collision_set, collision_mask,
+            tile_width, tile_height)``.
+        """
+        try:
+            return _collision_data[(self.name, None)]
+        except KeyError:
+            pass
+
+        prototype = entities.raw[self.name]
+
+        # Check to see if we have overwritten this value with the better ones
+        if hasattr(self, "_overwritten_collision_set"):
+            collision_set = self._collision_set
+        else:
+            collision_box = prototype["collision_box"]
+            collision_set = CollisionSet(
+                [
+                    utils.AABB(
+                        collision_box[0][0],
+                        collision_box[0][1],
+                        collision_box[1][0],
+                        collision_box[1][1],
+                    )
+                ]
+            )
+
+        if "collision_mask" in prototype:
+            collision_mask = frozenset(prototype["collision_mask"])
+        else:  # Class default
+            collision_mask = frozenset(self._default_collision_mask)
+
+        # Usually tile dimensions are implicitly based on the collision box
+        tile_width, tile_height = utils.aabb_to_dimensions(
+            collision_set.get_bounding_box()
+        )
+        # But sometimes it can be overrided in special cases (rails)
+        if "tile_width" in prototype:
+            tile_width = prototype["tile_width"]
+        if "tile_height" in prototype:
+            tile_height = prototype["tile_height"]
+
+        result = (collision_set, collision_mask, tile_width, tile_height)
+        _collision_data[(self.name, None)] = result
+        return result
+
+    def _get_rotated_collision_set(self, direction):
+        # type: (int) -> CollisionSet
+        """
+        Gets this Entity's default collision set rotated by ``direction``. Like
+        :py:meth:`_get_collision_data`, the result is cached and shared between
+        all Entities with the same name, and should not be modified in place.
+
+        :param direction: The amount to rotate, in increments of 45 degrees.
+
+        :returns: The shared, rotated :py:class:`.CollisionSet`.
+        """
+        try:
+            return _collision_data[(self.name, direction)]
+        except KeyError:
+            collision_set = self._get_collision_data()[0].rotate(direction)
+            _collision_data[(self.name, direction)] = collision_set
+            return collision_set
+
     def __repr__(self):  # pragma: no coverage
         # type: () -> str
         return "<{0}{1}>{2}".format(
@@ -0,0 +1,72 @@
+# entityfilter.py
+# -*- encoding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+from draftsman.classes.entitylike import EntityLike
+from draftsman.constants import Direction
+
+import six
+from typing import Iterable, Union
+
+
+class EntityFilter(object):
+    """
+    A reusable predicate which checks whether or not an entity matches a set
+    of criteria. Calling it with an :py:class:`.EntityLike` returns ``True``
+    if it matches, and ``False`` otherwise.
+
+    Each criterion is normalized once when the filter is created, so a single
+    filter can be passed to any number of searches with the ``filter`` keyword
+    of :py:meth:`.EntityCollection.find_entities_filtered` and
+    :py:meth:`.EntityCollection.find_entities_filtered_batch`. Searches with
+    an ``EntityFilter`` by ``name`` or ``type`` (that isn't inverted) only
+    look at the entities with those names or types, instead of every entity
+    in the searched region.
+    """
+
+    __slots__ = ("names", "types", "directions", "invert")
+
+    def __init__(self, name=None, type=None, direction=None, invert=False):
+        # type: (Union[str, Iterable[str]], Union[str, Iterable[str]], Union[Direction, Iterable[Direction]], bool) -> None
+        """
+        Creates a new :py:class:`.EntityFilter`. Each criterion that is
+        ``None`` matches every entity.
+
+        :param name: The name(s) of the entities to match.
+        :param type: The type(s) of the entities to match.
+        :param direction: The direction(s) of the entities to match. Excludes
+            entities that have no direction.
+        :param invert: Whether or not to match every entity that doesn't meet
+            the other criteria instead.
+        """
+        if isinstance(name, six.string_types):
+            name = {name}
+        if isinstance(type, six.string_types):
+            type = {type}
+        if isinstance(direction, int):
+            direction = {direction}
+
+        self.names = None if name is None else set(name)
+        self.types = None if type is None else set(type)
+        self.directions = None if direction is None else set(direction)
+        self.invert = bool(invert)
+
+    def __call__(self, entity):
+        # type: (EntityLike) -> bool
+        if self.names is not None and entity.name not in self.names:
+            return self.invert
+        if self.types is not None and entity.type not in self.types:
+            return self.invert
+        if (
+            self.directions is not None
+            and getattr(entity, "direction", None) not in self.directions
+        ):
+            return self.invert
+        return not self.invert
+
+    def __repr__(self):  # pragma: no coverage
+        # type: () -> str
+        return "<EntityFilter>(name={}, type={}, direction={}, invert={})".format(
+            self.names, self.types, self.directions, self.invert
+        )
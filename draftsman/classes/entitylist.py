@@ -14,7 +14,7 @@ except ImportError:  # pragma: no coverage
     from collections import MutableSequence
 from copy import deepcopy
 import six
-from typing import Union, Any, TYPE_CHECKING
+from typing import Iterable, Iterator, Union, Any, TYPE_CHECKING
 import warnings
 
 if TYPE_CHECKING:  # pragma: no coverage
@@ -31,36 +31,41 @@ class EntityList(MutableSequence):
     """
 
     @utils.reissue_warnings
-    def __init__(self, parent=None, initlist=None):
-        # type: (EntityCollection, Any) -> None
+    def __init__(self, parent=None, initlist=None, trusted=False):
+        # type: (EntityCollection, Any, bool) -> None
         """
         Instantiates a new ``EntityList``.
 
         :param parent: The parent object that contains the EntityList; used when
             assigning the ``parent`` to entities when inserted.
         :param initlist: A list containing data to initialize with.
+        :param trusted: Whether or not to skip the checks on the entities in
+            ``initlist``. See :py:meth:`extend_from_dicts`.
 
         :exception TypeError: If any of the entries in ``initlist`` are neither
             a ``dict`` nor an ``EntityLike``.
         """
         self.data = []
+        # Keys only map to entities; their indices are found when needed, so
+        # that inserting or removing an entity never has to shift them
         self.key_map = {}
-        self.key_to_idx = {}
-        self.idx_to_key = {}
+        # The ids of every EntityLike in data, for constant time membership
+        self._entity_ids = set()
+        # The index of every EntityLike in data by id, created by
+        # `_index_of()` when first needed; kept up to date when entities are
+        # added to the end or replaced, and discarded when the list shifts
+        self._indices = None
+        # The entities in data grouped by name and by type, created by
+        # `find_leaves()` when first needed and discarded whenever data changes
+        self._leaf_index = None
+        # Raw entity dicts that a lazy parent has yet to construct; anything
+        # other than `len()` has the parent construct them first
+        self._unloaded = None
 
         self._parent = parent
 
         if initlist is not None:
-            for elem in initlist:
-                if isinstance(elem, EntityLike):
-                    self.append(elem)
-                elif isinstance(elem, dict):
-                    name = elem.pop("name")
-                    self.append(name, **elem)
-                else:
-                    raise TypeError(
-                        "Constructor either takes EntityLike or dict entries"
-                    )
+            self.extend_from_dicts(initlist, trusted=trusted)
 
     @utils.reissue_warnings
     def append(self, name, copy=True, merge=False, **kwargs):
@@ -124,6 +129,7 @@ class EntityList(MutableSequence):
             assert inserter is blueprint.entities[-1]
             assert blueprint.entities[-1].stack_size_override == 1
         """
+        self._load()
         self.insert(len(self.data), name, copy=copy, merge=merge, **kwargs)
 
     @utils.reissue_warnings
@@ -189,6 +195,7 @@ class EntityList(MutableSequence):
             assert inserter is blueprint.entities[0]
             assert blueprint.entities[0].stack_size_override == 1
         """
+        self._load()
 
         # Convert to new Entity if constructed via string keyword
         new = False
@@ -228,7 +235,13 @@ class EntityList(MutableSequence):
 
         # Once the parent has itself in order, we can update our data
         self.data.insert(idx, entitylike)
-        self._shift_key_indices(idx, 1)
+        self._entity_ids.add(id(entitylike))
+        self._leaf_index = None
+        if self._indices is not None:
+            if self.data[-1] is entitylike:
+                self._indices[id(entitylike)] = len(self.data) - 1
+            else:
+                self._indices = None
         if entitylike.id:
             self.set_key(entitylike.id, entitylike)
 
@@ -236,6 +249,111 @@ class EntityList(MutableSequence):
         # that it's inserted
         entitylike._parent = self._parent
 
+    @utils.reissue_warnings
+    def extend_from_dicts(self, entities, copy=True, merge=False, trusted=False):
+        # type: (Iterable[Union[dict, EntityLike]], bool, bool, bool) -> None
+        """
+        Appends every entry in ``entities`` to the end of the sequence. Each
+        entry can either be an :py:class:`.EntityLike` instance or a ``dict``
+        of keyword arguments with a ``"name"`` key, like the entity dicts in
+        a blueprint string.
+
+        Equivalent to calling :py:meth:`append` with each entry, but all of the
+        entities are constructed first and then handed to the parent at once,
+        so the parent can index them and check them for overlap in a single
+        pass. This makes it much faster for adding large numbers of entities.
+        If ``merge`` is ``True``, each entity is appended individually instead,
+        as the result of merging depends on the entities added before it.
+
+        :param entities: An iterable of ``dict`` or :py:class:`.EntityLike`.
+        :param copy: Whether or not to create a copy of each passed in
+            ``EntityLike``. Entities constructed from a ``dict`` are always new
+            instances.
+        :param merge: Whether or not to merge entities of the same type at the
+            same position.
+        :param trusted: Whether or not the entities are known to be valid, such
+            as when loading a blueprint string exported by Factorio. If so,
+            they are not checked for being hidden or for overlapping, and the
+            parent is not asked to issue any entity-specific warnings.
+
+        :exception TypeError: If any of the entries in ``entities`` are neither
+            a ``dict`` nor an ``EntityLike``.
+        :exception DuplicateIDError: If any of the entities have an ``id``
+            already taken in the ``EntityList``, or by another entry in
+            ``entities``.
+
+        :example:
+
+        .. code-block:: python
+
+            blueprint = Blueprint()
+            blueprint.entities.extend_from_dicts(
+                [
+                    {"name": "wooden-chest", "tile_position": (0, 0)},
+                    {"name": "transport-belt", "position": {"x": 1.5, "y": 0.5}},
+                    Container("steel-chest", tile_position=(2, 0)),
+                ]
+            )
+            assert len(blueprint.entities) == 3
+        """
+        self._load()
+        new_entities = []
+        new_keys = set()
+        for elem in entities:
+            if isinstance(elem, EntityLike):
+                if merge:
+                    self.append(elem, copy=copy, merge=merge)
+                    continue
+                entitylike = deepcopy(elem) if copy else elem
+            elif isinstance(elem, dict):
+                kwargs = dict(elem)
+                name = kwargs.pop("name")
+                if merge:
+                    self.append(name, merge=merge, **kwargs)
+                    continue
+                entitylike = new_entity(name, **kwargs)
+            else:
+                raise TypeError("Constructor either takes EntityLike or dict entries")
+
+            # Do a set of idiot checks on the entity to make sure everything's
+            # okay, including checking against the other new entities
+            if not trusted:
+                self.check_entitylike(entitylike)
+            elif entitylike.id is not None and entitylike.id in self.key_map:
+                raise DuplicateIDError(entitylike.id)
+            if entitylike.id is not None:
+                if entitylike.id in new_keys:
+                    raise DuplicateIDError(entitylike.id)
+                new_keys.add(entitylike.id)
+
+            new_entities.append(entitylike)
+
+        if not new_entities:
+            return
+
+        # Let the parent issue any warnings and errors for the entire batch
+        if trusted:
+            new_entities = self._parent.on_entities_insert(new_entities, trusted=True)
+        else:
+            new_entities = self._parent.on_entities_insert(new_entities)
+
+        # Once the parent has itself in order, we can update our data
+        start = len(self.data)
+        self.data.extend(new_entities)
+        self._entity_ids.update(id(entitylike) for entitylike in new_entities)
+        self._leaf_index = None
+        if self._indices is not None:
+            self._indices.update(
+                (id(entitylike), idx)
+                for idx, entitylike in enumerate(new_entities, start)
+            )
+        for entitylike in new_entities:
+            if entitylike.id:
+                self.key_map[entitylike.id] = entitylike
+
+            # Make sure every entity we just added points to the correct parent
+            entitylike._parent = self._parent
+
     def recursive_remove(self, item):
         # type: (EntityLike) -> None
         """
@@ -243,6 +361,7 @@ class EntityList(MutableSequence):
         subgroups to see if ``item`` is there, removing the root-most entity
         first.
         """
+        self._load()
         # First, try to delete the item from this list
         try:
             del self[self.index(item)]
@@ -263,8 +382,62 @@ class EntityList(MutableSequence):
         # If we've made it this far, it's not anywhere in the list
         raise ValueError
 
+    def find_leaves(self, names=None, types=None):
+        # type: (Iterable[str], Iterable[str]) -> list[EntityLike]
+        """
+        Gets every entity in the EntityList and in any subgroups (but not the
+        subgroups themselves) whose name is in ``names`` and whose type is in
+        ``types``. Entities are grouped by name and type the first time this is
+        called after the EntityList changes, so later calls only have to look
+        at the entities that match.
+
+        :param names: The names of the entities to get, or ``None`` to get
+            entities of any name.
+        :param types: The types of the entities to get, or ``None`` to get
+            entities of any type.
+
+        :returns: A ``list`` of the matching entities, in the same depth-first
+            order as :py:func:`.utils.flatten_entities`.
+        """
+        self._load()
+        if self._leaf_index is None:
+            by_name, by_type, subgroups = {}, {}, []
+            for i, entitylike in enumerate(self.data):
+                if hasattr(entitylike, "entities"):
+                    subgroups.append((i, entitylike))
+                    continue
+                try:
+                    by_name[entitylike.name].append((i, entitylike))
+                except KeyError:
+                    by_name[entitylike.name] = [(i, entitylike)]
+                try:
+                    by_type[entitylike.type].append((i, entitylike))
+                except KeyError:
+                    by_type[entitylike.type] = [(i, entitylike)]
+            self._leaf_index = (by_name, by_type, subgroups)
+
+        by_name, by_type, subgroups = self._leaf_index
+        if names is not None:
+            found = [pair for name in set(names) for pair in by_name.get(name, ())]
+            if types is not None:
+                found = [pair for pair in found if pair[1].type in types]
+        elif types is not None:
+            found = [pair for type in set(types) for pair in by_type.get(type, ())]
+        else:
+            found = [pair for pairs in by_name.values() for pair in pairs]
+
+        # Put the entities from every subgroup in its place, and then sort
+        # everything back into the order of the list
+        found = [(i, [entitylike]) for i, entitylike in found]
+        for i, subgroup in subgroups:
+            found.append((i, subgroup.entities.find_leaves(names, types)))
+        found.sort(key=lambda pair: pair[0])
+
+        return [entitylike for _, entitylikes in found for entitylike in entitylikes]
+
     def __getitem__(self, item):
         # type: (Union[int, str, slice]) -> Union[EntityLike, list[EntityLike]]
+        self._load()
         if isinstance(item, (list, tuple)):
             new_base = self[item[0]]
             item = item[1:]
@@ -277,14 +450,17 @@ class EntityList(MutableSequence):
             return self.key_map[item]  # Raises KeyError
 
     def clear(self):
+        self._load()
         del self.data[:]
+        self._entity_ids.clear()
+        self._leaf_index = None
+        self._indices = None
         self.key_map.clear()
-        self.key_to_idx.clear()
-        self.idx_to_key.clear()
 
     @utils.reissue_warnings
     def __setitem__(self, item, value):
         # type: (Union[int, str], EntityLike) -> None
+        self._load()
 
         # Get the key and index of the item
         idx, key = self.get_pair(item)
@@ -296,7 +472,13 @@ class EntityList(MutableSequence):
         self._parent.on_entity_set(self.data[idx], value)
 
         # Set the new data association in the list side
+        self._entity_ids.discard(id(self.data[idx]))
+        if self._indices is not None:
+            del self._indices[id(self.data[idx])]
+            self._indices[id(value)] = idx
         self.data[idx] = value
+        self._entity_ids.add(id(value))
+        self._leaf_index = None
 
         # If the element has a new id, set it to that
         if key:
@@ -308,11 +490,9 @@ class EntityList(MutableSequence):
         # Add a reference to the parent in the object
         value._parent = self._parent
 
-        # TODO: this sucks man
-        self._parent.recalculate_area()
-
     def __delitem__(self, item):
         # type: (Union[int, str]) -> None
+        self._load()
         if isinstance(item, slice):
             # Get slice parameters
             start, stop, step = item.indices(len(self))
@@ -326,14 +506,14 @@ class EntityList(MutableSequence):
                 # Remove key pair
                 self.remove_key(key)
 
-            for i in range(start, stop, step):
-                # Shift elements above down by slice.step
-                self._shift_key_indices(i, -step)
-
             # Delete all entries in the main list
+            self._entity_ids.difference_update(id(e) for e in self.data[item])
             del self.data[item]
+            self._leaf_index = None
+            self._indices = None
 
-            # TODO: this sucks man
+            # The parent is notified before each entity is removed, so its area
+            # is only up to date once all of them are gone
             self._parent.recalculate_area()
         else:
             # Get pair
@@ -345,33 +525,66 @@ class EntityList(MutableSequence):
             self._parent.on_entity_remove(self.data[idx])
 
             # Delete from list
+            self._entity_ids.discard(id(self.data[idx]))
             del self.data[idx]
+            self._leaf_index = None
+            self._indices = None
 
             # Remove key pair
             self.remove_key(key)
 
-            # Shift all entries above down by one
-            self._shift_key_indices(idx, -1)
-
-            # TODO: this sucks man
-            self._parent.recalculate_area()
-
     def __len__(self):
         # type: () -> int
+        if self._unloaded is not None:
+            return len(self._unloaded)
         return len(self.data)
 
+    def __iter__(self):
+        # type: () -> Iterator[EntityLike]
+        self._load()
+        return iter(self.data)
+
     def __contains__(self, item):
         # type: (EntityLike) -> bool
-        if item in self.data:
+        self._load()
+        if id(item) in self._entity_ids:
             return True
-        else:  # Check every entity for sublists
-            for entity in self.data:
-                if hasattr(entity, "entities"):
-                    if item in entity.entities:  # recurse
-                        return True
+
+        # Otherwise, follow the parents of the item upwards to see if it lies
+        # inside one of our subgroups, making sure that each one actually
+        # contains the last
+        parent = getattr(item, "_parent", None)
+        while parent is not None and parent is not self._parent:
+            entities = getattr(parent, "entities", None)
+            if not isinstance(entities, EntityList):
+                return False
+            if id(item) not in entities._entity_ids:
+                return False
+            if id(parent) in self._entity_ids:
+                return True
+            item = parent
+            parent = getattr(item, "_parent", None)
+
         # Nothing was found
         return False
 
+    def _load(self):
+        # type: () -> None
+        """
+        Has the parent construct the entities it deferred loading of, if any.
+        """
+        if self._unloaded is not None:
+            self._parent._load_entities()
+
+    def __setstate__(self, state):
+        # type: (dict) -> None
+        self.__dict__.update(state)
+        self.__dict__.setdefault("_unloaded", None)
+        # Copied or unpickled entities have new ids
+        self._entity_ids = set(id(entitylike) for entitylike in self.data)
+        self._leaf_index = None
+        self._indices = None
+
     def __deepcopy__(self, memo):
         # type: (dict) -> EntityList
         """
@@ -439,6 +652,9 @@ class EntityList(MutableSequence):
                 for i, neighbour in enumerate(neighbours):
                     neighbours[i] = try_to_replace_association(neighbour)
 
+        # The parent copies its unloaded entities too; this finds that copy
+        new._unloaded = deepcopy(self._unloaded, memo)
+
         return new
 
     def check_entitylike(self, entitylike):
@@ -457,6 +673,7 @@ class EntityList(MutableSequence):
         :exception DuplicateIDError: If ``entitylike.id`` is already taken in
             the ``EntityList``.
         """
+        self._load()
         if not isinstance(entitylike, EntityLike):
             raise TypeError("Entry in EntityList must be an EntityLike")
 
@@ -465,7 +682,7 @@ class EntityList(MutableSequence):
 
         # Warn if the placed entity is hidden
         if getattr(entitylike, "hidden", False):
-            warnings.warn(
+            utils.warn(
                 "Attempting to add hidden entity '{}'".format(type(entitylike)),
                 HiddenEntityWarning,
                 stacklevel=2,
@@ -474,7 +691,7 @@ class EntityList(MutableSequence):
     def remove_key(self, key):
         # type: (str) -> None
         """
-        Shorthand to remove ``key`` from the key mapping dictionaries. Does
+        Shorthand to remove ``key`` from the key mapping dictionary. Does
         nothing if key is ``None``.
 
         :param key: The string to remove.
@@ -482,16 +699,14 @@ class EntityList(MutableSequence):
         :exception KeyError: If attempting to remove a key that does not exist
             in the ``EntityList``.
         """
+        self._load()
         if key is not None:
-            idx = self.key_to_idx[key]
             del self.key_map[key]
-            del self.key_to_idx[key]
-            del self.idx_to_key[idx]
 
     def set_key(self, key, value):
         # type: (str, EntityLike) -> None
         """
-        Shorthand to set ``key`` in the key mapping dictionaries to point to
+        Shorthand to set ``key`` in the key mapping dictionary to point to
         ``value``.
 
         :param key: A ``str`` to associate with ``value``.
@@ -502,12 +717,12 @@ class EntityList(MutableSequence):
         :exception IndexError: If ``value`` is not found within the
             ``EntityList``.
         """
+        self._load()
         if key in self.key_map:
             raise DuplicateIDError("'{}'".format(key))
-        idx = self.data.index(value)
+        if id(value) not in self._entity_ids:
+            raise IndexError("{} is not in the EntityList".format(repr(value)))
         self.key_map[key] = value
-        self.key_to_idx[key] = idx
-        self.idx_to_key[idx] = key
 
     def get_pair(self, item):
         # type: (Union[int, str]) -> tuple[int, str]
@@ -520,26 +735,60 @@ class EntityList(MutableSequence):
         :returns: A tuple of the format ``(index, key)``.
 
         :exception KeyError: If key ``item`` is not found in the key mapping
-            dictionaries in the ``EntityList``.
+            dictionary in the ``EntityList``.
+        :exception IndexError: If index ``item`` is out of range.
         """
+        self._load()
         if isinstance(item, six.string_types):
-            return (self.key_to_idx[six.text_type(item)], item)
+            item = six.text_type(item)
+            return (self._index_of(self.key_map[item]), item)
         else:
-            return (item, self.idx_to_key.get(item, None))
+            entitylike = self.data[item]
+            key = getattr(entitylike, "id", None)
+            if key is None or self.key_map.get(key) is not entitylike:
+                key = None
+            return (item, key)
+
+    def _index_of(self, entitylike):
+        # type: (EntityLike) -> int
+        """
+        Returns the index of ``entitylike`` in the list. Indexes every entity
+        the first time it's called after the list has shifted (an insertion
+        or deletion anywhere but the end), which takes linear time; every
+        other call takes constant time.
 
-    def _shift_key_indices(self, idx, amt):
-        # type: (int, int) -> None
+        :exception KeyError: If ``entitylike`` is not in the list.
+        """
+        if self._indices is None:
+            self._indices = {
+                id(entitylike): idx for idx, entitylike in enumerate(self.data)
+            }
+        return self._indices[id(entitylike)]
+
+    @property
+    def key_to_idx(self):
+        # type: () -> dict[str, int]
         """
-        Shifts all of the key mappings above or equal to``idx`` by ``amt``. Used
-        when inserting or removing elements before the end, which moves what
-        index each key should point to.
+        A ``dict`` mapping every key in the ``EntityList`` to the index of its
+        entity. Created from :py:attr:`key_map` each time it's accessed, which
+        takes time proportional to the number of keys; to look up a single
+        key, use :py:meth:`get_pair` instead. Read only.
+
+        :type: ``dict{str: int}``
         """
+        self._load()
+        return {key: self._index_of(value) for key, value in self.key_map.items()}
 
-        # Shift the indices for key_to_idx
-        self.key_to_idx = {
-            key: old_idx + amt if old_idx >= idx else old_idx
-            for key, old_idx in self.key_to_idx.items()
-        }
+    @property
+    def idx_to_key(self):
+        # type: () -> dict[int, str]
+        """
+        The inverse of :py:attr:`key_to_idx`. Created from :py:attr:`key_map`
+        each time it's accessed, which takes time proportional to the number
+        of keys; to look up a single index, use :py:meth:`get_pair` instead.
+        Read only.
 
-        # Reconstruct idx_to_key
-        self.idx_to_key = {value: key for key, value in self.key_to_idx.items()}
+        :type: ``dict{int: str}``
+        """
+        self._load()
+        return {self._index_of(value): key for key, value in self.key_map.items()}
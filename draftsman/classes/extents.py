@@ -0,0 +1,139 @@
+# extents.py
+# -*- encoding: utf-8 -*-
+
+from draftsman.utils import AABB
+
+import heapq
+from typing import Any, Union
+
+
+class Extents(object):
+    """
+    Keeps track of the minimum bounding box around a changing set of bounding
+    boxes, each associated with a unique key. Used by :py:class:`.Blueprint`
+    so that its ``area`` can be updated when an entity or tile is removed,
+    without having to check every other entity and tile.
+
+    Each edge of the bounding boxes (left, top, right, and bottom) is counted
+    in a separate ``dict``, alongside a heap of those values with their
+    outermost value on top. Values are removed from the heaps lazily when
+    they reach the top, so adding and removing boxes takes amortized
+    ``O(log n)`` time, and getting the bounding box ``O(1)`` time otherwise.
+    """
+
+    __slots__ = ("_boxes", "_counts", "_heaps", "_heaps_outdated")
+
+    def __init__(self):
+        # type: () -> None
+        """
+        Creates a new, empty :py:class:`.Extents`.
+        """
+        # The bounding box of each key, as a tuple of `(x1, y1, -x2, -y2)`;
+        # right and bottom edges are negated so that every heap is a min-heap
+        self._boxes = {}
+        # The number of boxes with each edge value
+        self._counts = ({}, {}, {}, {})
+        self._heaps = ([], [], [], [])
+        # When adding many boxes at once, the heaps are only built when the
+        # bounding box is next requested
+        self._heaps_outdated = False
+
+    def add(self, key, box):
+        # type: (Any, Union[AABB, None]) -> None
+        """
+        Adds a bounding box to the extents. If ``key`` already has a bounding
+        box, it is replaced.
+
+        :param key: A hashable value to identify ``box`` with, which is used to
+            remove it later.
+        :param box: The :py:class:`.AABB` to add, in world space. If ``None``,
+            nothing is added.
+        """
+        if key in self._boxes:
+            self.remove(key)
+        if box is None:
+            return
+
+        x, y = box.position
+        values = (
+            box.top_left[0] + x,
+            box.top_left[1] + y,
+            -(box.bot_right[0] + x),
+            -(box.bot_right[1] + y),
+        )
+        self._boxes[key] = values
+
+        for value, counts, heap in zip(values, self._counts, self._heaps):
+            if value in counts:
+                counts[value] += 1
+            else:
+                counts[value] = 1
+                if not self._heaps_outdated:
+                    heapq.heappush(heap, value)
+
+    def remove(self, key):
+        # type: (Any) -> None
+        """
+        Removes the bounding box associated with ``key`` from the extents.
+        Does nothing if ``key`` has no bounding box.
+
+        :param key: The key that the bounding box was added with.
+        """
+        values = self._boxes.pop(key, None)
+        if values is None:
+            return
+
+        for value, counts, heap in zip(values, self._counts, self._heaps):
+            if counts[value] == 1:
+                del counts[value]
+                # Removed values are left in the heap until they reach the
+                # top; if too many accumulate, the heap is rebuilt instead
+                if len(heap) > 2 * len(counts) + 32:
+                    heap[:] = counts
+                    heapq.heapify(heap)
+            else:
+                counts[value] -= 1
+
+    def clear(self):
+        # type: () -> None
+        """
+        Removes every bounding box from the extents.
+        """
+        self._boxes.clear()
+        for counts, heap in zip(self._counts, self._heaps):
+            counts.clear()
+            del heap[:]
+        self._heaps_outdated = True
+
+    def get_bounding_box(self):
+        # type: () -> Union[AABB, None]
+        """
+        Gets the minimum bounding box around every box in the extents.
+
+        :returns: A new :py:class:`.AABB`, or ``None`` if the extents are
+            empty.
+        """
+        if not self._boxes:
+            return None
+
+        if self._heaps_outdated:
+            for counts, heap in zip(self._counts, self._heaps):
+                heap[:] = counts
+                heapq.heapify(heap)
+            self._heaps_outdated = False
+
+        values = []
+        for counts, heap in zip(self._counts, self._heaps):
+            while heap[0] not in counts:
+                heapq.heappop(heap)
+            values.append(heap[0])
+
+        return AABB(values[0], values[1], -values[2], -values[3])
+
+    def __contains__(self, key):
+        # type: (Any) -> bool
+        return key in self._boxes
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._boxes)
@@ -8,8 +8,8 @@ from draftsman.classes.collisionset import CollisionSet
 from draftsman.classes.entitylist import EntityList
 from draftsman.classes.collection import EntityCollection
 from draftsman.classes.entitylike import EntityLike
+from draftsman.classes.spatial_backends import new_spatial_data_structure
 from draftsman.classes.spatial_data_structure import SpatialDataStructure
-from draftsman.classes.spatial_hashmap import SpatialHashMap
 from draftsman.classes.transformable import Transformable
 from draftsman.classes.vector import Vector
 from draftsman.error import DraftsmanError, IncorrectBlueprintTypeError
@@ -22,7 +22,7 @@ from draftsman.utils import (
 )
 
 import copy
-from typing import Union
+from typing import Callable, Iterable, Union
 import six
 
 
@@ -71,7 +71,9 @@ class Group(Transformable, EntityCollection, EntityLike):
     Groups have their own ``SpatialHashMap`` instances, so they will issue
     :py:class:`~draftsman.warning.OverlappingObjectsWarning` when entities
     overlap, both when adding entities to the Group and when adding the Group to
-    another ``EntityCollection``.
+    another ``EntityCollection``. Like :py:class:`.Blueprint`, a different
+    :py:class:`.SpatialDataStructure` can be used instead with the
+    ``spatial_backend`` argument.
     """
 
     @reissue_warnings
@@ -83,15 +85,18 @@ class Group(Transformable, EntityCollection, EntityLike):
         position=(0, 0),
         entities=[],
         string=None,
+        spatial_backend="hashmap",
     ):
-        # type: (str, str, str, Union[dict, list, tuple], list, str) -> None
+        # type: (str, str, str, Union[dict, list, tuple], list, str, Union[str, Callable]) -> None
         super(Group, self).__init__()  # EntityLike
 
         self.id = id
 
         self.name = name
         self.type = type
-        self._entity_map = SpatialHashMap()
+        # See `Blueprint.__init__()` and `spatial_backends`
+        self._spatial_backend = spatial_backend
+        self._entity_map = new_spatial_data_structure(spatial_backend)
 
         # Collision box
         self._collision_set = CollisionSet([])
@@ -171,6 +176,8 @@ class Group(Transformable, EntityCollection, EntityLike):
         else:
             self._entities = EntityList(self)
 
+        self._tune_entity_map()
+
     # =========================================================================
 
     @property
@@ -483,6 +490,7 @@ class Group(Transformable, EntityCollection, EntityLike):
         else:
             raise TypeError("'entities' must be an EntityList, list, or None")
 
+        self._tune_entity_map()
         self.recalculate_area()
 
     # =========================================================================
@@ -524,6 +532,34 @@ class Group(Transformable, EntityCollection, EntityLike):
 
         return entitylike
 
+    def on_entities_insert(self, entitylikes, trusted=False):
+        # type: (list[EntityLike], bool) -> list[EntityLike]
+        """
+        Callback function for when multiple ``EntityLike`` are added to this
+        Group's ``entities`` list at once. Equivalent to calling
+        :py:meth:`on_entity_insert` on each entity without merging, but adds
+        them to the Group's ``SpatialHashMap`` in a single pass. If
+        ``trusted`` is ``True``, the entities are not checked for overlap.
+        """
+        # Add to hashmap (as well as any children), handling overlapping
+        if trusted:
+            for entitylike in entitylikes:
+                self.entity_map.recursive_add(entitylike)
+        else:
+            self.entity_map.recursive_add_batch(entitylikes)
+
+        # Update dimensions
+        for entitylike in entitylikes:
+            self._collision_set.shapes.extend(
+                entitylike.get_world_collision_set().shapes
+            )
+        (
+            self._tile_width,
+            self._tile_height,
+        ) = aabb_to_dimensions(self._collision_set.get_bounding_box())
+
+        return entitylikes
+
     def on_entity_set(self, old_entitylike, new_entitylike):
         # type: (EntityLike, EntityLike) -> None
         """
@@ -540,7 +576,12 @@ class Group(Transformable, EntityCollection, EntityLike):
         # Add the new entity and its children
         self.entity_map.recursive_add(new_entitylike)
 
-        self.recalculate_area()
+        # The old entity is replaced after this function returns, so it's
+        # swapped out here
+        self._recalculate_area(
+            new_entitylike if entity is old_entitylike else entity
+            for entity in self.entities
+        )
 
     def on_entity_remove(self, entitylike):
         # type: (EntityLike) -> None
@@ -552,7 +593,11 @@ class Group(Transformable, EntityCollection, EntityLike):
         # Remove the entity and its children
         self.entity_map.recursive_remove(entitylike)
 
-        self.recalculate_area()
+        # The entity is removed after this function returns, so it's skipped
+        # here
+        self._recalculate_area(
+            entity for entity in self.entities if entity is not entitylike
+        )
 
     # =========================================================================
 
@@ -573,14 +618,28 @@ class Group(Transformable, EntityCollection, EntityLike):
         Recalculates the dimensions of the area and tile_width and
         height. Called when an ``EntityLike`` object is altered or removed.
         """
+        self._recalculate_area(self.entities)
+
+    def _recalculate_area(self, entities):
+        # type: (Iterable[EntityLike]) -> None
         self._collision_set = CollisionSet([])
-        for entity in self.entities:
+        for entity in entities:
             self._collision_set.shapes += entity.get_world_collision_set().shapes
 
         self._tile_width, self._tile_height = aabb_to_dimensions(
             self._collision_set.get_bounding_box()
         )
 
+    def _tune_entity_map(self):
+        # type: () -> None
+        """
+        Replaces :py:attr:`entity_map` with the structure best suited to the
+        current entities if ``spatial_backend`` is ``"auto"``. Does nothing
+        otherwise.
+        """
+        if self._spatial_backend == "auto":
+            self._entity_map = new_spatial_data_structure("auto", self._entities)
+
     # def get_area(self):
     #     # type: () -> AABB
     #     """
@@ -10,7 +10,6 @@ from draftsman import utils
 from draftsman.warning import DirectionWarning
 
 from typing import Union
-import warnings
 
 from typing import TYPE_CHECKING
 
@@ -57,9 +56,9 @@ class DirectionalMixin(object):
             #         self._collision_set_rotation[i] = self.collision_set
             # else:
             # Automatically generate a set of rotated collision sets for every
-            # orientation
+            # orientation (shared between all entities with the same name)
             for i in {0, 2, 4, 6}:
-                self._collision_set_rotation[i] = self._collision_set.rotate(i)
+                self._collision_set_rotation[i] = self._get_rotated_collision_set(i)
 
         self.direction = 0
         if "direction" in kwargs:
@@ -118,7 +117,7 @@ class DirectionalMixin(object):
             self._direction = Direction(value)
 
         if self._direction not in {0, 2, 4, 6}:
-            warnings.warn(
+            utils.warn(
                 "'{}' only has 4-way rotation".format(type(self).__name__),
                 DirectionWarning,
                 stacklevel=2,
@@ -5,10 +5,10 @@ from __future__ import unicode_literals
 
 from draftsman.classes.vector import Vector
 from draftsman.warning import RailAlignmentWarning
+from draftsman import utils
 
 import math
 from typing import Union
-import warnings
 
 
 class DoubleGridAlignedMixin(object):
@@ -71,7 +71,7 @@ class DoubleGridAlignedMixin(object):
                 math.floor(self._tile_position.x / 2) * 2,
                 math.floor(self._tile_position.y / 2) * 2,
             )
-            warnings.warn(
+            utils.warn(
                 "Double-grid aligned entity is not placed along chunk grid; "
                 "entity's position will be cast from {} to {} when imported".format(
                     self._tile_position, cast_position
@@ -125,7 +125,7 @@ class DoubleGridAlignedMixin(object):
                 math.floor(self._tile_position.x / 2) * 2,
                 math.floor(self._tile_position.y / 2) * 2,
             )
-            warnings.warn(
+            utils.warn(
                 "Double-grid aligned entity is not placed along chunk grid; "
                 "entity's position will be cast from {} to {} when imported".format(
                     self._tile_position, cast_position
@@ -6,9 +6,9 @@ from __future__ import unicode_literals
 from draftsman.data import entities, items
 from draftsman.error import DraftsmanError
 from draftsman.warning import IndexWarning, ItemCapacityWarning
+from draftsman import utils
 
 import math
-import warnings
 
 from typing import TYPE_CHECKING
 
@@ -131,7 +131,7 @@ class InventoryMixin(object):
                 raise IndexError("Bar index ({}) not in range [0, 65536)".format(value))
             elif value >= self.inventory_size:
                 # Warn if greater than what makes sense
-                warnings.warn(
+                utils.warn(
                     "Bar index ({}) not in range [0, {})".format(
                         value, self.inventory_size
                     ),
@@ -158,7 +158,7 @@ class InventoryMixin(object):
             self._inventory_slots_occupied += num_slots_add
 
         if self.inventory_slots_occupied > self.inventory_size:
-            warnings.warn(
+            utils.warn(
                 "Current item requests exceeds the inventory size of this entity",
                 ItemCapacityWarning,
                 stacklevel=2,
@@ -11,10 +11,10 @@ from draftsman.error import (
     DataFormatError,
 )
 from draftsman.warning import IndexWarning
+from draftsman import utils
 
 from schema import SchemaError
 import six
-import warnings
 
 from typing import TYPE_CHECKING
 
@@ -135,7 +135,7 @@ class InventoryFilterMixin(object):
         if not 0 <= value < 65536:
             raise IndexError("Bar index ({}) not in range [0, 65536)".format(value))
         elif value >= self.inventory_size:
-            warnings.warn(
+            utils.warn(
                 "Bar index ({}) not in range [0, {})".format(
                     value, self.inventory_size
                 ),
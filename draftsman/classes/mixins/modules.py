@@ -2,8 +2,8 @@
 
 from draftsman.data import entities, modules
 from draftsman.warning import ModuleCapacityWarning
+from draftsman import utils
 
-import warnings
 
 
 class ModulesMixin(object):  # (RequestItemsMixin)
@@ -69,7 +69,7 @@ class ModulesMixin(object):  # (RequestItemsMixin)
 
         # Make sure we dont have too many modules in the Entity
         if self.module_slots_occupied > self.total_module_slots:
-            warnings.warn(
+            utils.warn(
                 "Current number of module slots used ({}) greater than max "
                 "module capacity ({})".format(
                     self.module_slots_occupied, self.total_module_slots
@@ -3,10 +3,11 @@
 
 from __future__ import unicode_literals
 
+from draftsman.classes.collisionset import CollisionSet
 from draftsman.warning import ValueWarning
 from draftsman.utils import Rectangle
+from draftsman import utils
 
-import warnings
 
 from typing import TYPE_CHECKING
 
@@ -31,10 +32,12 @@ class OrientationMixin(object):
         # type: (str, list[str], **dict) -> None
         super(OrientationMixin, self).__init__(name, similar_entities, **kwargs)
 
+        # The collision set is shared with all other entities of the same name,
+        # so we replace it with our own copy since orientation modifies it
         old = self._collision_set.shapes[0]
         width = old.bot_right[0] - old.top_left[0]
         height = old.bot_right[1] - old.top_left[1]
-        self._collision_set.shapes[0] = Rectangle((0, 0), width, height, 0)
+        self._collision_set = CollisionSet([Rectangle((0, 0), width, height, 0)])
 
         self.orientation = 0.0
         if "orientation" in kwargs:
@@ -76,7 +79,7 @@ class OrientationMixin(object):
             self._collision_set.shapes[0].angle = 0
         elif isinstance(value, float):
             if value is not None and not 0.0 <= value < 1.0:
-                warnings.warn(
+                utils.warn(
                     "Orientation not in range [0.0, 1.0); will be cast to {} on import".format(
                         value % 1.0
                     ),
@@ -7,10 +7,10 @@ from draftsman import signatures
 from draftsman.data import recipes, modules
 from draftsman.error import InvalidRecipeError
 from draftsman.warning import ModuleLimitationWarning, ItemLimitationWarning
+from draftsman import utils
 
 from schema import SchemaError
 import six
-import warnings
 
 from typing import TYPE_CHECKING
 
@@ -119,7 +119,7 @@ class RecipeMixin(object):
                     # Check to see if the module is allowed with this recipe
                     if "limitation" in module:
                         if self.recipe not in module["limitation"]:
-                            warnings.warn(
+                            utils.warn(
                                 "Cannot use module '{}' with new recipe '{}'".format(
                                     item, self.recipe
                                 ),
@@ -127,7 +127,7 @@ class RecipeMixin(object):
                                 stacklevel=2,
                             )
                 elif item not in recipes.get_recipe_ingredients(self.recipe):
-                    warnings.warn(
+                    utils.warn(
                         "Item '{}' is not used in the current recipe ({})".format(
                             item, self.recipe
                         ),
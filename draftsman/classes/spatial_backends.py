@@ -0,0 +1,142 @@
+# spatial_backends.py
+# -*- encoding: utf-8 -*-
+
+"""
+Selection of the :py:class:`.SpatialDataStructure` used by an
+:py:class:`.EntityCollection`. :py:class:`.Blueprint` and :py:class:`.Group`
+take a ``spatial_backend`` argument, which is passed to
+:py:func:`new_spatial_data_structure` to create their ``entity_map`` (and
+``tile_map``). It can be one of the names in :py:data:`SPATIAL_BACKENDS`,
+``"auto"``, or any callable which returns a new
+:py:class:`.SpatialDataStructure`, such as a subclass of it.
+"""
+
+from __future__ import unicode_literals, division
+
+from draftsman.classes.spatial_data_structure import SpatialDataStructure
+from draftsman.classes.spatial_grid import SpatialGrid
+from draftsman.classes.spatial_hashmap import SpatialHashMap
+from draftsman.classes.spatial_rtree import SpatialRTree
+
+import math
+import six
+from typing import Callable, Iterable, Union
+
+SPATIAL_BACKENDS = {
+    "hashmap": SpatialHashMap,
+    "grid": SpatialGrid,
+    "rtree": SpatialRTree,
+}
+"""
+The built-in spatial backends, by name.
+"""
+
+AUTO_MINIMUM_ITEMS = 256
+"""
+The minimum number of items for which the ``"auto"`` backend chooses anything
+other than a default :py:class:`.SpatialHashMap`.
+"""
+
+
+def new_spatial_data_structure(backend="hashmap", items=None):
+    # type: (Union[str, Callable[[], SpatialDataStructure]], Iterable) -> SpatialDataStructure
+    """
+    Creates a new, empty :py:class:`.SpatialDataStructure` from ``backend``,
+    and then adds ``items`` to it (if given) with
+    :py:meth:`.SpatialDataStructure.rebuild`.
+
+    If ``backend`` is ``"auto"``, the structure is chosen by
+    :py:func:`choose_spatial_data_structure` based on the bounding boxes of
+    ``items``.
+
+    :param backend: The name of one of the :py:data:`SPATIAL_BACKENDS`,
+        ``"auto"``, or a callable which returns a new
+        :py:class:`.SpatialDataStructure`.
+    :param items: The objects to add, or their children (if they have any).
+
+    :returns: A new :py:class:`.SpatialDataStructure`.
+
+    :exception ValueError: If ``backend`` is a string that is not one of the
+        above names.
+    :exception TypeError: If ``backend`` is neither a string nor a callable, or
+        doesn't return a :py:class:`.SpatialDataStructure`.
+    """
+    if backend == "auto":
+        structure = choose_spatial_data_structure(items or ())
+    elif isinstance(backend, six.string_types):
+        try:
+            structure = SPATIAL_BACKENDS[backend]()
+        except KeyError:
+            raise ValueError(
+                "Unknown spatial backend '{}'; must be one of {} or 'auto'".format(
+                    backend, sorted(SPATIAL_BACKENDS)
+                )
+            )
+    elif callable(backend):
+        structure = backend()
+        if not isinstance(structure, SpatialDataStructure):
+            raise TypeError("'backend' must return a SpatialDataStructure")
+    else:
+        raise TypeError("'backend' must be a str or a callable")
+
+    if items is not None:
+        structure.rebuild(items)
+
+    return structure
+
+
+def choose_spatial_data_structure(items):
+    # type: (Iterable) -> SpatialDataStructure
+    """
+    Chooses the :py:class:`.SpatialDataStructure` that best suits the
+    distribution of ``items``, based on how much of their combined extents
+    their bounding boxes cover:
+
+    * Densely packed items use a :py:class:`.SpatialGrid`, with cells about as
+      large as the average item.
+    * Sparse items spread out over a large area use a
+      :py:class:`.SpatialRTree`.
+    * Anything in between (or fewer than :py:data:`AUTO_MINIMUM_ITEMS` items)
+      uses a :py:class:`.SpatialHashMap`, with cells about twice as large as
+      the average item.
+
+    :param items: The objects to measure, or their children (if they have
+        any). They are not added to the returned structure.
+
+    :returns: A new, empty :py:class:`.SpatialDataStructure`.
+    """
+    boxes = []
+
+    def add_leaves(item):
+        if hasattr(item, "entities"):
+            for sub_item in item.entities:
+                add_leaves(sub_item)
+        else:
+            box = item.get_world_bounding_box()
+            if box is not None:
+                boxes.append(box.world_top_left + box.world_bot_right)
+
+    for item in items:
+        add_leaves(item)
+
+    if len(boxes) < AUTO_MINIMUM_ITEMS:
+        return SpatialHashMap()
+
+    covered = 0
+    total_size = 0
+    for x1, y1, x2, y2 in boxes:
+        covered += (x2 - x1) * (y2 - y1)
+        total_size += max(x2 - x1, y2 - y1)
+    width = max(box[2] for box in boxes) - min(box[0] for box in boxes)
+    height = max(box[3] for box in boxes) - min(box[1] for box in boxes)
+    density = covered / max(width * height, 1)
+
+    # Round cell sizes to powers of 2, so that cells line up with the tile grid
+    size = max(total_size / len(boxes), 1)
+    exponent = int(math.ceil(math.log(size, 2)))
+    if density >= 0.25:
+        return SpatialGrid(cell_size=2**exponent)
+    elif density < 0.01:
+        return SpatialRTree()
+    else:
+        return SpatialHashMap(cell_size=2 ** min(exponent + 1, 5))
@@ -1,10 +1,13 @@
 # spatial_data_structure.py
 # -*- encoding: utf-8 -*-
 
+from draftsman import utils
+from draftsman.warning import OverlappingObjectsWarning
+
 import abc
 import six
 
-from typing import Sequence, TYPE_CHECKING
+from typing import Iterable, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no coverage
     from draftsman.classes.spatiallike import SpatialLike
@@ -16,6 +19,10 @@ class SpatialDataStructure(object):
     """
     An abstract class used to implement some kind of spatial querying
     accelleration, such as a spatial hash-map or quadtree.
+
+    Implementations only need to store and query individual objects; adding
+    and removing the children of Groups, as well as checking for overlapping
+    objects, are handled here in terms of those methods.
     """
 
     @abc.abstractmethod
@@ -28,9 +35,8 @@ class SpatialDataStructure(object):
         """
         pass
 
-    @abc.abstractmethod
-    def recursive_add(self, item, merge=False):  # pragma: no coverage
-        # type: (SpatialLike, bool) -> None
+    def recursive_add(self, item):
+        # type: (SpatialLike) -> None
         """
         Add the leaf-most entities to the hashmap.
 
@@ -40,7 +46,11 @@ class SpatialDataStructure(object):
 
         :param item: The object to add, or its children (if it has any).
         """
-        pass
+        if hasattr(item, "entities"):
+            for sub_item in item.entities:
+                self.recursive_add(sub_item)
+        else:
+            self.add(item)
 
     @abc.abstractmethod
     def remove(self, item):  # pragma: no coverage
@@ -52,15 +62,18 @@ class SpatialDataStructure(object):
         """
         pass
 
-    @abc.abstractmethod
-    def recursive_remove(self, item):  # pragma: no coverage
+    def recursive_remove(self, item):
         # type: (SpatialLike) -> None
         """
         Inverse of :py:meth:`recursive_add`.
 
         :param item: The object to remove, or its children (if it has any).
         """
-        pass
+        if hasattr(item, "entities"):
+            for sub_item in item.entities:
+                self.recursive_remove(sub_item)
+        else:
+            self.remove(item)
 
     @abc.abstractmethod
     def clear(self):  # pragma: no coverage
@@ -70,6 +83,113 @@ class SpatialDataStructure(object):
         """
         pass
 
+    def rebuild(self, items):
+        # type: (Iterable[SpatialLike]) -> None
+        """
+        Replaces the contents of the structure with ``items``, each added with
+        :py:meth:`recursive_add`. Used when every object in a collection has
+        moved at once, where removing and re-adding them one by one would be
+        slower. Implementations may defer the work until they are next used.
+
+        :param items: The objects to add, or their children (if they have
+            any).
+        """
+        self.clear()
+        for item in items:
+            self.recursive_add(item)
+
+    def handle_overlapping(self, item, merge):
+        # type: (SpatialLike, bool) -> SpatialLike
+        """
+        Handles overlapping items if ``item`` were to be added to this hashmap.
+        Issues overlapping objects warnings and merges entities if desired.
+
+        .. Warning::
+
+            This function may not be permanent, or it may move somewhere else in
+            future versions.
+
+        :returns: ``item``, or ``None`` if it was merged into an existing item.
+        """
+        if hasattr(item, "entities"):
+            # Recurse through all subentities
+            merged_entities = []  # keep track of merged entities, if any
+            for sub_entity in item.entities:
+                result = self.handle_overlapping(sub_entity, merge)
+                if result is None:
+                    merged_entities.append(sub_entity)
+
+            # Remove all merged entities from the list
+            for entity in merged_entities:
+                item.entities.remove(entity)
+
+            # Note: `item` here might be a Group with NO entities in it; this is
+            # deliberate
+            return item
+        else:
+            item_region = item.get_world_bounding_box()
+            overlapping_items = self.get_in_area(item_region)
+            for overlapping_item in overlapping_items:
+                # If we can merge the two items and this is desired, do so first
+                if merge and overlapping_item.mergable_with(item):
+                    overlapping_item.merge(item)
+                    return None
+
+                # Otherwise, we now check to issue and OverlappingObjectsWarning
+                self._warn_if_overlapping(item, overlapping_item)
+
+            return item
+
+    def recursive_add_batch(self, items):
+        # type: (list[SpatialLike]) -> None
+        """
+        Adds every item in ``items`` with :py:meth:`recursive_add` and then
+        checks all of them for overlaps. Issues the same warnings as calling
+        :py:meth:`handle_overlapping` followed by :py:meth:`recursive_add` on
+        each item one after another, without merging. Each item is only checked
+        against items that were already in the structure and items that come
+        before it in ``items``. If a warning is raised as an exception, none of
+        the items are added.
+
+        .. Warning::
+
+            This function may not be permanent, or it may move somewhere else in
+            future versions.
+
+        :param items: The ``list`` of items to add, in the order they are added.
+        """
+        # Keep track of which of the given items every leaf belongs to, so that
+        # we only check against leaves that would have been added before it
+        # (and never against leaves of the same Group)
+        order = {}
+        leaves = []
+
+        def add_leaves(item, index):
+            if hasattr(item, "entities"):
+                for sub_item in item.entities:
+                    add_leaves(sub_item, index)
+            else:
+                self.add(item)
+                order[id(item)] = index
+                leaves.append(item)
+
+        for index, item in enumerate(items):
+            add_leaves(item, index)
+
+        try:
+            for leaf in leaves:
+                index = order[id(leaf)]
+                bounding_box = leaf.get_world_bounding_box()
+                for overlapping_item in self.get_in_area(bounding_box):
+                    if order.get(id(overlapping_item), -1) < index:
+                        self._warn_if_overlapping(leaf, overlapping_item)
+        except BaseException:
+            # A warning was turned into an error; leave the structure as it
+            # was before
+            for leaf in leaves:
+                self.remove(leaf)
+            raise
+
     @abc.abstractmethod
     def get_all_entities(self):  # pragma: no coverage
         # type: () -> list[SpatialLike]
@@ -127,3 +247,103 @@ class SpatialDataStructure(object):
             empty.
         """
         pass
+
+    def get_in_radii(self, radii, points, limit=None):
+        # type: (Sequence[float], Sequence[Point], int) -> list[list[SpatialLike]]
+        """
+        Performs :py:meth:`get_in_radius` for every pair of radius and point in
+        ``radii`` and ``points``. Implementations can override this to answer
+        every query in a single pass over their contents.
+
+        :param radii: The radius of each circle.
+        :param points: The center of each circle.
+        :param limit: A maximum amount of entities to return for each circle.
+
+        :returns: A ``list`` with the results of each query, in the same order
+            as ``points``.
+        """
+        return [
+            self.get_in_radius(radius, point, limit)
+            for radius, point in zip(radii, points)
+        ]
+
+    def get_on_points(self, points, limit=None):
+        # type: (Sequence[Point], int) -> list[list[SpatialLike]]
+        """
+        Performs :py:meth:`get_on_point` for every point in ``points``.
+        Implementations can override this to answer every query in a single
+        pass over their contents.
+
+        :param points: The positions to examine.
+        :param limit: A maximum amount of entities to return for each point.
+
+        :returns: A ``list`` with the results of each query, in the same order
+            as ``points``.
+        """
+        return [self.get_on_point(point, limit) for point in points]
+
+    def get_in_areas(self, areas, limit=None):
+        # type: (Sequence[AABB], int) -> list[list[SpatialLike]]
+        """
+        Performs :py:meth:`get_in_area` for every area in ``areas``.
+        Implementations can override this to answer every query in a single
+        pass over their contents.
+
+        :param areas: The areas to examine.
+        :param limit: A maximum amount of entities to return for each area.
+
+        :returns: A ``list`` with the results of each query, in the same order
+            as ``areas``.
+        """
+        return [self.get_in_area(area, limit) for area in areas]
+
+    def _warn_if_overlapping(self, item, overlapping_item):
+        # type: (SpatialLike, SpatialLike) -> None
+        """
+        Issues an :py:class:`.OverlappingObjectsWarning` if ``item`` and
+        ``overlapping_item`` collide with each other.
+        """
+        # Only the broadphase has taken place up until this point, so we now do
+        # the proper collision check
+        item_collision_set = item.get_world_collision_set()
+        overlapping_collision_set = overlapping_item.get_world_collision_set()
+        if not item_collision_set.overlaps(overlapping_collision_set):
+            return
+
+        # If we get here, we know that geometrically at least they are
+        # overlapping, but we also need to check to see if they have the same
+        # collision layers
+        item_layers = item.collision_mask
+        other_layers = overlapping_item.collision_mask
+
+        # StraightRails and CurvedRails cannot collide with each other UNLESS
+        # they are the same type, face the same direction, and exist at the
+        # exact same place
+        # (Imported here so that importing this module doesn't import them)
+        from draftsman.prototypes.straight_rail import StraightRail
+        from draftsman.prototypes.curved_rail import CurvedRail
+
+        if isinstance(item, (StraightRail, CurvedRail)) and isinstance(
+            overlapping_item, (StraightRail, CurvedRail)
+        ):
+            identical = (
+                item.name == overlapping_item.name
+                and item.direction == overlapping_item.direction
+                and item.global_position == overlapping_item.global_position
+            )
+            if not identical:
+                return
+
+        if len(other_layers.intersection(item_layers)) > 0:
+            utils.warn(
+                "Added object '{}' ({}) at {} intersects '{}' ({}) at {}".format(
+                    item.name,
+                    type(item).__name__,
+                    item.global_position,
+                    overlapping_item.name,
+                    type(overlapping_item).__name__,
+                    overlapping_item.global_position,
+                ),
+                OverlappingObjectsWarning,
+                stacklevel=2,
+            )
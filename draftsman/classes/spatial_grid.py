@@ -0,0 +1,394 @@
+# spatial_grid.py
+# -*- encoding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+from draftsman.classes.spatiallike import SpatialLike
+from draftsman.classes.spatial_data_structure import SpatialDataStructure
+from draftsman import utils
+
+import itertools
+import math
+from typing import Iterator, Sequence
+
+GRID_MINIMUM_CELLS = 4096
+"""
+The number of cells a :py:class:`.SpatialGrid` can always grow to, regardless
+of how many items it contains.
+"""
+
+GRID_CELLS_PER_ITEM = 16
+"""
+The number of cells per item a :py:class:`.SpatialGrid` can grow to beyond
+:py:data:`GRID_MINIMUM_CELLS`.
+"""
+
+
+class SpatialGrid(SpatialDataStructure):
+    """
+    Implementation of a :py:class:`.SpatialDataStructure` using a dense grid.
+    Every cell inside the region occupied by the grid's items is stored in a
+    single flat ``list``, so finding a cell is a single index instead of a hash
+    lookup, and queries never look outside of the occupied region.
+
+    Best suited to densely packed collections, such as large fields of tiles
+    or solar panels, with a ``cell_size`` close to the size of their items.
+    Each item's bounding box is stored alongside it when it's added, so items
+    must be removed before they are moved and added again afterwards (as is
+    already the case for every :py:class:`.EntityCollection`).
+    The grid grows to fit any item added outside of it, but never shrinks.
+    Because it stores every cell in the region it covers, it only grows while
+    it has at most :py:data:`GRID_CELLS_PER_ITEM` cells per item (or
+    :py:data:`GRID_MINIMUM_CELLS` cells); the cells of items outside of it are
+    stored in a ``dict`` instead, like a :py:class:`.SpatialHashMap`, so a few
+    far away items don't fill memory with empty cells. Sparse collections
+    spread over a large area are better served by :py:class:`.SpatialHashMap`
+    or :py:class:`.SpatialRTree`.
+    """
+
+    def __init__(self, cell_size=2):
+        # type: (int) -> None
+        """
+        Create a new :py:class:`.SpatialGrid`.
+
+        :param cell_size: Size of the grid in tiles to divide the space up into.
+        """
+        self.cell_size = cell_size
+        self.clear()
+
+    def add(self, item):
+        # type: (SpatialLike) -> None
+        box = item.get_world_bounding_box()
+        cell_range = self._cell_range(box)
+        if cell_range is None:
+            return
+
+        self._count += 1
+
+        # Every cell shares the same entry, which is used to tell them apart
+        x1, y1 = box.world_top_left
+        x2, y2 = box.world_bot_right
+        entry = (x1, y1, x2, y2, item)
+
+        min_x, min_y, max_x, max_y = cell_range
+        if not self._contains(cell_range):
+            self._grow(min_x, min_y, max_x, max_y)
+            if not self._contains(cell_range):
+                for cell in self._iter_cells(cell_range, create=True):
+                    cell.append(entry)
+                return
+
+        cells = self.cells
+        for j in range(min_y - self._y, max_y - self._y + 1):
+            row = j * self._width - self._x
+            for i in range(min_x, max_x + 1):
+                cell = cells[row + i]
+                if cell is None:
+                    cells[row + i] = [entry]
+                else:
+                    cell.append(entry)
+
+    def remove(self, item):
+        # type: (SpatialLike) -> None
+        cell_range = self._cell_range(item.get_world_bounding_box())
+        if cell_range is None:
+            return
+
+        found = False
+        for cell in self._iter_cells(cell_range):
+            for k, entry in enumerate(cell):
+                if entry[4] is item:
+                    del cell[k]
+                    found = True
+                    break
+        if found:
+            self._count -= 1
+            self._remove_empty_cells(cell_range)
+
+    def clear(self):
+        # type: () -> None
+        self.cells = []
+        # The map-coordinates of the top left cell, and the dimensions of the
+        # grid in cells
+        self._x, self._y = 0, 0
+        self._width, self._height = 0, 0
+        # Cells outside of the grid, by map-coordinate
+        self._outside = {}
+        # The number of items, which limits how large the grid can grow
+        self._count = 0
+
+    def get_all_entities(self):
+        # type: () -> list[SpatialLike]
+        items = []
+        # Items spanning multiple cells are only included once
+        seen = set()
+        for cell in itertools.chain(self.cells, self._outside.values()):
+            if cell is None:
+                continue
+            for entry in cell:
+                if id(entry) not in seen:
+                    seen.add(id(entry))
+                    items.append(entry[4])
+
+        return items
+
+    def get_in_radius(self, radius, point, limit=None):
+        # type: (float, Sequence[float], int) -> list[SpatialLike]
+        if limit is not None and limit <= 0:
+            return []
+
+        area = utils.AABB(
+            point[0] - radius, point[1] - radius, point[0] + radius, point[1] + radius
+        )
+        items = []
+        for entry in self._get_candidates(area):
+            item = entry[4]
+            item_pos = (item.global_position.x, item.global_position.y)
+            if utils.point_in_circle(item_pos, radius, point):
+                items.append(item)
+                if len(items) == limit:
+                    break
+
+        return items
+
+    def get_on_point(self, point, limit=None):
+        # type: (utils.Point, int) -> list[SpatialLike]
+        x = int(math.floor(point[0] / self.cell_size))
+        y = int(math.floor(point[1] / self.cell_size))
+        i, j = x - self._x, y - self._y
+        if 0 <= i < self._width and 0 <= j < self._height:
+            cell = self.cells[j * self._width + i]
+        else:
+            cell = self._outside.get((x, y))
+
+        px, py = point[0], point[1]
+        items = []
+        for entry in cell or ():
+            if entry[0] <= px <= entry[2] and entry[1] <= py <= entry[3]:
+                if limit is not None and len(items) >= limit:
+                    break
+                items.append(entry[4])
+
+        return items
+
+    def get_in_area(self, area, limit=None):
+        # type: (utils.AABB, int) -> list[SpatialLike]
+        if limit is not None and limit <= 0:
+            return []
+
+        if area is None:
+            return []
+
+        x1, y1 = area.world_top_left
+        x2, y2 = area.world_bot_right
+        items = []
+        for entry in self._get_candidates(area):
+            if entry[0] < x2 and entry[2] > x1 and entry[1] < y2 and entry[3] > y1:
+                items.append(entry[4])
+                if len(items) == limit:
+                    break
+
+        return items
+
+    def _get_candidates(self, area):
+        # type: (utils.AABB) -> Iterator[tuple]
+        """
+        Yields the entry of every item in the cells that ``area`` covers, once
+        each. Entries are tuples of the form ``(x1, y1, x2, y2, item)``.
+        """
+        seen = set()
+        cell_range = self._clipped_cell_range(area)
+        if cell_range is not None:
+            min_x, min_y, max_x, max_y = cell_range
+            cells = self.cells
+            for j in range(min_y - self._y, max_y - self._y + 1):
+                row = j * self._width - self._x
+                for i in range(min_x, max_x + 1):
+                    for entry in cells[row + i] or ():
+                        if id(entry) not in seen:
+                            seen.add(id(entry))
+                            yield entry
+
+        if not self._outside:
+            return
+        cell_range = self._cell_range(area)
+        if self._contains(cell_range):
+            return
+        for cell in self._iter_outside_cells(cell_range):
+            for entry in cell:
+                if id(entry) not in seen:
+                    seen.add(id(entry))
+                    yield entry
+
+    def _cell_range(self, aabb):
+        # type: (utils.AABB) -> tuple[int, int, int, int]
+        """
+        Get the range of map-coordinates that a world-space AABB covers.
+
+        :param aabb: AABB to search, or ``None``.
+
+        :returns: A tuple of ``(min_x, min_y, max_x, max_y)``, inclusive, or
+            ``None`` if ``aabb`` is ``None``.
+        """
+        if aabb is None:
+            return None
+
+        # Add a small error to under-round if aabb lands on cell boundary
+        eps = 0.001
+        cell_size = self.cell_size
+        return (
+            int(math.floor(aabb.world_top_left[0] / cell_size)),
+            int(math.floor(aabb.world_top_left[1] / cell_size)),
+            int(math.floor((aabb.world_bot_right[0] - eps) / cell_size)),
+            int(math.floor((aabb.world_bot_right[1] - eps) / cell_size)),
+        )
+
+    def _clipped_cell_range(self, aabb):
+        # type: (utils.AABB) -> tuple[int, int, int, int]
+        """
+        Same as :py:meth:`_cell_range`, but limited to the cells inside the
+        grid. Returns ``None`` if ``aabb`` lies entirely outside of it.
+        """
+        cell_range = self._cell_range(aabb)
+        if cell_range is None:
+            return None
+
+        min_x = max(cell_range[0], self._x)
+        min_y = max(cell_range[1], self._y)
+        max_x = min(cell_range[2], self._x + self._width - 1)
+        max_y = min(cell_range[3], self._y + self._height - 1)
+        if min_x > max_x or min_y > max_y:
+            return None
+
+        return (min_x, min_y, max_x, max_y)
+
+    def _contains(self, cell_range):
+        # type: (tuple[int, int, int, int]) -> bool
+        """
+        Returns whether or not every cell in ``cell_range`` is inside the grid.
+        """
+        return (
+            cell_range[0] >= self._x
+            and cell_range[1] >= self._y
+            and cell_range[2] < self._x + self._width
+            and cell_range[3] < self._y + self._height
+        )
+
+    def _iter_cells(self, cell_range, create=False):
+        # type: (tuple[int, int, int, int], bool) -> Iterator[list]
+        """
+        Yields every non-empty cell in ``cell_range``, whether inside the grid
+        or outside of it. If ``create`` is ``True``, empty cells are created
+        and yielded too.
+        """
+        min_x, min_y, max_x, max_y = cell_range
+        cells = self.cells
+        for y in range(min_y, max_y + 1):
+            j = y - self._y
+            for x in range(min_x, max_x + 1):
+                i = x - self._x
+                if 0 <= i < self._width and 0 <= j < self._height:
+                    index = j * self._width + i
+                    if cells[index] is None and create:
+                        cells[index] = []
+                    cell = cells[index]
+                elif create:
+                    cell = self._outside.setdefault((x, y), [])
+                else:
+                    cell = self._outside.get((x, y))
+                if cell is not None:
+                    yield cell
+
+    def _iter_outside_cells(self, cell_range):
+        # type: (tuple[int, int, int, int]) -> Iterator[list]
+        """
+        Yields every cell outside of the grid in ``cell_range``. Looks up each
+        cell in the range, or checks every outside cell instead if there are
+        fewer of them.
+        """
+        min_x, min_y, max_x, max_y = cell_range
+        if (max_x - min_x + 1) * (max_y - min_y + 1) <= len(self._outside):
+            for y in range(min_y, max_y + 1):
+                for x in range(min_x, max_x + 1):
+                    cell = self._outside.get((x, y))
+                    if cell is not None:
+                        yield cell
+        else:
+            for (x, y), cell in self._outside.items():
+                if min_x <= x <= max_x and min_y <= y <= max_y:
+                    yield cell
+
+    def _remove_empty_cells(self, cell_range):
+        # type: (tuple[int, int, int, int]) -> None
+        """
+        Replaces every empty cell in ``cell_range`` inside the grid with
+        ``None``, and deletes those outside of it.
+        """
+        min_x, min_y, max_x, max_y = cell_range
+        cells = self.cells
+        for y in range(min_y, max_y + 1):
+            j = y - self._y
+            for x in range(min_x, max_x + 1):
+                i = x - self._x
+                if 0 <= i < self._width and 0 <= j < self._height:
+                    if cells[j * self._width + i] == []:
+                        cells[j * self._width + i] = None
+                elif self._outside.get((x, y)) == []:
+                    del self._outside[(x, y)]
+
+    def _grow(self, min_x, min_y, max_x, max_y):
+        # type: (int, int, int, int) -> None
+        """
+        Resizes the grid so that it includes the given range of
+        map-coordinates, keeping the contents of every existing cell. Does
+        nothing if the grid would have more cells than its items allow; see
+        :py:data:`GRID_CELLS_PER_ITEM`.
+        """
+        max_cells = max(GRID_MINIMUM_CELLS, GRID_CELLS_PER_ITEM * self._count)
+        if self._width == 0:
+            new_x, new_y, new_max_x, new_max_y = min_x, min_y, max_x, max_y
+        else:
+            old_max_x = self._x + self._width - 1
+            old_max_y = self._y + self._height - 1
+            new_x, new_y = min(min_x, self._x), min(min_y, self._y)
+            new_max_x, new_max_y = max(max_x, old_max_x), max(max_y, old_max_y)
+
+            # Grow by at least half of the current size in each direction that
+            # needs it (if there's room), so that adding items one at a time
+            # only has to resize the grid a handful of times
+            pad_x = self._width // 2 + 1
+            pad_y = self._height // 2 + 1
+            padded_x = min(new_x, self._x - pad_x) if min_x < self._x else new_x
+            padded_y = min(new_y, self._y - pad_y) if min_y < self._y else new_y
+            padded_max_x = (
+                max(new_max_x, old_max_x + pad_x) if max_x > old_max_x else new_max_x
+            )
+            padded_max_y = (
+                max(new_max_y, old_max_y + pad_y) if max_y > old_max_y else new_max_y
+            )
+            padded_cells = (padded_max_x - padded_x + 1) * (padded_max_y - padded_y + 1)
+            if padded_cells <= max_cells:
+                new_x, new_y = padded_x, padded_y
+                new_max_x, new_max_y = padded_max_x, padded_max_y
+
+        width = new_max_x - new_x + 1
+        height = new_max_y - new_y + 1
+        if width * height > max_cells:
+            return
+
+        cells = [None] * (width * height)
+        for j in range(self._height):
+            start = (j + self._y - new_y) * width + self._x - new_x
+            cells[start : start + self._width] = self.cells[
+                j * self._width : (j + 1) * self._width
+            ]
+
+        self.cells = cells
+        self._x, self._y = new_x, new_y
+        self._width, self._height = width, height
+
+        # Move any cells outside of the old grid that are now inside
+        for x, y in list(self._outside):
+            i, j = x - new_x, y - new_y
+            if 0 <= i < width and 0 <= j < height:
+                cells[j * width + i] = self._outside.pop((x, y))
@@ -3,17 +3,12 @@
 
 from __future__ import unicode_literals
 
-from draftsman.classes.collection import EntityCollection
 from draftsman.classes.spatiallike import SpatialLike
 from draftsman.classes.spatial_data_structure import SpatialDataStructure
-from draftsman.prototypes.straight_rail import StraightRail
-from draftsman.prototypes.curved_rail import CurvedRail
 from draftsman import utils
-from draftsman.warning import OverlappingObjectsWarning
 
 import math
-from typing import Sequence
-import warnings
+from typing import Callable, Iterable, Sequence
 
 
 class SpatialHashMap(SpatialDataStructure):
@@ -31,9 +26,14 @@ class SpatialHashMap(SpatialDataStructure):
         """
         self.cell_size = cell_size
         self.map = {}
+        # Items passed to `rebuild()` that have yet to be added
+        self._unindexed = None
 
     def add(self, item):
         # type: (SpatialLike, bool) -> None
+        if self._unindexed is not None:
+            self._index()
+
         item_region = item.get_world_bounding_box()
 
         # Get cells based off of collision_box
@@ -44,16 +44,11 @@ class SpatialHashMap(SpatialDataStructure):
             except KeyError:
                 self.map[cell_coord] = [item]
 
-    def recursive_add(self, item):
-        # type: (SpatialLike, bool) -> None
-        if hasattr(item, "entities"):
-            for sub_item in item.entities:
-                self.recursive_add(sub_item)
-        else:
-            self.add(item)
-
     def remove(self, item):
         # type: (SpatialLike) -> None
+        if self._unindexed is not None:
+            self._index()
+
         cell_coords = self._cell_coords_from_aabb(item.get_world_bounding_box())
         for cell_coord in cell_coords:
             try:
@@ -64,99 +59,99 @@ class SpatialHashMap(SpatialDataStructure):
             except:
                 pass
 
-    def recursive_remove(self, item):
-        # type: (SpatialLike) -> None
-        if hasattr(item, "entities"):
-            for sub_item in item.entities:
-                self.recursive_remove(sub_item)
-        else:
-            self.remove(item)
-
     def clear(self):
         # type: () -> None
         self.map.clear()
+        self._unindexed = None
 
-    def handle_overlapping(self, item, merge):
-        # type: (SpatialLike, bool) -> None
-        """
-        Handles overlapping items if ``item`` were to be added to this hashmap.
-        Issues overlapping objects warnings and merges entities if desired.
-
-        .. Warning::
+    def rebuild(self, items):
+        # type: (Iterable[SpatialLike]) -> None
+        # Every item is added when the map is next used, so transforming a
+        # collection many times in a row only adds them once
+        self.map.clear()
+        self._unindexed = list(items)
 
-            This function may not be permanent, or it may move somewhere else in
-            future versions.
+    def _index(self):
+        # type: () -> None
         """
-        if isinstance(item, EntityCollection):
-            # Recurse through all subentities
-            merged_entities = []  # keep track of merged entities, if any
-            for i, sub_entity in enumerate(item.entities):
-                result = self.handle_overlapping(sub_entity, merge)
-                if result is None:
-                    merged_entities.append(sub_entity)
-
-            # Remove all merged entities from the list
-            for entity in merged_entities:
-                item.entities.remove(entity)
-
-            # Note: `item` here might be a Group with NO entities in it; this is
-            # deliberate
-            return item
-        else:
-            item_region = item.get_world_bounding_box()
-            overlapping_items = self.get_in_area(item_region)
-            for overlapping_item in overlapping_items:
-                # If we can merge the two items and this is desired, do so first
-                if merge and overlapping_item.mergable_with(item):
-                    overlapping_item.merge(item)
-                    return None
-
-                # Otherwise, we now check to issue and OverlappingObjectsWarning
-                # Only the broadphase has taken place up until this point, so we
-                # now do the proper collision check
-                item_collision_set = item.get_world_collision_set()
-                overlapping_collision_set = overlapping_item.get_world_collision_set()
-                if not item_collision_set.overlaps(overlapping_collision_set):
-                    continue
-
-                # If we get here, we know that geometrically at least they are
-                # overlapping, but we also need to check to see if they have the
-                # same collision layers
-                item_layers = item.collision_mask
-                other_layers = overlapping_item.collision_mask
-
-                # StraightRails and CurvedRails cannot collide with each other
-                # UNLESS they are the same type, face the same direction, and
-                # exist at the exact same place
-                if isinstance(item, (StraightRail, CurvedRail)) and isinstance(
-                    overlapping_item, (StraightRail, CurvedRail)
-                ):
-                    identical = (
-                        item.name == overlapping_item.name
-                        and item.direction == overlapping_item.direction
-                        and item.global_position == overlapping_item.global_position
-                    )
-                    if not identical:
-                        continue
-
-                if len(other_layers.intersection(item_layers)) > 0:
-                    warnings.warn(
-                        "Added object '{}' ({}) at {} intersects '{}' ({}) at {}".format(
-                            item.name,
-                            type(item).__name__,
-                            item.global_position,
-                            overlapping_item.name,
-                            type(overlapping_item).__name__,
-                            overlapping_item.global_position,
-                        ),
-                        OverlappingObjectsWarning,
-                        stacklevel=2,
-                    )
-
-            return item
+        Adds all of the items passed to :py:meth:`rebuild`.
+        """
+        items = self._unindexed
+        self._unindexed = None
+        for item in items:
+            self.recursive_add(item)
+
+    def recursive_add_batch(self, items):
+        # type: (list[SpatialLike]) -> None
+        # Same as the default implementation, but the items are added to and
+        # checked against the cells directly in a single sweep
+        if self._unindexed is not None:
+            self._index()
+
+        # Keep track of which of the given items every leaf belongs to, so that
+        # we only check against leaves that would have been added before it
+        # (and never against leaves of the same Group)
+        order = {}
+        leaves = []
+        # World bounding boxes are needed many times during the sweep, so we
+        # only calculate them once per item
+        bounding_boxes = {}
+
+        def get_bounding_box(item):
+            try:
+                return bounding_boxes[id(item)]
+            except KeyError:
+                bounding_box = item.get_world_bounding_box()
+                bounding_boxes[id(item)] = bounding_box
+                return bounding_box
+
+        def add_leaves(item, index):
+            if hasattr(item, "entities"):
+                for sub_item in item.entities:
+                    add_leaves(sub_item, index)
+            else:
+                for cell_coord in self._cell_coords_from_aabb(get_bounding_box(item)):
+                    try:
+                        self.map[cell_coord].append(item)
+                    except KeyError:
+                        self.map[cell_coord] = [item]
+                order[id(item)] = index
+                leaves.append(item)
+
+        for index, item in enumerate(items):
+            add_leaves(item, index)
+
+        # Equivalent to `get_in_area()`, but with cached bounding boxes
+        try:
+            for leaf in leaves:
+                index = order[id(leaf)]
+                area = bounding_boxes[id(leaf)]
+                seen = set()
+                for cell_coord in self._cell_coords_from_aabb(area):
+                    for overlapping_item in self.map.get(cell_coord, ()):
+                        if id(overlapping_item) in seen:
+                            continue
+                        seen.add(id(overlapping_item))
+
+                        if order.get(id(overlapping_item), -1) >= index:
+                            continue
+
+                        if utils.aabb_overlaps_aabb(
+                            get_bounding_box(overlapping_item), area
+                        ):
+                            self._warn_if_overlapping(leaf, overlapping_item)
+        except BaseException:
+            # A warning was turned into an error; leave the map as it was
+            # before
+            for leaf in leaves:
+                self.remove(leaf)
+            raise
 
     def get_all_entities(self):
         # type: () -> list[SpatialLike]
+        if self._unindexed is not None:
+            self._index()
+
         items = []
         for cell_coord in self.map:
             for item in self.map[cell_coord]:
@@ -166,26 +161,35 @@ class SpatialHashMap(SpatialDataStructure):
 
     def get_in_radius(self, radius, point, limit=None):
         # type: (float, Sequence[float], int) -> list[SpatialLike]
+        if limit is not None and limit <= 0:
+            return []
+        if self._unindexed is not None:
+            self._index()
+
         cell_coords = self._cell_coords_from_radius(radius, point)
         items = []
+        # Make sure we dont test or add the same item multiple times if it is
+        # spread across multiple cells
+        seen = set()
         for cell_coord in cell_coords:
-            if cell_coord in self.map:
-                for item in self.map[cell_coord]:
-                    item_pos = (item.global_position.x, item.global_position.y)
-                    if utils.point_in_circle(item_pos, radius, point):
-                        if limit is not None and len(items) >= limit:
-                            break
-                        # Make sure we dont add the same item multiple times if
-                        # it is spread across multiple cells
-                        try:
-                            items.index(item)
-                        except ValueError:
-                            items.append(item)
+            for item in self.map.get(cell_coord, ()):
+                if id(item) in seen:
+                    continue
+                seen.add(id(item))
+
+                item_pos = (item.global_position.x, item.global_position.y)
+                if utils.point_in_circle(item_pos, radius, point):
+                    items.append(item)
+                    if len(items) == limit:
+                        return items
 
         return items
 
     def get_on_point(self, point, limit=None):
         # type: (utils.Point, int) -> list[SpatialLike]
+        if self._unindexed is not None:
+            self._index()
+
         cell_coord = self._map_coords(point)
         items = []
         if cell_coord in self.map:
@@ -199,23 +203,153 @@ class SpatialHashMap(SpatialDataStructure):
 
     def get_in_area(self, area, limit=None):
         # type: (utils.AABB, int) -> list[SpatialLike]
+        if limit is not None and limit <= 0:
+            return []
+        if self._unindexed is not None:
+            self._index()
+
         cell_coords = self._cell_coords_from_aabb(area)
         items = []
+        # Make sure we dont test or add the same item multiple times if it is
+        # spread across multiple cells
+        seen = set()
         for cell_coord in cell_coords:
-            if cell_coord in self.map:
-                for item in self.map[cell_coord]:
-                    if utils.aabb_overlaps_aabb(item.get_world_bounding_box(), area):
-                        if limit is not None and len(items) >= limit:
-                            break
-                        # Make sure we dont add the same item multiple times if
-                        # it is spread across multiple cells
-                        try:
-                            items.index(item)
-                        except ValueError:
-                            items.append(item)
+            for item in self.map.get(cell_coord, ()):
+                if id(item) in seen:
+                    continue
+                seen.add(id(item))
+
+                if utils.aabb_overlaps_aabb(item.get_world_bounding_box(), area):
+                    items.append(item)
+                    if len(items) == limit:
+                        return items
 
         return items
 
+    def get_in_radii(self, radii, points, limit=None):
+        # type: (Sequence[float], Sequence[utils.Point], int) -> list[list[SpatialLike]]
+        if limit is not None and limit <= 0:
+            return [[] for _ in points]
+
+        circles = [(radius, point[0], point[1]) for radius, point in zip(radii, points)]
+        positions = {}
+
+        def test(index, item):
+            try:
+                x, y = positions[id(item)]
+            except KeyError:
+                x, y = positions[id(item)] = (
+                    item.global_position.x,
+                    item.global_position.y,
+                )
+            radius, px, py = circles[index]
+            dx, dy = x - px, y - py
+            return dx * dx + dy * dy <= radius * radius
+
+        return self._get_in_cells_batch(
+            [
+                self._cell_coords_from_radius(radius, (px, py))
+                for radius, px, py in circles
+            ],
+            test,
+            limit,
+        )
+
+    def get_on_points(self, points, limit=None):
+        # type: (Sequence[utils.Point], int) -> list[list[SpatialLike]]
+        if limit is not None and limit <= 0:
+            return [[] for _ in points]
+
+        points = [(point[0], point[1]) for point in points]
+        boxes = {}
+
+        def test(index, item):
+            box = boxes.get(id(item))
+            if box is None:
+                box = boxes[id(item)] = self._get_bounds(item)
+            px, py = points[index]
+            return box[0] <= px <= box[2] and box[1] <= py <= box[3]
+
+        return self._get_in_cells_batch(
+            [[self._map_coords(point)] for point in points], test, limit
+        )
+
+    def get_in_areas(self, areas, limit=None):
+        # type: (Sequence[utils.AABB], int) -> list[list[SpatialLike]]
+        if limit is not None and limit <= 0:
+            return [[] for _ in areas]
+
+        bounds = [
+            None if area is None else area.world_top_left + area.world_bot_right
+            for area in areas
+        ]
+        boxes = {}
+
+        def test(index, item):
+            box = boxes.get(id(item))
+            if box is None:
+                box = boxes[id(item)] = self._get_bounds(item)
+            x1, y1, x2, y2 = bounds[index]
+            return box[0] < x2 and box[2] > x1 and box[1] < y2 and box[3] > y1
+
+        return self._get_in_cells_batch(
+            [self._cell_coords_from_aabb(area) for area in areas], test, limit
+        )
+
+    def _get_in_cells_batch(self, cells, test, limit):
+        # type: (list[list[tuple[int, int]]], Callable[[int, SpatialLike], bool], int) -> list[list[SpatialLike]]
+        """
+        Answers many queries in a single pass over the map. Each cell is only
+        visited once, however many of the queries cover it, and each query
+        finds the same items in the same order as it would on its own.
+
+        :param cells: The map-coordinates that each query covers, in the order
+            that a single query would search them.
+        :param test: A function which takes the index of a query and an item
+            in one of its cells, and returns ``True`` if the item matches it.
+        :param limit: A maximum amount of items to find for each query.
+
+        :returns: A ``list`` of the items that matched each query.
+        """
+        if self._unindexed is not None:
+            self._index()
+
+        queries_in_cell = {}
+        for index, cell_coords in enumerate(cells):
+            for cell_coord in cell_coords:
+                if cell_coord not in self.map:
+                    continue
+                try:
+                    queries_in_cell[cell_coord].append(index)
+                except KeyError:
+                    queries_in_cell[cell_coord] = [index]
+
+        results = [[] for _ in cells]
+        seen = [set() for _ in cells]
+        # Single queries search their cells row by row, so visiting every cell
+        # in that order keeps the results of each query in the same order
+        for cell_coord in sorted(queries_in_cell, key=lambda c: (c[1], c[0])):
+            indices = queries_in_cell[cell_coord]
+            for item in self.map[cell_coord]:
+                for index in indices:
+                    items = results[index]
+                    if len(items) == limit or id(item) in seen[index]:
+                        continue
+                    seen[index].add(id(item))
+                    if test(index, item):
+                        items.append(item)
+
+        return results
+
+    def _get_bounds(self, item):
+        # type: (SpatialLike) -> list[float]
+        """
+        Gets the world-space bounding box of ``item`` as a list of
+        ``[x1, y1, x2, y2]``.
+        """
+        box = item.get_world_bounding_box()
+        return box.world_top_left + box.world_bot_right
+
     def _map_coords(self, point):
         # type: (list[float]) -> tuple[int, int]
         """
@@ -243,15 +377,19 @@ class SpatialHashMap(SpatialDataStructure):
 
         # Add a small error to under-round if aabb lands on cell boundary
         eps = 0.001
-        grid_min = self._map_coords(aabb.top_left)
-        grid_max = self._map_coords([aabb.bot_right[0] - eps, aabb.bot_right[1] - eps])
+        cell_size = self.cell_size
+        min_x = int(math.floor(aabb.top_left[0] / cell_size))
+        min_y = int(math.floor(aabb.top_left[1] / cell_size))
+        max_x = int(math.floor((aabb.bot_right[0] - eps) / cell_size))
+        max_y = int(math.floor((aabb.bot_right[1] - eps) / cell_size))
 
-        grid_width = grid_max[0] - grid_min[0] + 1
-        grid_height = grid_max[1] - grid_min[1] + 1
+        # Most objects fit inside a single cell
+        if min_x == max_x and min_y == max_y:
+            return [(min_x, min_y)]
 
         cells = []
-        for j in range(grid_min[1], grid_min[1] + grid_height):
-            for i in range(grid_min[0], grid_min[0] + grid_width):
+        for j in range(min_y, max_y + 1):
+            for i in range(min_x, max_x + 1):
                 cells.append((i, j))
 
         return cells
@@ -0,0 +1,364 @@
+# spatial_rtree.py
+# -*- encoding: utf-8 -*-
+
+from __future__ import unicode_literals, division
+
+from draftsman.classes.spatiallike import SpatialLike
+from draftsman.classes.spatial_data_structure import SpatialDataStructure
+from draftsman import utils
+
+import math
+from typing import Iterable, Sequence
+
+
+class _Node(object):
+    """
+    A node of a :py:class:`.SpatialRTree`. Leaf nodes contain entries of the
+    form ``[x1, y1, x2, y2, item]``, and every other node contains more nodes.
+    """
+
+    __slots__ = ("box", "children", "leaf")
+
+    def __init__(self, children, leaf):
+        # type: (list, bool) -> None
+        self.children = children
+        self.leaf = leaf
+        self.update_box()
+
+    def update_box(self):
+        # type: () -> None
+        """
+        Sets ``box`` to the minimum bounding box around every child.
+        """
+        boxes = self.children if self.leaf else [child.box for child in self.children]
+        self.box = [
+            min(box[0] for box in boxes),
+            min(box[1] for box in boxes),
+            max(box[2] for box in boxes),
+            max(box[3] for box in boxes),
+        ]
+
+
+class SpatialRTree(SpatialDataStructure):
+    """
+    Implementation of a :py:class:`.SpatialDataStructure` using an R-tree: a
+    tree of nested bounding boxes around groups of nearby items. Queries only
+    visit the branches of the tree that could contain a match, so their cost
+    depends on the number of items found rather than the size of the area
+    searched.
+
+    Best suited to sparse collections that are spread over a large area, like
+    rail networks, where most cells of a :py:class:`.SpatialHashMap` or
+    :py:class:`.SpatialGrid` would be empty. :py:meth:`rebuild` packs every item
+    into a balanced tree at once, which is faster and produces a better tree
+    than adding them one at a time.
+
+    Each item's bounding box is stored when it's added, so items must be
+    removed before they are moved and added again afterwards (as is already
+    the case for every :py:class:`.EntityCollection`).
+
+    Removing an item shrinks the boxes of the nodes above it to fit what's
+    left, so queries never search branches that used to contain it. Nodes left
+    with only a few children are not merged with their neighbours, though, so
+    after removing a large portion of the items the tree has more nodes than
+    it needs; calling :py:meth:`rebuild` packs it tightly again.
+    """
+
+    def __init__(self, max_entries=16):
+        # type: (int) -> None
+        """
+        Create a new :py:class:`.SpatialRTree`.
+
+        :param max_entries: The maximum number of children of each node of the
+            tree.
+        """
+        self.max_entries = max_entries
+        self.clear()
+
+    def add(self, item):
+        # type: (SpatialLike) -> None
+        box = item.get_world_bounding_box()
+        if box is None:
+            return
+
+        x1, y1 = box.world_top_left
+        x2, y2 = box.world_bot_right
+        entry = [x1, y1, x2, y2, item]
+        if self._root is None:
+            self._root = _Node([entry], leaf=True)
+        else:
+            split = self._insert(self._root, entry)
+            if split is not None:
+                self._root = _Node([self._root, split], leaf=False)
+        self._count += 1
+
+    def remove(self, item):
+        # type: (SpatialLike) -> None
+        if self._root is None:
+            return
+
+        box = item.get_world_bounding_box()
+        if box is not None:
+            area = box.world_top_left + box.world_bot_right
+            found = self._remove(self._root, item, area)
+        else:
+            found = False
+        # If the item has moved since it was added, search the entire tree
+        if not found and not self._remove(self._root, item, None):
+            return
+
+        self._count -= 1
+        if self._count == 0:
+            self._root = None
+
+    def clear(self):
+        # type: () -> None
+        self._root = None
+        self._count = 0
+
+    def rebuild(self, items):
+        # type: (Iterable[SpatialLike]) -> None
+        leaves = []
+
+        def add_leaves(item):
+            if hasattr(item, "entities"):
+                for sub_item in item.entities:
+                    add_leaves(sub_item)
+            else:
+                box = item.get_world_bounding_box()
+                if box is not None:
+                    x1, y1 = box.world_top_left
+                    x2, y2 = box.world_bot_right
+                    leaves.append([x1, y1, x2, y2, item])
+
+        for item in items:
+            add_leaves(item)
+
+        self.clear()
+        if not leaves:
+            return
+
+        # Sort-Tile-Recursive bulk loading: pack the entries into leaves of
+        # neighbouring entries, then pack those into nodes, and so on
+        nodes = self._pack(leaves, leaf=True)
+        while len(nodes) > 1:
+            nodes = self._pack(nodes, leaf=False)
+        self._root = nodes[0]
+        self._count = len(leaves)
+
+    def get_all_entities(self):
+        # type: () -> list[SpatialLike]
+        items = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            if node.leaf:
+                items.extend(entry[4] for entry in node.children)
+            else:
+                stack.extend(reversed(node.children))
+
+        return items
+
+    def get_in_radius(self, radius, point, limit=None):
+        # type: (float, Sequence[float], int) -> list[SpatialLike]
+        if limit is not None and limit <= 0:
+            return []
+
+        px, py = point[0], point[1]
+        r2 = radius * radius
+
+        def in_range(box):
+            # Distance from the point to the nearest point in the box
+            dx = max(box[0] - px, 0, px - box[2])
+            dy = max(box[1] - py, 0, py - box[3])
+            return dx * dx + dy * dy <= r2
+
+        items = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            if not in_range(node.box):
+                continue
+            if node.leaf:
+                for entry in node.children:
+                    item = entry[4]
+                    item_pos = (item.global_position.x, item.global_position.y)
+                    if utils.point_in_circle(item_pos, radius, point):
+                        items.append(item)
+                        if len(items) == limit:
+                            return items
+            else:
+                stack.extend(reversed(node.children))
+
+        return items
+
+    def get_on_point(self, point, limit=None):
+        # type: (utils.Point, int) -> list[SpatialLike]
+        px, py = point[0], point[1]
+        items = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            box = node.box
+            if px < box[0] or px > box[2] or py < box[1] or py > box[3]:
+                continue
+            if node.leaf:
+                for entry in node.children:
+                    if entry[0] <= px <= entry[2] and entry[1] <= py <= entry[3]:
+                        if limit is not None and len(items) >= limit:
+                            return items
+                        items.append(entry[4])
+            else:
+                stack.extend(reversed(node.children))
+
+        return items
+
+    def get_in_area(self, area, limit=None):
+        # type: (utils.AABB, int) -> list[SpatialLike]
+        if limit is not None and limit <= 0:
+            return []
+        if area is None:
+            return []
+
+        x1, y1 = area.world_top_left
+        x2, y2 = area.world_bot_right
+        items = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            box = node.box
+            # Nodes only need to be searched if they overlap the area in the
+            # same way that their entries must
+            if box[0] >= x2 or box[2] <= x1 or box[1] >= y2 or box[3] <= y1:
+                continue
+            if node.leaf:
+                for entry in node.children:
+                    if (
+                        entry[0] < x2
+                        and entry[2] > x1
+                        and entry[1] < y2
+                        and entry[3] > y1
+                    ):
+                        items.append(entry[4])
+                        if len(items) == limit:
+                            return items
+            else:
+                stack.extend(reversed(node.children))
+
+        return items
+
+    def _insert(self, node, entry):
+        # type: (_Node, list) -> _Node
+        """
+        Adds ``entry`` to the leaf below ``node`` that needs to grow the least
+        to contain it, splitting any nodes that end up with too many children.
+
+        :returns: The new sibling of ``node`` if it was split, or ``None``.
+        """
+        box = node.box
+        box[0] = min(box[0], entry[0])
+        box[1] = min(box[1], entry[1])
+        box[2] = max(box[2], entry[2])
+        box[3] = max(box[3], entry[3])
+
+        if node.leaf:
+            node.children.append(entry)
+        else:
+            best = None
+            best_cost = None
+            for child in node.children:
+                b = child.box
+                area = (b[2] - b[0]) * (b[3] - b[1])
+                enlarged = (max(b[2], entry[2]) - min(b[0], entry[0])) * (
+                    max(b[3], entry[3]) - min(b[1], entry[1])
+                )
+                cost = (enlarged - area, area)
+                if best_cost is None or cost < best_cost:
+                    best, best_cost = child, cost
+            split = self._insert(best, entry)
+            if split is not None:
+                node.children.append(split)
+
+        if len(node.children) > self.max_entries:
+            return self._split(node)
+        return None
+
+    def _split(self, node):
+        # type: (_Node) -> _Node
+        """
+        Splits the children of ``node`` in half along the axis that they are
+        most spread out on, keeping one half and returning a new node with the
+        other.
+        """
+        boxes = node.children if node.leaf else [child.box for child in node.children]
+        spread_x = max(b[0] + b[2] for b in boxes) - min(b[0] + b[2] for b in boxes)
+        spread_y = max(b[1] + b[3] for b in boxes) - min(b[1] + b[3] for b in boxes)
+        axis = 0 if spread_x >= spread_y else 1
+
+        order = sorted(
+            range(len(boxes)), key=lambda i: boxes[i][axis] + boxes[i][axis + 2]
+        )
+        children = node.children
+        half = len(order) // 2
+        node.children = [children[i] for i in order[:half]]
+        node.update_box()
+        return _Node([children[i] for i in order[half:]], node.leaf)
+
+    def _remove(self, node, item, area):
+        # type: (_Node, SpatialLike, list[float]) -> bool
+        """
+        Removes ``item`` from the leaf below ``node`` that contains it. Only
+        searches the branches whose boxes contain ``area``, unless ``area`` is
+        ``None``.
+
+        :returns: ``True`` if ``item`` was found, ``False`` otherwise.
+        """
+        box = node.box
+        if area is not None and (
+            area[0] < box[0] or area[1] < box[1] or area[2] > box[2] or area[3] > box[3]
+        ):
+            return False
+
+        if node.leaf:
+            for i, entry in enumerate(node.children):
+                if entry[4] is item:
+                    del node.children[i]
+                    if node.children:
+                        node.update_box()
+                    return True
+            return False
+
+        for child in node.children:
+            if self._remove(child, item, area):
+                # Empty nodes are removed, and every other node on the way back
+                # up shrinks to fit its remaining children
+                if not child.children:
+                    node.children.remove(child)
+                if node.children:
+                    node.update_box()
+                return True
+        return False
+
+    def _pack(self, children, leaf):
+        # type: (list, bool) -> list[_Node]
+        """
+        Groups ``children`` into nodes of up to :py:attr:`max_entries` each;
+        sorted into vertical slices by their x position, and then by their y
+        position within each slice.
+        """
+        boxes = children if leaf else [child.box for child in children]
+        order = sorted(range(len(children)), key=lambda i: boxes[i][0] + boxes[i][2])
+        node_count = int(math.ceil(len(children) / self.max_entries))
+        slice_size = int(math.ceil(math.sqrt(node_count))) * self.max_entries
+
+        nodes = []
+        for start in range(0, len(order), slice_size):
+            strip = sorted(
+                order[start : start + slice_size],
+                key=lambda i: boxes[i][1] + boxes[i][3],
+            )
+            for i in range(0, len(strip), self.max_entries):
+                group = [children[j] for j in strip[i : i + self.max_entries]]
+                nodes.append(_Node(group, leaf))
+
+        return nodes
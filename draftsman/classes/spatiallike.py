@@ -16,6 +16,8 @@ class SpatialLike(object):
     can be added to a :py:class:`~draftsman.classes.spatialhashmap.SpatialHashMap`.
     """
 
+    __slots__ = ()
+
     @abc.abstractproperty
     def position(self):  # pragma: no coverage
         # type: () -> Vector
@@ -66,10 +68,11 @@ class SpatialLike(object):
         # Offset the bounding box by the global position of the SpatialLike to
         # get the world-space box
         if bounding_box is not None:
-            bounding_box.top_left[0] += self.global_position.x
-            bounding_box.top_left[1] += self.global_position.y
-            bounding_box.bot_right[0] += self.global_position.x
-            bounding_box.bot_right[1] += self.global_position.y
+            x, y = self.global_position.data
+            bounding_box.top_left[0] += x
+            bounding_box.top_left[1] += y
+            bounding_box.bot_right[0] += x
+            bounding_box.bot_right[1] += y
 
         return bounding_box
 
@@ -26,11 +26,21 @@ if TYPE_CHECKING:  # pragma: no coverage
     from draftsman.classes.blueprint import Blueprint
 
 
+# Every tile occupies exactly one grid square, so they all share a single
+# CollisionSet; it's copied by `get_world_collision_set()` before offsetting
+_tile_collision_set = CollisionSet([AABB(0, 0, 1, 1)])
+
+# Collision masks of each tile prototype, shared between tiles of the same name
+_tile_collision_masks = {}
+
+
 class Tile(SpatialLike):
     """
     Tile class. Used for keeping track of tiles in Blueprints.
     """
 
+    __slots__ = ("_parent", "_name", "_position")
+
     def __init__(self, name, position=(0, 0)):
         # type: (str, int, int) -> None
         """
@@ -53,13 +63,6 @@ class Tile(SpatialLike):
         # Tile positions are in grid coordinates
         self.position = position
 
-        # Tile AABB for SpatialHashMap
-        # self._collision_box = [[0, 0], [1, 1]]
-        self._collision_set = CollisionSet([AABB(0, 0, 1, 1)])
-
-        # Tile mask for SpatialHashMap
-        self._collision_mask = set(tiles.raw[self.name]["collision_mask"])
-
     # =========================================================================
 
     @property
@@ -149,13 +152,29 @@ class Tile(SpatialLike):
 
     @property
     def collision_set(self):
-        return self._collision_set
+        # type: () -> CollisionSet
+        return _tile_collision_set
 
     # =========================================================================
 
     @property
     def collision_mask(self):
-        return self._collision_mask
+        # type: () -> frozenset
+        try:
+            return _tile_collision_masks[self._name]
+        except KeyError:
+            mask = frozenset(tiles.raw[self._name]["collision_mask"])
+            _tile_collision_masks[self._name] = mask
+            return mask
+
+    # =========================================================================
+
+    def get_world_bounding_box(self):
+        # type: () -> AABB
+        # Every tile is a single grid square at its position, so the bounding
+        # box doesn't need to be derived from the collision set
+        x, y = self._position.data
+        return AABB(x, y, x + 1, y + 1)
 
     # =========================================================================
 
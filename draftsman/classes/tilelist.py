@@ -82,9 +82,6 @@ class TileList(MutableSequence):
         # Add a reference to the container in the object
         value._parent = self._parent
 
-        # TODO: this sucks, but it has to be like this
-        self._parent.recalculate_area()
-
     def __delitem__(self, idx):
         # type: (int) -> None
         if isinstance(idx, slice):
@@ -99,12 +96,12 @@ class TileList(MutableSequence):
         # Remove from self
         del self.data[idx]
 
-        # TODO: this sucks, but it has to be like this
-        self._parent.recalculate_area()
-
     def __len__(self):
         return len(self.data)
 
+    def __iter__(self):
+        return iter(self.data)
+
     def check_tile(self, tile):
         # type: (Tile) -> None
         if not isinstance(tile, Tile):
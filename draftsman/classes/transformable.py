@@ -2,10 +2,8 @@
 # -*- encoding: utf-8 -*-
 
 from draftsman.error import RotationError, FlippingError
-from draftsman.classes.vector import Vector
 from draftsman.warning import RailAlignmentWarning, FlippingWarning
-
-import warnings
+from draftsman import geometry, utils
 
 
 class Transformable(object):
@@ -30,7 +28,7 @@ class Transformable(object):
         # Warn if attempting to translate by an odd amount when containing
         # double-grid-aligned entities
         if self.double_grid_aligned and (x % 2 == 1 or y % 2 == 1):
-            warnings.warn(
+            utils.warn(
                 "Attempting to translate an odd number of tiles when this "
                 "Transformable contains double grid-aligned entities; Their "
                 "positions will be cast to the nearest grid square on export",
@@ -39,40 +37,31 @@ class Transformable(object):
             )
 
         # Entities
-        for entity in self.entities:
-            # Remove from map
-            self.entity_map.remove(entity)
-
+        positions = geometry.translate_points(
+            [entity.position.data for entity in self.entities], x, y
+        )
+        for entity, position in zip(self.entities, positions):
             entity._parent = None
 
             # Change entity position
-            # entity.position = entity.position + Vector(x, y)
-            entity.position += Vector(x, y)
+            entity.position = position
 
             entity._parent = self
 
-            # Re-add to map
-            self.entity_map.add(entity)
-
         # Tiles
         if hasattr(self, "tiles"):
-            for tile in self.tiles:
-                # Remove from map
-                self.tile_map.remove(tile)
-
+            positions = geometry.translate_points(
+                [tile.position.data for tile in self.tiles], x, y
+            )
+            for tile, position in zip(self.tiles, positions):
                 tile._parent = None
 
-                # Change entity position
-                # tile.position["x"] += x
-                # tile.position["y"] += y
-                tile.position += Vector(x, y)
+                # Change tile position
+                tile.position = position
 
                 tile._parent = self
 
-                # Re-add to map
-                self.tile_map.add(tile)
-
-        self.recalculate_area()
+        self.on_transform()
 
     def rotate(self, angle):
         # type: (int) -> None
@@ -103,63 +92,36 @@ class Transformable(object):
         if angle % 2 == 1:
             raise RotationError("Blueprints cannot be rotated by an odd number")
 
-        matrices = {
-            0: [1, 0, 0, 1],
-            2: [0, 1, -1, 0],
-            4: [-1, 0, 0, -1],
-            6: [0, -1, 1, 0],
-        }
-        matrix = matrices[angle]
-
         # Entities
-        for entity in self.entities:
-            # Remove from map
-            self.entity_map.remove(entity)
-
+        positions = geometry.rotate_points(
+            [entity.position.data for entity in self.entities], angle
+        )
+        for entity, position in zip(self.entities, positions):
             entity._parent = None
 
-            # Make a (separate!) copy of the position to transform
-            # pos = [entity.position["x"], entity.position["y"]]
-            pos = Vector(entity.position.x, entity.position.y)
-
             # Alter the direction
             if entity.rotatable:
                 entity.direction += angle
             # Alter (both) the position(s)
-            entity.position = (
-                pos.x * matrix[0] + pos.y * matrix[2],
-                pos.x * matrix[1] + pos.y * matrix[3],
-            )
+            entity.position = position
 
             entity._parent = self
 
-            # Re-add to map
-            self.entity_map.add(entity)
-
         # Tiles
         if hasattr(self, "tiles"):
-            for tile in self.tiles:
-                # Remove from map
-                self.tile_map.remove(tile)
-
+            # With tiles we rotate from their center
+            positions = geometry.rotate_points(
+                [tile.position.data for tile in self.tiles], angle, (0.5, 0.5)
+            )
+            for tile, position in zip(self.tiles, positions):
                 tile._parent = None
 
-                # Make a (separate!) copy of the position to transform
-                # With tiles we rotate from their center
-                pos = Vector(tile.position.x + 0.5, tile.position.y + 0.5)
-
                 # Alter the position
-                tile.position = (
-                    pos.x * matrix[0] + pos.y * matrix[2] - 0.5,
-                    pos.x * matrix[1] + pos.y * matrix[3] - 0.5,
-                )
+                tile.position = position
 
                 tile._parent = self
 
-                # Re-add to map
-                self.tile_map.add(tile)
-
-        self.recalculate_area()
+        self.on_transform()
 
     def flip(self, direction="horizontal"):
         # type: (str) -> None
@@ -183,7 +145,7 @@ class Transformable(object):
 
         # TODO: determine what entities are modded or not
         # if self.contains_modded_entities:
-        #     warnings.warn(
+        #     utils.warn(
         #         "Flipping the blueprint is not guaranteed to work when it has "
         #         "modded entities inside it; proceed with caution",
         #         FlippingWarning,
@@ -193,18 +155,13 @@ class Transformable(object):
         if direction not in {"horizontal", "vertical"}:
             raise ValueError("'direction' must be either 'horizontal' or 'vertical'")
 
-        matrices = {"horizontal": [-1, +1], "vertical": [+1, -1]}
-        matrix = matrices[direction]
-
         # Entities
-        for entity in self.entities:
-            # Remove from map
-            self.entity_map.remove(entity)
-
+        positions = geometry.flip_points(
+            [entity.position.data for entity in self.entities], direction
+        )
+        for entity, position in zip(self.entities, positions):
             entity._parent = None
 
-            # Make a (separate!) copy of the position to transform
-            pos = Vector(entity.position.x, entity.position.y)
             # Alter the direction
             if entity.rotatable:
                 if direction == "horizontal":
@@ -213,30 +170,37 @@ class Transformable(object):
                     entity.direction += (((-2 * entity.direction) % 8) - 4) % 8
 
             # Alter (both) the position(s)
-            entity.position = (pos.x * matrix[0], pos.y * matrix[1])
+            entity.position = position
 
             entity._parent = self
 
-            # Re-add to map
-            self.entity_map.add(entity)
-
         # Tiles
         if hasattr(self, "tiles"):
-            for tile in self.tiles:
-                # Remove from map
-                self.tile_map.remove(tile)
-
+            # With tiles we flip from their center
+            positions = geometry.flip_points(
+                [tile.position.data for tile in self.tiles], direction, (0.5, 0.5)
+            )
+            for tile, position in zip(self.tiles, positions):
                 tile._parent = None
 
-                # Make a (separate!) copy of the position to transform
-                # With tiles we flip from their center
-                pos = Vector(tile.position.x + 0.5, tile.position.y + 0.5)
                 # Alter the position
-                tile.position = (pos.x * matrix[0] - 0.5, pos.y * matrix[1] - 0.5)
+                tile.position = position
 
                 tile._parent = self
 
-                # Re-add to map
-                self.tile_map.add(tile)
+        self.on_transform()
+
+    def on_transform(self):
+        # type: () -> None
+        """
+        Called after every entity and tile has been moved by :py:meth:`translate`,
+        :py:meth:`rotate`, or :py:meth:`flip`. Rebuilds :py:attr:`entity_map`
+        (and ``tile_map``, if present) in one go, instead of moving each object
+        out of its old cells and into its new ones, and then recalculates the
+        area.
+        """
+        self.entity_map.rebuild(self.entities)
+        if hasattr(self, "tiles"):
+            self.tile_map.rebuild(self.tiles)
 
         self.recalculate_area()
@@ -54,7 +54,6 @@ import copy
 from schema import SchemaError
 import six
 from typing import Union, Sequence
-import warnings
 
 
 # def get_allowed_items():
@@ -118,7 +117,7 @@ class UpgradePlanner(Blueprintable):
 
         # Issue warnings for any keyword not recognized by UpgradePlanner
         for unused_arg in kwargs:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -207,13 +206,13 @@ class UpgradePlanner(Blueprintable):
         # Check both from_obj and to_obj to make sure that both are valid inputs
         # in the context of an upgrade planner
         # if from_obj["name"] not in _allowed_items:
-        #     warnings.warn(
+        #     utils.warn(
         #         "'{}' is not an allowed upgradable item".format(from_obj["name"]),
         #         ItemLimitationWarning,
         #         stacklevel=2,
         #     )
         # if to_obj["name"] not in _allowed_items:
-        #     warnings.warn(
+        #     utils.warn(
         #         "'{}' is not an allowed upgradable item".format(to_obj["name"]),
         #         ItemLimitationWarning,
         #         stacklevel=2,
@@ -222,7 +221,7 @@ class UpgradePlanner(Blueprintable):
         # TODO
         # Check that from_obj matches the upgrade type to to_obj
         # if not equivalent_upgrade_types(from_obj["name"], to_obj["name"]):
-        #     warnings.warn(
+        #     utils.warn(
         #         "'{}' ({}) cannot be upgraded to '{}' ({}); differing types"
         #         .format(
         #             from_obj["name"], from_obj["type"],
@@ -234,7 +233,7 @@ class UpgradePlanner(Blueprintable):
 
         # Check that the index picked is within the correct range
         if not 0 <= index < 24:
-            warnings.warn(
+            utils.warn(
                 "'index' must be in range [0, 24)", ValueWarning, stacklevel=2
             )
 
@@ -273,7 +272,7 @@ class UpgradePlanner(Blueprintable):
         else:
             # Check that the index picked is within the correct range
             if not 0 <= index < 24:
-                warnings.warn(
+                utils.warn(
                     "'index' not in range [0, 24)", ValueWarning, stacklevel=2
                 )
 
@@ -17,6 +17,8 @@ class Vector(object):
     A simple 2d vector class, used to aid in developent and user experience.
     """
 
+    __slots__ = ("data",)
+
     def __init__(self, x, y):
         """
         Constructs a new :py:class:`.Vector`.
@@ -155,7 +157,16 @@ class Vector(object):
 
     def __eq__(self, other):
         # type: (Vector) -> bool
-        return isinstance(other, Vector) and self.x == other.x and self.y == other.y
+        return isinstance(other, Vector) and self.data == other.data
+
+    def __copy__(self):
+        # type: () -> Vector
+        return Vector(self.data[0], self.data[1])
+
+    def __deepcopy__(self, memo):
+        # type: (dict) -> Vector
+        # Both coordinates are numbers, so a shallow copy is sufficient
+        return Vector(self.data[0], self.data[1])
 
     def __str__(self):  # pragma: no coverage
         # type: () -> str
@@ -0,0 +1,462 @@
+# cli.py
+
+"""
+Command line tools for working with many blueprint strings at once. Holds the
+``draftsman`` console script entry point, :py:func:`draftsman.cli.main()`.
+Type ``draftsman -h`` for a list of subcommands; the same commands are also
+available as ``python -m draftsman.cli``.
+
+The ``batch`` subcommand decodes, validates, normalizes, and re-encodes every
+blueprint string in a set of files, directories, or JSON Lines files,
+optionally across a pool of worker processes::
+
+    draftsman batch my_blueprints/ library.jsonl -j 8 -o results.jsonl
+
+Each blueprint string results in one JSON object written to the output, in
+input order, as soon as it's processed:
+
+.. code-block:: python
+
+    {
+        "source": str, # The file the string came from, plus ":line" for JSONL
+        "ok": bool, # Whether or not the string was successfully processed
+        "string": str, # The normalized, re-encoded blueprint string (if "ok")
+        "warnings": [str, ...], # Any warnings issued when loading the string
+        "error": str, # The error that occurred (if not "ok")
+        "time": { # Time spent in each stage, in seconds
+            "decode": float,
+            "load": float,
+            "encode": float,
+        }
+    }
+
+The ``importtime`` subcommand reports how long it takes to import Draftsman
+(or any of its modules) in a fresh interpreter, using the output of
+``python -X importtime``::
+
+    draftsman importtime draftsman.entity draftsman.blueprintable
+"""
+
+from __future__ import print_function, unicode_literals
+
+from draftsman import utils
+from draftsman.blueprintable import get_blueprintable_from_JSON
+
+import argparse
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import subprocess
+import sys
+import timeit
+import traceback
+import warnings
+
+
+def _iter_file_strings(path, key):
+    # type: (str, str) -> tuple[str, str]
+    """
+    Yields ``(source, string)`` pairs from a single file. Files ending in
+    ``.jsonl`` contain one entry per line, either a JSON string or a JSON
+    object with the blueprint string under ``key``; every other file contains
+    a single blueprint string. Files (or lines) that can't be read or decoded
+    yield the exception instead of a string, for the worker to report.
+    """
+    try:
+        with io.open(path, "rb") as input_file:
+            if not path.endswith(".jsonl"):
+                string = input_file.read().decode("utf-8").strip()
+            else:
+                for line_number, line in enumerate(input_file, 1):
+                    source = "{}:{}".format(path, line_number)
+                    try:
+                        line = line.decode("utf-8").strip()
+                        if not line:
+                            continue
+                        entry = json.loads(line)
+                        if isinstance(entry, dict):
+                            entry = entry[key]
+                    except (ValueError, KeyError) as e:
+                        # Let the worker report the problem along with
+                        # everything else
+                        entry = e
+                    yield source, entry
+                return
+    except (IOError, OSError, UnicodeDecodeError) as e:
+        # Files that can't be read (or decoded) are reported the same way
+        yield path, e
+        return
+
+    yield path, string
+
+
+def iter_sources(paths, key="string"):
+    # type: (list[str], str) -> tuple[str, str]
+    """
+    Yields a ``(source, string)`` pair for every blueprint string in
+    ``paths``. Directories are searched recursively in sorted order, and every
+    file is read according to its extension; see the module documentation.
+
+    :param paths: A list of file and directory paths.
+    :param key: The key in each JSON Lines object that holds the blueprint
+        string.
+
+    :returns: A generator yielding a tuple of the source name and the
+        blueprint string for every entry.
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for filename in sorted(files):
+                    filepath = os.path.join(root, filename)
+                    for entry in _iter_file_strings(filepath, key):
+                        yield entry
+        else:
+            for entry in _iter_file_strings(path, key):
+                yield entry
+
+
+def process_string(source, string, compression_level=9, fast_json=False):
+    # type: (str, str, int, bool) -> dict
+    """
+    Decodes, loads, and re-encodes a single blueprint string, catching any
+    errors and warnings that occur along the way. Loading the string into
+    a :py:class:`.Blueprintable` validates it, and exporting it again
+    normalizes it to the same format that Draftsman would create.
+
+    :param source: A name for where the string came from, used to identify
+        the result.
+    :param string: The blueprint string to process.
+    :param compression_level: The zlib compression level of the re-encoded
+        string. See :py:class:`.utils.StringEncoder`.
+    :param fast_json: Whether or not to serialize with ``orjson`` if it's
+        installed. See :py:class:`.utils.StringEncoder`.
+
+    :returns: A result ``dict``, in the format described in the module
+        documentation.
+    """
+    result = {"source": source, "ok": False, "warnings": [], "time": {}}
+    stage = "decode"
+    start = timeit.default_timer()
+    try:
+        with warnings.catch_warnings(record=True) as warning_list:
+            warnings.simplefilter("always")
+            if isinstance(string, Exception):
+                raise string
+            blueprintable_JSON = utils.string_to_JSON(string)
+            result["time"]["decode"] = timeit.default_timer() - start
+
+            stage, start = "load", timeit.default_timer()
+            blueprintable = get_blueprintable_from_JSON(blueprintable_JSON)
+            result["time"]["load"] = timeit.default_timer() - start
+
+            stage, start = "encode", timeit.default_timer()
+            result["string"] = blueprintable.to_string(compression_level, fast_json)
+            result["time"]["encode"] = timeit.default_timer() - start
+        result["ok"] = True
+    except Exception as e:
+        result["time"][stage] = timeit.default_timer() - start
+        result["error"] = "".join(traceback.format_exception_only(type(e), e)).strip()
+    result["warnings"] = [
+        "{}: {}".format(warning.category.__name__, warning.message)
+        for warning in warning_list
+    ]
+    return result
+
+
+def _process_entry(args):
+    # type: (tuple) -> dict
+    return process_string(*args)
+
+
+def batch(
+    paths,
+    output=None,
+    jobs=None,
+    key="string",
+    compression_level=9,
+    fast_json=False,
+):
+    # type: (list[str], io.TextIOBase, int, str, int, bool) -> dict
+    """
+    Processes every blueprint string in ``paths`` with
+    :py:func:`process_string`, writing each result as a line of JSON to
+    ``output`` in input order as soon as it's available.
+
+    :param paths: A list of file and directory paths to read blueprint
+        strings from. See :py:func:`iter_sources`.
+    :param output: A text file to write results to. Defaults to
+        ``sys.stdout``.
+    :param jobs: The number of worker processes to use. If ``None``, uses
+        one process per CPU; if ``1``, everything is processed in the current
+        process.
+    :param key: The key in each JSON Lines object that holds the blueprint
+        string.
+    :param compression_level: The zlib compression level of the re-encoded
+        strings.
+    :param fast_json: Whether or not to serialize with ``orjson`` if it's
+        installed.
+
+    :returns: A summary ``dict`` with the keys ``"total"``, ``"failed"``,
+        and ``"time"`` (in seconds).
+
+    :exception ValueError: If ``jobs`` is less than ``1``.
+    """
+    if output is None:
+        output = sys.stdout
+    if jobs is None:
+        jobs = multiprocessing.cpu_count()
+    elif jobs < 1:
+        raise ValueError("'jobs' must be at least 1, not {}".format(jobs))
+
+    start = timeit.default_timer()
+    entries = (
+        (source, string, compression_level, fast_json)
+        for source, string in iter_sources(paths, key)
+    )
+    summary = {"total": 0, "failed": 0}
+
+    def write_results(results):
+        for result in results:
+            summary["total"] += 1
+            summary["failed"] += not result["ok"]
+            output.write(json.dumps(result) + "\n")
+            output.flush()
+
+    if jobs == 1:
+        write_results(_process_entry(entry) for entry in entries)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Submit work a limited number of entries at a time so that huge
+        # libraries aren't read into memory all at once
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            while True:
+                chunk = list(itertools.islice(entries, jobs * 64))
+                if not chunk:
+                    break
+                write_results(executor.map(_process_entry, chunk))
+
+    summary["time"] = timeit.default_timer() - start
+    return summary
+
+
+def import_time_report(modules=("draftsman",), python=None):
+    # type: (list[str], str) -> list[dict]
+    """
+    Imports ``modules`` in a fresh Python interpreter with
+    ``python -X importtime`` (Python 3.7+), and returns the time spent
+    importing every module that was loaded as a result, in import order.
+    Each entry is a ``dict`` with the keys:
+
+    * ``"module"``: The full name of the imported module.
+    * ``"self"``: The time spent executing the module itself, in seconds.
+    * ``"cumulative"``: The time spent executing the module and importing
+      everything it imported, in seconds.
+    * ``"depth"``: How deeply nested the import was; modules imported
+      directly by ``modules`` have a depth of ``0``.
+
+    :param modules: The names of the modules to import.
+    :param python: The Python executable to use. Defaults to
+        ``sys.executable``.
+
+    :returns: A ``list`` of ``dict``, one for each imported module.
+
+    :exception RuntimeError: If the interpreter fails to import any of
+        ``modules``.
+    """
+    if python is None:
+        python = sys.executable
+    # Make sure the subprocess imports the same Draftsman as this one
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+
+    process = subprocess.Popen(
+        [python, "-X", "importtime", "-c", "import " + ", ".join(modules)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env=env,
+    )
+    _, stderr = process.communicate()
+    lines = stderr.decode("utf-8", "replace").splitlines()
+    if process.returncode != 0:
+        raise RuntimeError(
+            "\n".join(line for line in lines if "import time:" not in line)
+        )
+
+    report = []
+    for line in lines:
+        if not line.startswith("import time:"):
+            continue
+        self_time, cumulative, name = line[len("import time:") :].split("|")
+        try:
+            self_time, cumulative = int(self_time), int(cumulative)
+        except ValueError:
+            continue  # Header
+        report.append(
+            {
+                "module": name.strip(),
+                "self": self_time / 1e6,
+                "cumulative": cumulative / 1e6,
+                "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+            }
+        )
+    return report
+
+
+def _positive_int(value):
+    # type: (str) -> int
+    """
+    ``argparse`` type for arguments that must be integers greater than zero.
+    """
+    try:
+        result = int(value)
+    except ValueError:
+        result = 0
+    if result < 1:
+        raise argparse.ArgumentTypeError(
+            "must be a positive integer, not '{}'".format(value)
+        )
+    return result
+
+
+def main(argv=None):
+    # type: (list[str]) -> int
+    """
+    ``draftsman`` console script entry point. Type ``draftsman -h`` for a list
+    of subcommands, and ``draftsman <subcommand> -h`` for the options of each.
+
+    :param argv: The command line arguments to parse. Defaults to
+        ``sys.argv[1:]``.
+
+    :returns: The exit code; for ``batch``, ``0`` if every blueprint string
+        was processed successfully, and ``1`` otherwise.
+    """
+    parser = argparse.ArgumentParser(prog="draftsman")
+    subparsers = parser.add_subparsers(dest="command")
+    subparsers.required = True
+
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="Decode, validate, normalize, and re-encode many blueprint strings",
+    )
+    batch_parser.add_argument(
+        "paths",
+        nargs="+",
+        help="Files containing a single blueprint string, '.jsonl' files "
+        "containing one per line, or directories of either",
+    )
+    batch_parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        help="The file to write the results to as JSON Lines; defaults to stdout",
+    )
+    batch_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_positive_int,
+        help="The number of worker processes to use; defaults to the CPU count",
+    )
+    batch_parser.add_argument(
+        "-k",
+        "--key",
+        type=str,
+        default="string",
+        help="The key that holds the blueprint string in each line of a "
+        "'.jsonl' file that contains objects; defaults to 'string'",
+    )
+    batch_parser.add_argument(
+        "-c",
+        "--compression-level",
+        type=int,
+        default=9,
+        choices=range(10),
+        metavar="[0-9]",
+        help="The zlib compression level of the re-encoded strings; defaults to 9",
+    )
+    batch_parser.add_argument(
+        "--fast-json",
+        action="store_true",
+        help="Serialize with 'orjson' if it's installed",
+    )
+
+    importtime_parser = subparsers.add_parser(
+        "importtime",
+        help="Report the time it takes to import Draftsman's modules",
+    )
+    importtime_parser.add_argument(
+        "modules",
+        nargs="*",
+        default=["draftsman"],
+        help="The modules to import; defaults to 'draftsman'",
+    )
+    importtime_parser.add_argument(
+        "-n",
+        "--limit",
+        type=int,
+        default=20,
+        help="The number of modules to list, slowest first; defaults to 20",
+    )
+    importtime_parser.add_argument(
+        "-a",
+        "--all",
+        action="store_true",
+        help="Include modules outside of Draftsman, such as the standard library",
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "importtime":
+        report = import_time_report(args.modules)
+        total = sum(entry["cumulative"] for entry in report if entry["depth"] == 0)
+        if not args.all:
+            report = [
+                entry
+                for entry in report
+                if entry["module"].split(".")[0] == "draftsman"
+            ]
+        report.sort(key=lambda entry: entry["cumulative"], reverse=True)
+        print("{:>12} {:>12}  {}".format("cumulative", "self", "module"))
+        for entry in report[: args.limit]:
+            print(
+                "{:>10.1f}ms {:>10.1f}ms  {}".format(
+                    entry["cumulative"] * 1000, entry["self"] * 1000, entry["module"]
+                )
+            )
+        print("Total import time: {:.1f}ms".format(total * 1000), file=sys.stderr)
+        return 0
+
+    if args.output is None:
+        summary = batch(
+            args.paths,
+            None,
+            args.jobs,
+            args.key,
+            args.compression_level,
+            args.fast_json,
+        )
+    else:
+        with io.open(args.output, "w", encoding="utf-8") as output:
+            summary = batch(
+                args.paths,
+                output,
+                args.jobs,
+                args.key,
+                args.compression_level,
+                args.fast_json,
+            )
+
+    print(
+        "Processed {} blueprint strings in {:.2f}s; {} failed".format(
+            summary["total"], summary["time"], summary["failed"]
+        ),
+        file=sys.stderr,
+    )
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":  # pragma: no coverage
+    sys.exit(main())
@@ -1 +1,323 @@
 # __init__.py
+# -*- encoding: utf-8 -*-
+
+"""
+Loading of the data extracted by :py:func:`draftsman.env.update`. Each data
+module loads a pickle file of the same name stored alongside it, but only once
+one of its attributes is first accessed, so importing Draftsman only pays for
+the data that's actually used.
+
+:py:func:`write_cache` (called automatically by :py:func:`draftsman.env.update`)
+can additionally write a ``.cache`` file next to each pickle file, which stores
+each module attribute as its own pickle at a known offset. When an up-to-date
+cache file exists, each attribute is read individually, so accessing a small
+list like ``entities.containers`` doesn't require loading the entirety of
+``entities.raw``. Attributes that share objects with each other are stored
+(and loaded) together, so they keep sharing them. Cache files are entirely
+optional; if one is missing or out of date, the pickle file is used instead.
+"""
+
+from __future__ import unicode_literals
+
+import importlib
+import os
+import pickle
+import struct
+import sys
+
+try:  # pragma: no coverage
+    import importlib.resources as pkg_resources  # type: ignore
+except ImportError:  # pragma: no coverage
+    # Try backported to PY<37 `importlib_resources`.
+    import importlib_resources as pkg_resources  # type: ignore
+
+from typing import Any, Callable, Iterable
+
+# The names of every data module, each of which has a pickle file of the same
+# name
+_module_names = (
+    "entities",
+    "instruments",
+    "items",
+    "mods",
+    "modules",
+    "recipes",
+    "signals",
+    "tiles",
+)
+
+# Module level `__getattr__` was added in Python 3.7; prior to that every
+# module is loaded immediately on import
+_lazy_modules_supported = sys.version_info >= (3, 7)
+
+_CACHE_MAGIC = b"DRAFTSMANCACHE02"
+_CACHE_HEADER_LENGTH = struct.Struct("<Q")
+
+
+def _cache_signature(path):
+    # type: (str) -> tuple[int, float]
+    """
+    Returns the size and modification time of the file at ``path``, which is
+    used to determine whether or not a cache file is up to date.
+    """
+    stat = os.stat(path)
+    return (stat.st_size, stat.st_mtime)
+
+
+def _read_cache_header(cache_path, source_path):
+    # type: (str, str) -> dict
+    """
+    Reads the index of the cache file at ``cache_path``. Returns ``None`` if
+    the cache doesn't exist, is in an unknown format, or was not generated
+    from the current contents of ``source_path``.
+    """
+    try:
+        with open(cache_path, "rb") as cache_file:
+            if cache_file.read(len(_CACHE_MAGIC)) != _CACHE_MAGIC:
+                return None
+            (length,) = _CACHE_HEADER_LENGTH.unpack(
+                cache_file.read(_CACHE_HEADER_LENGTH.size)
+            )
+            header = pickle.loads(cache_file.read(length))
+        if header["source"] != _cache_signature(source_path):
+            return None
+        # Segment offsets are relative to the end of the header
+        header["data_start"] = len(_CACHE_MAGIC) + _CACHE_HEADER_LENGTH.size + length
+        header["signature"] = _cache_signature(cache_path)
+        return header
+    except Exception:
+        # Missing, truncated, or written by an incompatible Python version
+        return None
+
+
+class LazyData(object):
+    """
+    Loads the data attributes of one of the :py:mod:`draftsman.data` modules
+    when they're first accessed, instead of when the module is imported. The
+    loaded values are stored as regular module globals, so after the first
+    access there is no overhead.
+
+    :param module_name: The name of the module to populate, usually
+        ``__name__``.
+    :param unpack: A function which takes the contents of the pickle file and
+        returns a ``dict`` of module attribute names to values.
+    :param names: Every name ``unpack`` returns.
+    :param location: The folder containing the pickle and cache files.
+        Defaults to the location of this module.
+    """
+
+    def __init__(self, module_name, unpack, names, location=None):
+        # type: (str, Callable[[Any], dict], Iterable[str], str) -> None
+        self.module = sys.modules[module_name]
+        self.filename = module_name.rsplit(".", 1)[-1]
+        self.unpack = unpack
+        self.names = frozenset(names)
+        self.location = location
+        self._cache_header = None
+
+        if _lazy_modules_supported:
+            self.module.__getattr__ = self.getattr
+        else:  # pragma: no coverage
+            self.load()
+
+    @property
+    def source_path(self):
+        # type: () -> str
+        """
+        The path to the pickle file of the module.
+        """
+        location = self.location or os.path.dirname(__file__)
+        return os.path.join(location, self.filename + ".pkl")
+
+    @property
+    def cache_path(self):
+        # type: () -> str
+        """
+        The path to the cache file of the module.
+        """
+        location = self.location or os.path.dirname(__file__)
+        return os.path.join(location, self.filename + ".cache")
+
+    def is_loaded(self, name):
+        # type: (str) -> bool
+        """
+        Returns whether or not the attribute ``name`` has been loaded into the
+        module.
+        """
+        return name in vars(self.module)
+
+    def load(self):
+        # type: () -> None
+        """
+        Loads every attribute from the pickle file into the module.
+        """
+        if self.location is None:
+            inp = pkg_resources.open_binary(__name__, self.filename + ".pkl")
+        else:
+            inp = open(self.source_path, "rb")
+        with inp:
+            data = pickle.load(inp)
+        for name, value in self.unpack(data).items():
+            # Don't replace anything already loaded so existing references to
+            # it stay valid
+            vars(self.module).setdefault(name, value)
+
+    def _load_from_cache(self, name):
+        # type: (str) -> bool
+        """
+        Attempts to load only ``name`` from the cache file. Returns ``False``
+        if the cache could not be used.
+        """
+        if self._cache_header is None:
+            self._cache_header = _read_cache_header(self.cache_path, self.source_path)
+            if self._cache_header is None:
+                return False
+        try:
+            offset, length = self._cache_header["segments"][name]
+            with open(self.cache_path, "rb") as cache_file:
+                # Make sure the file hasn't changed since the header was read
+                if os.fstat(cache_file.fileno()).st_mtime != (
+                    self._cache_header["signature"][1]
+                ):
+                    raise ValueError("Cache file changed")
+                cache_file.seek(self._cache_header["data_start"] + offset)
+                values = pickle.loads(cache_file.read(length))
+        except Exception:
+            self._cache_header = None
+            return False
+        # Each segment holds every attribute that shares objects with `name`
+        for segment_name, value in values.items():
+            vars(self.module).setdefault(segment_name, value)
+        return True
+
+    def getattr(self, name):
+        # type: (str) -> Any
+        """
+        Module level ``__getattr__`` of the module, only called when ``name``
+        has not yet been loaded.
+        """
+        if name not in self.names:
+            raise AttributeError(
+                "module '{}' has no attribute '{}'".format(self.module.__name__, name)
+            )
+        if not self._load_from_cache(name):
+            self.load()
+        return vars(self.module)[name]
+
+    def require(self, *names):
+        # type: (*str) -> None
+        """
+        Makes sure each attribute in ``names`` is loaded, so that functions
+        within the module can refer to them as globals.
+        """
+        for name in names:
+            if not self.is_loaded(name):
+                self.getattr(name)
+
+
+def _mutable_ids(value):
+    # type: (Any) -> set[int]
+    """
+    Returns the ids of every ``dict``, ``list``, and ``set`` reachable from
+    ``value``, including ``value`` itself.
+    """
+    ids = set()
+    stack = [value]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, (dict, list, set)):
+            if id(current) in ids:
+                continue
+            ids.add(id(current))
+            stack.extend(current.values() if isinstance(current, dict) else current)
+        elif isinstance(current, (tuple, frozenset)):
+            stack.extend(current)
+    return ids
+
+
+def write_module_cache(source_path, cache_path, unpack):
+    # type: (str, str, Callable[[Any], dict]) -> None
+    """
+    Writes the cache file for a single data module. The cache file consists
+    of a magic string, the length of the header, the header itself (a pickled
+    ``dict`` with the signature of ``source_path`` and the offset and length
+    of the segment holding each attribute), and then each segment in turn.
+
+    Each segment is a pickled ``dict`` of attribute names to values. Attributes
+    are normally pickled in their own segment, but attributes which share any
+    ``dict``, ``list``, or ``set`` with each other are pickled in the same
+    segment, so they still share it after being loaded from the cache.
+
+    :param source_path: The path to the pickle file of the module.
+    :param cache_path: The path to write the cache file to.
+    :param unpack: The function that splits the contents of the pickle file
+        into module attributes. See :py:class:`LazyData`.
+    """
+    with open(source_path, "rb") as inp:
+        attributes = unpack(pickle.load(inp))
+
+    # Group together the attributes that share mutable objects
+    groups = []  # type: list[tuple[list[str], set[int]]]
+    for name, value in attributes.items():
+        names, ids = [name], _mutable_ids(value)
+        for group in [group for group in groups if not ids.isdisjoint(group[1])]:
+            groups.remove(group)
+            names = group[0] + names
+            ids |= group[1]
+        groups.append((names, ids))
+
+    segments = {}
+    blobs = []
+    offset = 0
+    for names, _ in groups:
+        blob = pickle.dumps(
+            {name: attributes[name] for name in names}, pickle.HIGHEST_PROTOCOL
+        )
+        for name in names:
+            segments[name] = (offset, len(blob))
+        blobs.append(blob)
+        offset += len(blob)
+
+    header = pickle.dumps(
+        {"source": _cache_signature(source_path), "segments": segments},
+        pickle.HIGHEST_PROTOCOL,
+    )
+
+    # Write to a temporary file first so that a partially written cache is
+    # never read
+    temp_path = cache_path + ".tmp"
+    with open(temp_path, "wb") as out:
+        out.write(_CACHE_MAGIC)
+        out.write(_CACHE_HEADER_LENGTH.pack(len(header)))
+        out.write(header)
+        for blob in blobs:
+            out.write(blob)
+    if os.path.exists(cache_path):
+        os.remove(cache_path)
+    os.rename(temp_path, cache_path)
+
+
+def write_cache(data_location=None):
+    # type: (str) -> None
+    """
+    Writes a ``.cache`` file next to the pickle file of every module in
+    :py:mod:`draftsman.data`, using :py:func:`write_module_cache`. Each
+    attribute of the module (or group of attributes that share objects) is
+    pickled separately at a known offset in the file, so they can be loaded
+    individually. Each cache file records the size
+    and modification time of the pickle file it was created from, and is
+    ignored if the pickle file has changed since.
+
+    :param data_location: The folder containing the pickle files. Defaults to
+        the location of this module.
+    """
+    if data_location is None:
+        data_location = os.path.dirname(__file__)
+
+    for module_name in _module_names:
+        module = importlib.import_module("draftsman.data." + module_name)
+        write_module_cache(
+            os.path.join(data_location, module_name + ".pkl"),
+            os.path.join(data_location, module_name + ".cache"),
+            module._loader.unpack,
+        )
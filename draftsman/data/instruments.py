@@ -1,19 +1,13 @@
 # instruments.py
 # -*- encoding: utf-8 -*-
 
-import pickle
+from draftsman.data import LazyData
 
-try:  # pragma: no coverage
-    import importlib.resources as pkg_resources  # type: ignore
-except ImportError:  # pragma: no coverage
-    # Try backported to PY<37 `importlib_resources`.
-    import importlib_resources as pkg_resources  # type: ignore
 
-from draftsman import data
+def _unpack(data):
+    # type: (list) -> dict
+    return {"raw": data[0], "index": data[1], "names": data[2]}
 
 
-with pkg_resources.open_binary(data, "instruments.pkl") as inp:
-    _data = pickle.load(inp)
-    raw = _data[0]
-    index = _data[1]
-    names = _data[2]
+# Loaded from `instruments.pkl` when first accessed
+_loader = LazyData(__name__, _unpack, ["raw", "index", "names"])
@@ -1,16 +1,13 @@
 # mods.py
 # -*- encoding: utf-8 -*-
 
-import pickle
+from draftsman.data import LazyData
 
-try:  # pragma: no coverage
-    import importlib.resources as pkg_resources  # type: ignore
-except ImportError:  # pragma: no coverage
-    # Try backported to PY<37 `importlib_resources`.
-    import importlib_resources as pkg_resources  # type: ignore
 
-from draftsman import data
+def _unpack(data):
+    # type: (dict) -> dict
+    return {"mod_list": data}
 
 
-with pkg_resources.open_binary(data, "mods.pkl") as inp:
-    mod_list = pickle.load(inp)
+# Loaded from `mods.pkl` when first accessed
+_loader = LazyData(__name__, _unpack, ["mod_list"])
@@ -1,18 +1,13 @@
 # modules.py
 # -*- encoding: utf-8 -*-
 
-import pickle
+from draftsman.data import LazyData
 
-try:  # pragma: no coverage
-    import importlib.resources as pkg_resources  # type: ignore
-except ImportError:  # pragma: no coverage
-    # Try backported to PY<37 `importlib_resources`.
-    import importlib_resources as pkg_resources  # type: ignore
 
-from draftsman import data
+def _unpack(data):
+    # type: (list) -> dict
+    return {"raw": data[0], "categories": data[1]}
 
 
-with pkg_resources.open_binary(data, "modules.pkl") as inp:
-    _data = pickle.load(inp)
-    raw = _data[0]
-    categories = _data[1]
+# Loaded from `modules.pkl` when first accessed
+_loader = LazyData(__name__, _unpack, ["raw", "categories"])
@@ -1,24 +1,16 @@
 # recipes.py
 # -*- encoding: utf-8 -*-
 
-import os
-import pickle
+from draftsman.data import LazyData
 
-try:  # pragma: no coverage
-    import importlib.resources as pkg_resources  # type: ignore
-except ImportError:  # pragma: no coverage
-    # Try backported to PY<37 `importlib_resources`.
-    import importlib_resources as pkg_resources  # type: ignore
 
-# from draftsman import data
-from .. import data
+def _unpack(data):
+    # type: (list) -> dict
+    return {"raw": data[0], "categories": data[1], "for_machine": data[2]}
 
 
-with pkg_resources.open_binary(data, "recipes.pkl") as inp:
-    _data = pickle.load(inp)
-    raw = _data[0]
-    categories = _data[1]
-    for_machine = _data[2]
+# Loaded from `recipes.pkl` when first accessed
+_loader = LazyData(__name__, _unpack, ["raw", "categories", "for_machine"])
 
 
 def get_recipe_ingredients(recipe_name):
@@ -52,6 +44,7 @@ def get_recipe_ingredients(recipe_name):
         # {'iron-plate', 'copper-cable'}
 
     """
+    _loader.require("raw")
     if "ingredients" in raw[recipe_name]:
         try:
             return {x[0] for x in raw[recipe_name]["ingredients"]}
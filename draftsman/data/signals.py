@@ -3,27 +3,27 @@
 
 from __future__ import unicode_literals
 
-from draftsman import data
+from draftsman.data import LazyData
 from draftsman.error import InvalidSignalError
 
-import pickle
 import six
 
-try:  # pragma: no coverage
-    import importlib.resources as pkg_resources  # type: ignore
-except ImportError:  # pragma: no coverage
-    # Try backported to PY<37 `importlib_resources`.
-    import importlib_resources as pkg_resources  # type: ignore
 
+def _unpack(data):
+    # type: (list) -> dict
+    return {
+        "raw": data[0],
+        "type_of": data[1],
+        "item": data[2],
+        "fluid": data[3],
+        "virtual": data[4],
+    }
 
-with pkg_resources.open_binary(data, "signals.pkl") as inp:
-    _data = pickle.load(inp)
-    raw = _data[0]
-    type_of = _data[1]
-    item = _data[2]
-    fluid = _data[3]
-    virtual = _data[4]
-    pure_virtual = ["signal-everything", "signal-anything", "signal-each"]
+
+# Loaded from `signals.pkl` when first accessed
+_loader = LazyData(__name__, _unpack, ["raw", "type_of", "item", "fluid", "virtual"])
+
+pure_virtual = ["signal-everything", "signal-anything", "signal-each"]
 
 
 def get_signal_type(signal_name):
@@ -50,6 +50,7 @@ def get_signal_type(signal_name):
     # else:
     #     raise InvalidSignalError("'{}'".format(str(signal_name)))
 
+    _loader.require("type_of")
     try:
         return six.text_type(type_of[signal_name])
     except KeyError:
@@ -1,15 +1,12 @@
 # tiles.py
 
-import pickle
+from draftsman.data import LazyData
 
-try:  # pragma: no coverage
-    import importlib.resources as pkg_resources  # type: ignore
-except ImportError:  # pragma: no coverage
-    # Try backported to PY<37 `importlib_resources`.
-    import importlib_resources as pkg_resources  # type: ignore
 
-from draftsman import data
+def _unpack(data):
+    # type: (dict) -> dict
+    return {"raw": data}
 
 
-with pkg_resources.open_binary(data, "tiles.pkl") as inp:
-    raw = pickle.load(inp)
+# Loaded from `tiles.pkl` when first accessed
+_loader = LazyData(__name__, _unpack, ["raw"])
@@ -3,73 +3,283 @@
 """
 Entity alias module. Imports the base-class :py:class:`.Entity`, as well as
 all the prototypes in :py:mod:`draftsman.prototypes`.
+
+Each prototype class (and its list of valid entity names) is only imported
+from :py:mod:`draftsman.prototypes` when it's first accessed, so
+``from draftsman.entity import Container`` only loads the modules that
+``Container`` needs, and :py:func:`new_entity` only loads the classes of the
+entities it actually creates.
 """
 
 from draftsman.classes.entity import Entity
+from draftsman.data import entities
 from draftsman.error import InvalidEntityError
 
+import importlib
+import six
+import sys
+
+try:  # pragma: no coverage
+    from collections.abc import MutableMapping
+except ImportError:  # pragma: no coverage
+    from collections import MutableMapping
 
+
+# The module in :py:mod:`draftsman.prototypes` that defines each prototype
+# class, paired with the name of the class and the name of the list in
+# :py:mod:`draftsman.data.entities` that contains all of the valid names for
+# that class. If an entity name appears in multiple lists, the first class in
+# this list takes precedence.
 # fmt: off
-from draftsman.prototypes.container import Container, containers
-from draftsman.prototypes.storage_tank import StorageTank, storage_tanks
-from draftsman.prototypes.transport_belt import TransportBelt, transport_belts
-from draftsman.prototypes.underground_belt import UndergroundBelt, underground_belts
-from draftsman.prototypes.splitter import Splitter, splitters
-from draftsman.prototypes.inserter import Inserter, inserters
-from draftsman.prototypes.filter_inserter import FilterInserter, filter_inserters
-from draftsman.prototypes.loader import Loader, loaders
-from draftsman.prototypes.electric_pole import ElectricPole, electric_poles
-from draftsman.prototypes.pipe import Pipe, pipes
-from draftsman.prototypes.underground_pipe import UndergroundPipe, underground_pipes
-from draftsman.prototypes.pump import Pump, pumps
-from draftsman.prototypes.straight_rail import StraightRail, straight_rails
-from draftsman.prototypes.curved_rail import CurvedRail, curved_rails
-from draftsman.prototypes.train_stop import TrainStop, train_stops
-from draftsman.prototypes.rail_signal import RailSignal, rail_signals
-from draftsman.prototypes.rail_chain_signal import RailChainSignal, rail_chain_signals
-from draftsman.prototypes.locomotive import Locomotive, locomotives
-from draftsman.prototypes.cargo_wagon import CargoWagon, cargo_wagons
-from draftsman.prototypes.fluid_wagon import FluidWagon, fluid_wagons
-from draftsman.prototypes.artillery_wagon import ArtilleryWagon, artillery_wagons
-from draftsman.prototypes.logistic_passive_container import LogisticPassiveContainer, logistic_passive_containers
-from draftsman.prototypes.logistic_active_container import LogisticActiveContainer, logistic_active_containers
-from draftsman.prototypes.logistic_storage_container import LogisticStorageContainer, logistic_storage_containers
-from draftsman.prototypes.logistic_buffer_container import LogisticBufferContainer, logistic_buffer_containers
-from draftsman.prototypes.logistic_request_container import LogisticRequestContainer, logistic_request_containers
-from draftsman.prototypes.roboport import Roboport, roboports
-from draftsman.prototypes.lamp import Lamp, lamps
-from draftsman.prototypes.arithmetic_combinator import ArithmeticCombinator, arithmetic_combinators
-from draftsman.prototypes.decider_combinator import DeciderCombinator, decider_combinators
-from draftsman.prototypes.constant_combinator import ConstantCombinator, constant_combinators
-from draftsman.prototypes.power_switch import PowerSwitch, power_switches
-from draftsman.prototypes.programmable_speaker import ProgrammableSpeaker, programmable_speakers
-from draftsman.prototypes.boiler import Boiler, boilers
-from draftsman.prototypes.generator import Generator, generators
-from draftsman.prototypes.solar_panel import SolarPanel, solar_panels
-from draftsman.prototypes.accumulator import Accumulator, accumulators
-from draftsman.prototypes.reactor import Reactor, reactors
-from draftsman.prototypes.heat_pipe import HeatPipe, heat_pipes
-from draftsman.prototypes.mining_drill import MiningDrill, mining_drills
-from draftsman.prototypes.offshore_pump import OffshorePump, offshore_pumps
-from draftsman.prototypes.furnace import Furnace, furnaces
-from draftsman.prototypes.assembling_machine import AssemblingMachine, assembling_machines
-from draftsman.prototypes.lab import Lab, labs
-from draftsman.prototypes.beacon import Beacon, beacons
-from draftsman.prototypes.rocket_silo import RocketSilo, rocket_silos
-from draftsman.prototypes.land_mine import LandMine, land_mines
-from draftsman.prototypes.wall import Wall, walls
-from draftsman.prototypes.gate import Gate, gates
-from draftsman.prototypes.turret import Turret, turrets
-from draftsman.prototypes.radar import Radar, radars
-from draftsman.prototypes.electric_energy_interface import ElectricEnergyInterface, electric_energy_interfaces
-from draftsman.prototypes.linked_container import LinkedContainer, linked_containers
-from draftsman.prototypes.heat_interface import HeatInterface, heat_interfaces
-from draftsman.prototypes.linked_belt import LinkedBelt, linked_belts
-from draftsman.prototypes.infinity_container import InfinityContainer, infinity_containers
-from draftsman.prototypes.infinity_pipe import InfinityPipe, infinity_pipes
-from draftsman.prototypes.burner_generator import BurnerGenerator, burner_generators
+_prototype_classes = [
+    ("container", "Container", "containers"),
+    ("storage_tank", "StorageTank", "storage_tanks"),
+    ("transport_belt", "TransportBelt", "transport_belts"),
+    ("underground_belt", "UndergroundBelt", "underground_belts"),
+    ("splitter", "Splitter", "splitters"),
+    ("inserter", "Inserter", "inserters"),
+    ("filter_inserter", "FilterInserter", "filter_inserters"),
+    ("loader", "Loader", "loaders"),
+    ("electric_pole", "ElectricPole", "electric_poles"),
+    ("pipe", "Pipe", "pipes"),
+    ("underground_pipe", "UndergroundPipe", "underground_pipes"),
+    ("pump", "Pump", "pumps"),
+    ("straight_rail", "StraightRail", "straight_rails"),
+    ("curved_rail", "CurvedRail", "curved_rails"),
+    ("train_stop", "TrainStop", "train_stops"),
+    ("rail_signal", "RailSignal", "rail_signals"),
+    ("rail_chain_signal", "RailChainSignal", "rail_chain_signals"),
+    ("locomotive", "Locomotive", "locomotives"),
+    ("cargo_wagon", "CargoWagon", "cargo_wagons"),
+    ("fluid_wagon", "FluidWagon", "fluid_wagons"),
+    ("artillery_wagon", "ArtilleryWagon", "artillery_wagons"),
+    ("logistic_passive_container", "LogisticPassiveContainer", "logistic_passive_containers"),
+    ("logistic_active_container", "LogisticActiveContainer", "logistic_active_containers"),
+    ("logistic_storage_container", "LogisticStorageContainer", "logistic_storage_containers"),
+    ("logistic_buffer_container", "LogisticBufferContainer", "logistic_buffer_containers"),
+    ("logistic_request_container", "LogisticRequestContainer", "logistic_request_containers"),
+    ("roboport", "Roboport", "roboports"),
+    ("lamp", "Lamp", "lamps"),
+    ("arithmetic_combinator", "ArithmeticCombinator", "arithmetic_combinators"),
+    ("decider_combinator", "DeciderCombinator", "decider_combinators"),
+    ("constant_combinator", "ConstantCombinator", "constant_combinators"),
+    ("power_switch", "PowerSwitch", "power_switches"),
+    ("programmable_speaker", "ProgrammableSpeaker", "programmable_speakers"),
+    ("boiler", "Boiler", "boilers"),
+    ("generator", "Generator", "generators"),
+    ("solar_panel", "SolarPanel", "solar_panels"),
+    ("accumulator", "Accumulator", "accumulators"),
+    ("reactor", "Reactor", "reactors"),
+    ("heat_pipe", "HeatPipe", "heat_pipes"),
+    ("mining_drill", "MiningDrill", "mining_drills"),
+    ("offshore_pump", "OffshorePump", "offshore_pumps"),
+    ("furnace", "Furnace", "furnaces"),
+    ("assembling_machine", "AssemblingMachine", "assembling_machines"),
+    ("lab", "Lab", "labs"),
+    ("beacon", "Beacon", "beacons"),
+    ("rocket_silo", "RocketSilo", "rocket_silos"),
+    ("land_mine", "LandMine", "land_mines"),
+    ("wall", "Wall", "walls"),
+    ("gate", "Gate", "gates"),
+    ("turret", "Turret", "turrets"),
+    ("radar", "Radar", "radars"),
+    ("electric_energy_interface", "ElectricEnergyInterface", "electric_energy_interfaces"),
+    ("linked_container", "LinkedContainer", "linked_containers"),
+    ("heat_interface", "HeatInterface", "heat_interfaces"),
+    ("linked_belt", "LinkedBelt", "linked_belts"),
+    ("infinity_container", "InfinityContainer", "infinity_containers"),
+    ("infinity_pipe", "InfinityPipe", "infinity_pipes"),
+    ("burner_generator", "BurnerGenerator", "burner_generators"),
+]
 # fmt: on
 
+# The prototype module that defines each exported class. Entity lists are
+# taken straight from `draftsman.data.entities` and map to `None`, so accessing
+# one doesn't import any classes.
+_lazy_attributes = {}
+for _module_name, _class_name, _list_name in _prototype_classes:
+    _lazy_attributes[_class_name] = _module_name
+    _lazy_attributes[_list_name] = None
+del _module_name, _class_name, _list_name
+
+__all__ = [
+    "Entity",
+    "InvalidEntityError",
+    "entities",
+    "entity_classes",
+    "register_entity_class",
+    "reload_entity_classes",
+    "new_entity",
+] + sorted(_lazy_attributes)
+
+
+def _import_prototype(module_name, attribute):
+    # type: (str, str) -> type
+    """
+    Imports ``attribute`` from ``draftsman.prototypes.<module_name>`` and
+    stores it in this module, so subsequent accesses are regular global
+    lookups.
+    """
+    module = importlib.import_module("draftsman.prototypes." + module_name)
+    value = getattr(module, attribute)
+    globals()[attribute] = value
+    return value
+
+
+def __getattr__(name):
+    # type: (str) -> type
+    """
+    Module level ``__getattr__``, only called when ``name`` has not yet been
+    imported.
+    """
+    try:
+        module_name = _lazy_attributes[name]
+    except KeyError:
+        six.raise_from(
+            AttributeError("module '{}' has no attribute '{}'".format(__name__, name)),
+            None,
+        )
+    if module_name is None:
+        globals()[name] = getattr(entities, name)
+        return globals()[name]
+    return _import_prototype(module_name, name)
+
+
+def __dir__():
+    # type: () -> list[str]
+    return sorted(set(globals()) | set(_lazy_attributes))
+
+
+# Module level `__getattr__` was added in Python 3.7; prior to that every
+# prototype is imported immediately
+if sys.version_info < (3, 7):  # pragma: no coverage
+    for _name in _lazy_attributes:
+        __getattr__(_name)
+
+
+class EntityClassMapping(MutableMapping):
+    """
+    Mapping of entity names to the class used to construct them. Behaves like
+    a regular ``dict``, except that the prototype classes are stored as
+    the name of the module and class that defines them, and are only imported
+    when they're first looked up.
+    """
+
+    def __init__(self):
+        # type: () -> None
+        self._classes = {}
+
+    def __getitem__(self, name):
+        # type: (str) -> type
+        entity_class = self._classes[name]
+        if isinstance(entity_class, tuple):
+            entity_class = _import_prototype(*entity_class)
+            self._classes[name] = entity_class
+        return entity_class
+
+    def __setitem__(self, name, entity_class):
+        # type: (str, type) -> None
+        self._classes[name] = entity_class
+
+    def __delitem__(self, name):
+        # type: (str) -> None
+        del self._classes[name]
+
+    def __contains__(self, name):
+        # type: (str) -> bool
+        return name in self._classes
+
+    def __iter__(self):
+        return iter(self._classes)
+
+    def __len__(self):
+        # type: () -> int
+        return len(self._classes)
+
+    def clear(self):
+        # type: () -> None
+        # Overridden so that the inherited implementation doesn't import every
+        # prototype while popping each item
+        self._classes.clear()
+
+    def is_loaded(self, name):
+        # type: (str) -> bool
+        """
+        Returns whether or not the class for the entity ``name`` has been
+        imported yet.
+        """
+        return not isinstance(self._classes[name], tuple)
+
+    def setdefault_lazy(self, name, module_name, class_name):
+        # type: (str, str, str) -> None
+        """
+        Associates ``name`` with the class ``class_name`` in
+        ``draftsman.prototypes.<module_name>``, without importing it, if
+        ``name`` is not already associated with a class.
+        """
+        self._classes.setdefault(name, (module_name, class_name))
+
+
+# User registered classes, in the order they were registered. Kept separately
+# so they survive a call to `reload_entity_classes()`.
+_registered_classes = []
+
+# Mapping of every known entity name to the class used to construct it.
+entity_classes = EntityClassMapping()
+
+
+def register_entity_class(entity_class, names):
+    # type: (type, list[str]) -> None
+    """
+    Registers an :py:class:`.Entity` subclass as the class to construct for
+    each name in ``names`` when calling :py:func:`new_entity`. Intended for
+    custom classes that implement modded entities; registering a name that is
+    already associated with another class overwrites that association.
+
+    ``entity_class`` must have a constructor with the signature
+    ``entity_class(name, **kwargs)``. The entity itself must still exist in
+    :py:data:`draftsman.data.entities.raw`, so the mod it comes from has to be
+    loaded with ``draftsman-update`` first.
+
+    :param entity_class: The class to associate with each name.
+    :param names: A sequence of entity names.
+
+    :example:
+
+    .. code-block:: python
+
+        class ModdedChest(Container):
+            def __init__(self, name="modded-chest", **kwargs):
+                super(ModdedChest, self).__init__(name, **kwargs)
+
+        register_entity_class(ModdedChest, ["modded-chest"])
+        assert isinstance(new_entity("modded-chest"), ModdedChest)
+    """
+    names = list(names)
+    _registered_classes.append((entity_class, names))
+    for name in names:
+        entity_classes[six.text_type(name)] = entity_class
+
+
+def reload_entity_classes():
+    # type: () -> None
+    """
+    Rebuilds :py:data:`entity_classes` from the current contents of
+    :py:mod:`draftsman.data.entities`, and then re-applies every class added
+    with :py:func:`register_entity_class`. Called automatically after
+    :py:func:`draftsman.env.update` if this module has already been imported.
+    """
+    entity_classes.clear()
+    for module_name, class_name, list_name in _prototype_classes:
+        for name in getattr(entities, list_name):
+            entity_classes.setdefault_lazy(name, module_name, class_name)
+    for entity_class, names in _registered_classes:
+        for name in names:
+            entity_classes[six.text_type(name)] = entity_class
+
+
+reload_entity_classes()
+
 
 def new_entity(name, **kwargs):
     # type: (str, **dict) -> Entity
@@ -77,7 +287,9 @@ def new_entity(name, **kwargs):
     Factory function for creating a new ``Entity``. The class used will be based
     on the entity's name, so ``new_entity("wooden-chest")`` will return a
     ``Container`` instance. Useful if you know the name of the Entity you want
-    to make, but don't know what type it is.
+    to make, but don't know what type it is. The class is determined with a
+    single lookup into :py:data:`entity_classes`, and is imported the first
+    time an entity of that class is created.
 
     Any additional keyword arguments are passed to the entity's constructor,
     allowing you to specify the entity's position, ID, or any other relevant
@@ -93,121 +305,9 @@ def new_entity(name, **kwargs):
     :exception InvalidEntityID: If the name passed in is not recognized as any
         valid entity name.
     """
-    if name in containers:
-        return Container(name, **kwargs)
-    if name in storage_tanks:
-        return StorageTank(name, **kwargs)
-    if name in transport_belts:
-        return TransportBelt(name, **kwargs)
-    if name in underground_belts:
-        return UndergroundBelt(name, **kwargs)
-    if name in splitters:
-        return Splitter(name, **kwargs)
-    if name in inserters:
-        return Inserter(name, **kwargs)
-    if name in filter_inserters:
-        return FilterInserter(name, **kwargs)
-    if name in loaders:
-        return Loader(name, **kwargs)
-    if name in electric_poles:
-        return ElectricPole(name, **kwargs)
-    if name in pipes:
-        return Pipe(name, **kwargs)
-    if name in underground_pipes:
-        return UndergroundPipe(name, **kwargs)
-    if name in pumps:
-        return Pump(name, **kwargs)
-    if name in straight_rails:
-        return StraightRail(name, **kwargs)
-    if name in curved_rails:
-        return CurvedRail(name, **kwargs)
-    if name in train_stops:
-        return TrainStop(name, **kwargs)
-    if name in rail_signals:
-        return RailSignal(name, **kwargs)
-    if name in rail_chain_signals:
-        return RailChainSignal(name, **kwargs)
-    if name in locomotives:
-        return Locomotive(name, **kwargs)
-    if name in cargo_wagons:
-        return CargoWagon(name, **kwargs)
-    if name in fluid_wagons:
-        return FluidWagon(name, **kwargs)
-    if name in artillery_wagons:
-        return ArtilleryWagon(name, **kwargs)
-    if name in logistic_passive_containers:
-        return LogisticPassiveContainer(name, **kwargs)
-    if name in logistic_active_containers:
-        return LogisticActiveContainer(name, **kwargs)
-    if name in logistic_storage_containers:
-        return LogisticStorageContainer(name, **kwargs)
-    if name in logistic_buffer_containers:
-        return LogisticBufferContainer(name, **kwargs)
-    if name in logistic_request_containers:
-        return LogisticRequestContainer(name, **kwargs)
-    if name in roboports:
-        return Roboport(name, **kwargs)
-    if name in lamps:
-        return Lamp(name, **kwargs)
-    if name in arithmetic_combinators:
-        return ArithmeticCombinator(name, **kwargs)
-    if name in decider_combinators:
-        return DeciderCombinator(name, **kwargs)
-    if name in constant_combinators:
-        return ConstantCombinator(name, **kwargs)
-    if name in power_switches:
-        return PowerSwitch(name, **kwargs)
-    if name in programmable_speakers:
-        return ProgrammableSpeaker(name, **kwargs)
-    if name in boilers:
-        return Boiler(name, **kwargs)
-    if name in generators:
-        return Generator(name, **kwargs)
-    if name in solar_panels:
-        return SolarPanel(name, **kwargs)
-    if name in accumulators:
-        return Accumulator(name, **kwargs)
-    if name in reactors:
-        return Reactor(name, **kwargs)
-    if name in heat_pipes:
-        return HeatPipe(name, **kwargs)
-    if name in mining_drills:
-        return MiningDrill(name, **kwargs)
-    if name in offshore_pumps:
-        return OffshorePump(name, **kwargs)
-    if name in furnaces:
-        return Furnace(name, **kwargs)
-    if name in assembling_machines:
-        return AssemblingMachine(name, **kwargs)
-    if name in labs:
-        return Lab(name, **kwargs)
-    if name in beacons:
-        return Beacon(name, **kwargs)
-    if name in rocket_silos:
-        return RocketSilo(name, **kwargs)
-    if name in land_mines:
-        return LandMine(name, **kwargs)
-    if name in walls:
-        return Wall(name, **kwargs)
-    if name in gates:
-        return Gate(name, **kwargs)
-    if name in turrets:
-        return Turret(name, **kwargs)
-    if name in radars:
-        return Radar(name, **kwargs)
-    if name in electric_energy_interfaces:
-        return ElectricEnergyInterface(name, **kwargs)
-    if name in linked_containers:
-        return LinkedContainer(name, **kwargs)
-    if name in heat_interfaces:
-        return HeatInterface(name, **kwargs)
-    if name in linked_belts:
-        return LinkedBelt(name, **kwargs)
-    if name in infinity_containers:
-        return InfinityContainer(name, **kwargs)
-    if name in infinity_pipes:
-        return InfinityPipe(name, **kwargs)
-    if name in burner_generators:
-        return BurnerGenerator(name, **kwargs)
-
-    raise InvalidEntityError("'{}'".format(name))
+    try:
+        entity_class = entity_classes[name]
+    except (KeyError, TypeError):
+        six.raise_from(InvalidEntityError("'{}'".format(name)), None)
+
+    return entity_class(name, **kwargs)
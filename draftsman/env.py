@@ -26,6 +26,7 @@ from draftsman.error import (
     IncorrectModVersionError,
     IncorrectModFormatError,
 )
+from draftsman.data import write_cache
 from draftsman.utils import decode_version, version_string_to_tuple
 from draftsman._factorio_version import __factorio_version_info__
 
@@ -41,6 +42,7 @@ import os
 import pickle
 import re
 import struct
+import sys
 import zipfile
 
 # print(f"Using {lupa.LuaRuntime().lua_implementation} (compiled with {lupa.LUA_VERSION})")
@@ -1191,6 +1193,46 @@ def extract_tiles(lua, data_location, verbose):
 # =============================================================================
 
 
+def refresh_entity_data(data_location):
+    # type: (str) -> None
+    """
+    Updates the contents of :py:mod:`draftsman.data.entities` in-place from the
+    ``entities.pkl`` file in ``data_location``, clears the cached collision
+    data of every prototype, and then rebuilds the name to class mapping in
+    :py:mod:`draftsman.entity`. The existing lists and dicts
+    are modified instead of replaced so that any references held by other
+    modules stay valid. Does nothing if the modules have not been imported yet.
+    """
+    entities_module = sys.modules.get("draftsman.data.entities", None)
+    if entities_module is None:
+        return
+
+    with open(os.path.join(data_location, "entities.pkl"), "rb") as inp:
+        new_data = pickle.load(inp)
+
+    for key, value in new_data.items():
+        loader = entities_module._loader
+        if key in loader.names and not loader.is_loaded(key):
+            # Not loaded yet, so it will be read from the new file when it is
+            continue
+        existing = getattr(entities_module, key, None)
+        if isinstance(existing, list):
+            existing[:] = value
+        elif isinstance(existing, dict):
+            existing.clear()
+            existing.update(value)
+        else:
+            setattr(entities_module, key, value)
+
+    entity_class_module = sys.modules.get("draftsman.classes.entity", None)
+    if entity_class_module is not None:
+        entity_class_module.clear_collision_data()
+
+    entity_module = sys.modules.get("draftsman.entity", None)
+    if entity_module is not None:
+        entity_module.reload_entity_classes()
+
+
 def update(verbose=False, path=None, show_logs=False, no_mods=False):
     """
     Updates the data in the :py:mod:`.draftsman.data` modules.
@@ -1780,6 +1822,13 @@ def update(verbose=False, path=None, show_logs=False, no_mods=False):
     extract_signals(lua, data_location, verbose, items)
     extract_tiles(lua, data_location, verbose)
 
+    # Write the per-attribute caches for faster loading
+    write_cache(data_location)
+
+    # If the entity data was already imported in this session, update it with
+    # the newly extracted data so that `new_entity()` recognizes any new names
+    refresh_entity_data(data_location)
+
     # TODO: Think about a way that users can extract the data that they want
     # instead of it being hardcoded for my purposes alone
 
@@ -0,0 +1,342 @@
+# geometry.py
+# -*- encoding: utf-8 -*-
+
+"""
+Geometry operations on many points or bounding boxes at once. These are used
+by collections like :py:class:`.Blueprint` and :py:class:`.Group` to transform
+or measure all of their entities and tiles in one go, instead of one Python
+call per object.
+
+If `NumPy <https://numpy.org/>`_ is installed, each function is computed with
+a handful of array operations; otherwise, an equivalent pure Python
+implementation is used. Both give identical results, and always return regular
+Python ``list`` objects. Inputs can also be given as NumPy arrays, which
+avoids the cost of converting them. Otherwise, NumPy is only used for inputs
+with at least :py:data:`NUMPY_THRESHOLD` elements, as it is slower than plain
+Python for small inputs.
+
+Points are given as sequences of ``[x, y]`` pairs, and bounding boxes as
+sequences of ``[x1, y1, x2, y2]`` lists in world space.
+"""
+
+from __future__ import unicode_literals, division
+
+from draftsman.classes.vector import PrimitiveVector
+from draftsman.utils import AABB
+
+from collections import defaultdict
+import itertools
+from typing import Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no coverage
+    np = None
+
+
+NUMPY_THRESHOLD = 64
+"""
+The minimum number of points or bounding boxes for which NumPy is used.
+"""
+
+# The rotation matrices for each (even) direction; each point is transformed
+# to `(x * m[0] + y * m[2], x * m[1] + y * m[3])`
+_ROTATION_MATRICES = {
+    0: (1, 0, 0, 1),
+    2: (0, 1, -1, 0),
+    4: (-1, 0, 0, -1),
+    6: (0, -1, 1, 0),
+}
+
+# The offsets of a grid cell and all of its neighbours
+_NEIGHBOURS = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)]
+
+# The scale of each axis when flipping in each direction
+_FLIP_MATRICES = {"horizontal": (-1, 1), "vertical": (1, -1)}
+
+_numpy_enabled = np is not None
+
+
+def set_numpy_enabled(value):
+    # type: (bool) -> None
+    """
+    Sets whether or not NumPy is used for large inputs. Enabled by default if
+    NumPy is installed; has no effect if it isn't.
+
+    :param value: ``True`` to use NumPy, ``False`` to always use the pure
+        Python implementations.
+    """
+    global _numpy_enabled
+    _numpy_enabled = bool(value) and np is not None
+
+
+def is_numpy_enabled():
+    # type: () -> bool
+    """
+    Returns whether or not NumPy is installed and used for large inputs.
+    """
+    return _numpy_enabled
+
+
+def _use_numpy(values):
+    # type: (Sequence) -> bool
+    return _numpy_enabled and (
+        len(values) >= NUMPY_THRESHOLD or isinstance(values, np.ndarray)
+    )
+
+
+def _as_array(values, columns):
+    # type: (Sequence, int) -> np.ndarray
+    return np.asarray(values, dtype=float).reshape(-1, columns)
+
+
+# =============================================================================
+# Transformations
+# =============================================================================
+
+
+def translate_points(points, x, y):
+    # type: (Sequence[PrimitiveVector], float, float) -> list[list[float]]
+    """
+    Translates every point in ``points`` by ``x`` and ``y``.
+
+    :param points: The points to translate.
+    :param x: The amount to translate along x.
+    :param y: The amount to translate along y.
+
+    :returns: A ``list`` of translated ``[x, y]`` points.
+    """
+    if _use_numpy(points):
+        return (_as_array(points, 2) + (x, y)).tolist()
+    return [[p[0] + x, p[1] + y] for p in points]
+
+
+def rotate_points(points, angle, offset=(0, 0)):
+    # type: (Sequence[PrimitiveVector], int, PrimitiveVector) -> list[list[float]]
+    """
+    Rotates every point in ``points`` around the origin. ``angle`` is specified
+    in terms of :py:data:`.Direction`, so ``2`` is a rotation of 90 degrees
+    clockwise. Each point is moved by ``offset`` before rotating, and then moved
+    back afterwards; this is used to rotate tiles, which are positioned by their
+    top left corner, around their centers (``offset=(0.5, 0.5)``).
+
+    :param points: The points to rotate.
+    :param angle: The angle to rotate by; must be a multiple of 2.
+    :param offset: The offset to apply to each point while rotating.
+
+    :returns: A ``list`` of rotated ``[x, y]`` points.
+
+    :exception ValueError: If ``angle`` is not a multiple of 2.
+    """
+    try:
+        m = _ROTATION_MATRICES[angle % 8]
+    except KeyError:
+        raise ValueError("'angle' must be a multiple of 2")
+    ox, oy = offset
+
+    if _use_numpy(points):
+        array = _as_array(points, 2) + (ox, oy)
+        matrix = np.array([[m[0], m[1]], [m[2], m[3]]], dtype=float)
+        return (array.dot(matrix) - (ox, oy)).tolist()
+
+    result = []
+    for p in points:
+        x = p[0] + ox
+        y = p[1] + oy
+        result.append([x * m[0] + y * m[2] - ox, x * m[1] + y * m[3] - oy])
+    return result
+
+
+def flip_points(points, direction, offset=(0, 0)):
+    # type: (Sequence[PrimitiveVector], str, PrimitiveVector) -> list[list[float]]
+    """
+    Flips every point in ``points`` across the y-axis if ``direction`` is
+    ``"horizontal"``, or across the x-axis if ``direction`` is ``"vertical"``.
+    ``offset`` is applied in the same manner as :py:func:`rotate_points`.
+
+    :param points: The points to flip.
+    :param direction: Either ``"horizontal"`` or ``"vertical"``.
+    :param offset: The offset to apply to each point while flipping.
+
+    :returns: A ``list`` of flipped ``[x, y]`` points.
+
+    :exception ValueError: If ``direction`` is not one of the above values.
+    """
+    try:
+        sx, sy = _FLIP_MATRICES[direction]
+    except KeyError:
+        raise ValueError("'direction' must be either 'horizontal' or 'vertical'")
+    ox, oy = offset
+
+    if _use_numpy(points):
+        array = (_as_array(points, 2) + (ox, oy)) * (sx, sy)
+        return (array - (ox, oy)).tolist()
+
+    return [[(p[0] + ox) * sx - ox, (p[1] + oy) * sy - oy] for p in points]
+
+
+# =============================================================================
+# Measurement
+# =============================================================================
+
+
+def bounding_box(boxes):
+    # type: (Sequence[Sequence[float]]) -> Union[AABB, None]
+    """
+    Gets the minimum :py:class:`.AABB` that encompasses every bounding box in
+    ``boxes``. Equivalent to repeatedly calling :py:func:`.utils.extend_aabb`.
+
+    :param boxes: The bounding boxes to encompass.
+
+    :returns: A new :py:class:`.AABB`, or ``None`` if ``boxes`` is empty.
+    """
+    if len(boxes) == 0:
+        return None
+
+    # Converting a list to an array costs more than finding its extents in
+    # Python, so NumPy is only used if the boxes are already in an array
+    if _numpy_enabled and isinstance(boxes, np.ndarray):
+        array = _as_array(boxes, 4)
+        x1, y1 = array[:, :2].min(axis=0).tolist()
+        x2, y2 = array[:, 2:].max(axis=0).tolist()
+        return AABB(x1, y1, x2, y2)
+
+    return AABB(
+        min(box[0] for box in boxes),
+        min(box[1] for box in boxes),
+        max(box[2] for box in boxes),
+        max(box[3] for box in boxes),
+    )
+
+
+def points_in_circle(points, r, c=(0, 0)):
+    # type: (Sequence[PrimitiveVector], float, PrimitiveVector) -> list[bool]
+    """
+    Checks whether or not each point in ``points`` lies within radius ``r`` of
+    point ``c``. Equivalent to calling :py:func:`.utils.point_in_circle` on each
+    point.
+
+    :param points: The points to check.
+    :param r: The radius of the circle.
+    :param c: The center of the circle. Defaults to the origin.
+
+    :returns: A ``list`` with a ``bool`` for each point.
+    """
+    if _use_numpy(points):
+        delta = _as_array(points, 2) - (c[0], c[1])
+        return ((delta * delta).sum(axis=1) <= r * r).tolist()
+
+    result = []
+    for p in points:
+        dx = p[0] - c[0]
+        dy = p[1] - c[1]
+        result.append(dx * dx + dy * dy <= r * r)
+    return result
+
+
+def overlapping_pairs(boxes, others=None):
+    # type: (Sequence[Sequence[float]], Sequence[Sequence[float]]) -> list[tuple[int, int]]
+    """
+    Finds every pair of overlapping bounding boxes, using the same criteria as
+    :py:func:`.utils.aabb_overlaps_aabb` (boxes that only touch do not
+    overlap). If ``others`` is specified, every overlapping pair between
+    ``boxes`` and ``others`` is returned; otherwise, every overlapping pair
+    within ``boxes`` is returned.
+
+    Boxes are sorted into a grid of cells as large as the largest box, and
+    each box is only compared against the boxes in its own and neighbouring
+    cells, so this is suitable as a broadphase check for large numbers of
+    similarly sized boxes.
+
+    :param boxes: The bounding boxes to check.
+    :param others: A second ``list`` of bounding boxes to check against, or
+        ``None``.
+
+    :returns: A sorted ``list`` of ``(i, j)`` tuples, where ``i`` is an index
+        into ``boxes`` and ``j`` is an index into ``others`` (or into ``boxes``,
+        in which case ``i < j``).
+    """
+    same = others is None
+    if same:
+        others = boxes
+    if len(boxes) == 0 or len(others) == 0:
+        return []
+
+    if _use_numpy(boxes) or _use_numpy(others):
+        return _overlapping_pairs_numpy(boxes, others, same)
+
+    # Any box that overlaps another must have its top left corner in the same
+    # or a neighbouring cell, as long as cells are at least as large as either
+    cell_size = max(
+        max(box[2] - box[0], box[3] - box[1]) for box in itertools.chain(boxes, others)
+    )
+    cell_size = cell_size or 1
+
+    cells = defaultdict(list)
+    for j, b in enumerate(others):
+        cells[(b[0] // cell_size, b[1] // cell_size)].append(j)
+
+    pairs = []
+    for i, a in enumerate(boxes):
+        cx = a[0] // cell_size
+        cy = a[1] // cell_size
+        for dx, dy in _NEIGHBOURS:
+            for j in cells.get((cx + dx, cy + dy), ()):
+                if same and j <= i:
+                    continue
+                b = others[j]
+                if a[0] < b[2] and a[2] > b[0] and a[1] < b[3] and a[3] > b[1]:
+                    pairs.append((i, j))
+    pairs.sort()
+    return pairs
+
+
+def _overlapping_pairs_numpy(boxes, others, same):
+    # type: (Sequence[Sequence[float]], Sequence[Sequence[float]], bool) -> list[tuple[int, int]]
+    a = _as_array(boxes, 4)
+    b = _as_array(others, 4)
+
+    cell_size = max((a[:, 2:] - a[:, :2]).max(), (b[:, 2:] - b[:, :2]).max())
+    cell_size = cell_size or 1
+    a_cells = np.floor_divide(a[:, :2], cell_size).astype(np.int64)
+    b_cells = np.floor_divide(b[:, :2], cell_size).astype(np.int64)
+
+    # Give each cell a unique integer key; the y range is padded so that the
+    # neighbours of each cell never share a key with any other cell
+    low = np.minimum(a_cells.min(axis=0), b_cells.min(axis=0)) - 1
+    span = np.maximum(a_cells.max(axis=0), b_cells.max(axis=0)) - low + 2
+    a_cells -= low
+    b_cells -= low
+    b_keys = b_cells[:, 0] * span[1] + b_cells[:, 1]
+    order = np.argsort(b_keys, kind="stable")
+    b_keys = b_keys[order]
+
+    i_parts = []
+    j_parts = []
+    for dx, dy in _NEIGHBOURS:
+        keys = (a_cells[:, 0] + dx) * span[1] + (a_cells[:, 1] + dy)
+        begin = np.searchsorted(b_keys, keys, side="left")
+        counts = np.searchsorted(b_keys, keys, side="right") - begin
+
+        # Expand the range of each box into a flat list of candidate pairs
+        i = np.repeat(np.arange(len(a)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(
+            np.cumsum(counts) - counts, counts
+        )
+        j = order[np.repeat(begin, counts) + offsets]
+
+        mask = (
+            (a[i, 0] < b[j, 2])
+            & (a[i, 2] > b[j, 0])
+            & (a[i, 1] < b[j, 3])
+            & (a[i, 3] > b[j, 1])
+        )
+        if same:
+            mask &= j > i
+        i_parts.append(i[mask])
+        j_parts.append(j[mask])
+
+    i = np.concatenate(i_parts)
+    j = np.concatenate(j_parts)
+    sort = np.lexsort((j, i))
+    return list(zip(i[sort].tolist(), j[sort].tolist()))
@@ -11,10 +11,10 @@ from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import accumulators
 from draftsman.data.signals import signal_dict
+from draftsman import utils
 
 from schema import SchemaError
 import six
-import warnings
 
 
 class Accumulator(ControlBehaviorMixin, CircuitConnectableMixin, Entity):
@@ -44,7 +44,7 @@ class Accumulator(ControlBehaviorMixin, CircuitConnectableMixin, Entity):
         super(Accumulator, self).__init__(name, accumulators, **kwargs)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
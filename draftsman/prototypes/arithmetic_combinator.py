@@ -19,7 +19,6 @@ from draftsman import utils
 from schema import SchemaError
 import six
 from typing import Union
-import warnings
 
 
 class ArithmeticCombinator(
@@ -58,7 +57,7 @@ class ArithmeticCombinator(
         self._dual_circuit_connectable = True
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -167,7 +166,7 @@ class ArithmeticCombinator(
             and self.output_signal is not None
             and self.output_signal["name"] == "signal-each"
         ):
-            warnings.warn(
+            utils.warn(
                 "first_operand unset from 'signal-each'; output_signal can no "
                 "longer be 'signal-each' and will be reset to `None`",
                 DraftsmanWarning,
@@ -312,7 +311,7 @@ class ArithmeticCombinator(
             and self.output_signal is not None
             and self.output_signal["name"] == "signal-each"
         ):
-            warnings.warn(
+            utils.warn(
                 "second_operand unset from 'signal-each'; output_signal can no "
                 "longer be 'signal-each' and will be reset to `None`",
                 DraftsmanWarning,
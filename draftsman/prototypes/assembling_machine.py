@@ -22,7 +22,6 @@ from draftsman.data.entities import assembling_machines
 from draftsman.data import modules
 from draftsman.data import recipes
 
-import warnings
 
 
 class AssemblingMachine(
@@ -60,7 +59,7 @@ class AssemblingMachine(
         super(AssemblingMachine, self).__init__(name, assembling_machines, **kwargs)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -76,7 +75,7 @@ class AssemblingMachine(
             if "limitation" in module:
                 if self.recipe is not None and self.recipe not in module["limitation"]:
                     tooltip = module.get("limitation_message_key", "no message key")
-                    warnings.warn(
+                    utils.warn(
                         "Cannot use module '{}' with recipe '{}' ({})".format(
                             item, self.recipe, tooltip
                         ),
@@ -89,7 +88,7 @@ class AssemblingMachine(
             ingredients = recipes.get_recipe_ingredients(self.recipe)
 
             if item not in ingredients:
-                warnings.warn(
+                utils.warn(
                     "Cannot request items that the recipe '{}' doesn't use ({})".format(
                         self.recipe, item
                     ),
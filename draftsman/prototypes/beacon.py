@@ -17,7 +17,6 @@ from draftsman.data.entities import beacons
 from draftsman.data import modules
 from draftsman.data import items
 
-import warnings
 
 
 class Beacon(ModulesMixin, RequestItemsMixin, Entity):
@@ -47,7 +46,7 @@ class Beacon(ModulesMixin, RequestItemsMixin, Entity):
         super(Beacon, self).__init__(name, beacons, **kwargs)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -58,14 +57,14 @@ class Beacon(ModulesMixin, RequestItemsMixin, Entity):
         # type: (str, int) -> None
 
         if item in items.raw and item not in modules.raw:
-            warnings.warn(
+            utils.warn(
                 "Item '{}' cannot be placed in Beacon".format(item),
                 ItemLimitationWarning,
                 stacklevel=2,
             )
 
         if item in modules.categories["productivity"]:
-            warnings.warn(
+            utils.warn(
                 "Cannot use '{}' in Beacon".format(item),
                 ModuleLimitationWarning,
                 stacklevel=2,
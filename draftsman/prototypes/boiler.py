@@ -8,8 +8,8 @@ from draftsman.classes.mixins import RequestItemsMixin, DirectionalMixin
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import boilers
+from draftsman import utils
 
-import warnings
 
 
 class Boiler(RequestItemsMixin, DirectionalMixin, Entity):
@@ -40,7 +40,7 @@ class Boiler(RequestItemsMixin, DirectionalMixin, Entity):
         super(Boiler, self).__init__(name, boilers, **kwargs)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -8,8 +8,8 @@ from draftsman.classes.mixins import DirectionalMixin
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import burner_generators
+from draftsman import utils
 
-import warnings
 
 
 class BurnerGenerator(DirectionalMixin, Entity):
@@ -33,7 +33,7 @@ class BurnerGenerator(DirectionalMixin, Entity):
         super(BurnerGenerator, self).__init__(name, burner_generators, **kwargs)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -8,9 +8,8 @@ from draftsman.classes.mixins import InventoryFilterMixin, OrientationMixin
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import cargo_wagons
-from draftsman.data import entities
+from draftsman import utils
 
-import warnings
 
 
 class CargoWagon(InventoryFilterMixin, OrientationMixin, Entity):
@@ -31,17 +30,14 @@ class CargoWagon(InventoryFilterMixin, OrientationMixin, Entity):
     _exports.update(OrientationMixin._exports)
     _exports.update(InventoryFilterMixin._exports)
 
+    _default_collision_mask = {"train-layer"}
+
     def __init__(self, name=cargo_wagons[0], **kwargs):
         # type: (str, **dict) -> None
         super(CargoWagon, self).__init__(name, cargo_wagons, **kwargs)
 
-        if "collision_mask" in entities.raw[self.name]:  # pragma: no coverage
-            self._collision_mask = set(entities.raw[self.name]["collision_mask"])
-        else:  # pragma: no coverage
-            self._collision_mask = {"train-layer"}
-
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -16,10 +16,10 @@ from draftsman.warning import DraftsmanWarning
 from draftsman.data.entities import constant_combinators
 from draftsman.data import entities
 from draftsman.data import signals
+from draftsman import utils
 
 from schema import SchemaError
 import six
-import warnings
 
 
 class ConstantCombinator(
@@ -52,7 +52,7 @@ class ConstantCombinator(
         self._item_slot_count = entities.raw[self.name]["item_slot_count"]
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -130,7 +130,7 @@ class ConstantCombinator(
                 # by Factorio we issue warnings if we find one
                 for filter in value:
                     if filter["signal"]["name"] in signals.pure_virtual:
-                        warnings.warn(
+                        utils.warn(
                             "Set signal in index {} to '{}'; is this intentional?".format(
                                 filter["index"], filter["signal"]["name"]
                             ),
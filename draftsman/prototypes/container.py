@@ -11,9 +11,9 @@ from draftsman.classes.mixins import (
 )
 from draftsman.warning import DraftsmanWarning
 
-from draftsman.data.entities import containers, raw
+from draftsman.data.entities import containers
+from draftsman import utils
 
-import warnings
 
 
 class Container(InventoryMixin, RequestItemsMixin, CircuitConnectableMixin, Entity):
@@ -41,7 +41,7 @@ class Container(InventoryMixin, RequestItemsMixin, CircuitConnectableMixin, Enti
         super(Container, self).__init__(name, containers, **kwargs)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
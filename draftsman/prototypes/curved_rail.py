@@ -11,9 +11,26 @@ from draftsman.utils import AABB, Rectangle
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import curved_rails
-from draftsman.data import entities
+from draftsman import utils
 
-import warnings
+
+
+_left_turn = CollisionSet(
+    [AABB(0.25, 1.8, 1.75, 3.9), Rectangle((-0.375, -0.7175), 1.4, 5.45, -35)]
+)
+_right_turn = CollisionSet(
+    [AABB(-1.75, 1.8, -0.25, 3.9), Rectangle((0.375, -0.7175), 1.4, 5.45, 35)]
+)
+_collision_set_rotation = {
+    Direction.NORTH: _left_turn,
+    Direction.NORTHEAST: _right_turn,
+    Direction.EAST: _left_turn.rotate(2),
+    Direction.SOUTHEAST: _right_turn.rotate(2),
+    Direction.SOUTH: _left_turn.rotate(4),
+    Direction.SOUTHWEST: _right_turn.rotate(4),
+    Direction.WEST: _left_turn.rotate(6),
+    Direction.NORTHWEST: _right_turn.rotate(6),
+}
 
 
 class CurvedRail(DoubleGridAlignedMixin, EightWayDirectionalMixin, Entity):
@@ -34,6 +51,14 @@ class CurvedRail(DoubleGridAlignedMixin, EightWayDirectionalMixin, Entity):
     _exports.update(EightWayDirectionalMixin._exports)
     _exports.update(DoubleGridAlignedMixin._exports)
 
+    _default_collision_mask = {
+        "item-layer",
+        "object-layer",
+        "rail-layer",
+        "floor-layer",
+        "water-tile",
+    }
+
     def __init__(self, name=curved_rails[0], **kwargs):
         # type: (str, **dict) -> None
         """
@@ -49,39 +74,15 @@ class CurvedRail(DoubleGridAlignedMixin, EightWayDirectionalMixin, Entity):
         # We set a (private) flag to ignore the dummy collision box that
         # Factorio provides
         self._overwritten_collision_set = True
-        # We then provide a list of all the custom rotations
-        left_turn = CollisionSet(
-            [AABB(0.25, 1.8, 1.75, 3.9), Rectangle((-0.375, -0.7175), 1.4, 5.45, -35)]
-        )
-        right_turn = CollisionSet(
-            [AABB(-1.75, 1.8, -0.25, 3.9), Rectangle((0.375, -0.7175), 1.4, 5.45, 35)]
-        )
-        self._collision_set = left_turn
-        self._collision_set_rotation = {}
-        self._collision_set_rotation[Direction.NORTH] = left_turn
-        self._collision_set_rotation[Direction.NORTHEAST] = right_turn
-        self._collision_set_rotation[Direction.EAST] = left_turn.rotate(2)
-        self._collision_set_rotation[Direction.SOUTHEAST] = right_turn.rotate(2)
-        self._collision_set_rotation[Direction.SOUTH] = left_turn.rotate(4)
-        self._collision_set_rotation[Direction.SOUTHWEST] = right_turn.rotate(4)
-        self._collision_set_rotation[Direction.WEST] = left_turn.rotate(6)
-        self._collision_set_rotation[Direction.NORTHWEST] = right_turn.rotate(6)
+        # We then provide a list of all the custom rotations, which are shared
+        # between all CurvedRail instances
+        self._collision_set = _collision_set_rotation[Direction.NORTH]
+        self._collision_set_rotation = _collision_set_rotation
 
         super(CurvedRail, self).__init__(name, curved_rails, **kwargs)
 
-        if "collision_mask" in entities.raw[self.name]:  # pragma: no coverage
-            self._collision_mask = set(entities.raw[self.name]["collision_mask"])
-        else:  # pragma: no coverage
-            self._collision_mask = {
-                "item-layer",
-                "object-layer",
-                "rail-layer",
-                "floor-layer",
-                "water-tile",
-            }
-
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
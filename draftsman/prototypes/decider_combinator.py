@@ -20,7 +20,6 @@ from draftsman import utils
 from schema import SchemaError
 import six
 from typing import Union
-import warnings
 
 
 class DeciderCombinator(
@@ -52,7 +51,7 @@ class DeciderCombinator(
         self._dual_circuit_connectable = True
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -159,7 +158,7 @@ class DeciderCombinator(
             value_name, {"signal-anything", "signal-each"}
         )
         if output_signal_name in current_blacklist:
-            warnings.warn(
+            utils.warn(
                 "'{}' cannot be an output_signal when '{}' is the first operand; "
                 "output_signal will be set to `None`".format(
                     output_signal_name, value_name
@@ -7,9 +7,9 @@ from draftsman.classes.entity import Entity
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import electric_energy_interfaces
+from draftsman import utils
 
 import six
-import warnings
 
 
 class ElectricEnergyInterface(Entity):
@@ -85,7 +85,7 @@ class ElectricEnergyInterface(Entity):
         # self._add_export("power_usage", lambda x: x is not None)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -8,8 +8,8 @@ from draftsman.classes.mixins import CircuitConnectableMixin, PowerConnectableMi
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import electric_poles
+from draftsman import utils
 
-import warnings
 
 
 class ElectricPole(CircuitConnectableMixin, PowerConnectableMixin, Entity):
@@ -35,7 +35,7 @@ class ElectricPole(CircuitConnectableMixin, PowerConnectableMixin, Entity):
         super(ElectricPole, self).__init__(name, electric_poles, **kwargs)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -20,10 +20,10 @@ from draftsman import signatures
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import filter_inserters
+from draftsman import utils
 
 from schema import SchemaError
 import six
-import warnings
 
 
 class FilterInserter(
@@ -101,7 +101,7 @@ class FilterInserter(
         # self._add_export("filter_mode", lambda x: x is not None)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
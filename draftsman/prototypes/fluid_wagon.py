@@ -8,9 +8,8 @@ from draftsman.classes.mixins import OrientationMixin
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import fluid_wagons
-from draftsman.data import entities
+from draftsman import utils
 
-import warnings
 
 
 class FluidWagon(OrientationMixin, Entity):
@@ -29,17 +28,14 @@ class FluidWagon(OrientationMixin, Entity):
     _exports.update(Entity._exports)
     _exports.update(OrientationMixin._exports)
 
+    _default_collision_mask = {"train-layer"}
+
     def __init__(self, name=fluid_wagons[0], **kwargs):
         # type: (str, **dict) -> None
         super(FluidWagon, self).__init__(name, fluid_wagons, **kwargs)
 
-        if "collision_mask" in entities.raw[self.name]:  # pragma: no coverage
-            self._collision_mask = set(entities.raw[self.name]["collision_mask"])
-        else:  # pragma: no coverage
-            self._collision_mask = {"train-layer"}
-
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
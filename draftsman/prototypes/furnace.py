@@ -8,10 +8,9 @@ from draftsman.classes.mixins import ModulesMixin, RequestItemsMixin
 from draftsman import utils
 from draftsman.warning import DraftsmanWarning, ItemLimitationWarning
 
-from draftsman.data.entities import furnaces, raw
-from draftsman.data import modules, recipes
+from draftsman.data.entities import furnaces
+from draftsman.data import entities, modules, recipes
 
-import warnings
 
 
 class Furnace(ModulesMixin, RequestItemsMixin, Entity):
@@ -38,7 +37,7 @@ class Furnace(ModulesMixin, RequestItemsMixin, Entity):
         # FIXME: the following
         # Create a set of valid ingredients for this entity
         try:
-            crafting_categories = raw[name]["crafting_categories"]
+            crafting_categories = entities.raw[name]["crafting_categories"]
             total_recipes = []
             for crafting_category in crafting_categories:
                 total_recipes.extend(recipes.categories[crafting_category])
@@ -57,10 +56,10 @@ class Furnace(ModulesMixin, RequestItemsMixin, Entity):
 
         # TODO: Get a set of valid fuel items for this entity
         # self._valid_fuel_items = set()
-        # energy_source = raw[self.name]["energy_source"]
+        # energy_source = entities.raw[self.name]["energy_source"]
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -85,7 +84,7 @@ class Furnace(ModulesMixin, RequestItemsMixin, Entity):
     def set_item_request(self, item, count):
         # type: (str, int) -> None
         if item not in modules.raw and item not in self.valid_input_ingredients:
-            warnings.warn(
+            utils.warn(
                 "Cannot request items that this Furnace doesn't use ({})".format(item),
                 ItemLimitationWarning,
                 stacklevel=2,
@@ -8,9 +8,8 @@ from draftsman.classes.mixins import DirectionalMixin
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import gates
-from draftsman.data import entities
+from draftsman import utils
 
-import warnings
 
 
 class Gate(DirectionalMixin, Entity):
@@ -29,23 +28,20 @@ class Gate(DirectionalMixin, Entity):
     _exports.update(Entity._exports)
     _exports.update(DirectionalMixin._exports)
 
+    _default_collision_mask = {
+        "item-layer",
+        "object-layer",
+        "player-layer",
+        "water-tile",
+        "train-layer",
+    }
+
     def __init__(self, name=gates[0], **kwargs):
         # type: (str, **dict) -> None
         super(Gate, self).__init__(name, gates, **kwargs)
 
-        if "collision_mask" in entities.raw[self.name]:  # pragma: no coverage
-            self._collision_mask = set(entities.raw[self.name]["collision_mask"])
-        else:  # pragma: no coverage
-            self._collision_mask = {
-                "item-layer",
-                "object-layer",
-                "player-layer",
-                "water-tile",
-                "train-layer",
-            }
-
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
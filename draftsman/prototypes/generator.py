@@ -8,8 +8,8 @@ from draftsman.classes.mixins import DirectionalMixin
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import generators
+from draftsman import utils
 
-import warnings
 
 
 class Generator(DirectionalMixin, Entity):
@@ -33,7 +33,7 @@ class Generator(DirectionalMixin, Entity):
         super(Generator, self).__init__(name, generators, **kwargs)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -9,8 +9,8 @@ import draftsman.signatures as signatures
 from draftsman.warning import DraftsmanWarning, TemperatureRangeWarning
 
 from draftsman.data.entities import heat_interfaces
+from draftsman import utils
 
-import warnings
 
 
 class HeatInterface(Entity):
@@ -68,7 +68,7 @@ class HeatInterface(Entity):
         # self._add_export("mode", lambda x: x is not None and x != "at-least")
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -101,7 +101,7 @@ class HeatInterface(Entity):
             self._temperature = value
         elif isinstance(value, int):
             if not 0 <= value <= 1000:
-                warnings.warn(
+                utils.warn(
                     "'temperature' ({}) not in range [0, 1000]; will be clamped"
                     " on import".format(value),
                     TemperatureRangeWarning,
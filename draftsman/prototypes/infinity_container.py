@@ -11,10 +11,10 @@ from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import infinity_containers
 from draftsman.data import items
+from draftsman import utils
 
 from schema import SchemaError
 import six
-import warnings
 
 
 class InfinityContainer(RequestItemsMixin, Entity):
@@ -58,7 +58,7 @@ class InfinityContainer(RequestItemsMixin, Entity):
         # self._add_export("infinity_settings", lambda x: len(x) != 0)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -10,10 +10,10 @@ from draftsman.warning import DraftsmanWarning, TemperatureRangeWarning
 
 from draftsman.data.entities import infinity_pipes
 import draftsman.data.signals as signals
+from draftsman import utils
 
 from schema import SchemaError
 import six
-import warnings
 
 
 class InfinityPipe(Entity):
@@ -55,7 +55,7 @@ class InfinityPipe(Entity):
         # self._add_export("infinity_settings", lambda x: len(x) != 0)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -219,7 +219,7 @@ class InfinityPipe(Entity):
             self.infinity_settings.pop("temperature", None)
         elif isinstance(value, (int, float)):
             if not 0 <= value <= 1000:
-                warnings.warn(
+                utils.warn(
                     "'infinite_fluid_temperature' ({}) not in range [0, 1000]; "
                     "will be clamped on import".format(value),
                     TemperatureRangeWarning,
@@ -274,7 +274,7 @@ class InfinityPipe(Entity):
 
         # Warn if temperature is less than 0 or greater than 1000
         if not 0 <= temperature <= 1000:
-            warnings.warn(
+            utils.warn(
                 "'infinite_fluid_temperature' ({}) not in range [0, 1000]; "
                 "will be clamped on import".format(percentage),
                 TemperatureRangeWarning,
@@ -20,10 +20,10 @@ from draftsman import signatures
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import inserters
+from draftsman import utils
 
 from schema import SchemaError
 import six
-import warnings
 
 
 class Inserter(
@@ -77,7 +77,7 @@ class Inserter(
         super(Inserter, self).__init__(name, inserters, **kwargs)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
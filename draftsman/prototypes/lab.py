@@ -8,10 +8,9 @@ from draftsman.classes.mixins import ModulesMixin, RequestItemsMixin
 from draftsman import utils
 from draftsman.warning import DraftsmanWarning, ItemLimitationWarning
 
-from draftsman.data.entities import labs, raw
-from draftsman.data import items, modules
+from draftsman.data.entities import labs
+from draftsman.data import entities, items, modules
 
-import warnings
 
 
 class Lab(ModulesMixin, RequestItemsMixin, Entity):
@@ -37,10 +36,10 @@ class Lab(ModulesMixin, RequestItemsMixin, Entity):
         super(Lab, self).__init__(name, labs, **kwargs)
 
         # Keep track of science packs that this lab can use
-        self._inputs = raw[self.name]["inputs"]
+        self._inputs = entities.raw[self.name]["inputs"]
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -64,7 +63,7 @@ class Lab(ModulesMixin, RequestItemsMixin, Entity):
     def set_item_request(self, item, count):
         # type: (str, int) -> None
         if item not in modules.raw and item not in self.inputs:
-            warnings.warn(
+            utils.warn(
                 "Item '{}' cannot be placed in Lab".format(item),
                 ItemLimitationWarning,
                 stacklevel=2,
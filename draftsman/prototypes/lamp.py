@@ -14,10 +14,10 @@ import draftsman.signatures as signatures
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import lamps
+from draftsman import utils
 
 from schema import SchemaError
 import six
-import warnings
 
 
 class Lamp(
@@ -47,7 +47,7 @@ class Lamp(
         super(Lamp, self).__init__(name, lamps, **kwargs)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -9,9 +9,8 @@ from draftsman.error import DraftsmanError
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import linked_belts
-from draftsman.data import entities
+from draftsman import utils
 
-import warnings
 
 try:  # pragma: no coverage
     default_linked_belt = linked_belts[0]
@@ -41,6 +40,13 @@ class LinkedBelt(DirectionalMixin, Entity):
     _exports.update(Entity._exports)
     _exports.update(DirectionalMixin._exports)
 
+    _default_collision_mask = {
+        "object-layer",
+        "item-layer",
+        "transport-belt-layer",
+        "water-tile",
+    }
+
     def __init__(self, name=default_linked_belt, **kwargs):
         # type: (str, **dict) -> None
         if len(linked_belts) == 0:  # pragma: no coverage
@@ -50,18 +56,8 @@ class LinkedBelt(DirectionalMixin, Entity):
 
         super(LinkedBelt, self).__init__(name, linked_belts, **kwargs)
 
-        if "collision_mask" in entities.raw[self.name]:  # pragma: no coverage
-            self._collision_mask = set(entities.raw[self.name]["collision_mask"])
-        else:  # pragma: no coverage
-            self._collision_mask = {
-                "object-layer",
-                "item-layer",
-                "transport-belt-layer",
-                "water-tile",
-            }
-
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
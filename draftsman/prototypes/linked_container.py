@@ -9,9 +9,9 @@ from draftsman import signatures
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import linked_containers
+from draftsman import utils
 
 import six
-import warnings
 
 
 class LinkedContainer(InventoryMixin, RequestItemsMixin, Entity):
@@ -58,7 +58,7 @@ class LinkedContainer(InventoryMixin, RequestItemsMixin, Entity):
         # self._add_export("link_id", lambda x: x != 0)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
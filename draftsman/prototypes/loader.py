@@ -8,9 +8,8 @@ from draftsman.classes.mixins import FiltersMixin, IOTypeMixin, DirectionalMixin
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import loaders
-from draftsman.data import entities
+from draftsman import utils
 
-import warnings
 
 
 class Loader(FiltersMixin, IOTypeMixin, DirectionalMixin, Entity):
@@ -34,22 +33,19 @@ class Loader(FiltersMixin, IOTypeMixin, DirectionalMixin, Entity):
     _exports.update(IOTypeMixin._exports)
     _exports.update(FiltersMixin._exports)
 
+    _default_collision_mask = {
+        "object-layer",
+        "item-layer",
+        "transport-belt-layer",
+        "water-tile",
+    }
+
     def __init__(self, name=loaders[0], **kwargs):
         # type: (str, **dict) -> None
         super(Loader, self).__init__(name, loaders, **kwargs)
 
-        if "collision_mask" in entities.raw[self.name]:  # pragma: no coverage
-            self._collision_mask = set(entities.raw[self.name]["collision_mask"])
-        else:  # pragma: no coverage
-            self._collision_mask = {
-                "object-layer",
-                "item-layer",
-                "transport-belt-layer",
-                "water-tile",
-            }
-
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
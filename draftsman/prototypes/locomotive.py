@@ -8,9 +8,8 @@ from draftsman.classes.mixins import ColorMixin, OrientationMixin
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import locomotives
-from draftsman.data import entities
+from draftsman import utils
 
-import warnings
 
 
 class Locomotive(ColorMixin, OrientationMixin, Entity):
@@ -31,17 +30,14 @@ class Locomotive(ColorMixin, OrientationMixin, Entity):
     _exports.update(OrientationMixin._exports)
     _exports.update(ColorMixin._exports)
 
+    _default_collision_mask = {"train-layer"}
+
     def __init__(self, name=locomotives[0], **kwargs):
         # type: (str, **dict) -> None
         super(Locomotive, self).__init__(name, locomotives, **kwargs)
 
-        if "collision_mask" in entities.raw[self.name]:  # pragma: no coverage
-            self._collision_mask = set(entities.raw[self.name]["collision_mask"])
-        else:  # pragma: no coverage
-            self._collision_mask = {"train-layer"}
-
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -12,8 +12,8 @@ from draftsman.classes.mixins import (
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import logistic_active_containers
+from draftsman import utils
 
-import warnings
 
 
 class LogisticActiveContainer(
@@ -46,7 +46,7 @@ class LogisticActiveContainer(
         )
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -18,10 +18,10 @@ from draftsman import signatures
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import logistic_buffer_containers
+from draftsman import utils
 
 from schema import SchemaError
 import six
-import warnings
 
 
 class LogisticBufferContainer(
@@ -68,7 +68,7 @@ class LogisticBufferContainer(
         )
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -17,10 +17,10 @@ from draftsman import signatures
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import logistic_request_containers
+from draftsman import utils
 
 from schema import SchemaError
 import six
-import warnings
 
 
 class LogisticRequestContainer(
@@ -84,7 +84,7 @@ class LogisticRequestContainer(
         # self._add_export("request_from_buffers", lambda x: x is not None)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -13,8 +13,8 @@ from draftsman.classes.mixins import (
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import logistic_storage_containers
+from draftsman import utils
 
-import warnings
 
 
 class LogisticStorageContainer(
@@ -53,7 +53,7 @@ class LogisticStorageContainer(
         )
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -26,7 +26,6 @@ from draftsman.data import items
 
 from schema import SchemaError
 import six
-import warnings
 
 
 class MiningDrill(
@@ -77,7 +76,7 @@ class MiningDrill(
         super(MiningDrill, self).__init__(name, mining_drills, **kwargs)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -105,7 +104,7 @@ class MiningDrill(
         #     raise InvalidItemError(item)
 
         if item in items.raw and item not in modules.raw:
-            warnings.warn(
+            utils.warn(
                 "Item '{}' cannot be placed in MiningDrill".format(item),
                 ItemLimitationWarning,
                 stacklevel=2,
@@ -16,10 +16,10 @@ from draftsman import signatures
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import offshore_pumps
+from draftsman import utils
 
 from schema import SchemaError
 import six
-import warnings
 
 
 class OffshorePump(
@@ -58,7 +58,7 @@ class OffshorePump(
         super(OffshorePump, self).__init__(name, offshore_pumps, **kwargs)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -17,10 +17,10 @@ from draftsman import signatures
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import power_switches
+from draftsman import utils
 
 from schema import SchemaError
 import six
-import warnings
 
 
 class PowerSwitch(
@@ -85,7 +85,7 @@ class PowerSwitch(
         # self._add_export("switch_state", lambda x: x is not None)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -21,11 +21,11 @@ from draftsman.warning import DraftsmanWarning, VolumeRangeWarning
 from draftsman.data.entities import programmable_speakers
 import draftsman.data.instruments as instruments_data
 from draftsman.data.signals import signal_dict
+from draftsman import utils
 
 from schema import SchemaError
 import six
 from typing import Union
-import warnings
 
 
 class ProgrammableSpeaker(
@@ -123,7 +123,7 @@ class ProgrammableSpeaker(
         #     self._normalize_circuit_parameters()
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -233,7 +233,7 @@ class ProgrammableSpeaker(
             self.parameters.pop("playback_volume", None)
         elif isinstance(value, float):
             if not 0.0 <= value <= 1.0:
-                warnings.warn(
+                utils.warn(
                     "volume ({}) not in range of [0.0, 1.0], will be clamped "
                     "on import".format(value),
                     VolumeRangeWarning,
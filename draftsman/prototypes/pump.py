@@ -15,10 +15,10 @@ from draftsman import signatures
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import pumps
+from draftsman import utils
 
 from schema import SchemaError
 import six
-import warnings
 
 
 class Pump(
@@ -53,7 +53,7 @@ class Pump(
         super(Pump, self).__init__(name, pumps, **kwargs)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
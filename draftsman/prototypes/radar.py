@@ -7,8 +7,8 @@ from draftsman.classes.entity import Entity
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import radars
+from draftsman import utils
 
-import warnings
 
 
 class Radar(Entity):
@@ -30,7 +30,7 @@ class Radar(Entity):
         super(Radar, self).__init__(name, radars, **kwargs)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
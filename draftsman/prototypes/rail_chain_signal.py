@@ -16,12 +16,11 @@ from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import rail_chain_signals
 from draftsman.data.signals import signal_dict
-from draftsman.data import entities
+from draftsman import utils
 
 from schema import SchemaError
 import six
 from typing import Union
-import warnings
 
 
 class RailChainSignal(
@@ -53,6 +52,8 @@ class RailChainSignal(
     _exports.update(ControlBehaviorMixin._exports)
     _exports.update(ReadRailSignalMixin._exports)
 
+    _default_collision_mask = {"floor-layer", "rail-layer", "item-layer"}
+
     def __init__(self, name=rail_chain_signals[0], **kwargs):
         # type: (str, **dict) -> None
 
@@ -63,13 +64,8 @@ class RailChainSignal(
 
         super(RailChainSignal, self).__init__(name, rail_chain_signals, **kwargs)
 
-        if "collision_mask" in entities.raw[self.name]:  # pragma: no coverage
-            self._collision_mask = set(entities.raw[self.name]["collision_mask"])
-        else:  # pragma: no coverage
-            self._collision_mask = {"floor-layer", "rail-layer", "item-layer"}
-
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
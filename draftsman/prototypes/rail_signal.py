@@ -17,11 +17,10 @@ from draftsman import signatures
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import rail_signals
-from draftsman.data import entities
+from draftsman import utils
 
 from schema import SchemaError
 import six
-import warnings
 
 
 class RailSignal(
@@ -59,6 +58,8 @@ class RailSignal(
     _exports.update(CircuitConditionMixin._exports)
     _exports.update(ReadRailSignalMixin._exports)
 
+    _default_collision_mask = {"floor-layer", "rail-layer", "item-layer"}
+
     def __init__(self, name=rail_signals[0], **kwargs):
         # type: (str, **dict) -> None
         """
@@ -72,13 +73,8 @@ class RailSignal(
 
         super(RailSignal, self).__init__(name, rail_signals, **kwargs)
 
-        if "collision_mask" in entities.raw[self.name]:  # pragma: no coverage
-            self._collision_mask = set(entities.raw[self.name]["collision_mask"])
-        else:  # pragma: no coverage
-            self._collision_mask = {"floor-layer", "rail-layer", "item-layer"}
-
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
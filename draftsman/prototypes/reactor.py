@@ -8,8 +8,8 @@ from draftsman.classes.mixins import RequestItemsMixin
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import reactors
+from draftsman import utils
 
-import warnings
 
 
 class Reactor(RequestItemsMixin, Entity):
@@ -33,7 +33,7 @@ class Reactor(RequestItemsMixin, Entity):
         super(Reactor, self).__init__(name, reactors, **kwargs)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
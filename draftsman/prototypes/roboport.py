@@ -11,11 +11,11 @@ from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import roboports
 from draftsman.data.signals import signal_dict
+from draftsman import utils
 
 from schema import SchemaError
 import six
 from typing import Union
-import warnings
 
 
 class Roboport(ControlBehaviorMixin, CircuitConnectableMixin, Entity):
@@ -41,7 +41,7 @@ class Roboport(ControlBehaviorMixin, CircuitConnectableMixin, Entity):
         super(Roboport, self).__init__(name, roboports, **kwargs)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -9,8 +9,8 @@ from draftsman.classes.mixins import RequestItemsMixin
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import rocket_silos
+from draftsman import utils
 
-import warnings
 
 
 class RocketSilo(RequestItemsMixin, Entity):
@@ -54,7 +54,7 @@ class RocketSilo(RequestItemsMixin, Entity):
         # self._add_export("auto_launch", lambda x: x is not None)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -11,10 +11,9 @@ from draftsman.warning import DraftsmanWarning
 from draftsman.data import items
 
 from draftsman.data.entities import splitters
-from draftsman.data import entities
+from draftsman import utils
 
 import six
-import warnings
 
 try:
     from typing import Literal
@@ -71,20 +70,17 @@ class Splitter(DirectionalMixin, Entity):
         },
     })
 
+    _default_collision_mask = {
+        "object-layer",
+        "item-layer",
+        "transport-belt-layer",
+        "water-tile",
+    }
+
     def __init__(self, name=splitters[0], **kwargs):
         # type: (str, **dict) -> None
         super(Splitter, self).__init__(name, splitters, **kwargs)
 
-        if "collision_mask" in entities.raw[self.name]:  # pragma: no coverage
-            self._collision_mask = set(entities.raw[self.name]["collision_mask"])
-        else:  # pragma: no coverage
-            self._collision_mask = {
-                "object-layer",
-                "item-layer",
-                "transport-belt-layer",
-                "water-tile",
-            }
-
         self.input_priority = None
         if "input_priority" in kwargs:
             self.input_priority = kwargs["input_priority"]
@@ -104,7 +100,7 @@ class Splitter(DirectionalMixin, Entity):
         # self._add_export("filter", lambda x: x is not None)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -8,8 +8,8 @@ from draftsman.classes.mixins import CircuitConnectableMixin, DirectionalMixin
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import storage_tanks
+from draftsman import utils
 
-import warnings
 
 
 class StorageTank(CircuitConnectableMixin, DirectionalMixin, Entity):
@@ -35,7 +35,7 @@ class StorageTank(CircuitConnectableMixin, DirectionalMixin, Entity):
         super(StorageTank, self).__init__(name, storage_tanks, **kwargs)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -11,9 +11,24 @@ from draftsman.utils import AABB, Rectangle
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import straight_rails
-from draftsman.data import entities
+from draftsman import utils
 
-import warnings
+
+
+_eps = 0.001
+_vertical_collision = CollisionSet([AABB(-0.75, -1.0 + _eps, 0.75, 1.0 - _eps)])
+_horizontal_collision = _vertical_collision.rotate(2)
+_diagonal_collision = CollisionSet([Rectangle((-0.5, -0.5), 1.25, 1.40, 45)])
+_collision_set_rotation = {
+    Direction.NORTH: _vertical_collision,
+    Direction.NORTHEAST: _diagonal_collision.rotate(2),
+    Direction.EAST: _horizontal_collision,
+    Direction.SOUTHEAST: _diagonal_collision.rotate(4),
+    Direction.SOUTH: _vertical_collision,
+    Direction.SOUTHWEST: _diagonal_collision.rotate(-2),
+    Direction.WEST: _horizontal_collision,
+    Direction.NORTHWEST: _diagonal_collision,
+}
 
 
 class StraightRail(DoubleGridAlignedMixin, EightWayDirectionalMixin, Entity):
@@ -34,6 +49,14 @@ class StraightRail(DoubleGridAlignedMixin, EightWayDirectionalMixin, Entity):
     _exports.update(EightWayDirectionalMixin._exports)
     _exports.update(DoubleGridAlignedMixin._exports)
 
+    _default_collision_mask = {
+        "item-layer",
+        "object-layer",
+        "rail-layer",
+        "floor-layer",
+        "water-tile",
+    }
+
     def __init__(self, name=straight_rails[0], **kwargs):
         # type: (str, **dict) -> None
         """
@@ -49,41 +72,15 @@ class StraightRail(DoubleGridAlignedMixin, EightWayDirectionalMixin, Entity):
         # We set a (private) flag to ignore the dummy collision box that
         # Factorio provides
         self._overwritten_collision_set = True
-        # We then provide a list of all the custom rotations
-        eps = 0.001
-        vertical_collision = CollisionSet([AABB(-0.75, -1.0 + eps, 0.75, 1.0 - eps)])
-        horizontal_collision = vertical_collision.rotate(2)
-        diagonal_collision = CollisionSet([Rectangle((-0.5, -0.5), 1.25, 1.40, 45)])
-        self._collision_set = vertical_collision
-        self._collision_set_rotation = {}
-        self._collision_set_rotation[Direction.NORTH] = vertical_collision
-        self._collision_set_rotation[Direction.NORTHEAST] = diagonal_collision.rotate(2)
-        self._collision_set_rotation[Direction.EAST] = horizontal_collision
-        self._collision_set_rotation[Direction.SOUTHEAST] = diagonal_collision.rotate(4)
-        self._collision_set_rotation[Direction.SOUTH] = vertical_collision
-        self._collision_set_rotation[Direction.SOUTHWEST] = diagonal_collision.rotate(
-            -2
-        )
-        self._collision_set_rotation[Direction.WEST] = horizontal_collision
-        self._collision_set_rotation[
-            Direction.NORTHWEST
-        ] = diagonal_collision  # .rotate(4)
+        # We then provide a list of all the custom rotations, which are shared
+        # between all StraightRail instances
+        self._collision_set = _collision_set_rotation[Direction.NORTH]
+        self._collision_set_rotation = _collision_set_rotation
 
         super(StraightRail, self).__init__(name, straight_rails, **kwargs)
 
-        if "collision_mask" in entities.raw[self.name]:  # pragma: no coverage
-            self._collision_mask = set(entities.raw[self.name]["collision_mask"])
-        else:  # pragma: no coverage
-            self._collision_mask = {
-                "item-layer",
-                "object-layer",
-                "rail-layer",
-                "floor-layer",
-                "water-tile",
-            }
-
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
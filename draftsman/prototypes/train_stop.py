@@ -20,11 +20,11 @@ from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import train_stops
 from draftsman.data.signals import signal_dict
+from draftsman import utils
 
 from schema import SchemaError
 import six
 from typing import Union
-import warnings
 
 
 class TrainStop(
@@ -108,7 +108,7 @@ class TrainStop(
         # self._add_export("manual_trains_limit", lambda x: x is not None)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
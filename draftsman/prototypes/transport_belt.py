@@ -18,11 +18,10 @@ from draftsman import signatures
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import transport_belts
-from draftsman.data import entities
+from draftsman import utils
 
 from schema import SchemaError
 import six
-import warnings
 
 
 class TransportBelt(
@@ -62,22 +61,19 @@ class TransportBelt(
     _exports.update(CircuitConditionMixin._exports)
     _exports.update(CircuitReadContentsMixin._exports)
 
+    _default_collision_mask = {
+        "object-layer",
+        "item-layer",
+        "transport-belt-layer",
+        "water-tile",
+    }
+
     def __init__(self, name=transport_belts[0], **kwargs):
         # type: (str, **dict) -> None
         super(TransportBelt, self).__init__(name, transport_belts, **kwargs)
 
-        if "collision_mask" in entities.raw[self.name]:  # pragma: no coverage
-            self._collision_mask = set(entities.raw[self.name]["collision_mask"])
-        else:  # pragma: no coverage
-            self._collision_mask = {
-                "object-layer",
-                "item-layer",
-                "transport-belt-layer",
-                "water-tile",
-            }
-
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
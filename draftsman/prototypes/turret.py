@@ -8,8 +8,8 @@ from draftsman.classes.mixins import RequestItemsMixin, DirectionalMixin
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import turrets
+from draftsman import utils
 
-import warnings
 
 
 class Turret(RequestItemsMixin, DirectionalMixin, Entity):
@@ -35,7 +35,7 @@ class Turret(RequestItemsMixin, DirectionalMixin, Entity):
         super(Turret, self).__init__(name, turrets, **kwargs)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -9,8 +9,8 @@ from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import underground_belts
 from draftsman.data import entities
+from draftsman import utils
 
-import warnings
 
 
 class UndergroundBelt(IOTypeMixin, DirectionalMixin, Entity):
@@ -31,22 +31,19 @@ class UndergroundBelt(IOTypeMixin, DirectionalMixin, Entity):
     _exports.update(DirectionalMixin._exports)
     _exports.update(IOTypeMixin._exports)
 
+    _default_collision_mask = {
+        "object-layer",
+        "item-layer",
+        "transport-belt-layer",
+        "water-tile",
+    }
+
     def __init__(self, name=underground_belts[0], **kwargs):
         # type: (str, **dict) -> None
         super(UndergroundBelt, self).__init__(name, underground_belts, **kwargs)
 
-        if "collision_mask" in entities.raw[self.name]:  # pragma: no coverage
-            self._collision_mask = set(entities.raw[self.name]["collision_mask"])
-        else:  # pragma: no coverage
-            self._collision_mask = {
-                "object-layer",
-                "item-layer",
-                "transport-belt-layer",
-                "water-tile",
-            }
-
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -8,8 +8,8 @@ from draftsman.classes.mixins import DirectionalMixin
 from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import underground_pipes
+from draftsman import utils
 
-import warnings
 
 
 class UndergroundPipe(DirectionalMixin, Entity):
@@ -33,7 +33,7 @@ class UndergroundPipe(DirectionalMixin, Entity):
         super(UndergroundPipe, self).__init__(name, underground_pipes, **kwargs)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -16,11 +16,11 @@ from draftsman.warning import DraftsmanWarning
 
 from draftsman.data.entities import walls
 from draftsman.data.signals import signal_dict
+from draftsman import utils
 
 from schema import SchemaError
 import six
 from typing import Union
-import warnings
 
 
 class Wall(
@@ -56,7 +56,7 @@ class Wall(
         super(Wall, self).__init__(name, walls, **kwargs)
 
         for unused_arg in self.unused_args:
-            warnings.warn(
+            utils.warn(
                 "{} has no attribute '{}'".format(type(self), unused_arg),
                 DraftsmanWarning,
                 stacklevel=2,
@@ -5,6 +5,11 @@
 Module of data formats, implemented as ``Schema`` objects. Used to validate and
 normalize data. Each one raises a ``SchemaError`` if the passed in data does not 
 match the data format specified, which is usually wrapped with ``DraftsmanError``.
+
+Each format is compiled into a :py:class:`CompiledSchema` when this module is
+imported, which validates data with a set of plain Python functions instead of
+interpreting the ``Schema`` on every call. Validation can be turned off
+entirely for trusted data with :py:func:`set_validation_enabled`.
 """
 
 
@@ -14,11 +19,301 @@ from draftsman.classes.association import Association
 from draftsman.data.signals import signal_dict
 
 from builtins import int
-from schema import Schema, Use, Optional, Or, And
+from contextlib import contextmanager
+from schema import Schema, Use, Optional, Or, And, Hook
 import six
+import threading
 import weakref
 
 
+# =============================================================================
+# Compilation
+# =============================================================================
+
+# Whether or not validation is enabled, separately for each thread
+_validation_state = threading.local()
+
+
+def set_validation_enabled(value):
+    # type: (bool) -> None
+    """
+    Sets whether or not the formats in this module validate the data passed to
+    them. When disabled, :py:meth:`CompiledSchema.validate` returns the data it
+    was given without checking or normalizing it, which makes setting entity
+    attributes considerably faster. The setting only applies to the current
+    thread; every thread starts with validation enabled.
+
+    Only disable validation for data that is already known to be in the exact
+    format Draftsman exports, such as the contents of a blueprint string
+    Draftsman created; shorthands like signal names given as strings are no
+    longer converted, and invalid data is no longer caught.
+
+    :param value: ``True`` to validate data, ``False`` to trust it.
+    """
+    _validation_state.enabled = bool(value)
+
+
+def is_validation_enabled():
+    # type: () -> bool
+    """
+    Returns whether or not data is currently validated in this thread. See
+    :py:func:`set_validation_enabled`.
+    """
+    return getattr(_validation_state, "enabled", True)
+
+
+@contextmanager
+def validation_disabled():
+    """
+    Context manager that disables validation for the duration of the ``with``
+    block, restoring the previous setting afterwards. See
+    :py:func:`set_validation_enabled`.
+
+    .. code-block:: python
+
+        with validation_disabled():
+            blueprint = Blueprint(trusted_string)
+    """
+    previous = is_validation_enabled()
+    set_validation_enabled(False)
+    try:
+        yield
+    finally:
+        set_validation_enabled(previous)
+
+
+class _Invalid(Exception):
+    """
+    Raised by compiled validators when the data doesn't match; never escapes
+    :py:meth:`CompiledSchema.validate`.
+    """
+
+    pass
+
+
+def _compile_type(type_):
+    if type_ is int:
+
+        def validate_int(data):
+            if isinstance(data, int) and not isinstance(data, bool):
+                return data
+            raise _Invalid
+
+        return validate_int
+
+    def validate_type(data):
+        if isinstance(data, type_):
+            return data
+        raise _Invalid
+
+    return validate_type
+
+
+def _compile_literal(value):
+    def validate_literal(data):
+        if value == data:
+            return data
+        raise _Invalid
+
+    return validate_literal
+
+
+def _compile_callable(function):
+    def validate_callable(data):
+        if function(data):
+            return data
+        raise _Invalid
+
+    return validate_callable
+
+
+def _compile_iterable(schema, memo):
+    container_type = type(schema)
+    validate_element = _compile_or(schema, memo)
+
+    def validate_iterable(data):
+        if not isinstance(data, container_type):
+            raise _Invalid
+        return type(data)(validate_element(element) for element in data)
+
+    return validate_iterable
+
+
+def _compile_dict(schema, memo):
+    # Only dicts with literal keys are compiled; `Schema` matches each key
+    # with `==`, which a dict lookup reproduces exactly
+    validators = {}
+    required = set()
+    for key, value in schema.items():
+        if isinstance(key, Hook):
+            raise NotImplementedError
+        elif isinstance(key, Optional):
+            key = key._schema
+        else:
+            required.add(key)
+        if not isinstance(key, six.string_types):
+            raise NotImplementedError
+        validators[key] = _compile(value, memo)
+
+    def validate_dict(data):
+        if not isinstance(data, dict):
+            raise _Invalid
+        new = type(data)()
+        # `Schema` validates (and therefore orders) dict values last
+        nested = []
+        for key, value in data.items():
+            if isinstance(value, dict):
+                nested.append((key, value))
+            else:
+                new[key] = validators[key](value)
+        for key, value in nested:
+            new[key] = validators[key](value)
+        if not required.issubset(new):
+            raise _Invalid
+        return new
+
+    return validate_dict
+
+
+def _compile_and(schemas, memo):
+    validators = [_compile(schema, memo) for schema in schemas]
+    if len(validators) == 1:
+        return validators[0]
+
+    def validate_and(data):
+        for validator in validators:
+            data = validator(data)
+        return data
+
+    return validate_and
+
+
+def _compile_or(schemas, memo):
+    if all(
+        type(schema) in (type(None), bool, int, float) + six.string_types
+        for schema in schemas
+    ):
+        # Comparing against every option is equivalent to a set lookup
+        options = frozenset(schemas)
+
+        def validate_choice(data):
+            if data in options:
+                return data
+            raise _Invalid
+
+        return validate_choice
+
+    validators = [_compile(schema, memo) for schema in schemas]
+    if len(validators) == 1:
+        return validators[0]
+
+    def validate_or(data):
+        for validator in validators:
+            try:
+                return validator(data)
+            except Exception:
+                pass
+        raise _Invalid
+
+    return validate_or
+
+
+def _compile(schema, memo):
+    # type: (object, dict) -> callable
+    """
+    Converts ``schema`` into a function that returns the same value as
+    ``Schema(schema).validate()``, or raises an exception if it would fail.
+    Anything that can't be compiled is validated with ``Schema`` itself.
+    """
+    if isinstance(schema, CompiledSchema):
+        return schema._validator
+    key = id(schema)
+    if key in memo:
+        return memo[key][1]
+    try:
+        if type(schema) in (list, tuple, set, frozenset):
+            validator = _compile_iterable(schema, memo)
+        elif isinstance(schema, dict):
+            validator = _compile_dict(schema, memo)
+        elif issubclass(type(schema), type):
+            validator = _compile_type(schema)
+        elif type(schema) is Schema:
+            validator = _compile(schema._schema, memo)
+        elif type(schema) is And:
+            validator = _compile_and(schema._args, memo)
+        elif type(schema) is Or and not schema.only_one:
+            validator = _compile_or(schema._args, memo)
+        elif type(schema) is Use:
+            validator = schema._callable
+        elif hasattr(schema, "validate"):
+            raise NotImplementedError
+        elif callable(schema):
+            validator = _compile_callable(schema)
+        else:
+            validator = _compile_literal(schema)
+    except NotImplementedError:
+        validator = Schema(schema).validate
+    # Keep `schema` alive so its id isn't reused during compilation
+    memo[key] = (schema, validator)
+    return validator
+
+
+class CompiledSchema(object):
+    """
+    A data format compiled from a ``Schema``. Validating data with it returns
+    exactly the same normalized result as ``schema.validate()``, but checks
+    the data with a set of specialized functions built once, instead of
+    interpreting the ``Schema`` every call. If the data is invalid, it's
+    validated again with the original ``Schema`` to raise the same
+    ``SchemaError`` that it would.
+
+    :param schema: The ``Schema`` to compile.
+    :param memo: A ``dict`` used to share compiled functions between schemas
+        compiled at the same time.
+    """
+
+    def __init__(self, schema, memo=None):
+        # type: (Schema, dict) -> None
+        self.schema = schema
+        self._validator = _compile(schema, {} if memo is None else memo)
+
+    def validate(self, data, **kwargs):
+        # type: (object, **dict) -> object
+        """
+        Validates and normalizes ``data``. Returns ``data`` unchanged if
+        validation is disabled with :py:func:`set_validation_enabled`.
+
+        :exception SchemaError: If ``data`` does not match the format.
+        """
+        if not getattr(_validation_state, "enabled", True):
+            return data
+        try:
+            return self._validator(data)
+        except Exception:
+            # Produce the exact error `Schema` would have
+            return self.schema.validate(data, **kwargs)
+
+    def is_valid(self, data):
+        # type: (object) -> bool
+        """
+        Returns whether or not ``data`` matches the format.
+        """
+        try:
+            self._validator(data)
+            return True
+        except Exception:
+            return False
+
+    def __repr__(self):
+        # type: () -> str
+        return "CompiledSchema({!r})".format(self.schema)
+
+
+# =============================================================================
+# Formats
+# =============================================================================
+
+
 # TODO: separate CONTROL_BEHAVIOR into their individual signatures for each entity
 
 
@@ -718,3 +1013,12 @@ SCHEDULES = Schema([SCHEDULE])
 #         ),
 #     )
 # )
+
+
+# Compile every format defined above, sharing the functions of formats that
+# are nested inside others
+_memo = {}
+for _name, _value in list(globals().items()):
+    if isinstance(_value, Schema):
+        globals()[_name] = CompiledSchema(_value, _memo)
+del _memo, _name, _value
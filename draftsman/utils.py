@@ -14,15 +14,44 @@ from draftsman.error import MalformedBlueprintStringError
 
 from abc import ABCMeta, abstractmethod
 import base64
+import codecs
+from contextlib import contextmanager
 import json
 import math
 from functools import wraps
+import re
 import six
 import sys
-from typing import Any, Union
+import threading
+import timeit
+from typing import Any, Iterable, Iterator, Optional, Sequence, Union
 import warnings
 import zlib
 
+try:
+    import orjson
+except ImportError:  # pragma: no coverage
+    orjson = None
+
+_NON_BASE64_CHARS = re.compile(r"[^A-Za-z0-9+/=]")
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Characters that could continue a number, such as "1." or "1e"
+_JSON_NUMBER_TAIL = re.compile(r"[0-9.eE+\-]*")
+# Objects and arrays which `stream_string_to_JSON()` reads one entry at a time
+_STREAMED_OBJECTS = {
+    "blueprint",
+    "blueprint_book",
+    "deconstruction_planner",
+    "upgrade_planner",
+}
+_STREAMED_ARRAYS = {"entities", "tiles", "schedules", "blueprints"}
+# Anything in `orjson` output that the standard library might write differently:
+# exponents ("1e-7" vs "1e-07"), small floats ("0.00001" vs "1e-05"), NaN and
+# infinities (written as "null"), and characters outside of printable ASCII
+_ORJSON_MISMATCH = re.compile(br"[0-9][eE]|0\.0000|null|[\x7f-\xff]")
+# Reused so `json.dumps()` doesn't construct a new encoder on every call
+_COMPACT_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
 # =============================================================================
 # Abstract Shape Classes
 # =============================================================================
@@ -35,6 +64,8 @@ class Shape:
     single attribute, a PrimitiveVector :py:attr:`position`.
     """
 
+    __slots__ = ("position",)
+
     def __init__(self, position):
         # type: (Vector) -> None
         self.position = [position[0], position[1]]
@@ -61,6 +92,13 @@ class AABB(Shape):
     convenience functions.
     """
 
+    __slots__ = ("top_left", "bot_right")
+
+    normals = ((0, -1), (1, 0), (0, 1), (-1, 0))
+    """
+    The face normals of every AABB, shared between all instances. Read only.
+    """
+
     def __init__(self, x1, y1, x2, y2, position=[0, 0]):
         # type: (float, float, float, float, Vector) -> None
         """
@@ -93,11 +131,6 @@ class AABB(Shape):
         # self.bot_right = Vector(x2, y2)
         self.bot_right = [x2, y2]
 
-        # self.points = [Vector(x1, y1), Vector(x2, y1), Vector(x2, y2), Vector(x1, y2)]
-        self.points = [[x1, y1], [x2, y1], [x2, y2], [x1, y2]]
-        # self.normals = [Vector(0, -1), Vector(1, 0), Vector(0, 1), Vector(-1, 0)]
-        self.normals = [[0, -1], [1, 0], [0, 1], [-1, 0]]
-
     @staticmethod
     def from_other(aabb):
         # type: (Union[list[float], tuple[float]]) -> AABB
@@ -115,6 +148,20 @@ class AABB(Shape):
         except IndexError:
             raise TypeError("Could not resolve '{}' to an AABB".format(aabb))
 
+    @property
+    def points(self):
+        # type: () -> list[PrimitiveVector]
+        """
+        The 4 corners of the AABB in local coordinates, in clockwise order
+        starting from the top left. Calculated from :py:attr:`top_left` and
+        :py:attr:`bot_right` when queried. Read only.
+
+        :type: ``list[PrimitiveVector]``
+        """
+        x1, y1 = self.top_left
+        x2, y2 = self.bot_right
+        return [[x1, y1], [x2, y1], [x2, y2], [x1, y2]]
+
     @property
     def world_top_left(self):
         # type: () -> PrimitiveVector
@@ -230,6 +277,22 @@ class AABB(Shape):
 
         return AABB(top_left[0], top_left[1], bot_right[0], bot_right[1], self.position)
 
+    def __copy__(self):
+        # type: () -> AABB
+        return AABB(
+            self.top_left[0],
+            self.top_left[1],
+            self.bot_right[0],
+            self.bot_right[1],
+            self.position,
+        )
+
+    def __deepcopy__(self, memo):
+        # type: (dict) -> AABB
+        # All of the coordinates are numbers, and the constructor copies them
+        # into new lists
+        return self.__copy__()
+
     def __eq__(self, other):
         # type: (AABB) -> bool
         return (
@@ -251,6 +314,9 @@ class AABB(Shape):
 
 PrimitiveAABB = "list[list[float, float], list[float, float]]"
 
+# The face normals of rotated Rectangles, keyed by angle
+_rectangle_normals = {}
+
 
 class Rectangle(Shape):
     """
@@ -259,6 +325,8 @@ class Rectangle(Shape):
     ``position`` (it's center).
     """
 
+    __slots__ = ("width", "height", "angle")
+
     def __init__(self, position, width, height, angle):
         # type: (Vector, float, float, float) -> None
         """
@@ -275,18 +343,45 @@ class Rectangle(Shape):
         self.height = height
         self.angle = angle
 
-        hw = width / 2
-        hh = height / 2
-        self.points = [[-hw, -hh], [hw, -hh], [hw, hh], [-hw, hh]]
+    @property
+    def points(self):
+        # type: () -> list[PrimitiveVector]
+        """
+        The 4 corners of the Rectangle around it's center, before it's rotated
+        by :py:attr:`angle`. Read only.
+
+        :type: ``list[PrimitiveVector]``
+        """
+        hw = self.width / 2
+        hh = self.height / 2
+        return [[-hw, -hh], [hw, -hh], [hw, hh], [-hw, hh]]
 
-        # Calculate normals
-        self.normals = [0] * 4
-        rel_points = self.get_points()
-        for i in range(len(self.points)):
-            p1 = rel_points[i]
-            p2 = rel_points[i + 1] if i < len(rel_points) - 1 else rel_points[0]
-            edge = [p2[0] - p1[0], p2[1] - p1[1]]
-            self.normals[i] = normalize(perpendicular(edge))
+    @property
+    def normals(self):
+        # type: () -> tuple[PrimitiveVector]
+        """
+        The face normals of the Rectangle. These only depend on
+        :py:attr:`angle`, so they are shared between every Rectangle with the
+        same angle. Read only.
+
+        :type: ``tuple[PrimitiveVector]``
+        """
+        try:
+            return _rectangle_normals[self.angle]
+        except KeyError:
+            points = [
+                rotate_vector(point, math.radians(self.angle))
+                for point in ((-1, -1), (1, -1), (1, 1), (-1, 1))
+            ]
+            normals = []
+            for i in range(len(points)):
+                p1 = points[i]
+                p2 = points[(i + 1) % len(points)]
+                edge = [p2[0] - p1[0], p2[1] - p1[1]]
+                normals.append(tuple(normalize(perpendicular(edge))))
+            normals = tuple(normals)
+            _rectangle_normals[self.angle] = normals
+            return normals
 
     def overlaps(self, other):
         # type: (Shape) -> bool
@@ -356,6 +451,14 @@ class Rectangle(Shape):
             self.angle + amt * 45,
         )
 
+    def __copy__(self):
+        # type: () -> Rectangle
+        return Rectangle(self.position, self.width, self.height, self.angle)
+
+    def __deepcopy__(self, memo):
+        # type: (dict) -> Rectangle
+        return self.__copy__()
+
     def __eq__(self, other):
         # type: (Rectangle) -> bool
         return (
@@ -398,14 +501,353 @@ def string_to_JSON(string):
         raise MalformedBlueprintStringError
 
 
-def JSON_to_string(JSON):
-    # type: (dict) -> str
+def decode_string_chunks(string, chunk_size=65536):
+    # type: (str, int) -> Iterator[str]
+    """
+    Decodes a Factorio Blueprint string into JSON text piece by piece. The
+    string is base64-decoded ``chunk_size`` characters at a time and fed into a
+    streaming zlib decompressor, so the entire decompressed text never has to
+    exist in memory at once. Joining every yielded chunk results in the same
+    JSON text that :py:func:`string_to_JSON` parses.
+
+    :param string: The input Factorio blueprint string.
+    :param chunk_size: The number of characters of ``string`` to decode at a
+        time.
+
+    :returns: A generator yielding consecutive pieces of the JSON text.
+
+    :exception MalformedBlueprintStringError: If the input string is not
+        decodable.
+    """
+    decompressor = zlib.decompressobj()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    # Make sure we always decode whole groups of 4 base64 characters
+    chunk_size = max(4, chunk_size - chunk_size % 4)
+    leftover = ""
+    try:
+        for i in range(1, len(string), chunk_size):
+            chunk = leftover + string[i : i + chunk_size]
+            # Ignore any non-base64 characters, same as `base64.b64decode()`
+            if _NON_BASE64_CHARS.search(chunk):
+                chunk = _NON_BASE64_CHARS.sub("", chunk)
+            cutoff = len(chunk) - len(chunk) % 4
+            chunk, leftover = chunk[:cutoff], chunk[cutoff:]
+            text = text_decoder.decode(decompressor.decompress(base64.b64decode(chunk)))
+            if text:
+                yield text
+        if leftover:
+            raise ValueError("Incorrect padding")
+        text = text_decoder.decode(decompressor.flush(), final=True)
+        if not decompressor.eof:
+            raise ValueError("Incomplete compressed data")
+    except (ValueError, TypeError, zlib.error):
+        six.raise_from(MalformedBlueprintStringError, None)
+    if text:
+        yield text
+
+
+class _JSONStreamReader(object):
+    """
+    Reads values from a JSON document that arrives as a sequence of text
+    chunks, only keeping the unread portion in memory. Individual values are
+    parsed with :py:meth:`json.JSONDecoder.raw_decode`, so each value must fit
+    in memory, but the document as a whole does not.
+    """
+
+    def __init__(self, chunks):
+        # type: (Iterable[str]) -> None
+        self.chunks = iter(chunks)
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def read_more(self):
+        # type: () -> bool
+        """
+        Appends the next chunk to the buffer, discarding everything already
+        read. Returns ``False`` if there are no more chunks.
+        """
+        try:
+            chunk = next(self.chunks)
+        except StopIteration:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        # type: () -> str
+        """
+        Skips whitespace and returns the next character without consuming it.
+        """
+        # Fast path for compact JSON, which has no whitespace to skip
+        if self.pos < len(self.buffer) and self.buffer[self.pos] not in " \t\n\r":
+            return self.buffer[self.pos]
+        while True:
+            self.pos = _JSON_WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.read_more():
+                raise MalformedBlueprintStringError("Unexpected end of JSON")
+
+    def expect(self, char):
+        # type: (str) -> None
+        """
+        Consumes the next character, which must be ``char``.
+        """
+        if self.peek() != char:
+            raise MalformedBlueprintStringError(
+                "Expected '{}' at position {}".format(char, self.pos)
+            )
+        self.pos += 1
+
+    def value(self):
+        # type: () -> Any
+        """
+        Reads and returns the next complete JSON value.
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # Numbers and literals at the end of the buffer might continue
+                # in the next chunk, even if part of what was read so far
+                # couldn't be decoded (like the "." in "1.")
+                if (
+                    self.eof
+                    or self.buffer[end - 1] in '"]}'
+                    or _JSON_NUMBER_TAIL.match(self.buffer, end).end()
+                    < len(self.buffer)
+                ):
+                    self.pos = end
+                    return value
+            except ValueError:
+                if self.eof:
+                    six.raise_from(MalformedBlueprintStringError, None)
+            # Read at least as much again as we have, so large values are not
+            # re-parsed too many times
+            target = 2 * (len(self.buffer) - self.pos)
+            while len(self.buffer) - self.pos < target and self.read_more():
+                pass
+
+    def separator(self, closing):
+        # type: (str) -> bool
+        """
+        Consumes either a comma or the ``closing`` character. Returns ``True``
+        if there are more entries in the current object or array.
+        """
+        char = self.peek()
+        self.pos += 1
+        if char == ",":
+            return True
+        elif char == closing:
+            return False
+        raise MalformedBlueprintStringError(
+            "Expected ',' or '{}' at position {}".format(closing, self.pos - 1)
+        )
+
+
+def iter_JSON_array(chunks, path):
+    # type: (Iterable[str], Sequence[str]) -> Iterator[Any]
+    """
+    Yields every element of a JSON array one at a time from a JSON document
+    split into ``chunks``, such as the output of :py:func:`decode_string_chunks`.
+    The array is located by ``path``, a sequence of object keys leading to it
+    from the root of the document. Only one element (plus any value that has
+    to be skipped over) is held in memory at a time.
+
+    If any key in ``path`` does not exist, nothing is yielded.
+
+    :param chunks: An iterable of strings that make up a JSON document.
+    :param path: The keys leading to the array, such as
+        ``("blueprint", "entities")``.
+
+    :returns: A generator yielding each element of the array.
+
+    :exception MalformedBlueprintStringError: If the JSON document is malformed.
+    """
+    reader = _JSONStreamReader(chunks)
+    # Navigate down to the array
+    for key in path:
+        reader.expect("{")
+        if reader.peek() == "}":
+            return
+        while True:
+            current_key = reader.value()
+            reader.expect(":")
+            if current_key == key:
+                break
+            reader.value()  # Skip
+            if not reader.separator("}"):
+                return
+
+    # Yield each element in the array
+    reader.expect("[")
+    if reader.peek() == "]":
+        return
+    while True:
+        yield reader.value()
+        if not reader.separator("]"):
+            return
+
+
+def _read_streamed_value(reader, key):
+    # type: (_JSONStreamReader, Optional[str]) -> Any
+    """
+    Reads the next value from ``reader``, descending into the blueprintable
+    objects and large arrays found under ``key`` instead of parsing them whole.
+    """
+    char = reader.peek()
+    if char == "{" and (key is None or key in _STREAMED_OBJECTS):
+        reader.pos += 1
+        result = {}
+        if reader.peek() == "}":
+            reader.pos += 1
+            return result
+        while True:
+            member = reader.value()
+            reader.expect(":")
+            result[member] = _read_streamed_value(reader, member)
+            if not reader.separator("}"):
+                return result
+    elif char == "[" and key in _STREAMED_ARRAYS:
+        reader.pos += 1
+        result = []
+        if reader.peek() == "]":
+            reader.pos += 1
+            return result
+        while True:
+            if key == "blueprints":
+                # Blueprint book entries are blueprintables themselves
+                result.append(_read_streamed_value(reader, None))
+            else:
+                result.append(reader.value())
+            if not reader.separator("]"):
+                return result
+    else:
+        return reader.value()
+
+
+def stream_string_to_JSON(string):
+    # type: (str) -> dict
+    """
+    Decodes a Factorio Blueprint string to a readable JSON Dict, like
+    :py:func:`string_to_JSON`, but without ever holding the entire decompressed
+    JSON text in memory. The text is produced by :py:func:`decode_string_chunks`,
+    and the contents of blueprintables and their entity, tile, schedule and
+    blueprint book arrays are parsed one entry at a time; only the returned
+    ``dict`` itself has to fit in memory.
+
+    :param string: The input Factorio blueprint string.
+
+    :returns: A JSON ``dict`` with the blueprint's components as keys.
+
+    :exception MalformedBlueprintStringError: If the input string is not
+        decodable to a JSON object.
+    """
+    reader = _JSONStreamReader(decode_string_chunks(string))
+    result = _read_streamed_value(reader, None)
+    # Make sure nothing but whitespace follows the document
+    try:
+        reader.peek()
+    except MalformedBlueprintStringError:
+        return result
+    raise MalformedBlueprintStringError("Extra data at position {}".format(reader.pos))
+
+
+class StringEncoder(object):
+    """
+    Encodes JSON dicts to Factorio-readable blueprint strings with a particular
+    set of options. Intended to be created once and reused when encoding many
+    blueprints with the same settings.
+
+    With the default options, the output is identical to the output of
+    :py:func:`JSON_to_string`.
+
+    :param compression_level: The zlib compression level to use, from ``0``
+        (no compression) to ``9`` (best compression). Lower levels are much
+        faster but result in longer strings; Factorio can import all of them.
+    :param fast_json: Whether or not to serialize with `orjson
+        <https://github.com/ijl/orjson>`_ instead of the standard library
+        ``json`` module. Only takes effect if ``orjson`` is installed;
+        otherwise the standard library is used regardless. The output is
+        byte-identical either way; any ``orjson`` output which could differ
+        from ``json`` (non-ASCII characters, floats written with exponents or
+        many leading zeros, ``NaN``, and ``Infinity``) is discarded and
+        serialized again with the standard library.
+
+    :exception ValueError: If ``compression_level`` is not in the range
+        ``[0, 9]``.
+    """
+
+    def __init__(self, compression_level=9, fast_json=False):
+        # type: (int, bool) -> None
+        if not 0 <= compression_level <= 9:
+            raise ValueError(
+                "'compression_level' must be in the range [0, 9], not {}".format(
+                    compression_level
+                )
+            )
+        self.compression_level = compression_level
+        self.fast_json = fast_json
+
+    @property
+    def json_backend(self):
+        # type: () -> str
+        """
+        The name of the module used to serialize JSON, either ``"orjson"`` or
+        ``"json"``. Read only.
+
+        :type: ``str``
+        """
+        return "orjson" if self.fast_json and orjson is not None else "json"
+
+    def dumps(self, JSON):
+        # type: (dict) -> bytes
+        """
+        Serializes a JSON ``dict`` to compact, UTF-8 encoded JSON text.
+
+        :param JSON: The input JSON ``dict`` object.
+
+        :returns: The serialized ``bytes``.
+        """
+        if self.fast_json and orjson is not None:
+            try:
+                result = orjson.dumps(JSON, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                # Anything orjson can't handle (such as integers larger than 64
+                # bits) still gets handled by the standard library
+                pass
+            else:
+                if not _ORJSON_MISMATCH.search(result):
+                    return result
+        return _COMPACT_JSON_ENCODER.encode(JSON).encode("utf-8")
+
+    def encode(self, JSON):
+        # type: (dict) -> str
+        """
+        Encodes a JSON ``dict`` to a Factorio-readable blueprint string.
+
+        :param JSON: The input JSON ``dict`` object.
+
+        :returns: A ``str`` which can be imported into Factorio.
+        """
+        compressed = zlib.compress(self.dumps(JSON), self.compression_level)
+        return "0" + base64.b64encode(compressed).decode("utf-8")
+
+
+def JSON_to_string(JSON, compression_level=9, fast_json=False):
+    # type: (dict, int, bool) -> str
     """
     Encodes a JSON dict to a Factorio-readable blueprint string.
 
     Follows the data format specification `here <https://wiki.factorio.com/Blueprint_string_format>`_.
 
-    For the inverse operation, see :py:func:`string_to_JSON`.
+    For the inverse operation, see :py:func:`string_to_JSON`. To encode many
+    blueprints with the same options, consider using a :py:class:`StringEncoder`
+    directly.
 
     .. NOTE::
 
@@ -415,12 +857,59 @@ def JSON_to_string(JSON):
         consider using :py:class:`.Blueprint` instead.
 
     :param JSON: The input JSON ``dict`` object.
+    :param compression_level: The zlib compression level to use, from ``0``
+        to ``9``. See :py:class:`StringEncoder`.
+    :param fast_json: Whether or not to serialize with ``orjson`` if it's
+        installed. See :py:class:`StringEncoder`.
 
     :returns: A ``str`` which can be imported into Factorio.
+
+    :exception ValueError: If ``compression_level`` is not in the range
+        ``[0, 9]``.
+    """
+    return StringEncoder(compression_level, fast_json).encode(JSON)
+
+
+def compression_report(JSON, levels=range(10), fast_json=False, repeat=3):
+    # type: (dict, Iterable[int], bool, int) -> list[dict]
+    """
+    Measures the length of the resulting blueprint string and the time taken
+    to encode ``JSON`` at each compression level in ``levels``. Useful for
+    picking a compression level for a particular kind of blueprint.
+
+    :param JSON: The input JSON ``dict`` object, such as the output of
+        :py:meth:`.Blueprint.to_dict`.
+    :param levels: The compression levels to measure.
+    :param fast_json: Whether or not to serialize with ``orjson`` if it's
+        installed. See :py:class:`StringEncoder`.
+    :param repeat: How many times to encode at each level. The fastest time is
+        reported.
+
+    :returns: A ``list`` of ``dict`` objects, one for each level, with the
+        keys ``"compression_level"``, ``"length"`` (in characters), and
+        ``"time"`` (in seconds).
+
+    :example:
+
+    .. code-block:: python
+
+        for row in compression_report(blueprint.to_dict(), levels=[1, 6, 9]):
+            print("{compression_level}: {length} chars in {time:.4f}s".format(**row))
     """
-    return "0" + base64.b64encode(
-        zlib.compress(json.dumps(JSON, separators=(",", ":")).encode("utf-8"), 9)
-    ).decode("utf-8")
+    report = []
+    for level in levels:
+        encoder = StringEncoder(level, fast_json)
+        best_time = None
+        for _ in range(max(1, repeat)):
+            start = timeit.default_timer()
+            string = encoder.encode(JSON)
+            elapsed = timeit.default_timer() - start
+            if best_time is None or elapsed < best_time:
+                best_time = elapsed
+        report.append(
+            {"compression_level": level, "length": len(string), "time": best_time}
+        )
+    return report
 
 
 def encode_version(major, minor, patch=0, dev_ver=0):
@@ -841,24 +1330,132 @@ def flatten_entities(entities):
 #     return wrapper_ignore_exctb
 
 
+# The warnings collected by the outermost function decorated with
+# `reissue_warnings()`, separately for each thread
+_warning_state = threading.local()
+
+
+def _raises_warning(message, category):
+    # type: (str, type) -> bool
+    """
+    Returns whether or not the current warning filters would turn a warning
+    into an exception. Filters restricted to a module or line number are
+    skipped, since where a collected warning is attributed to isn't known
+    until it's reissued.
+    """
+    if isinstance(message, Warning):
+        category = type(message)
+    elif category is None:
+        category = UserWarning
+    text = six.text_type(message)
+    for action, regex, filter_category, module, lineno in warnings.filters:
+        if module is not None or lineno:
+            continue
+        if (regex is None or regex.match(text)) and issubclass(
+            category, filter_category
+        ):
+            return action == "error"
+    return warnings.defaultaction == "error"
+
+
+def warn(message, category=None, stacklevel=1):
+    # type: (str, type, int) -> None
+    """
+    Issues a warning. Equivalent to ``warnings.warn()``, except that if it's
+    called from within a function decorated with :py:func:`reissue_warnings`,
+    the warning is collected and issued when the outermost decorated function
+    returns instead. Draftsman issues all of its warnings with this function.
+
+    Warnings that the current filters turn into errors are never collected by
+    :py:func:`reissue_warnings`, so the exception is raised before the caller
+    has a chance to modify anything.
+
+    :param message: The warning message, or a ``Warning`` instance.
+    :param category: The ``Warning`` subclass to issue. Defaults to
+        ``UserWarning``.
+    :param stacklevel: The stack level to attribute the warning to, in the
+        same manner as ``warnings.warn()``.
+    """
+    collected = getattr(_warning_state, "collected", None)
+    if collected is None or (
+        getattr(_warning_state, "reissuing", False)
+        and _raises_warning(message, category)
+    ):
+        warnings.warn(message, category, stacklevel=stacklevel + 1)
+    else:
+        collected.append((message, category))
+
+
+@contextmanager
+def collect_warnings():
+    """
+    Context manager that collects every warning issued with :py:func:`warn`
+    within the ``with`` block, in the current thread only, instead of issuing
+    them. Yields a list which is populated with a ``(message, category)``
+    tuple for each warning.
+    """
+    previous = getattr(_warning_state, "collected", None)
+    previous_reissuing = getattr(_warning_state, "reissuing", False)
+    _warning_state.collected = collected = []
+    _warning_state.reissuing = False
+    try:
+        yield collected
+    finally:
+        _warning_state.collected = previous
+        _warning_state.reissuing = previous_reissuing
+
+
+@contextmanager
+def discard_warnings():
+    """
+    Context manager that discards every warning issued with :py:func:`warn`
+    within the ``with`` block, in the current thread only.
+    """
+    with collect_warnings():
+        yield
+
+
 def reissue_warnings(func):
     # type: (Any) -> Any
     """
-    Function decorator that catches all warnings issued from a function and
-    re-issues them to the calling function.
+    Function decorator that catches all warnings issued from a function with
+    :py:func:`warn` and re-issues them to the calling function.
+
+    Warnings are collected in a per-thread list instead of with
+    ``warnings.catch_warnings()``, so decorated functions can safely be called
+    from multiple threads at once. When decorated functions call each other,
+    only the outermost one issues the collected warnings, so nested calls cost
+    almost nothing. If a decorated function raises an exception, the warnings
+    it issued are discarded. Warnings that the current filters turn into
+    errors are raised immediately instead of being collected.
 
     :param func: The function who's errors are caught and re-issued.
 
     :returns: The result of the function.
     """
-    # @ignore_traceback
+
     @wraps(func)
     def inner(*args, **kwargs):
-        with warnings.catch_warnings(record=True) as warning_list:
+        collected = getattr(_warning_state, "collected", None)
+        if collected is not None:
+            # An outer decorated function will issue the warnings
+            start = len(collected)
+            try:
+                return func(*args, **kwargs)
+            except BaseException:
+                del collected[start:]
+                raise
+
+        _warning_state.collected = collected = []
+        _warning_state.reissuing = True
+        try:
             result = func(*args, **kwargs)
+        finally:
+            _warning_state.collected = None
+            _warning_state.reissuing = False
 
-        for warning in warning_list:
-            warnings.warn(warning.message, warning.category, stacklevel=2)
+        for message, category in collected:
+            warnings.warn(message, category, stacklevel=2)
 
         return result
 
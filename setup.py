@@ -70,7 +70,8 @@ setup(
     ],
     entry_points = {
         'console_scripts': [
-                'draftsman-update = draftsman.env:main'
+                'draftsman-update = draftsman.env:main',
+                'draftsman = draftsman.cli:main'
         ]
     },
     classifiers=[
@@ -0,0 +1,57 @@
+# find_entities_batch.py
+
+from draftsman.blueprintable import Blueprint
+
+import random
+import timeit
+
+
+def main():
+    # A 100 x 100 grid of machines, with a beacon in every fourth spot
+    blueprint = Blueprint()
+    entities = []
+    for x in range(100):
+        for y in range(100):
+            name = "beacon" if (x + y) % 4 == 0 else "assembling-machine-1"
+            entities.append(
+                {"name": name, "position": {"x": x * 3 + 1.5, "y": y * 3 + 1.5}}
+            )
+    blueprint.entities = entities
+
+    rng = random.Random(0)
+    areas = []
+    for _ in range(5000):
+        x, y = rng.uniform(0, 290), rng.uniform(0, 290)
+        areas.append([x, y, x + 9, y + 9])
+
+    start = timeit.default_timer()
+    single = [
+        blueprint.find_entities_filtered(area=area, name="beacon") for area in areas
+    ]
+    print(
+        "find_entities_filtered():       {:.3f}s".format(timeit.default_timer() - start)
+    )
+
+    start = timeit.default_timer()
+    batch = blueprint.find_entities_filtered_batch(
+        areas=areas, filter=lambda entity: entity.name == "beacon"
+    )
+    print(
+        "find_entities_filtered_batch(): {:.3f}s (predicate)".format(
+            timeit.default_timer() - start
+        )
+    )
+    assert batch == single
+
+    start = timeit.default_timer()
+    batch = blueprint.find_entities_filtered_batch(areas=areas, name="beacon")
+    print(
+        "find_entities_filtered_batch(): {:.3f}s (name)".format(
+            timeit.default_timer() - start
+        )
+    )
+    assert batch == single
+
+
+if __name__ == "__main__":
+    main()
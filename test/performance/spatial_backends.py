@@ -0,0 +1,113 @@
+# spatial_backends.py
+
+from draftsman.classes.spatial_backends import (
+    SPATIAL_BACKENDS,
+    choose_spatial_data_structure,
+)
+from draftsman.entity import Container, SolarPanel, StraightRail
+from draftsman.tile import Tile
+from draftsman import utils
+
+import random
+import timeit
+
+
+def dense_tiles():
+    return [Tile("refined-concrete", (x, y)) for x in range(200) for y in range(200)]
+
+
+def sparse_rails():
+    # Long straight rail lines a long way apart from each other
+    rails = []
+    for line in range(10):
+        for i in range(1000):
+            rails.append(StraightRail(tile_position=(i * 2, line * 500)))
+            rails.append(
+                StraightRail(tile_position=(line * 500 + 250, i * 2), direction=2)
+            )
+    return rails
+
+
+def mixed_layout():
+    # Blocks of solar panels with scattered chests between them
+    rng = random.Random(0)
+    entities = []
+    for bx in range(10):
+        for by in range(10):
+            for x in range(0, 30, 3):
+                for y in range(0, 30, 3):
+                    position = (bx * 60 + x, by * 60 + y)
+                    entities.append(SolarPanel(tile_position=position))
+    for _ in range(2000):
+        position = (rng.randint(0, 600) * 2 + 1, rng.randint(0, 600) * 2 + 1)
+        entities.append(Container(tile_position=position))
+    return entities
+
+
+def measure(structure_type, items, areas):
+    result = {}
+
+    structure = structure_type()
+    start = timeit.default_timer()
+    for item in items:
+        structure.add(item)
+    result["add"] = timeit.default_timer() - start
+
+    structure = structure_type()
+    start = timeit.default_timer()
+    structure.rebuild(items)
+    # SpatialHashMap only adds the items when it's next queried
+    structure.get_on_point((0, 0))
+    result["rebuild"] = timeit.default_timer() - start
+
+    start = timeit.default_timer()
+    for area in areas:
+        structure.get_in_area(area)
+    result["get_in_area"] = timeit.default_timer() - start
+
+    start = timeit.default_timer()
+    for area in areas:
+        structure.get_on_point(area.world_top_left)
+    result["get_on_point"] = timeit.default_timer() - start
+
+    start = timeit.default_timer()
+    for item in items[::10]:
+        structure.remove(item)
+    result["remove"] = timeit.default_timer() - start
+
+    return result
+
+
+def main():
+    workloads = {
+        "dense tiles": dense_tiles(),
+        "sparse rails": sparse_rails(),
+        "mixed layout": mixed_layout(),
+    }
+    rng = random.Random(1)
+    for name, items in workloads.items():
+        extents = utils.AABB(0, 0, 0, 0)
+        for item in items:
+            extents = utils.extend_aabb(extents, item.get_world_bounding_box())
+        x1, y1 = extents.world_top_left
+        x2, y2 = extents.world_bot_right
+        areas = []
+        for _ in range(10000):
+            x, y = rng.uniform(x1, x2), rng.uniform(y1, y2)
+            areas.append(utils.AABB(x, y, x + 10, y + 10))
+
+        backends = dict(SPATIAL_BACKENDS)
+        backends["auto"] = lambda: choose_spatial_data_structure(items)
+        print("{} ({} items):".format(name, len(items)))
+        for backend, structure_type in backends.items():
+            result = measure(structure_type, items, areas)
+            print(
+                "    {:8}".format(backend)
+                + "".join(
+                    "  {} {:.3f}s".format(key, value) for key, value in result.items()
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
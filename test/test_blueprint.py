@@ -4,10 +4,15 @@
 from __future__ import absolute_import, unicode_literals
 
 from draftsman._factorio_version import __factorio_version__, __factorio_version_info__
-from draftsman.blueprintable import Blueprint, get_blueprintable_from_string
+from draftsman.blueprintable import (
+    Blueprint,
+    BlueprintBook,
+    get_blueprintable_from_string,
+)
 from draftsman.classes.association import Association
 from draftsman.classes.blueprint import TileList
 from draftsman.classes.collisionset import CollisionSet
+from draftsman.classes.entityfilter import EntityFilter
 from draftsman.classes.entitylike import EntityLike
 from draftsman.classes.entitylist import EntityList
 from draftsman.classes.group import Group
@@ -31,11 +36,15 @@ from draftsman.error import (
 from draftsman.utils import encode_version, AABB
 from draftsman.warning import (
     DraftsmanWarning,
+    OverlappingObjectsWarning,
     RailAlignmentWarning,
     TooManyConnectionsWarning,
 )
 
+import copy
+import pickle
 import sys
+import warnings
 
 if sys.version_info >= (3, 3):  # pragma: no coverage
     import unittest
@@ -177,6 +186,179 @@ class BlueprintTesting(unittest.TestCase):
 
     # =========================================================================
 
+    def test_lazy_loading(self):
+        example = {
+            "label": "lazy",
+            "entities": [
+                {
+                    "entity_number": 1,
+                    "name": "small-electric-pole",
+                    "position": {"x": 0.5, "y": 0.5},
+                    "neighbours": [2],
+                },
+                {
+                    "entity_number": 2,
+                    "name": "small-electric-pole",
+                    "position": {"x": 3.5, "y": 0.5},
+                    "neighbours": [1],
+                },
+                {
+                    "entity_number": 3,
+                    "name": "locomotive",
+                    "position": {"x": 10, "y": 10},
+                },
+            ],
+            "schedules": [{"locomotives": [3], "schedule": []}],
+        }
+        blueprint = Blueprint(copy.deepcopy(example), lazy=True)
+        self.assertEqual(blueprint.label, "lazy")
+        self.assertEqual(len(blueprint._unloaded_entities), 3)
+        self.assertEqual(len(blueprint._root["entities"].data), 0)
+
+        # Copies of unloaded blueprints can be loaded independently
+        blueprint_copy = copy.deepcopy(blueprint)
+        self.assertIsNot(blueprint_copy._unloaded_entities, None)
+
+        # Counting the entities doesn't load them
+        self.assertEqual(len(blueprint.entities), 3)
+        self.assertIsNot(blueprint._unloaded_entities, None)
+
+        # Anything else does
+        self.assertIs(blueprint.entities[0].neighbours[0](), blueprint.entities[1])
+        self.assertIs(blueprint._unloaded_entities, None)
+        self.assertEqual(len(blueprint.entities), 3)
+        self.assertIs(blueprint.schedules[0]["locomotives"][0](), blueprint.entities[2])
+        expected = Blueprint(copy.deepcopy(example)).to_dict()
+        self.assertEqual(blueprint.to_dict(), expected)
+
+        # Everything else that depends on the entities loads them too
+        self.assertEqual(blueprint_copy.tile_width, blueprint.tile_width)
+        self.assertIs(blueprint_copy._unloaded_entities, None)
+        self.assertEqual(blueprint_copy.to_dict(), expected)
+        for use in [
+            lambda entities: list(entities),
+            lambda entities: entities.append("wooden-chest", tile_position=(5, 5)),
+            lambda entities: entities.find_leaves(["locomotive"]),
+        ]:
+            blueprint = Blueprint(copy.deepcopy(example), lazy=True)
+            use(blueprint.entities)
+            self.assertIs(blueprint._unloaded_entities, None)
+            self.assertIs(blueprint.entities[0].neighbours[0](), blueprint.entities[1])
+
+        # Setting the entities to another lazy blueprint's list
+        other = Blueprint(copy.deepcopy(example), lazy=True)
+        blueprint = Blueprint()
+        blueprint.entities = other.entities
+        self.assertEqual(len(blueprint.entities), 3)
+        self.assertEqual(
+            blueprint.to_dict()["blueprint"]["entities"],
+            expected["blueprint"]["entities"],
+        )
+
+        # Warnings are deferred until the entities are loaded
+        blueprint = Blueprint(
+            {"entities": [{"name": "wooden-chest"}, {"name": "wooden-chest"}]},
+            lazy=True,
+        )
+        with self.assertWarns(OverlappingObjectsWarning):
+            blueprint.entity_map
+
+        # Lazy loading from strings, and through blueprint books
+        blueprint_string = Blueprint(copy.deepcopy(example)).to_string()
+        blueprint = get_blueprintable_from_string(blueprint_string, lazy=True)
+        self.assertIsNot(blueprint._unloaded_entities, None)
+        book = BlueprintBook({"blueprints": [{"blueprint": example}]}, lazy=True)
+        self.assertIsNot(book.blueprints[0]._unloaded_entities, None)
+
+    def test_trusted_loading(self):
+        example = {
+            "label": "trusted",
+            "label_color": {"r": 1.0, "g": 0.5, "b": 0.0},
+            "icons": [{"index": 1, "signal": {"name": "signal-A", "type": "virtual"}}],
+            "entities": [
+                {
+                    "entity_number": 1,
+                    "name": "small-electric-pole",
+                    "position": {"x": 0.5, "y": 0.5},
+                    "neighbours": [2],
+                },
+                {
+                    "entity_number": 2,
+                    "name": "small-electric-pole",
+                    "position": {"x": 3.5, "y": 0.5},
+                    "neighbours": [1],
+                },
+                {
+                    "entity_number": 3,
+                    "name": "decider-combinator",
+                    "position": {"x": 6.5, "y": 1.0},
+                    "control_behavior": {
+                        "decider_conditions": {
+                            "first_signal": {"name": "signal-A", "type": "virtual"},
+                            "comparator": "<",
+                            "constant": 10,
+                            "output_signal": {"name": "signal-B", "type": "virtual"},
+                            "copy_count_from_input": True,
+                        }
+                    },
+                },
+            ],
+        }
+        expected = Blueprint(copy.deepcopy(example)).to_dict()
+        blueprint_string = Blueprint(copy.deepcopy(example)).to_string()
+
+        # Trusted blueprints are identical to untrusted ones
+        blueprint = Blueprint(blueprint_string, trusted=True)
+        self.assertEqual(blueprint.to_dict(), expected)
+        self.assertIs(blueprint.entities[0].neighbours[0](), blueprint.entities[1])
+        blueprint = get_blueprintable_from_string(blueprint_string, trusted=True)
+        self.assertEqual(blueprint.to_dict(), expected)
+        blueprint = Blueprint(blueprint_string, lazy=True, trusted=True)
+        self.assertEqual(blueprint.to_dict(), expected)
+
+        # Validation is only skipped when loading
+        with self.assertRaises(DataFormatError):
+            blueprint.label_color = "incorrect"
+
+        # Nothing is validated and no warnings are issued
+        invalid = {
+            "label_color": "incorrect",
+            "entities": [{"name": "wooden-chest"}, {"name": "wooden-chest"}],
+        }
+        with warnings.catch_warnings(record=True) as warning_list:
+            warnings.simplefilter("always")
+            blueprint = Blueprint(copy.deepcopy(invalid), trusted=True)
+            self.assertEqual(len(blueprint.entities), 2)
+            lazy_blueprint = Blueprint(copy.deepcopy(invalid), lazy=True, trusted=True)
+            self.assertEqual(len(lazy_blueprint.entities), 2)
+        self.assertEqual(warning_list, [])
+        self.assertEqual(blueprint.label_color, "incorrect")
+
+        # Until `validate()` is called, which leaves the blueprint unchanged
+        # if it fails
+        with self.assertRaises(DataFormatError):
+            blueprint.validate()
+        self.assertTrue(blueprint._trusted)
+        self.assertEqual(len(blueprint.entities), 2)
+        blueprint.label_color = None
+        with self.assertWarns(OverlappingObjectsWarning):
+            blueprint.validate()
+        self.assertFalse(blueprint._trusted)
+        with self.assertWarns(OverlappingObjectsWarning):
+            blueprint.entities.append("wooden-chest")
+
+        # Trusted blueprint books
+        book = BlueprintBook(
+            {"blueprints": [{"blueprint": copy.deepcopy(example)}]}, trusted=True
+        )
+        self.assertTrue(book.blueprints[0]._trusted)
+        self.assertEqual(book.blueprints[0].to_dict(), expected)
+        book.validate()
+        self.assertFalse(book.blueprints[0]._trusted)
+        self.assertEqual(book.blueprints[0].to_dict(), expected)
+
+    # =========================================================================
+
     def test_set_label(self):
         blueprint = Blueprint()
         blueprint.version = (1, 1, 54, 0)
@@ -553,6 +735,21 @@ class BlueprintTesting(unittest.TestCase):
         with self.assertRaises(UnreasonablySizedBlueprintError):
             blueprint.entities.append("inserter", tile_position=(0, 100000))
 
+        # Warnings turned into errors are raised before anything is added
+        blueprint = Blueprint()
+        blueprint.entities.append("wooden-chest")
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", OverlappingObjectsWarning)
+            with self.assertRaises(OverlappingObjectsWarning):
+                blueprint.entities.append("wooden-chest")
+            with self.assertRaises(OverlappingObjectsWarning):
+                blueprint.entities.extend_from_dicts(
+                    [{"name": "wooden-chest", "tile_position": (1, 0)}, Container()]
+                )
+        self.assertEqual(len(blueprint.entities), 1)
+        self.assertEqual(len(blueprint.entity_map.get_all_entities()), 1)
+        self.assertEqual(len(blueprint.find_entities(AABB(0, 0, 2, 1))), 1)
+
     def test_change_entity_id(self):
         blueprint = Blueprint()
 
@@ -657,6 +854,56 @@ class BlueprintTesting(unittest.TestCase):
         with self.assertRaises(UnreasonablySizedBlueprintError):
             blueprint.entities[1] = Container(tile_position=(10002, 0))
 
+    def test_area_tracking(self):
+        def rounded_area(blueprint):
+            if blueprint.area is None:
+                return None
+            area = blueprint.area.top_left + blueprint.area.bot_right
+            return [round(value, 6) for value in area]
+
+        blueprint = Blueprint()
+        blueprint.entities.append("wooden-chest")
+        blueprint.entities.append("wooden-chest", tile_position=(4, 0))
+        blueprint.entities.append("wooden-chest", tile_position=(0, 4))
+        blueprint.tiles.append("landfill", position=(-2, 0))
+        self.assertEqual(rounded_area(blueprint), [-2, 0, 4.85, 4.85])
+
+        # Removing
+        del blueprint.tiles[0]
+        self.assertEqual(rounded_area(blueprint), [0.15, 0.15, 4.85, 4.85])
+        blueprint.entities.pop(1)
+        self.assertEqual(rounded_area(blueprint), [0.15, 0.15, 0.85, 4.85])
+        self.assertEqual((blueprint.tile_width, blueprint.tile_height), (1, 5))
+
+        # Replacing
+        blueprint.entities[1] = Container("wooden-chest", tile_position=(2, 2))
+        self.assertEqual(rounded_area(blueprint), [0.15, 0.15, 2.85, 2.85])
+        with self.assertRaises(UnreasonablySizedBlueprintError):
+            blueprint.entities[1] = Container(tile_position=(10002, 0))
+        # The area is unchanged
+        self.assertEqual(rounded_area(blueprint), [0.15, 0.15, 2.85, 2.85])
+        blueprint.tiles.append("landfill", position=(5, 5))
+        blueprint.tiles[0] = Tile("landfill", position=(3, 3))
+        self.assertEqual(rounded_area(blueprint), [0.15, 0.15, 4, 4])
+
+        # Copies keep track of their own area
+        for duplicate in (
+            copy.deepcopy(blueprint),
+            pickle.loads(pickle.dumps(blueprint)),
+        ):
+            del duplicate.tiles[0]
+            self.assertEqual(rounded_area(duplicate), [0.15, 0.15, 2.85, 2.85])
+            duplicate.entities.pop()
+            self.assertEqual(rounded_area(duplicate), [0.15, 0.15, 0.85, 0.85])
+        self.assertEqual(rounded_area(blueprint), [0.15, 0.15, 4, 4])
+
+        # Slices
+        del blueprint.entities[:]
+        self.assertEqual(rounded_area(blueprint), [3, 3, 4, 4])
+        blueprint.tiles.pop()
+        self.assertEqual(rounded_area(blueprint), None)
+        self.assertEqual((blueprint.tile_width, blueprint.tile_height), (0, 0))
+
     # =========================================================================
 
     def test_to_dict(self):
@@ -887,6 +1134,30 @@ class BlueprintTesting(unittest.TestCase):
         with self.assertRaises(DraftsmanError):
             blueprint.to_dict()
 
+        # Association to an entity outside of the blueprint
+        blueprint = Blueprint()
+        outside = ElectricPole("small-electric-pole", tile_position=(5, 0))
+        blueprint.entities.append("small-electric-pole")
+        blueprint.entities[0].neighbours.append(Association(outside))
+        with self.assertRaises(InvalidAssociationError):
+            blueprint.to_dict()
+
+        # Schedule with a locomotive outside of the blueprint
+        blueprint = Blueprint()
+        outside = new_entity("locomotive")
+        blueprint.schedules = [{"locomotives": [Association(outside)], "schedule": []}]
+        with self.assertRaises(InvalidAssociationError):
+            blueprint.to_dict()
+
+        # Schedule with a locomotive that no longer exists
+        blueprint.entities.append("locomotive")
+        blueprint.schedules = [
+            {"locomotives": [Association(blueprint.entities[0])], "schedule": []}
+        ]
+        del blueprint.entities[0]
+        with self.assertRaises(InvalidAssociationError):
+            blueprint.to_dict()
+
     # =========================================================================
 
     def test_getitem(self):
@@ -1176,6 +1447,18 @@ class BlueprintTesting(unittest.TestCase):
         )
         self.assertEqual(found, [blueprint.entities[0], blueprint.entities[2]])
 
+        # Filter
+        found = blueprint.find_entities_filtered(
+            filter=EntityFilter(type="container", invert=True)
+        )
+        self.assertEqual(found, [blueprint.entities[1], blueprint.entities[3]])
+        found = blueprint.find_entities_filtered(
+            filter=lambda entity: entity.tile_position.x > 4, limit=2
+        )
+        self.assertEqual(found, [blueprint.entities[1], blueprint.entities[2]])
+        with self.assertRaises(ValueError):
+            blueprint.find_entities_filtered(filter=EntityFilter(), name="steel-chest")
+
         # Group search case
         blueprint.entities = None
         group = Group("test")
@@ -1184,6 +1467,105 @@ class BlueprintTesting(unittest.TestCase):
         found = blueprint.find_entities_filtered()
         self.assertEqual(found, [blueprint.entities[("test", 0)]])
 
+    def test_find_entities_filtered_batch(self):
+        blueprint = Blueprint()
+        blueprint.entities.append("wooden-chest", tile_position=(1, 1))
+        blueprint.entities.append("decider-combinator", tile_position=(5, 0))
+        blueprint.entities.append("steel-chest", tile_position=(10, 10))
+        blueprint.entities.append(
+            "arithmetic-combinator", tile_position=(6, 0), direction=Direction.SOUTH
+        )
+        group = Group("test", position=(20, 20))
+        group.entities.append("wooden-chest")
+        group.entities.append("small-lamp", tile_position=(1, 0))
+        blueprint.entities.append(group)
+        chest, decider, steel_chest, arithmetic = blueprint.entities[0:4]
+        grouped_chest = blueprint.entities[("test", 0)]
+        grouped_lamp = blueprint.entities[("test", 1)]
+
+        # Areas
+        areas = [
+            [4, -1, 11, 11],
+            AABB(0, 0, 2, 2),
+            [100, 100, 101, 101],
+            [0, 0, 30, 30],
+        ]
+        found = blueprint.find_entities_filtered_batch(areas=areas)
+        for area, result in zip(areas, found):
+            self.assertEqual(result, blueprint.find_entities_filtered(area=area))
+        self.assertEqual(found[0], [decider, arithmetic, steel_chest])
+        self.assertEqual(found[2], [])
+
+        # Positions
+        positions = [(1.5, 1.5), (6.5, 0.5), (50, 50), (20.5, 20.5)]
+        found = blueprint.find_entities_filtered_batch(positions=positions)
+        self.assertEqual(found, [[chest], [arithmetic], [], [grouped_chest]])
+
+        # Positions + Radius
+        found = blueprint.find_entities_filtered_batch(positions=positions, radius=10)
+        for position, result in zip(positions, found):
+            self.assertEqual(
+                result, blueprint.find_entities_filtered(position=position, radius=10)
+            )
+        found = blueprint.find_entities_filtered_batch(
+            positions=[(0, 0), (0, 0)], radius=[1, 10]
+        )
+        self.assertEqual(found, [[], [chest, decider, arithmetic]])
+
+        # Limit
+        found = blueprint.find_entities_filtered_batch(areas=areas, limit=1)
+        self.assertEqual(found, [[decider], [chest], [], [chest]])
+
+        # Criteria
+        found = blueprint.find_entities_filtered_batch(areas=areas, type="container")
+        self.assertEqual(
+            found, [[steel_chest], [chest], [], [chest, steel_chest, grouped_chest]]
+        )
+        found = blueprint.find_entities_filtered_batch(
+            areas=areas, direction=Direction.SOUTH
+        )
+        self.assertEqual(found, [[arithmetic], [], [], [arithmetic]])
+        found = blueprint.find_entities_filtered_batch(areas=areas, name="small-lamp")
+        self.assertEqual(found, [[], [], [], [grouped_lamp]])
+        found = blueprint.find_entities_filtered_batch(
+            areas=areas, name={"wooden-chest", "small-lamp"}, limit=2
+        )
+        self.assertEqual(found[1:], [[chest], [], [chest, grouped_chest]])
+        found = blueprint.find_entities_filtered_batch(
+            areas=areas, type="container", invert=True
+        )
+        self.assertEqual(
+            found, [[decider, arithmetic], [], [], [decider, arithmetic, grouped_lamp]]
+        )
+
+        # Filter
+        test = EntityFilter(name="steel-chest")
+        found = blueprint.find_entities_filtered_batch(areas=areas, filter=test)
+        self.assertEqual(found, [[steel_chest], [], [], [steel_chest]])
+        found = blueprint.find_entities_filtered_batch(
+            positions=positions, filter=lambda entity: entity.name == "wooden-chest"
+        )
+        self.assertEqual(found, [[chest], [], [], [grouped_chest]])
+
+        # Entities added since the last search
+        blueprint.entities.append("steel-chest", tile_position=(1, 0))
+        found = blueprint.find_entities_filtered_batch(areas=areas, filter=test)
+        self.assertEqual(found[1], [blueprint.entities[-1]])
+
+        # Errors
+        with self.assertRaises(ValueError):
+            blueprint.find_entities_filtered_batch()
+        with self.assertRaises(ValueError):
+            blueprint.find_entities_filtered_batch(areas=areas, positions=positions)
+        with self.assertRaises(ValueError):
+            blueprint.find_entities_filtered_batch(areas=areas, radius=10)
+        with self.assertRaises(ValueError):
+            blueprint.find_entities_filtered_batch(positions=positions, radius=[1, 2])
+        with self.assertRaises(ValueError):
+            blueprint.find_entities_filtered_batch(
+                areas=areas, filter=test, type="container"
+            )
+
     # =========================================================================
 
     def test_power_connections(self):
@@ -1678,6 +2060,27 @@ class BlueprintTesting(unittest.TestCase):
             blueprint.entities.append("medium-electric-pole", tile_position=(0, i))
             blueprint.entities.append("medium-electric-pole", tile_position=(3, i))
         blueprint.generate_power_connections()
+        for entity in blueprint.entities:
+            self.assertLessEqual(len(entity.neighbours), 5)
+
+        # Poles inside groups are connected by their global positions
+        blueprint.entities = None
+        group = Group("poles", position=(0, 18))
+        for i in range(4):
+            blueprint.entities.append("substation", tile_position=(i * 18, 0))
+            group.entities.append("substation", tile_position=(i * 18, 0))
+        blueprint.entities.append(group)
+        blueprint.generate_power_connections()
+        group = blueprint.entities["poles"]
+        self.assertEqual(
+            [len(entity.neighbours) for entity in blueprint.entities[:4]],
+            [2, 3, 3, 2],
+        )
+        self.assertEqual(
+            [len(entity.neighbours) for entity in group.entities],
+            [2, 3, 3, 2],
+        )
+        self.assertIn(Association(group.entities[0]), blueprint.entities[0].neighbours)
 
     # =========================================================================
 
@@ -2017,6 +2420,14 @@ class BlueprintTesting(unittest.TestCase):
 
         self.assertEqual(blueprint.entities[0].tile_position, Vector(5, 5))
         self.assertEqual(blueprint.tiles[0].position, Vector(-4, -4))
+        self.assertEqual(blueprint.area.top_left, [-4, -4])
+        self.assertEqual(blueprint.area.bot_right, [5.85, 5.85])
+        # Spatial maps are rebuilt at the new positions
+        self.assertEqual(blueprint.find_entities((5, 5, 6, 6)), [blueprint.entities[0]])
+        self.assertEqual(blueprint.find_entities((10, 10, 11, 11)), [])
+        self.assertEqual(
+            blueprint.find_tiles_filtered(position=(-4, -4)), [blueprint.tiles[0]]
+        )
 
         blueprint.entities.append("straight-rail")
         self.assertEqual(blueprint.double_grid_aligned, True)
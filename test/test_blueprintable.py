@@ -141,3 +141,57 @@ class BlueprintUtilsTesting(unittest.TestCase):
         example = JSON_to_string({"incorrect": {}})
         with self.assertRaises(IncorrectBlueprintTypeError):
             get_blueprintable_from_string(example)
+
+    def test_get_blueprintable_from_JSON(self):
+        blueprintable = get_blueprintable_from_JSON(
+            {"blueprint": {"item": "blueprint", "label": "test"}}
+        )
+        self.assertIsInstance(blueprintable, Blueprint)
+        self.assertEqual(blueprintable.label, "test")
+
+        blueprintable = get_blueprintable_from_JSON(
+            {"blueprint_book": {"item": "blueprint-book"}}
+        )
+        self.assertIsInstance(blueprintable, BlueprintBook)
+
+        with self.assertRaises(IncorrectBlueprintTypeError):
+            get_blueprintable_from_JSON({"incorrect": {}})
+
+    def test_iter_entities_from_string(self):
+        blueprint = Blueprint()
+        for i in range(10):
+            blueprint.entities.append("wooden-chest", tile_position=(i, 0))
+        entities = list(iter_entities_from_string(blueprint.to_string()))
+        self.assertEqual(entities, blueprint.to_dict()["blueprint"]["entities"])
+
+        # Not a blueprint
+        self.assertEqual(
+            list(iter_entities_from_string(BlueprintBook().to_string())), []
+        )
+
+        with self.assertRaises(MalformedBlueprintStringError):
+            list(iter_entities_from_string("0lmaothisiswrong"))
+
+    def test_iter_blueprintables_from_string(self):
+        blueprint_book = BlueprintBook()
+        blueprint = Blueprint()
+        blueprint.label = "first"
+        blueprint.entities.append("wooden-chest")
+        blueprint_book.blueprints.append(blueprint)
+        blueprint_book.blueprints.append(DeconstructionPlanner())
+        blueprint_book.blueprints.append(BlueprintBook())
+
+        blueprintables = list(
+            iter_blueprintables_from_string(blueprint_book.to_string(), lazy=True)
+        )
+        self.assertEqual(
+            [type(blueprintable) for blueprintable in blueprintables],
+            [Blueprint, DeconstructionPlanner, BlueprintBook],
+        )
+        self.assertEqual(blueprintables[0].label, "first")
+        self.assertEqual(blueprintables[0].entities[0].name, "wooden-chest")
+
+        # Not a blueprint book
+        self.assertEqual(
+            list(iter_blueprintables_from_string(blueprint.to_string())), []
+        )
@@ -460,6 +460,43 @@ class BlueprintBookTesting(unittest.TestCase):
         self.assertIs(blueprint_book.blueprints, blueprint_book._root["blueprints"])
         self.assertIs(blueprint_book.blueprints, blueprint_book["blueprints"])
 
+    def test_workers(self):
+        blueprint_book = BlueprintBook()
+        for i in range(3):
+            blueprint = Blueprint()
+            blueprint.label = str(i)
+            blueprint.entities.append("small-electric-pole")
+            blueprint.entities.append("small-electric-pole", tile_position=(3, 0))
+            blueprint.add_power_connection(0, 1)
+            blueprint_book.blueprints.append(blueprint)
+        blueprint_book.blueprints.append(DeconstructionPlanner())
+
+        # Export
+        expected = blueprint_book.to_string()
+        self.assertEqual(blueprint_book.to_dict(workers=2), blueprint_book.to_dict())
+        self.assertEqual(blueprint_book.to_string(workers=2), expected)
+
+        # Import
+        result = BlueprintBook(expected, workers=2)
+        self.assertEqual(result.to_dict(), BlueprintBook(expected).to_dict())
+        self.assertEqual([bp.label for bp in result.blueprints[:3]], ["0", "1", "2"])
+        self.assertIsInstance(result.blueprints[3], DeconstructionPlanner)
+        # Associations still point to entities in the same blueprint
+        entities = result.blueprints[0].entities
+        self.assertIs(entities[0].neighbours[0](), entities[1])
+
+        # Warnings issued in the worker processes are reissued
+        with self.assertWarns(DraftsmanWarning):
+            BlueprintBook(
+                {
+                    "blueprints": [
+                        {"blueprint": {"item": "blueprint", "unused": 1}},
+                        {"blueprint": {"item": "blueprint"}},
+                    ]
+                },
+                workers=2,
+            )
+
     def test_setitem(self):
         blueprint_book = BlueprintBook()
         blueprint_book["label"] = "whatever"
@@ -0,0 +1,215 @@
+# test_cli.py
+# -*- encoding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+from draftsman import cli
+from draftsman.classes.blueprint import Blueprint
+from draftsman.warning import OverlappingObjectsWarning
+
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+if sys.version_info >= (3, 3):  # pragma: no coverage
+    import unittest
+else:  # pragma: no coverage
+    import unittest2 as unittest
+
+
+class CLITesting(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.output_directory = tempfile.mkdtemp()
+        blueprint = Blueprint()
+        blueprint.entities.append("wooden-chest")
+        self.string = blueprint.to_string()
+
+        os.mkdir(os.path.join(self.directory, "sub"))
+        with io.open(os.path.join(self.directory, "a.txt"), "w") as f:
+            f.write(self.string + "\n")
+        with io.open(os.path.join(self.directory, "sub", "b.txt"), "w") as f:
+            f.write("0malformed")
+        with io.open(os.path.join(self.directory, "c.jsonl"), "w") as f:
+            f.write(json.dumps({"string": self.string}) + "\n\n")
+            f.write(json.dumps(self.string) + "\n")
+            f.write(json.dumps({"other": self.string}) + "\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        shutil.rmtree(self.output_directory)
+
+    def test_iter_sources(self):
+        sources = list(cli.iter_sources([self.directory]))
+        self.assertEqual(
+            [os.path.relpath(source, self.directory) for source, _ in sources],
+            [
+                "a.txt",
+                "c.jsonl:1",
+                "c.jsonl:3",
+                "c.jsonl:4",
+                os.path.join("sub", "b.txt"),
+            ],
+        )
+        self.assertEqual(sources[0][1], self.string)
+        self.assertEqual(sources[2][1], self.string)
+        self.assertIsInstance(sources[3][1], KeyError)
+
+        sources = list(
+            cli.iter_sources([os.path.join(self.directory, "c.jsonl")], key="other")
+        )
+        self.assertEqual([string for _, string in sources][1:], [self.string] * 2)
+
+    def test_iter_sources_unreadable(self):
+        with io.open(os.path.join(self.directory, "d.bin"), "wb") as f:
+            f.write(b"\x00\xff\xfe\x80binary")
+        with io.open(os.path.join(self.directory, "e.jsonl"), "wb") as f:
+            f.write(json.dumps(self.string).encode("utf-8") + b"\n\xff\xfe\n")
+        missing = os.path.join(self.directory, "missing.txt")
+
+        sources = list(cli.iter_sources([self.directory, missing]))
+        self.assertEqual(
+            [os.path.relpath(source, self.directory) for source, _ in sources],
+            [
+                "a.txt",
+                "c.jsonl:1",
+                "c.jsonl:3",
+                "c.jsonl:4",
+                "d.bin",
+                "e.jsonl:1",
+                "e.jsonl:2",
+                os.path.join("sub", "b.txt"),
+                "missing.txt",
+            ],
+        )
+        self.assertIsInstance(sources[4][1], UnicodeDecodeError)
+        self.assertEqual(sources[5][1], self.string)
+        self.assertIsInstance(sources[6][1], UnicodeDecodeError)
+        self.assertIsInstance(sources[8][1], (IOError, OSError))
+
+        # The rest of the run carries on
+        output_path = os.path.join(self.output_directory, "results.jsonl")
+        exit_code = cli.main(["batch", self.directory, "-j", "1", "-o", output_path])
+        self.assertEqual(exit_code, 1)
+        with io.open(output_path) as f:
+            results = [json.loads(line) for line in f]
+        self.assertEqual(
+            [result["ok"] for result in results],
+            [True, True, True, False, False, True, False, False],
+        )
+        self.assertIn("UnicodeDecodeError", results[4]["error"])
+
+    def test_process_string(self):
+        result = cli.process_string("test", self.string)
+        self.assertTrue(result["ok"])
+        self.assertEqual(result["string"], self.string)
+        self.assertEqual(result["warnings"], [])
+        self.assertEqual(set(result["time"]), {"decode", "load", "encode"})
+
+        result = cli.process_string("test", self.string, compression_level=0)
+        self.assertTrue(result["ok"])
+        self.assertGreater(len(result["string"]), len(self.string))
+
+        result = cli.process_string("test", "0malformed")
+        self.assertFalse(result["ok"])
+        self.assertIn("MalformedBlueprintStringError", result["error"])
+        self.assertEqual(set(result["time"]), {"decode"})
+
+        # Warnings are recorded
+        blueprint = Blueprint()
+        blueprint.entities.append("wooden-chest")
+        with self.assertWarns(OverlappingObjectsWarning):
+            blueprint.entities.append("wooden-chest")
+        result = cli.process_string("test", blueprint.to_string())
+        self.assertTrue(result["ok"])
+        self.assertEqual(len(result["warnings"]), 1)
+        self.assertTrue(result["warnings"][0].startswith("OverlappingObjectsWarning"))
+
+    def test_main(self):
+        for jobs in ("1", "2"):
+            output_path = os.path.join(self.output_directory, "results.jsonl")
+            exit_code = cli.main(
+                ["batch", self.directory, "-j", jobs, "-o", output_path]
+            )
+            self.assertEqual(exit_code, 1)
+            with io.open(output_path) as f:
+                results = [json.loads(line) for line in f]
+            self.assertEqual(
+                [result["ok"] for result in results],
+                [True, True, True, False, False],
+            )
+
+        exit_code = cli.main(
+            [
+                "batch",
+                os.path.join(self.directory, "a.txt"),
+                "-j",
+                "1",
+                "-o",
+                output_path,
+            ]
+        )
+        self.assertEqual(exit_code, 0)
+
+        # The number of jobs must be positive
+        stderr = sys.stderr
+        try:
+            sys.stderr = io.StringIO()
+            for jobs in ("0", "-2", "many"):
+                with self.assertRaises(SystemExit):
+                    cli.main(["batch", self.directory, "-j", jobs])
+                self.assertIn("must be a positive integer", sys.stderr.getvalue())
+        finally:
+            sys.stderr = stderr
+        with self.assertRaises(ValueError):
+            cli.batch([self.directory], io.StringIO(), jobs=0)
+
+    def test_run_as_module(self):
+        output_path = os.path.join(self.output_directory, "results.jsonl")
+        environment = dict(os.environ)
+        environment["PYTHONPATH"] = os.path.dirname(os.path.dirname(cli.__file__))
+        exit_code = subprocess.call(
+            [
+                sys.executable,
+                "-m",
+                "draftsman.cli",
+                "batch",
+                os.path.join(self.directory, "a.txt"),
+                "-j",
+                "1",
+                "-o",
+                output_path,
+            ],
+            env=environment,
+            stderr=subprocess.DEVNULL,
+        )
+        self.assertEqual(exit_code, 0)
+        with io.open(output_path) as f:
+            self.assertTrue(json.loads(f.readline())["ok"])
+
+    @unittest.skipIf(sys.version_info < (3, 7), "Requires -X importtime")
+    def test_import_time_report(self):
+        report = cli.import_time_report(["draftsman.constants"])
+        modules = [entry["module"] for entry in report]
+        self.assertEqual(modules[-1], "draftsman.constants")
+        self.assertIn("draftsman", modules)
+        for entry in report:
+            self.assertEqual(set(entry), {"module", "self", "cumulative", "depth"})
+            self.assertGreaterEqual(entry["cumulative"], entry["self"])
+        self.assertEqual(report[-1]["depth"], 0)
+
+        with self.assertRaises(RuntimeError):
+            cli.import_time_report(["draftsman.not_a_module"])
+
+        stdout = io.StringIO()
+        original_stdout = sys.stdout
+        sys.stdout = stdout
+        try:
+            self.assertEqual(cli.main(["importtime", "draftsman.constants"]), 0)
+        finally:
+            sys.stdout = original_stdout
+        self.assertIn("draftsman.constants", stdout.getvalue())
@@ -0,0 +1,229 @@
+# test_compact_entitylist.py
+# -*- encoding: utf-8 -*-
+
+from __future__ import absolute_import, unicode_literals
+
+from draftsman.classes.association import Association
+from draftsman.classes.blueprint import Blueprint
+from draftsman.classes.compact_entitylist import (
+    CompactEntityList,
+    CompactEntityView,
+)
+from draftsman.entity import AssemblingMachine, Container
+from draftsman.error import DraftsmanError, InvalidAssociationError
+
+import copy
+import sys
+
+if sys.version_info >= (3, 3):  # pragma: no coverage
+    import unittest
+else:  # pragma: no coverage
+    import unittest2 as unittest
+
+
+class CompactEntityListTesting(unittest.TestCase):
+    def create_blueprint(self):
+        blueprint = Blueprint()
+        blueprint.entities.append("transport-belt", direction=2)
+        blueprint.entities.append(
+            "assembling-machine-1", tile_position=(0, 2), recipe="iron-gear-wheel"
+        )
+        blueprint.entities.append("small-electric-pole", tile_position=(4, 0))
+        blueprint.entities.append("small-electric-pole", tile_position=(8, 0))
+        blueprint.entities.append("curved-rail", tile_position=(10, 10), direction=3)
+        blueprint.add_power_connection(2, 3)
+        blueprint.add_circuit_connection("red", 2, 3)
+        blueprint.tiles.append("refined-concrete", position=(-5, -5))
+        return blueprint
+
+    def test_blueprint(self):
+        blueprint = self.create_blueprint()
+        expected = blueprint.to_dict()
+
+        compact = Blueprint(copy.deepcopy(expected["blueprint"]), compact=True)
+        self.assertIsInstance(compact.entities, CompactEntityList)
+        self.assertEqual(len(compact.entities), 5)
+        self.assertEqual(compact.to_dict(), expected)
+        self.assertEqual(compact.area.top_left, blueprint.area.top_left)
+        self.assertEqual(compact.area.bot_right, blueprint.area.bot_right)
+        self.assertEqual(compact.tile_width, blueprint.tile_width)
+        self.assertEqual(compact.tile_height, blueprint.tile_height)
+
+        # Strings
+        compact = Blueprint(blueprint.to_string(), compact=True)
+        self.assertEqual(compact.to_string(), blueprint.to_string())
+
+        # Copies are independent
+        duplicate = copy.deepcopy(compact)
+        self.assertIs(duplicate.entities._parent, duplicate)
+        duplicate.entities[0].position = (100.5, 100.5)
+        self.assertEqual(compact.to_dict(), expected)
+        self.assertEqual(duplicate.tile_width, 106)
+
+        # Setting entities
+        compact.entities = None
+        self.assertEqual(len(compact.entities), 0)
+        compact.entities = [Container("wooden-chest")]
+        self.assertIsInstance(compact.entities, CompactEntityList)
+        self.assertEqual(compact.entities[0].name, "wooden-chest")
+
+    def test_unsupported(self):
+        blueprint = Blueprint(
+            self.create_blueprint().to_dict()["blueprint"], compact=True
+        )
+        self.assertTrue(blueprint.double_grid_aligned)
+        blueprint.entities = [Container("wooden-chest")]
+        self.assertFalse(blueprint.double_grid_aligned)
+
+        unsupported = [
+            lambda: blueprint.flippable,
+            lambda: blueprint.translate(2, 2),
+            lambda: blueprint.rotate(2),
+            lambda: blueprint.flip(),
+            lambda: blueprint.find_entity("wooden-chest", (0.5, 0.5)),
+            lambda: blueprint.find_entity_at_position((0.5, 0.5)),
+            lambda: blueprint.find_entities(),
+            lambda: blueprint.find_entities_filtered(name="wooden-chest"),
+            lambda: blueprint.find_entities_filtered_batch(positions=[(0, 0)]),
+            lambda: blueprint.add_power_connection(0, 1),
+            lambda: blueprint.generate_power_connections(),
+            lambda: blueprint.add_circuit_connection("red", 0, 1),
+            lambda: blueprint.remove_power_connection(0, 1),
+            lambda: blueprint.remove_power_connections(),
+            lambda: blueprint.remove_circuit_connection("red", 0, 1),
+            lambda: blueprint.remove_circuit_connections(),
+        ]
+        for function in unsupported:
+            with self.assertRaisesRegex(
+                DraftsmanError, "not supported on compact blueprints"
+            ):
+                function()
+        self.assertEqual(blueprint.entities[0].position.to_dict(), {"x": 0.5, "y": 0.5})
+
+    def test_entity_numbers(self):
+        entities = [
+            {
+                "entity_number": 5,
+                "name": "small-electric-pole",
+                "position": {"x": 0.5, "y": 0.5},
+                "neighbours": [10],
+            },
+            {
+                "entity_number": 10,
+                "name": "small-electric-pole",
+                "position": {"x": 5.5, "y": 0.5},
+                "neighbours": [5],
+                "connections": {"1": {"green": [{"entity_id": 5}]}},
+            },
+        ]
+        result = CompactEntityList(None, entities).to_dicts()
+        self.assertEqual(result[0]["entity_number"], 1)
+        self.assertEqual(result[0]["neighbours"], [2])
+        self.assertEqual(result[1]["neighbours"], [1])
+        self.assertEqual(result[1]["connections"], {"1": {"green": [{"entity_id": 1}]}})
+        # Input is not modified
+        self.assertEqual(entities[0]["neighbours"], [10])
+
+        # Connections to entities that don't exist
+        test = CompactEntityList()
+        with self.assertRaises(InvalidAssociationError):
+            test.extend(entities[:1])
+        # Nothing is added if an error occurs
+        self.assertEqual(len(test), 0)
+
+    def test_append(self):
+        test = CompactEntityList()
+        test.append(AssemblingMachine("assembling-machine-1", recipe="iron-gear-wheel"))
+        test.append({"name": "inserter", "position": [2.5, 0.5], "direction": 4})
+        self.assertEqual(
+            test.to_dicts(),
+            [
+                {
+                    "name": "assembling-machine-1",
+                    "position": {"x": 1.5, "y": 1.5},
+                    "recipe": "iron-gear-wheel",
+                    "entity_number": 1,
+                },
+                {
+                    "name": "inserter",
+                    "position": {"x": 2.5, "y": 0.5},
+                    "direction": 4,
+                    "entity_number": 2,
+                },
+            ],
+        )
+
+        with self.assertRaises(TypeError):
+            test.append("inserter")
+        with self.assertRaises(ValueError):
+            test.append({"name": "inserter", "position": [0, 0], "direction": 8})
+        with self.assertRaises(DraftsmanError):
+            test.append(
+                {
+                    "name": "small-electric-pole",
+                    "position": [0, 0],
+                    "neighbours": [Association(Container())],
+                }
+            )
+        self.assertEqual(len(test), 2)
+
+        test.clear()
+        self.assertEqual(len(test), 0)
+        self.assertEqual(test.to_dicts(), [])
+
+    def test_views(self):
+        blueprint = Blueprint(
+            self.create_blueprint().to_dict()["blueprint"], compact=True
+        )
+        entities = blueprint.entities
+
+        view = entities[1]
+        self.assertIsInstance(view, CompactEntityView)
+        self.assertEqual(view, entities[-4])
+        self.assertNotEqual(view, entities[0])
+        self.assertEqual(view.name, "assembling-machine-1")
+        self.assertEqual(view.type, "assembling-machine")
+        self.assertEqual(view.position.to_dict(), {"x": 1.5, "y": 3.5})
+        self.assertEqual(view.direction, 0)
+        self.assertEqual(view.entity_number, 2)
+        self.assertFalse(view.double_grid_aligned)
+        self.assertTrue(entities[4].double_grid_aligned)
+        self.assertEqual(view["recipe"], "iron-gear-wheel")
+        self.assertIn("recipe", view)
+        self.assertNotIn("items", view)
+        self.assertEqual([v.name for v in entities[2:4]], ["small-electric-pole"] * 2)
+        self.assertEqual(len(list(entities)), 5)
+        with self.assertRaises(IndexError):
+            entities[5]
+
+        # Modifying
+        view.name = "assembling-machine-2"
+        view.position = {"x": 20.5, "y": 20.5}
+        view.direction = 2
+        view["recipe"] = "copper-cable"
+        view["items"] = {"speed-module": 2}
+        del view["items"]
+        self.assertEqual(
+            view.to_dict(),
+            {
+                "name": "assembling-machine-2",
+                "position": {"x": 20.5, "y": 20.5},
+                "direction": 2,
+                "recipe": "copper-cable",
+            },
+        )
+        # Area is updated when next accessed
+        self.assertEqual(blueprint.area.bot_right, [21.7, 21.7])
+        with self.assertRaises(TypeError):
+            view.name = 10
+        with self.assertRaises(ValueError):
+            view.direction = 8
+        with self.assertRaises(KeyError):
+            view["position"] = (0, 0)
+
+        # Full entities
+        entity = view.to_entity()
+        self.assertIsInstance(entity, AssemblingMachine)
+        self.assertEqual(entity.recipe, "copper-cable")
+        self.assertEqual(entity.position.to_dict(), {"x": 20.5, "y": 20.5})
+        self.assertEqual(view.get_world_bounding_box().top_left, [19.3, 19.3])
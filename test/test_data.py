@@ -1,9 +1,15 @@
 # test_data.py
 # -*- encoding: utf-8 -*-
 
-from draftsman.data import entities
+from draftsman import data
+from draftsman.data import entities, signals, tiles
 
+import os
+import pickle
+import shutil
 import sys
+import tempfile
+import types
 
 if sys.version_info >= (3, 3):  # pragma: no coverage
     import unittest
@@ -18,3 +24,113 @@ class EntitiesDataTesting(unittest.TestCase):
                 entities.flippable[entity_name]
             except KeyError:
                 self.fail("'{}' had no entry in entities.flippable".format(entity_name))
+
+
+@unittest.skipIf(sys.version_info < (3, 7), "requires module level __getattr__")
+class LazyDataTesting(unittest.TestCase):
+    def setUp(self):
+        self.location = tempfile.mkdtemp()
+        self.source_path = os.path.join(self.location, "example.pkl")
+        self.cache_path = os.path.join(self.location, "example.cache")
+        with open(self.source_path, "wb") as out:
+            pickle.dump([[1, 2, 3], {"a": "b"}], out, 2)
+
+    def tearDown(self):
+        shutil.rmtree(self.location)
+        sys.modules.pop("draftsman.data.example", None)
+
+    def make_module(self):
+        module = types.ModuleType("draftsman.data.example")
+        sys.modules[module.__name__] = module
+        loader = data.LazyData(
+            module.__name__,
+            lambda data: {"numbers": data[0], "mapping": data[1]},
+            ["numbers", "mapping"],
+            location=self.location,
+        )
+        return module, loader
+
+    def test_data_modules(self):
+        self.assertIsInstance(tiles.raw, dict)
+        self.assertEqual(signals.get_signal_type("signal-A"), "virtual")
+        with self.assertRaises(AttributeError):
+            tiles.incorrect
+        with self.assertRaises(ImportError):
+            from draftsman.data.tiles import incorrect
+
+    def test_load(self):
+        module, loader = self.make_module()
+        self.assertFalse(loader.is_loaded("numbers"))
+
+        # Without a cache everything is loaded at once
+        self.assertEqual(module.numbers, [1, 2, 3])
+        self.assertTrue(loader.is_loaded("numbers"))
+        self.assertTrue(loader.is_loaded("mapping"))
+        self.assertIs(module.numbers, module.numbers)
+
+        with self.assertRaises(AttributeError):
+            module.incorrect
+
+    def test_cache(self):
+        data.write_module_cache(
+            self.source_path,
+            self.cache_path,
+            lambda data: {"numbers": data[0], "mapping": data[1]},
+        )
+        self.assertTrue(os.path.isfile(self.cache_path))
+
+        # With a cache only the requested attribute is loaded
+        module, loader = self.make_module()
+        self.assertEqual(module.mapping, {"a": "b"})
+        self.assertTrue(loader.is_loaded("mapping"))
+        self.assertFalse(loader.is_loaded("numbers"))
+        loader.require("numbers")
+        self.assertTrue(loader.is_loaded("numbers"))
+        self.assertEqual(module.numbers, [1, 2, 3])
+
+        # The cache is ignored if the pickle file changes
+        with open(self.source_path, "wb") as out:
+            pickle.dump([[4, 5, 6, 7], {}], out, 2)
+        module, loader = self.make_module()
+        self.assertEqual(module.mapping, {})
+        self.assertTrue(loader.is_loaded("numbers"))
+        self.assertEqual(module.numbers, [4, 5, 6, 7])
+
+        # The cache is ignored if it's malformed
+        data.write_module_cache(
+            self.source_path,
+            self.cache_path,
+            lambda data: {"numbers": data[0], "mapping": data[1]},
+        )
+        with open(self.cache_path, "r+b") as cache_file:
+            cache_file.truncate(40)
+        module, loader = self.make_module()
+        self.assertEqual(module.numbers, [4, 5, 6, 7])
+        self.assertTrue(loader.is_loaded("mapping"))
+
+    def test_cache_shared_objects(self):
+        numbers = [1, 2, 3]
+        with open(self.source_path, "wb") as out:
+            pickle.dump([numbers, {"a": ("b", numbers)}, {"c": "d"}], out, 2)
+
+        def unpack(data):
+            return {"numbers": data[0], "mapping": data[1], "other": data[2]}
+
+        data.write_module_cache(self.source_path, self.cache_path, unpack)
+        module = types.ModuleType("draftsman.data.example")
+        sys.modules[module.__name__] = module
+        loader = data.LazyData(
+            module.__name__,
+            unpack,
+            ["numbers", "mapping", "other"],
+            location=self.location,
+        )
+
+        # Attributes that share objects are loaded together and still share
+        # them; unrelated attributes are still loaded individually
+        self.assertEqual(module.mapping, {"a": ("b", [1, 2, 3])})
+        self.assertTrue(loader.is_loaded("numbers"))
+        self.assertFalse(loader.is_loaded("other"))
+        self.assertIs(module.mapping["a"][1], module.numbers)
+        self.assertEqual(module.other, {"c": "d"})
+
@@ -9,6 +9,7 @@ from draftsman.error import *
 from draftsman.warning import *
 from draftsman.utils import AABB
 
+import subprocess
 import sys
 
 if sys.version_info >= (3, 3):  # pragma: no coverage
@@ -154,6 +155,33 @@ class EntityTesting(unittest.TestCase):
         belt = TransportBelt()
         self.assertEqual(belt.flippable, True)
 
+    def test_shared_collision_data(self):
+        # Entities of the same name share the same collision data
+        chest1 = Container("wooden-chest")
+        chest2 = Container("wooden-chest", tile_position=(5, 5))
+        self.assertIs(chest1.collision_set, chest2.collision_set)
+        self.assertIs(chest1.collision_mask, chest2.collision_mask)
+        self.assertIsNot(chest1.collision_set, Container("iron-chest").collision_set)
+
+        # Rotated collision sets are also shared
+        belt1 = TransportBelt(direction=Direction.EAST)
+        belt2 = TransportBelt()
+        self.assertIsNot(belt1.collision_set, belt2.collision_set)
+        belt2.direction = Direction.EAST
+        self.assertIs(belt1.collision_set, belt2.collision_set)
+        self.assertEqual(
+            belt1.collision_mask,
+            {"object-layer", "item-layer", "transport-belt-layer", "water-tile"},
+        )
+
+        # Entities that modify their collision set get their own copy
+        wagon1 = CargoWagon()
+        wagon2 = CargoWagon()
+        self.assertIsNot(wagon1.collision_set, wagon2.collision_set)
+        wagon1.orientation = 0.25
+        self.assertEqual(wagon1.collision_set.shapes[0].angle, 90.0)
+        self.assertEqual(wagon2.collision_set.shapes[0].angle, 0.0)
+
 
 # =============================================================================
 # Factory function new_entity()
@@ -343,5 +371,56 @@ class EntityFactoryTesting(unittest.TestCase):
             new_entity,
             "I have a lot of entities that I need to test...",
         )
+        self.assertRaises(InvalidEntityError, new_entity, {"unhashable": True})
+
+    def test_register_entity_class(self):
+        import draftsman.entity
+
+        class ModdedChest(Container):
+            def __init__(self, name="modded-chest", **kwargs):
+                Entity.__init__(self, name, ["modded-chest"], **kwargs)
+
+        self.assertIs(entity_classes["wooden-chest"], Container)
+        try:
+            register_entity_class(ModdedChest, ["modded-chest"])
+            self.assertIs(entity_classes["modded-chest"], ModdedChest)
+            # Registrations survive a reload
+            reload_entity_classes()
+            self.assertIs(entity_classes["modded-chest"], ModdedChest)
+        finally:
+            draftsman.entity._registered_classes.pop()
+            reload_entity_classes()
+        self.assertNotIn("modded-chest", entity_classes)
+
+    @unittest.skipIf(sys.version_info < (3, 7), "Requires module __getattr__")
+    def test_lazy_prototypes(self):
+        # Run in a fresh interpreter, since every prototype has already been
+        # imported by the star import above
+        code = "\n".join(
+            [
+                "import sys",
+                "import draftsman.entity",
+                "from draftsman.entity import Wall, entity_classes, new_entity",
+                "loaded = lambda name: 'draftsman.prototypes.' + name in sys.modules",
+                "assert loaded('wall') and not loaded('container')",
+                "assert not entity_classes.is_loaded('wooden-chest')",
+                "assert 'wooden-chest' in entity_classes",
+                "new_entity('wooden-chest')",
+                "assert loaded('container') and not loaded('inserter')",
+                "assert entity_classes.is_loaded('wooden-chest')",
+                "assert draftsman.entity.inserters is draftsman.data.entities.inserters",
+                "assert not loaded('inserter')",
+                "assert 'Inserter' in dir(draftsman.entity)",
+                "draftsman.entity.reload_entity_classes()",
+                "assert not loaded('inserter')",
+                "assert not entity_classes.is_loaded('wooden-chest')",
+            ]
+        )
+        subprocess.check_call([sys.executable, "-c", code])
+
+        import draftsman.entity
+
+        with self.assertRaises(AttributeError):
+            draftsman.entity.NotAPrototype
 
 # fmt: on
@@ -0,0 +1,71 @@
+# test_entityfilter.py
+# -*- encoding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+from draftsman.classes.entityfilter import EntityFilter
+from draftsman.classes.group import Group
+from draftsman.constants import Direction
+from draftsman.entity import Container, Inserter
+
+import sys
+
+if sys.version_info >= (3, 3):  # pragma: no coverage
+    import unittest
+else:  # pragma: no coverage
+    import unittest2 as unittest
+
+
+class EntityFilterTesting(unittest.TestCase):
+    def test_constructor(self):
+        test = EntityFilter()
+        self.assertEqual(test.names, None)
+        self.assertEqual(test.types, None)
+        self.assertEqual(test.directions, None)
+        self.assertEqual(test.invert, False)
+
+        test = EntityFilter(
+            name="wooden-chest",
+            type=["container", "inserter"],
+            direction=Direction.EAST,
+            invert=1,
+        )
+        self.assertEqual(test.names, {"wooden-chest"})
+        self.assertEqual(test.types, {"container", "inserter"})
+        self.assertEqual(test.directions, {Direction.EAST})
+        self.assertEqual(test.invert, True)
+
+    def test_call(self):
+        chest = Container("wooden-chest")
+        inserter = Inserter("fast-inserter", direction=Direction.EAST)
+        group = Group("test")
+
+        self.assertTrue(EntityFilter()(chest))
+        self.assertTrue(EntityFilter()(group))
+        self.assertFalse(EntityFilter(invert=True)(chest))
+
+        # Name
+        test = EntityFilter(name={"wooden-chest", "iron-chest"})
+        self.assertTrue(test(chest))
+        self.assertFalse(test(inserter))
+
+        # Type
+        test = EntityFilter(type="inserter")
+        self.assertFalse(test(chest))
+        self.assertTrue(test(inserter))
+
+        # Direction
+        test = EntityFilter(direction={Direction.NORTH, Direction.EAST})
+        self.assertFalse(test(chest))  # Has no direction
+        self.assertTrue(test(inserter))
+        self.assertFalse(EntityFilter(direction=Direction.NORTH)(inserter))
+
+        # Everything
+        test = EntityFilter(name="fast-inserter", type="inserter", direction=2)
+        self.assertFalse(test(chest))
+        self.assertTrue(test(inserter))
+
+        # Invert
+        test = EntityFilter(type="inserter", direction=Direction.EAST, invert=True)
+        self.assertTrue(test(chest))
+        self.assertFalse(test(inserter))
@@ -12,7 +12,10 @@ from draftsman.error import DuplicateIDError
 from draftsman.utils import encode_version
 from draftsman.warning import OverlappingObjectsWarning, HiddenEntityWarning
 
+import copy
+import pickle
 import sys
+import warnings
 
 if sys.version_info >= (3, 3):  # pragma: no coverage
     import unittest
@@ -69,6 +72,74 @@ class EntityListTesting(unittest.TestCase):
         with self.assertRaises(ValueError):
             blueprint.entities.append(Container(), copy=False, merge=True)
 
+    def test_extend_from_dicts(self):
+        blueprint = Blueprint()
+        test = blueprint.entities
+        example = Container("steel-chest", tile_position=(2, 0))
+        entity_dict = {"name": "wooden-chest", "id": "a"}
+        test.extend_from_dicts(
+            [
+                entity_dict,
+                {"name": "transport-belt", "position": {"x": 1.5, "y": 0.5}},
+                example,
+            ]
+        )
+        self.assertEqual(
+            [entity.name for entity in test],
+            ["wooden-chest", "transport-belt", "steel-chest"],
+        )
+        self.assertEqual(entity_dict, {"name": "wooden-chest", "id": "a"})
+        self.assertIsNot(test[2], example)
+        self.assertIs(test["a"], test[0])
+        self.assertEqual(test.key_to_idx, {"a": 0})
+        self.assertEqual(test.idx_to_key, {0: "a"})
+        for entity in test:
+            self.assertIs(entity.parent, blueprint)
+        self.assertEqual(len(blueprint.entity_map.get_in_area(blueprint.area)), 3)
+        self.assertEqual((blueprint.tile_width, blueprint.tile_height), (3, 1))
+
+        # Overlapping warnings are issued against existing and earlier entities
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            test.extend_from_dicts(
+                [
+                    {"name": "iron-chest", "tile_position": (0, 0)},
+                    {"name": "iron-chest", "tile_position": (5, 5)},
+                    {"name": "iron-chest", "tile_position": (5, 5)},
+                ]
+            )
+        self.assertEqual(len(w), 2)
+        for warning in w:
+            self.assertIs(warning.category, OverlappingObjectsWarning)
+
+        # Entities within the same Group are not checked against each other
+        group = Group("test")
+        group.entities.extend_from_dicts([{"name": "wooden-chest"}] * 2)
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            Blueprint().entities.extend_from_dicts([group], copy=False)
+        self.assertEqual(len(w), 0)
+
+        # Merging
+        test.extend_from_dicts(
+            [{"name": "iron-chest", "tile_position": (5, 5)}], merge=True
+        )
+        self.assertEqual(len(test), 6)
+
+        # Errors
+        with self.assertRaises(DuplicateIDError):
+            test.extend_from_dicts([{"name": "wooden-chest", "id": "a"}])
+        with self.assertRaises(DuplicateIDError):
+            test.extend_from_dicts(
+                [
+                    {"name": "wooden-chest", "id": "b", "tile_position": (10, 0)},
+                    {"name": "wooden-chest", "id": "b", "tile_position": (11, 0)},
+                ]
+            )
+        with self.assertRaises(TypeError):
+            test.extend_from_dicts(["incorrect"])
+        self.assertEqual(len(test), 6)
+
     def test_remove(self):
         pass  # TODO
 
@@ -253,6 +324,76 @@ class EntityListTesting(unittest.TestCase):
         self.assertEqual(blueprint.entities.key_to_idx, {})
         self.assertEqual(blueprint.entities.idx_to_key, {})
 
+        # Test keys after the deleted entities
+        for i in range(5):
+            blueprint.entities.insert(
+                0, "wooden-chest", tile_position=(i, 0), id=str(i)
+            )
+        del blueprint.entities[-1]
+        del blueprint.entities["2"]
+        del blueprint.entities[::2]
+        self.assertEqual(blueprint.entities.key_to_idx, {"3": 0})
+        self.assertEqual(blueprint.entities.get_pair("3"), (0, "3"))
+        self.assertEqual(blueprint.entities.get_pair(0), (0, "3"))
+        blueprint.entities[0].id = None
+        self.assertEqual(blueprint.entities.get_pair(0), (0, None))
+        self.assertEqual(blueprint.entities.key_map, {})
+        with self.assertRaises(IndexError):
+            blueprint.entities.set_key("outside", Container())
+
+    def test_find_leaves(self):
+        blueprint = Blueprint()
+        blueprint.entities.append("wooden-chest")
+        blueprint.entities.append("small-lamp", tile_position=(1, 0))
+        group = Group("group", position=(5, 5))
+        group.entities.append("wooden-chest")
+        group.entities.append("steel-chest", tile_position=(1, 0))
+        blueprint.entities.append(group)
+        blueprint.entities.append("steel-chest", tile_position=(2, 0))
+
+        chest, lamp, _, steel_chest = blueprint.entities
+        grouped_chest, grouped_steel_chest = blueprint.entities["group"].entities
+
+        # Entities are found in the same order as flatten_entities()
+        self.assertEqual(
+            blueprint.entities.find_leaves(),
+            [chest, lamp, grouped_chest, grouped_steel_chest, steel_chest],
+        )
+        self.assertEqual(
+            blueprint.entities.find_leaves(names={"steel-chest", "wooden-chest"}),
+            [chest, grouped_chest, grouped_steel_chest, steel_chest],
+        )
+        self.assertEqual(
+            blueprint.entities.find_leaves(types={"lamp"}),
+            [lamp],
+        )
+        self.assertEqual(
+            blueprint.entities.find_leaves(names={"small-lamp"}, types={"container"}),
+            [],
+        )
+        self.assertEqual(blueprint.entities.find_leaves(names={"group"}), [])
+
+        # The index is updated when the list (or a subgroup) changes
+        del blueprint.entities[0]
+        blueprint.entities["group"].entities.append("small-lamp", tile_position=(2, 0))
+        new_lamp = blueprint.entities[("group", 2)]
+        self.assertEqual(
+            blueprint.entities.find_leaves(types={"lamp"}),
+            [lamp, new_lamp],
+        )
+        blueprint.entities[0] = new_entity("iron-chest")
+        self.assertEqual(
+            blueprint.entities.find_leaves(names={"iron-chest", "small-lamp"}),
+            [blueprint.entities[0], new_lamp],
+        )
+        blueprint_copy = pickle.loads(pickle.dumps(blueprint))
+        self.assertEqual(
+            blueprint_copy.entities.find_leaves(names={"iron-chest"}),
+            [blueprint_copy.entities[0]],
+        )
+        blueprint.entities.clear()
+        self.assertEqual(blueprint.entities.find_leaves(), [])
+
     def test_contains(self):
         blueprint = Blueprint()
 
@@ -273,3 +414,75 @@ class EntityListTesting(unittest.TestCase):
         self.assertIn(entityB, blueprint.entities)
         self.assertNotIn(entityC, group.entities)
         self.assertIn(entityC, blueprint.entities)
+        self.assertNotIn(Container("wooden-chest"), blueprint.entities)
+        self.assertNotIn("wooden-chest", blueprint.entities)
+
+        # Nested groups
+        outer = Group("outer")
+        outer.entities.append(group, copy=False)
+        blueprint.entities[0] = outer
+        self.assertNotIn(group, blueprint.entities.data)
+        self.assertIn(group, blueprint.entities)
+        self.assertIn(entityA, blueprint.entities)
+        self.assertIn(entityA, outer.entities)
+
+        # Removed entities
+        group.entities.remove(entityB)
+        self.assertNotIn(entityB, group.entities)
+        self.assertNotIn(entityB, blueprint.entities)
+        del blueprint.entities[:]
+        self.assertNotIn(entityA, blueprint.entities)
+        self.assertNotIn(entityC, blueprint.entities)
+        self.assertIn(entityA, outer.entities)
+
+        # Copies
+        blueprint.entities.append(outer)
+        copied = copy.deepcopy(blueprint)
+        copied_entity = copied.entities[("outer", 0, 0)]
+        self.assertIn(copied_entity, copied.entities)
+        self.assertNotIn(copied_entity, blueprint.entities)
+        self.assertNotIn(entityA, copied.entities)
+        unpickled = pickle.loads(pickle.dumps(blueprint))
+        self.assertIn(unpickled.entities[("outer", 0, 0)], unpickled.entities)
+
+    def test_get_pair(self):
+        blueprint = Blueprint()
+        test = blueprint.entities
+
+        def check():
+            for idx, entitylike in enumerate(test.data):
+                self.assertEqual(test.get_pair(entitylike.id), (idx, entitylike.id))
+            self.assertEqual(
+                test.key_to_idx, {e.id: idx for idx, e in enumerate(test.data)}
+            )
+            self.assertEqual(
+                test.idx_to_key, {idx: e.id for idx, e in enumerate(test.data)}
+            )
+
+        for i in range(4):
+            test.append("wooden-chest", tile_position=(i, 0), id=str(i))
+        check()
+
+        # Appending and replacing keep the existing index
+        indices = test._indices
+        test.append("wooden-chest", tile_position=(4, 0), id="4")
+        test.extend_from_dicts(
+            [{"name": "wooden-chest", "tile_position": (5, 0), "id": "5"}]
+        )
+        test[2] = Container("wooden-chest", tile_position=(2, 0), id="replaced")
+        self.assertIs(test._indices, indices)
+        check()
+
+        # Shifting the list rebuilds it
+        test.insert(0, "wooden-chest", tile_position=(6, 0), id="6")
+        check()
+        del test[1]
+        check()
+        del test["replaced"]
+        check()
+        del test[1:3]
+        check()
+        test.clear()
+        check()
+        with self.assertRaises(KeyError):
+            test.get_pair("0")
@@ -0,0 +1,69 @@
+# test_extents.py
+# -*- encoding: utf-8 -*-
+
+from draftsman.classes.extents import Extents
+from draftsman.utils import AABB
+
+import random
+import sys
+
+if sys.version_info >= (3, 3):  # pragma: no coverage
+    import unittest
+else:  # pragma: no coverage
+    import unittest2 as unittest
+
+
+class ExtentsTesting(unittest.TestCase):
+    def test_add_remove(self):
+        extents = Extents()
+        self.assertEqual(extents.get_bounding_box(), None)
+
+        extents.add("a", AABB(0, 0, 1, 1))
+        extents.add("b", AABB(-1, 2, 0, 3))
+        extents.add("c", AABB(0, 0, 1, 1, [5, 0]))
+        extents.add("d", None)
+        self.assertEqual(len(extents), 3)
+        self.assertIn("a", extents)
+        self.assertNotIn("d", extents)
+        self.assertEqual(extents.get_bounding_box(), AABB(-1, 0, 6, 3))
+
+        extents.remove("c")
+        self.assertEqual(extents.get_bounding_box(), AABB(-1, 0, 1, 3))
+        # Removing a missing key does nothing
+        extents.remove("c")
+        # Replacing
+        extents.add("b", AABB(0, 0, 0.5, 0.5))
+        self.assertEqual(len(extents), 2)
+        self.assertEqual(extents.get_bounding_box(), AABB(0, 0, 1, 1))
+
+        extents.clear()
+        self.assertEqual(len(extents), 0)
+        self.assertEqual(extents.get_bounding_box(), None)
+        extents.add("a", AABB(0, 0, 1, 1))
+        self.assertEqual(extents.get_bounding_box(), AABB(0, 0, 1, 1))
+
+    def test_random(self):
+        rng = random.Random(0)
+        extents = Extents()
+        boxes = {}
+        for i in range(2000):
+            if boxes and rng.random() < 0.45:
+                key = rng.choice(list(boxes))
+                del boxes[key]
+                extents.remove(key)
+            else:
+                x = rng.randint(-20, 20)
+                y = rng.randint(-20, 20)
+                boxes[i] = AABB(x, y, x + rng.randint(0, 3), y + rng.randint(0, 3))
+                extents.add(i, boxes[i])
+
+            if boxes:
+                expected = AABB(
+                    min(box.top_left[0] for box in boxes.values()),
+                    min(box.top_left[1] for box in boxes.values()),
+                    max(box.bot_right[0] for box in boxes.values()),
+                    max(box.bot_right[1] for box in boxes.values()),
+                )
+            else:
+                expected = None
+            self.assertEqual(extents.get_bounding_box(), expected)
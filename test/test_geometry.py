@@ -0,0 +1,117 @@
+# test_geometry.py
+# -*- encoding: utf-8 -*-
+
+from draftsman import geometry, utils
+
+import math
+import random
+import sys
+
+if sys.version_info >= (3, 3):  # pragma: no coverage
+    import unittest
+else:  # pragma: no coverage
+    import unittest2 as unittest
+
+
+def random_boxes(count, rng):
+    boxes = []
+    for _ in range(count):
+        x = rng.randint(-50, 50) + rng.choice([0, 0.5])
+        y = rng.randint(-50, 50) + rng.choice([0, 0.5])
+        boxes.append([x, y, x + rng.randint(0, 4), y + rng.randint(1, 4)])
+    return boxes
+
+
+class GeometryTesting(unittest.TestCase):
+    def tearDown(self):
+        geometry.set_numpy_enabled(True)
+
+    def compare_backends(self, function, *args):
+        # NumPy is only used past the threshold, so inputs are sized past it
+        geometry.set_numpy_enabled(False)
+        expected = function(*args)
+        geometry.set_numpy_enabled(True)
+        self.assertEqual(function(*args), expected)
+        return expected
+
+    def test_transformations(self):
+        rng = random.Random(0)
+        points = [
+            [rng.randint(-10, 10) + 0.5, rng.randint(-10, 10)] for _ in range(200)
+        ]
+
+        result = self.compare_backends(geometry.translate_points, points, 3, -1.5)
+        self.assertEqual(result[0], [points[0][0] + 3, points[0][1] - 1.5])
+
+        for angle in (0, 2, 4, 6, -2):
+            result = self.compare_backends(geometry.rotate_points, points, angle)
+            expected = utils.rotate_vector(points[0], math.radians(angle % 8 * 45))
+            self.assertAlmostEqual(result[0][0], expected[0])
+            self.assertAlmostEqual(result[0][1], expected[1])
+        result = self.compare_backends(geometry.rotate_points, points, 2, (0.5, 0.5))
+        self.assertEqual(result[0], [-points[0][1] - 1, points[0][0]])
+        with self.assertRaises(ValueError):
+            geometry.rotate_points(points, 1)
+
+        result = self.compare_backends(geometry.flip_points, points, "horizontal")
+        self.assertEqual(result[0], [-points[0][0], points[0][1]])
+        result = self.compare_backends(
+            geometry.flip_points, points, "vertical", (0.5, 0.5)
+        )
+        self.assertEqual(result[0], [points[0][0], -points[0][1] - 1])
+        with self.assertRaises(ValueError):
+            geometry.flip_points(points, "incorrect")
+
+    def test_bounding_box(self):
+        self.assertIs(geometry.bounding_box([]), None)
+
+        boxes = random_boxes(200, random.Random(1))
+        expected = None
+        for box in boxes:
+            expected = utils.extend_aabb(expected, utils.AABB(*box))
+        inputs = [boxes]
+        if geometry.is_numpy_enabled():
+            inputs.append(geometry.np.array(boxes))
+        for value in inputs:
+            result = geometry.bounding_box(value)
+            self.assertEqual(result.top_left, expected.top_left)
+            self.assertEqual(result.bot_right, expected.bot_right)
+
+    def test_points_in_circle(self):
+        rng = random.Random(2)
+        points = [[rng.uniform(-5, 5), rng.uniform(-5, 5)] for _ in range(200)]
+        result = self.compare_backends(geometry.points_in_circle, points, 3, (1, 1))
+        self.assertEqual(result, [utils.point_in_circle(p, 3, (1, 1)) for p in points])
+
+    def test_overlapping_pairs(self):
+        rng = random.Random(3)
+        boxes = random_boxes(300, rng)
+        others = random_boxes(100, rng)
+        aabbs = [utils.AABB(*box) for box in boxes]
+        other_aabbs = [utils.AABB(*box) for box in others]
+
+        expected = [
+            (i, j)
+            for i in range(len(boxes))
+            for j in range(i + 1, len(boxes))
+            if utils.aabb_overlaps_aabb(aabbs[i], aabbs[j])
+        ]
+        self.assertNotEqual(expected, [])
+        self.assertEqual(
+            self.compare_backends(geometry.overlapping_pairs, boxes), expected
+        )
+
+        expected = [
+            (i, j)
+            for i in range(len(boxes))
+            for j in range(len(others))
+            if utils.aabb_overlaps_aabb(aabbs[i], other_aabbs[j])
+        ]
+        self.assertEqual(
+            self.compare_backends(geometry.overlapping_pairs, boxes, others),
+            expected,
+        )
+
+        # Touching boxes don't overlap
+        self.assertEqual(geometry.overlapping_pairs([[0, 0, 1, 1], [1, 0, 2, 1]]), [])
+        self.assertEqual(geometry.overlapping_pairs([], others), [])
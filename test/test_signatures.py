@@ -0,0 +1,130 @@
+# test_signatures.py
+# -*- encoding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+from draftsman import signatures
+
+from schema import Schema, SchemaError, Optional, Or, And, Use
+import sys
+import threading
+
+if sys.version_info >= (3, 3):  # pragma: no coverage
+    import unittest
+else:  # pragma: no coverage
+    import unittest2 as unittest
+
+
+class CompiledSchemaTesting(unittest.TestCase):
+    def test_compiled(self):
+        self.assertIsInstance(signatures.SIGNAL_ID, signatures.CompiledSchema)
+        self.assertIsInstance(signatures.SIGNAL_ID.schema, Schema)
+
+        # Same normalization as the original schema
+        samples = [
+            (signatures.INTEGER, 10),
+            (signatures.STRING_OR_NONE, None),
+            (signatures.COLOR, (255, 0, 0)),
+            (signatures.COMPARATOR, "<="),
+            (signatures.OPERATION, "xor"),
+            (signatures.SIGNAL_FILTERS, [("signal-A", 100)]),
+            (signatures.ICONS, ["signal-A", "signal-B"]),
+            (signatures.AABB, [[0, 0], [1, 1]]),
+            (
+                signatures.DECIDER_COMBINATOR_CONTROL_BEHAVIOR,
+                {
+                    "decider_conditions": {
+                        "first_signal": "signal-A",
+                        "comparator": "!=",
+                        "constant": 10,
+                    },
+                },
+            ),
+            (
+                signatures.LAMP_CONTROL_BEHAVIOR,
+                {"circuit_condition": {"constant": 1}, "use_colors": True},
+            ),
+        ]
+        for compiled, data in samples:
+            expected = compiled.schema.validate(data)
+            result = compiled.validate(data)
+            self.assertEqual(result, expected)
+            self.assertEqual(type(result), type(expected))
+            if isinstance(expected, dict):
+                self.assertEqual(list(result), list(expected))
+
+        # Same errors as the original schema
+        samples = [
+            (signatures.INTEGER, True),
+            (signatures.STRING, 10),
+            (signatures.COLOR, {"r": 256, "g": 0, "b": 0}),
+            (signatures.SIGNAL_ID, "incorrect"),
+            (signatures.CONDITION, {"unknown": 10}),
+            (signatures.SIGNAL_FILTER, {"index": 1, "count": 1}),
+            (signatures.SCHEDULES, [{"schedule": [{"station": 10}]}]),
+        ]
+        for compiled, data in samples:
+            with self.assertRaises(SchemaError) as expected:
+                compiled.schema.validate(data)
+            with self.assertRaises(SchemaError) as result:
+                compiled.validate(data)
+            self.assertEqual(str(result.exception), str(expected.exception))
+            self.assertFalse(compiled.is_valid(data))
+
+    def test_compile_custom(self):
+        compiled = signatures.CompiledSchema(
+            Schema(
+                {
+                    "a": And(Use(int), lambda x: x > 0),
+                    Optional("b"): Or("x", "y", None),
+                    Optional("c"): [{"d": float}],
+                }
+            )
+        )
+        self.assertEqual(
+            compiled.validate({"a": "10", "c": [{"d": 1.0}]}),
+            {"a": 10, "c": [{"d": 1.0}]},
+        )
+        self.assertTrue(compiled.is_valid({"a": 1, "b": "x"}))
+        self.assertFalse(compiled.is_valid({"a": -1}))
+        self.assertFalse(compiled.is_valid({"b": "x"}))
+        self.assertFalse(compiled.is_valid({"a": 1, "b": "z"}))
+        self.assertFalse(compiled.is_valid({"a": 1, "e": None}))
+        self.assertFalse(compiled.is_valid([]))
+
+        self.assertEqual(repr(compiled), "CompiledSchema({!r})".format(compiled.schema))
+
+    def test_validation_enabled(self):
+        self.assertTrue(signatures.is_validation_enabled())
+        with signatures.validation_disabled():
+            self.assertFalse(signatures.is_validation_enabled())
+            # Data is returned as-is, without normalization
+            self.assertEqual(signatures.SIGNAL_ID.validate("signal-A"), "signal-A")
+            self.assertEqual(signatures.INTEGER.validate("incorrect"), "incorrect")
+        self.assertTrue(signatures.is_validation_enabled())
+        self.assertEqual(
+            signatures.SIGNAL_ID.validate("signal-A"),
+            {"name": "signal-A", "type": "virtual"},
+        )
+
+        try:
+            signatures.set_validation_enabled(False)
+            self.assertFalse(signatures.is_validation_enabled())
+        finally:
+            signatures.set_validation_enabled(True)
+        with self.assertRaises(SchemaError):
+            signatures.INTEGER.validate("incorrect")
+
+        # The setting is separate for each thread
+        results = []
+
+        def validate():
+            results.append(signatures.is_validation_enabled())
+            results.append(signatures.SIGNAL_ID.validate("signal-A"))
+
+        with signatures.validation_disabled():
+            thread = threading.Thread(target=validate)
+            thread.start()
+            thread.join()
+            self.assertFalse(signatures.is_validation_enabled())
+        self.assertEqual(results, [True, {"name": "signal-A", "type": "virtual"}])
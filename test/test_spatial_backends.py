@@ -0,0 +1,427 @@
+# test_spatial_backends.py
+# -*- encoding: utf-8 -*-
+
+from draftsman.classes.blueprint import Blueprint
+from draftsman.classes.group import Group
+from draftsman.classes.spatial_backends import (
+    SPATIAL_BACKENDS,
+    new_spatial_data_structure,
+    choose_spatial_data_structure,
+)
+from draftsman.classes import spatial_grid
+from draftsman.classes.spatial_grid import SpatialGrid
+from draftsman.classes.spatial_hashmap import SpatialHashMap
+from draftsman.classes.spatial_rtree import SpatialRTree
+from draftsman.entity import AssemblingMachine, Container, StraightRail
+from draftsman.tile import Tile
+from draftsman.warning import OverlappingObjectsWarning
+from draftsman import utils
+
+import copy
+import pickle
+import random
+import sys
+
+if sys.version_info >= (3, 3):  # pragma: no coverage
+    import unittest
+else:  # pragma: no coverage
+    import unittest2 as unittest
+
+
+def random_items(count, spread, seed):
+    # Tiles compare equal if they have the same position, so each item gets
+    # a different one
+    rng = random.Random(seed)
+    positions = [(x, y) for x in range(-spread, spread) for y in range(-spread, spread)]
+    items = []
+    for i, position in enumerate(rng.sample(positions, count)):
+        if i % 3 == 0:
+            items.append(AssemblingMachine(tile_position=position))
+        else:
+            items.append(Tile("landfill", position))
+    return items
+
+
+def ids(items):
+    # SpatialHashMap.get_all_entities() returns items spanning multiple cells
+    # more than once
+    return sorted(set(id(item) for item in items))
+
+
+class SpatialBackendsTesting(unittest.TestCase):
+    def check_matches_hashmap(self, structure):
+        # Every backend should find the same items as a SpatialHashMap, though
+        # not necessarily in the same order
+        expected = SpatialHashMap()
+        items = random_items(500, 40, 0)
+        for item in items:
+            expected.add(item)
+            structure.add(item)
+        for item in items[::4]:
+            expected.remove(item)
+            structure.remove(item)
+
+        self.assertEqual(
+            ids(structure.get_all_entities()), ids(expected.get_all_entities())
+        )
+
+        rng = random.Random(1)
+        for _ in range(100):
+            x, y = rng.uniform(-45, 45), rng.uniform(-45, 45)
+            w, h = rng.uniform(0, 20), rng.uniform(0, 20)
+            area = utils.AABB(x, y, x + w, y + h)
+            self.assertEqual(
+                ids(structure.get_in_area(area)), ids(expected.get_in_area(area))
+            )
+            self.assertEqual(
+                ids(structure.get_on_point((x, y))),
+                ids(expected.get_on_point((x, y))),
+            )
+            self.assertEqual(
+                ids(structure.get_in_radius(w, (x, y))),
+                ids(expected.get_in_radius(w, (x, y))),
+            )
+
+            # Limits
+            found = structure.get_in_area(area, limit=2)
+            self.assertEqual(len(found), min(2, len(expected.get_in_area(area))))
+            for item in found:
+                self.assertIn(item, expected.get_in_area(area))
+            self.assertEqual(structure.get_in_area(area, limit=0), [])
+
+        # Batches
+        areas = [
+            utils.AABB(x, y, x + 10, y + 10) for x in range(-40, 40, 10) for y in (0, 5)
+        ]
+        points = [(area.top_left[0] + 0.5, area.top_left[1] + 0.5) for area in areas]
+        self.assertEqual(
+            [ids(found) for found in structure.get_in_areas(areas)],
+            [ids(found) for found in expected.get_in_areas(areas)],
+        )
+        self.assertEqual(
+            [ids(found) for found in structure.get_on_points(points)],
+            [ids(found) for found in expected.get_on_points(points)],
+        )
+        self.assertEqual(
+            [ids(found) for found in structure.get_in_radii([5] * len(points), points)],
+            [ids(found) for found in expected.get_in_radii([5] * len(points), points)],
+        )
+
+        # Rebuild
+        structure.rebuild(items[::2])
+        expected.rebuild(items[::2])
+        self.assertEqual(
+            ids(structure.get_all_entities()), ids(expected.get_all_entities())
+        )
+        area = utils.AABB(-10, -10, 10, 10)
+        self.assertEqual(
+            ids(structure.get_in_area(area)), ids(expected.get_in_area(area))
+        )
+
+        # Items added after a rebuild
+        tile = Tile("landfill", (100, 100))
+        structure.add(tile)
+        self.assertEqual(structure.get_on_point((100.5, 100.5)), [tile])
+        structure.remove(tile)
+        self.assertEqual(structure.get_on_point((100.5, 100.5)), [])
+
+        # Clear
+        structure.clear()
+        self.assertEqual(structure.get_all_entities(), [])
+        self.assertEqual(structure.get_in_area(area), [])
+        self.assertEqual(structure.get_on_point((0, 0)), [])
+        self.assertEqual(structure.get_in_radius(10, (0, 0)), [])
+        structure.remove(tile)
+
+    def test_grid(self):
+        self.check_matches_hashmap(SpatialGrid())
+        self.check_matches_hashmap(SpatialGrid(cell_size=1))
+        self.check_matches_hashmap(SpatialGrid(cell_size=16))
+
+        # Growing keeps the contents of every cell
+        grid = SpatialGrid()
+        first = Tile("landfill", (0, 0))
+        grid.add(first)
+        self.assertEqual((grid._width, grid._height), (1, 1))
+        second = Tile("landfill", (-21, 33))
+        grid.add(second)
+        self.assertEqual(grid.get_on_point((0.5, 0.5)), [first])
+        self.assertEqual(grid.get_on_point((-20.5, 33.5)), [second])
+        self.assertEqual(
+            grid.get_in_area(utils.AABB(-100, -100, 100, 100)), [first, second]
+        )
+
+        # Cells beyond the limit are stored outside of the grid
+        limits = spatial_grid.GRID_MINIMUM_CELLS, spatial_grid.GRID_CELLS_PER_ITEM
+        try:
+            spatial_grid.GRID_MINIMUM_CELLS = 16
+            spatial_grid.GRID_CELLS_PER_ITEM = 1
+            self.check_matches_hashmap(SpatialGrid(cell_size=1))
+            self.check_matches_hashmap(SpatialGrid(cell_size=4))
+        finally:
+            spatial_grid.GRID_MINIMUM_CELLS, spatial_grid.GRID_CELLS_PER_ITEM = limits
+
+    def test_grid_far_away_items(self):
+        blueprint = Blueprint(spatial_backend="auto")
+        blueprint.tiles = [
+            Tile("landfill", (x, y)) for x in range(20) for y in range(20)
+        ]
+        grid = blueprint.tile_map
+        self.assertIsInstance(grid, SpatialGrid)
+        self.assertEqual(grid.cell_size, 1)
+
+        blueprint.tiles.append("landfill", position=(5000, 5000))
+        far_tile = blueprint.tiles[-1]
+        self.assertLessEqual(
+            len(grid.cells),
+            max(
+                spatial_grid.GRID_MINIMUM_CELLS, spatial_grid.GRID_CELLS_PER_ITEM * 401
+            ),
+        )
+        self.assertEqual(len(grid._outside), 1)
+        self.assertEqual(grid.get_on_point((5000.5, 5000.5)), [far_tile])
+        self.assertEqual(
+            len(blueprint.find_tiles_filtered(area=[4990, 4990, 5010, 5010])), 1
+        )
+        self.assertEqual(len(grid.get_in_area(utils.AABB(-10, -10, 6000, 6000))), 401)
+        self.assertEqual(len(grid.get_all_entities()), 401)
+
+        # Tiles near the grid still grow it
+        blueprint.tiles.append("landfill", position=(25, 25))
+        near_tile = blueprint.tiles[-1]
+        self.assertEqual(len(grid._outside), 1)
+        self.assertEqual(grid.get_on_point((25.5, 25.5)), [near_tile])
+
+        blueprint.tiles.remove(far_tile)
+        self.assertEqual(grid._outside, {})
+        self.assertEqual(grid.get_on_point((5000.5, 5000.5)), [])
+
+    def test_rtree(self):
+        self.check_matches_hashmap(SpatialRTree())
+        self.check_matches_hashmap(SpatialRTree(max_entries=4))
+
+        # Items are found by identity, even if they've moved since being added
+        rtree = SpatialRTree(max_entries=4)
+        tiles = [Tile("landfill", (i, i)) for i in range(20)]
+        for tile in tiles:
+            rtree.add(tile)
+        tiles[5].position = (100, 100)
+        rtree.remove(tiles[5])
+        self.assertEqual(len(rtree.get_all_entities()), 19)
+        self.assertNotIn(tiles[5], rtree.get_all_entities())
+
+        # Node boxes shrink to fit the remaining items
+        rtree = SpatialRTree(max_entries=4)
+        tiles = [Tile("landfill", (i, i)) for i in range(20)]
+        for tile in tiles:
+            rtree.add(tile)
+        for tile in tiles[10:]:
+            rtree.remove(tile)
+        self.assertEqual(rtree._root.box, [0, 0, 10, 10])
+        stack = [rtree._root]
+        while stack:
+            node = stack.pop()
+            if not node.leaf:
+                stack.extend(node.children)
+            box = node.box
+            node.update_box()
+            self.assertEqual(box, node.box)
+        self.assertEqual(rtree.get_in_area(utils.AABB(10, 10, 20, 20)), [])
+
+        # Removing every item
+        for tile in tiles:
+            rtree.remove(tile)
+        self.assertEqual(rtree.get_all_entities(), [])
+        rtree.add(tiles[0])
+        self.assertEqual(rtree.get_all_entities(), [tiles[0]])
+
+    def test_new_spatial_data_structure(self):
+        for name, structure_type in SPATIAL_BACKENDS.items():
+            self.assertIsInstance(new_spatial_data_structure(name), structure_type)
+        self.assertIsInstance(new_spatial_data_structure(), SpatialHashMap)
+
+        structure = new_spatial_data_structure(lambda: SpatialGrid(cell_size=4))
+        self.assertIsInstance(structure, SpatialGrid)
+        self.assertEqual(structure.cell_size, 4)
+
+        tiles = [Tile("landfill", (i, 0)) for i in range(10)]
+        structure = new_spatial_data_structure("rtree", tiles)
+        self.assertEqual(ids(structure.get_all_entities()), ids(tiles))
+
+        # Errors
+        with self.assertRaises(ValueError):
+            new_spatial_data_structure("incorrect")
+        with self.assertRaises(TypeError):
+            new_spatial_data_structure(None)
+        with self.assertRaises(TypeError):
+            new_spatial_data_structure(list)
+
+    def test_choose_spatial_data_structure(self):
+        # Too few items
+        tiles = [Tile("landfill", (i, 0)) for i in range(10)]
+        self.assertIsInstance(choose_spatial_data_structure(tiles), SpatialHashMap)
+        self.assertIsInstance(choose_spatial_data_structure([]), SpatialHashMap)
+
+        # Densely packed
+        tiles = [Tile("landfill", (x, y)) for x in range(32) for y in range(32)]
+        structure = choose_spatial_data_structure(tiles)
+        self.assertIsInstance(structure, SpatialGrid)
+        self.assertEqual(structure.cell_size, 1)
+        self.assertEqual(structure.get_all_entities(), [])
+
+        # Sparse
+        rails = [StraightRail(tile_position=(x * 2, (x % 7) * 200)) for x in range(500)]
+        self.assertIsInstance(choose_spatial_data_structure(rails), SpatialRTree)
+
+        # In between
+        chests = [
+            Container(tile_position=(x * 3, y * 3))
+            for x in range(20)
+            for y in range(20)
+        ]
+        structure = choose_spatial_data_structure(chests)
+        self.assertIsInstance(structure, SpatialHashMap)
+        self.assertEqual(structure.cell_size, 2)
+
+        # Groups are measured by their entities
+        group = Group(
+            "test",
+            entities=[
+                Container(tile_position=(x, y)) for x in range(16) for y in range(16)
+            ],
+        )
+        self.assertIsInstance(choose_spatial_data_structure([group]), SpatialGrid)
+
+    def test_blueprint(self):
+        for backend in ["hashmap", "grid", "rtree", "auto"]:
+            blueprint = Blueprint(spatial_backend=backend)
+            if backend != "auto":
+                self.assertIsInstance(blueprint.entity_map, SPATIAL_BACKENDS[backend])
+                self.assertIsInstance(blueprint.tile_map, SPATIAL_BACKENDS[backend])
+
+            blueprint.entities = [
+                Container(tile_position=(x, y)) for x in range(20) for y in range(20)
+            ]
+            blueprint.tiles = [
+                Tile("landfill", (x, y)) for x in range(20) for y in range(20)
+            ]
+            if backend == "auto":
+                self.assertIsInstance(blueprint.entity_map, SpatialGrid)
+                self.assertIsInstance(blueprint.tile_map, SpatialGrid)
+
+            with self.assertWarns(OverlappingObjectsWarning):
+                blueprint.entities.append("wooden-chest", tile_position=(5, 5))
+
+            found = blueprint.find_entities(utils.AABB(2, 2, 4, 4))
+            self.assertEqual(len(found), 4)
+            self.assertEqual(len(blueprint.find_tiles_filtered(area=[0, 0, 3, 3])), 9)
+
+            blueprint.translate(100, 0)
+            self.assertEqual(blueprint.find_entities(utils.AABB(2, 2, 4, 4)), [])
+            self.assertEqual(
+                len(blueprint.find_entities(utils.AABB(102, 2, 104, 4))), 4
+            )
+
+            blueprint_copy = copy.deepcopy(blueprint)
+            self.assertIsInstance(blueprint_copy.entity_map, type(blueprint.entity_map))
+            self.assertEqual(
+                len(blueprint_copy.find_entities(utils.AABB(102, 2, 104, 4))), 4
+            )
+            blueprint_copy = pickle.loads(pickle.dumps(blueprint))
+            self.assertEqual(
+                len(blueprint_copy.find_entities(utils.AABB(102, 2, 104, 4))), 4
+            )
+
+            # Loading a blueprint
+            blueprint = Blueprint(blueprint.to_string(), spatial_backend=backend)
+            self.assertEqual(
+                len(blueprint.find_entities(utils.AABB(102, 2, 104, 4))), 4
+            )
+            if backend == "auto":
+                self.assertIsInstance(blueprint.entity_map, SpatialGrid)
+
+        with self.assertRaises(ValueError):
+            Blueprint(spatial_backend="incorrect")
+
+    def test_find_entities_filtered_batch(self):
+        for backend in ["hashmap", "grid", "rtree", "auto"]:
+            blueprint = Blueprint(spatial_backend=backend)
+            blueprint.entities = [
+                Container(
+                    "wooden-chest" if (x + y) % 3 else "iron-chest",
+                    tile_position=(x, y),
+                )
+                for x in range(20)
+                for y in range(20)
+            ]
+            areas = [utils.AABB(x, y, x + 7, y + 5) for x in (0, 6, 13) for y in (1, 9)]
+            positions = [(x + 0.5, x * 0.75) for x in range(0, 20, 4)]
+
+            # Limited searches cut off the same entities as single searches,
+            # though they may be in a different order
+            for limit in (None, 0, 1, 3, 50):
+                found = blueprint.find_entities_filtered_batch(
+                    areas=areas, name="iron-chest", limit=limit
+                )
+                for area, result in zip(areas, found):
+                    self.assertEqual(
+                        ids(result),
+                        ids(
+                            blueprint.find_entities_filtered(
+                                area=area, name="iron-chest", limit=limit
+                            )
+                        ),
+                    )
+
+                found = blueprint.find_entities_filtered_batch(
+                    positions=positions, radius=4, type="container", limit=limit
+                )
+                for position, result in zip(positions, found):
+                    self.assertEqual(
+                        ids(result),
+                        ids(
+                            blueprint.find_entities_filtered(
+                                position=position,
+                                radius=4,
+                                type="container",
+                                limit=limit,
+                            )
+                        ),
+                    )
+
+    def test_group(self):
+        for backend in ["hashmap", "grid", "rtree", "auto"]:
+            group = Group(
+                "test",
+                entities=[
+                    Container(tile_position=(x, y))
+                    for x in range(16)
+                    for y in range(16)
+                ],
+                spatial_backend=backend,
+            )
+            if backend == "auto":
+                self.assertIsInstance(group.entity_map, SpatialGrid)
+            else:
+                self.assertIsInstance(group.entity_map, SPATIAL_BACKENDS[backend])
+
+            with self.assertWarns(OverlappingObjectsWarning):
+                group.entities.append("wooden-chest", tile_position=(5, 5))
+            self.assertEqual(len(group.find_entities(utils.AABB(2, 2, 4, 4))), 4)
+
+            # Groups inside of blueprints
+            group = Group(
+                "small",
+                entities=[
+                    Container(tile_position=(x, y)) for x in range(4) for y in range(4)
+                ],
+                spatial_backend=backend,
+            )
+            blueprint = Blueprint(spatial_backend=backend)
+            blueprint.entities.append(group)
+            self.assertEqual(len(blueprint.find_entities(utils.AABB(2, 2, 4, 4))), 4)
+            with self.assertWarns(OverlappingObjectsWarning):
+                blueprint.entities.append("wooden-chest", tile_position=(2, 2))
+
+        with self.assertRaises(ValueError):
+            Group(spatial_backend="incorrect")
@@ -2,6 +2,7 @@
 # -*- encoding: utf-8 -*-
 
 from draftsman.classes.blueprint import SpatialHashMap
+from draftsman.entity import AssemblingMachine
 from draftsman.tile import Tile
 from draftsman import utils
 
@@ -100,3 +101,74 @@ class SpatialHashMapTesting(unittest.TestCase):
         self.assertEqual(results, [tile_to_add, another_tile_to_add, other_tile_to_add])
         results = map.get_in_area(utils.AABB(-100, -100, 100, 100), limit=1)
         self.assertEqual(results, [tile_to_add])
+
+    def test_query_spanning_cells(self):
+        map = SpatialHashMap()
+        # 3x3 entity that spans 4 cells
+        machine = AssemblingMachine("assembling-machine-1", tile_position=(7, 7))
+        map.add(machine)
+        tile_to_add = Tile("landfill", (1, 1))
+        map.add(tile_to_add)
+        self.assertEqual(len(map.get_all_entities()), 5)
+
+        results = map.get_in_area(utils.AABB(-100, -100, 100, 100))
+        self.assertEqual(results, [machine, tile_to_add])
+        results = map.get_in_radius(100, (0, 0))
+        self.assertEqual(results, [machine, tile_to_add])
+
+        self.assertEqual(map.get_in_area(utils.AABB(-100, -100, 100, 100), limit=0), [])
+        self.assertEqual(map.get_in_radius(100, (0, 0), limit=0), [])
+
+    def test_rebuild(self):
+        map = SpatialHashMap()
+        tile_to_add = Tile("refined-concrete", (0, 0))
+        map.add(tile_to_add)
+        other_tile_to_add = Tile("landfill", (10, 0))
+
+        # Items are only added when the map is next used
+        map.rebuild([other_tile_to_add])
+        self.assertEqual(map.map, {})
+        self.assertEqual(map.get_on_point((10.5, 0.5)), [other_tile_to_add])
+        self.assertEqual(map.map, {(1, 0): [other_tile_to_add]})
+
+        map.rebuild([tile_to_add])
+        map.add(other_tile_to_add)
+        self.assertEqual(map.get_all_entities(), [tile_to_add, other_tile_to_add])
+
+        map.rebuild([tile_to_add])
+        map.clear()
+        self.assertEqual(map.get_all_entities(), [])
+
+    def test_batch_queries(self):
+        map = SpatialHashMap()
+        items = []
+        for x in range(-20, 20, 3):
+            for y in range(-20, 20, 3):
+                items.append(AssemblingMachine(tile_position=(x, y)))
+                items.append(Tile("landfill", (x + 2, y + 2)))
+        # Batch queries also add any items passed to `rebuild()`
+        map.rebuild(items)
+
+        # Every query finds the same items in the same order as on its own
+        areas = [
+            utils.AABB(x, y, x + size, y + size)
+            for x, y, size in [(0, 0, 5), (-30, -30, 60), (-7.5, 3, 0.5), (50, 50, 1)]
+        ]
+        points = [(0.5, 0.5), (2.5, 2.5), (-19.5, -19.5), (50, 50)]
+        radii = [1, 5, 10.5, 2]
+        for limit in [None, 0, 1, 3]:
+            self.assertEqual(
+                map.get_in_areas(areas, limit),
+                [map.get_in_area(area, limit) for area in areas],
+            )
+            self.assertEqual(
+                map.get_on_points(points, limit),
+                [map.get_on_point(point, limit) for point in points],
+            )
+            self.assertEqual(
+                map.get_in_radii(radii, points, limit),
+                [map.get_in_radius(r, p, limit) for r, p in zip(radii, points)],
+            )
+
+        self.assertEqual(map.get_in_areas([]), [])
+        self.assertEqual(map.get_in_areas([None]), [[]])
@@ -3,6 +3,9 @@
 
 from draftsman.tile import Tile
 from draftsman.error import InvalidTileError
+from draftsman.utils import AABB
+
+import draftsman.data.tiles as tiles
 
 import sys
 
@@ -53,6 +56,19 @@ class TileTesting(unittest.TestCase):
             tile.to_dict(), {"name": "landfill", "position": {"x": 123, "y": 123}}
         )
 
+    def test_collision(self):
+        tile = Tile("landfill", (10, 10))
+        # Every tile shares the same collision set
+        self.assertIs(tile.collision_set, Tile("concrete").collision_set)
+        self.assertEqual(tile.get_world_bounding_box(), AABB(10, 10, 11, 11))
+        self.assertEqual(tile.collision_set.shapes[0], AABB(0, 0, 1, 1))
+        # Collision masks follow the name of the tile
+        self.assertEqual(
+            tile.collision_mask, set(tiles.raw["landfill"]["collision_mask"])
+        )
+        tile.name = "water"
+        self.assertEqual(tile.collision_mask, set(tiles.raw["water"]["collision_mask"]))
+
     # def test_repr(self):
     #     tile = Tile("concrete", (0, 0))
     #     self.assertEqual(
@@ -4,9 +4,12 @@
 from collections import OrderedDict
 from draftsman import utils
 from draftsman.classes.vector import Vector
-from draftsman.error import InvalidSignalError
+from draftsman.error import InvalidSignalError, MalformedBlueprintStringError
 from draftsman.data import recipes, signals
 
+import base64
+import copy
+import json
 import sys
 
 if sys.version_info >= (3, 3):  # pragma: no coverage
@@ -15,6 +18,7 @@ else:  # pragma: no coverage
     import unittest2 as unittest
 
 import warnings
+import zlib
 
 
 class AABBTesting(unittest.TestCase):
@@ -109,11 +113,43 @@ class AABBTesting(unittest.TestCase):
         self.assertEqual(utils.AABB(0, 0, 1, 1), utils.AABB(0, 0, 1, 1))
         self.assertNotEqual(utils.AABB(0, 0, 1, 1), utils.AABB(1, 1, 2, 2))
 
+    def test_points(self):
+        aabb = utils.AABB(0, 1, 2, 3, [1, 1])
+        self.assertEqual(aabb.points, [[0, 1], [2, 1], [2, 3], [0, 3]])
+        self.assertEqual(aabb.get_points(), [[1, 2], [3, 2], [3, 4], [1, 4]])
+        # Points follow their corners
+        aabb.bot_right[0] = 4
+        self.assertEqual(aabb.points, [[0, 1], [4, 1], [4, 3], [0, 3]])
+        # Normals are shared
+        self.assertIs(aabb.normals, utils.AABB(5, 5, 6, 6).normals)
+        # No per-instance dict
+        with self.assertRaises(AttributeError):
+            aabb.something = 10
+
+    def test_copy(self):
+        aabb = utils.AABB(0, 1, 2, 3, [1, 1])
+        for duplicate in (copy.copy(aabb), copy.deepcopy(aabb)):
+            self.assertEqual(duplicate, aabb)
+            self.assertIsNot(duplicate.top_left, aabb.top_left)
+            self.assertIsNot(duplicate.position, aabb.position)
+
 
 class RectangleTesting(unittest.TestCase):
     def test_constructor(self):
-        # TODO
-        pass
+        rect = utils.Rectangle((4, 4), 2, 1, 0)
+        self.assertEqual(rect.position, [4, 4])
+        self.assertEqual(rect.points, [[-1, -0.5], [1, -0.5], [1, 0.5], [-1, 0.5]])
+        self.assertEqual(rect.get_points(), [[3, 3.5], [5, 3.5], [5, 4.5], [3, 4.5]])
+        self.assertEqual(rect.normals, ((0, -1), (1, 0), (0, 1), (-1, 0)))
+        # Normals are shared between rectangles of the same angle
+        self.assertIs(rect.normals, utils.Rectangle((0, 0), 5, 5, 0).normals)
+        # And follow the angle if it changes
+        rect.angle = 90
+        self.assertAlmostEqual(rect.normals[0][0], 1)
+        self.assertAlmostEqual(rect.normals[0][1], 0)
+        # Copies
+        self.assertEqual(copy.deepcopy(rect), rect)
+        self.assertIsNot(copy.copy(rect).position, rect.position)
 
     def test_overlaps(self):
         # TODO
@@ -171,6 +207,105 @@ class UtilsTesting(unittest.TestCase):
             },
         )
 
+    def test_decode_string_chunks(self):
+        string = "0eNqN0N0KwjAMBeB3yXU33E/d7KuISKdRCltW2mxsjL67ncIEvdDLHnK+lCzQtANaZ4hBLWAuPXlQxwW8uZNu14xni6BgNI6HmAgg3a3BayLZQRBg6IoTqCycBCCxYYMv5vmYzzR0Dbo4sLVv2nPCTpO3veOkwZYjbXsfuz2te6Mnd1UqBcygkqyuUxmC+CLzjfyt7X9qxabhZB16/8cf6w813sAwdtF431bAiM4/W3mdldUhr8qDLCtZhPAAeZl+cQ=="
+        text = "".join(utils.decode_string_chunks(string, chunk_size=10))
+        self.assertEqual(json.loads(text), utils.string_to_JSON(string))
+        self.assertEqual(
+            "".join(utils.decode_string_chunks(string)),
+            "".join(utils.decode_string_chunks(string, chunk_size=1)),
+        )
+
+        # Malformed strings
+        with self.assertRaises(MalformedBlueprintStringError):
+            list(utils.decode_string_chunks("0notbase64"))
+        with self.assertRaises(MalformedBlueprintStringError):
+            list(utils.decode_string_chunks(string[:-20]))
+        with self.assertRaises(MalformedBlueprintStringError):
+            list(utils.decode_string_chunks(string[:-1]))
+
+    def test_iter_JSON_array(self):
+        text = json.dumps(
+            {
+                "other": {"key": [1, 2, "}"]},
+                "blueprint": {
+                    "label": "test",
+                    "entities": [{"name": "wooden-chest"}, 12345678, "string"],
+                },
+            }
+        )
+        chunks = [text[i : i + 3] for i in range(0, len(text), 3)]
+        self.assertEqual(
+            list(utils.iter_JSON_array(chunks, ("blueprint", "entities"))),
+            [{"name": "wooden-chest"}, 12345678, "string"],
+        )
+        self.assertEqual(
+            list(utils.iter_JSON_array([text], ("other", "key"))), [1, 2, "}"]
+        )
+
+        # Numbers split after a character that can't be decoded on its own,
+        # such as "1." or "1e"
+        text = '{"a": [1.5e-3, 2, 1E+5, -7, true]}'
+        for i in range(len(text)):
+            self.assertEqual(
+                list(utils.iter_JSON_array([text[:i], text[i:]], ("a",))),
+                [1.5e-3, 2, 1e5, -7, True],
+            )
+
+        # Missing keys and empty arrays
+        self.assertEqual(list(utils.iter_JSON_array(chunks, ("missing",))), [])
+        self.assertEqual(list(utils.iter_JSON_array(["{}"], ("a", "b"))), [])
+        self.assertEqual(list(utils.iter_JSON_array(['{"a": [ ]}'], ("a",))), [])
+
+        # Malformed documents
+        with self.assertRaises(MalformedBlueprintStringError):
+            list(utils.iter_JSON_array(['{"a": [1, 2'], ("a",)))
+        with self.assertRaises(MalformedBlueprintStringError):
+            list(utils.iter_JSON_array(['{"a": [1 2]}'], ("a",)))
+        with self.assertRaises(MalformedBlueprintStringError):
+            list(utils.iter_JSON_array(['{"a": 1}'], ("a",)))
+
+    def test_stream_string_to_JSON(self):
+        string = "0eNqN0N0KwjAMBeB3yXU33E/d7KuISKdRCltW2mxsjL67ncIEvdDLHnK+lCzQtANaZ4hBLWAuPXlQxwW8uZNu14xni6BgNI6HmAgg3a3BayLZQRBg6IoTqCycBCCxYYMv5vmYzzR0Dbo4sLVv2nPCTpO3veOkwZYjbXsfuz2te6Mnd1UqBcygkqyuUxmC+CLzjfyt7X9qxabhZB16/8cf6w813sAwdtF431bAiM4/W3mdldUhr8qDLCtZhPAAeZl+cQ=="
+        self.assertEqual(
+            utils.stream_string_to_JSON(string), utils.string_to_JSON(string)
+        )
+
+        # Blueprint books, including nested books, empty containers, and
+        # whitespace between tokens
+        book = {
+            "blueprint_book": {
+                "item": "blueprint-book",
+                "blueprints": [
+                    {
+                        "index": 0,
+                        "blueprint": {
+                            "item": "blueprint",
+                            "entities": [{"name": "wooden-chest"}, {"name": "}"}],
+                            "tiles": [],
+                        },
+                    },
+                    {"index": 1, "blueprint_book": {"blueprints": [{}]}},
+                ],
+                "active_index": 0,
+            }
+        }
+
+        def encode(text):
+            return "0" + base64.b64encode(zlib.compress(text.encode())).decode()
+
+        for indent in (None, 1):
+            string = encode(json.dumps(book, indent=indent))
+            self.assertEqual(utils.stream_string_to_JSON(string), book)
+
+        # Malformed strings
+        with self.assertRaises(MalformedBlueprintStringError):
+            utils.stream_string_to_JSON("0notbase64")
+        with self.assertRaises(MalformedBlueprintStringError):
+            utils.stream_string_to_JSON(encode('{"blueprint": {"entities": [1, 2}}'))
+        with self.assertRaises(MalformedBlueprintStringError):
+            utils.stream_string_to_JSON(encode('{"blueprint": {}} {}'))
+
     def test_JSON_to_string(self):
         # Blueprints
         test_dict = OrderedDict(
@@ -186,6 +321,71 @@ class UtilsTesting(unittest.TestCase):
             "0eNplyEEKgCAURdG9vLFE2sytRMiPzCQx+Fog0t6ThjW6h1tBPPvMxMUslMlIaCm+U0Grrv/tAXpEyuyjKxCvnLPceOTNcsIksPpIIRToit224KJwWtz3AzZ8Kjs=",
         )
 
+    def test_string_encoder(self):
+        test_dict = {
+            "blueprint": {
+                "label": "\u00e9t\u00e9",
+                "entities": [
+                    {"name": "wooden-chest", "position": {"x": 0.5, "y": 0.5}}
+                ],
+                "version": 281479274954753,
+            }
+        }
+        # Default options match the original output exactly
+        encoder = utils.StringEncoder()
+        expected = "0" + base64.b64encode(
+            zlib.compress(
+                json.dumps(test_dict, separators=(",", ":")).encode("utf-8"), 9
+            )
+        ).decode("utf-8")
+        self.assertEqual(encoder.encode(test_dict), expected)
+        self.assertEqual(utils.JSON_to_string(test_dict), expected)
+        self.assertEqual(encoder.json_backend, "json")
+
+        # Every combination of options round-trips
+        for level in range(10):
+            for fast_json in (False, True):
+                string = utils.JSON_to_string(test_dict, level, fast_json)
+                self.assertEqual(utils.string_to_JSON(string), test_dict)
+
+        # Fast backend
+        encoder = utils.StringEncoder(compression_level=1, fast_json=True)
+        self.assertEqual(
+            encoder.json_backend, "json" if utils.orjson is None else "orjson"
+        )
+        self.assertEqual(json.loads(encoder.dumps(test_dict)), test_dict)
+        # Values orjson can't serialize fall back to the standard library
+        self.assertEqual(json.loads(encoder.dumps({"big": 2**70})), {"big": 2**70})
+
+        # The fast backend is byte-identical to the standard library, even for
+        # values orjson would write differently
+        slow_encoder = utils.StringEncoder(fast_json=False)
+        fast_encoder = utils.StringEncoder(fast_json=True)
+        for value in (
+            test_dict,
+            {"label": "héllo ✓", "description": "\x7f\U0001f600"},
+            {"position": {"x": 1e-07, "y": 0.00001}},
+            {"values": [1e16, -1.5e300, 0.0001, 0.5, -0.0, None]},
+            {"values": [float("nan"), float("inf"), float("-inf")]},
+            {1: "integer keys", "x": 123456789.125},
+        ):
+            self.assertEqual(fast_encoder.dumps(value), slow_encoder.dumps(value))
+            self.assertEqual(fast_encoder.encode(value), slow_encoder.encode(value))
+
+        with self.assertRaises(ValueError):
+            utils.StringEncoder(compression_level=10)
+        with self.assertRaises(ValueError):
+            utils.JSON_to_string(test_dict, compression_level=-1)
+
+    def test_compression_report(self):
+        test_dict = {"blueprint": {"entities": [{"name": "wooden-chest"}] * 100}}
+        report = utils.compression_report(test_dict, levels=[0, 9], repeat=2)
+        self.assertEqual([row["compression_level"] for row in report], [0, 9])
+        self.assertGreater(report[0]["length"], report[1]["length"])
+        self.assertEqual(report[1]["length"], len(utils.JSON_to_string(test_dict)))
+        for row in report:
+            self.assertGreaterEqual(row["time"], 0)
+
     def test_encode_version(self):
         self.assertEqual(utils.encode_version(1, 1, 50, 1), 281479274954753)
 
@@ -354,3 +554,108 @@ class UtilsTesting(unittest.TestCase):
             result = test_function()
 
         self.assertEqual(result, "examples")
+
+    def test_reissue_warnings_nested(self):
+        @utils.reissue_warnings
+        def inner(fail):
+            utils.warn("inner", UserWarning)
+            if fail:
+                raise ValueError
+            return "inner"
+
+        @utils.reissue_warnings
+        def outer():
+            utils.warn("outer", UserWarning)
+            try:
+                inner(True)
+            except ValueError:
+                pass
+            return inner(False)
+
+        with warnings.catch_warnings(record=True) as warning_list:
+            warnings.simplefilter("always")
+            self.assertEqual(outer(), "inner")
+            line = sys._getframe().f_lineno - 1
+
+        # Each warning is issued once, at the caller of the outermost function
+        # Warnings from the call that raised an exception are discarded
+        self.assertEqual([str(w.message) for w in warning_list], ["outer", "inner"])
+        self.assertEqual([w.filename for w in warning_list], [__file__] * 2)
+        self.assertEqual([w.lineno for w in warning_list], [line] * 2)
+
+        # Not collected outside of a decorated function
+        with self.assertWarns(UserWarning):
+            utils.warn("testing")
+
+    def test_reissue_warnings_error_filter(self):
+        issued = []
+
+        @utils.reissue_warnings
+        def test_function():
+            utils.warn("first", UserWarning)
+            utils.warn("second", RuntimeWarning)
+            issued.append(True)
+
+        # Warnings that would be raised are raised immediately
+        with warnings.catch_warnings(record=True) as warning_list:
+            warnings.simplefilter("always")
+            warnings.simplefilter("error", RuntimeWarning)
+            with self.assertRaises(RuntimeWarning):
+                test_function()
+        self.assertEqual(issued, [])
+        self.assertEqual(warning_list, [])
+
+        # Filters for a specific message
+        with warnings.catch_warnings():
+            warnings.filterwarnings("error", "fir")
+            with self.assertRaises(UserWarning):
+                test_function()
+            warnings.filterwarnings("ignore", "first")
+            test_function()
+        self.assertEqual(issued, [True])
+
+        # Except when collecting warnings explicitly
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            with utils.collect_warnings() as collected:
+                test_function()
+        self.assertEqual(
+            collected, [("first", UserWarning), ("second", RuntimeWarning)]
+        )
+
+    def test_collect_warnings(self):
+        with warnings.catch_warnings(record=True) as warning_list:
+            warnings.simplefilter("always")
+            with utils.collect_warnings() as collected:
+                utils.warn("testing", UserWarning)
+            with utils.discard_warnings():
+                utils.warn("testing", UserWarning)
+        self.assertEqual(warning_list, [])
+        self.assertEqual(collected, [("testing", UserWarning)])
+
+    def test_reissue_warnings_threads(self):
+        import threading
+
+        barrier = threading.Barrier(2)
+        results = {}
+
+        @utils.reissue_warnings
+        def test_function(name):
+            utils.warn(name, UserWarning)
+            # Make sure both threads are collecting warnings at the same time
+            barrier.wait()
+            utils.warn(name, UserWarning)
+
+        def run(name):
+            with utils.collect_warnings() as collected:
+                test_function(name)
+            results[name] = collected
+
+        threads = [threading.Thread(target=run, args=(n,)) for n in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results["a"], [("a", UserWarning)] * 2)
+        self.assertEqual(results["b"], [("b", UserWarning)] * 2)
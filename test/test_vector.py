@@ -3,6 +3,7 @@
 
 from draftsman.classes.vector import Vector
 
+import copy
 import sys
 
 if sys.version_info >= (3, 3):  # pragma: no coverage
@@ -124,3 +125,11 @@ class VectorTesting(unittest.TestCase):
         # Vector
         point = Vector(-1, 0) // Vector(3.0, 2.0)
         self.assertEqual(point, Vector(-1.0, 0.0))
+
+    def test_copy(self):
+        point = Vector(1, 2)
+        for duplicate in (copy.copy(point), copy.deepcopy(point)):
+            self.assertEqual(duplicate, point)
+            self.assertIsNot(duplicate.data, point.data)
+        with self.assertRaises(AttributeError):
+            point.z = 3